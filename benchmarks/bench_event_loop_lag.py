@@ -0,0 +1,118 @@
+"""Measure event-loop lag while pages are scraped concurrently.
+
+Serves saved pages from an in-process mock transport, scrapes them all at
+once with ascrape_many, and records how late a 5 ms timer on the same
+loop fires (more ticks and less lag mean a more responsive loop).
+Parsing inline on the loop (parse_workers=0) is compared with
+the thread and process parse pools.
+
+Usage:
+    python benchmarks/bench_event_loop_lag.py [--pages N] [--extractor NAME]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from pencraft.tools.scraper import WebScraper
+
+PAGES_DIR = Path(__file__).parent / "pages"
+
+TICK = 0.005
+
+
+def load_bodies(copies: int) -> list[bytes]:
+    """Load the saved pages, each repeated ``copies`` times to make a large page."""
+    bodies = []
+    for path in sorted(PAGES_DIR.glob("*.htm*")):
+        html = path.read_text(encoding="utf-8")
+        head, _, rest = html.partition("<body")
+        body = "<body" + rest.replace("</body>", "").replace("</html>", "")
+        bodies.append((head + body * copies + "</body></html>").encode())
+    return bodies
+
+
+def make_scraper(bodies: list[bytes], extractor: str, **kwargs: Any) -> WebScraper:
+    """Build a scraper whose requests are answered with the saved pages."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # A little network latency so downloads overlap
+        await asyncio.sleep(0.01)
+        index = int(request.url.path.strip("/")) % len(bodies)
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=bodies[index])
+
+    scraper = WebScraper(max_concurrency=20, per_host_limit=20, extractor=extractor, **kwargs)
+    scraper._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return scraper
+
+
+async def measure(scraper: WebScraper, pages: int) -> tuple[float, list[float]]:
+    """Scrape ``pages`` URLs concurrently, sampling the loop's timer lag."""
+    loop = asyncio.get_running_loop()
+    scraper._async_loop = loop
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(TICK)
+            lags.append(max(0.0, loop.time() - start - TICK))
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    results = await scraper.ascrape_many([f"https://bench.example/{i}" for i in range(pages)])
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    await scraper.aclose()
+    scraper.close()
+
+    failed = [r.url for r in results if not r.success]
+    if failed:
+        raise RuntimeError(f"{len(failed)} pages failed to scrape")
+    return elapsed, lags
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20, help="pages scraped concurrently")
+    parser.add_argument("--copies", type=int, default=30, help="size multiplier of each page")
+    parser.add_argument("--extractor", default="soup", help="extraction backend")
+    parser.add_argument("--workers", type=int, default=4, help="parse workers")
+    args = parser.parse_args()
+
+    bodies = load_bodies(args.copies)
+    if not bodies:
+        print(f"No .html pages found in {PAGES_DIR}", file=sys.stderr)
+        return 1
+    size = sum(len(b) for b in bodies) / len(bodies) / 1024
+    print(f"{args.pages} pages of about {size:.0f} KiB, {args.extractor} extractor\n")
+
+    modes: list[tuple[str, dict[str, Any]]] = [
+        ("inline", {"parse_workers": 0}),
+        ("thread", {"parse_workers": args.workers, "parse_pool": "thread"}),
+        ("process", {"parse_workers": args.workers, "parse_pool": "process"}),
+    ]
+    print(f"{'mode':<8} {'wall s':>7} {'ticks':>6} {'max lag ms':>11} {'mean lag ms':>12}")
+    for name, kwargs in modes:
+        scraper = make_scraper(bodies, args.extractor, **kwargs)
+        elapsed, lags = asyncio.run(measure(scraper, args.pages))
+        print(
+            f"{name:<8} {elapsed:>7.2f} {len(lags):>6} {max(lags, default=0) * 1000:>11.1f} "
+            f"{statistics.fmean(lags or [0.0]) * 1000:>12.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Compare the HTML extraction backends on saved pages.
+
+Reports pages/sec for each installed backend, how closely its output
+matches the BeautifulSoup backend (the reference implementation), and
+the estimated prompt tokens of the extracted text per page.
+
+Usage:
+    python benchmarks/bench_extractors.py [--pages DIR] [--repeat N] [--diff]
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from pencraft.tools.extractors import EXTRACTORS, ExtractedPage, Extractor, SoupExtractor
+
+PAGES_DIR = Path(__file__).parent / "pages"
+
+# Rough characters per token of English text
+CHARS_PER_TOKEN = 4
+
+
+def load_pages(directory: Path) -> dict[str, str]:
+    """Load the saved HTML pages of a directory."""
+    return {
+        path.name: path.read_text(encoding="utf-8", errors="replace")
+        for path in sorted(directory.glob("*.htm*"))
+    }
+
+
+def pages_per_second(extractor: Extractor, pages: dict[str, str], repeat: int) -> float:
+    """Time extracting every page ``repeat`` times."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages.values():
+            extractor.extract(html)
+    return len(pages) * repeat / (time.perf_counter() - start)
+
+
+def similarity(page: ExtractedPage, reference: ExtractedPage) -> float:
+    """Get how similar two extractions are (1.0 means identical)."""
+    if page == reference:
+        return 1.0
+    return difflib.SequenceMatcher(None, page.content, reference.content).ratio()
+
+
+def tokens(page: ExtractedPage) -> int:
+    """Estimate the prompt tokens of a page's content."""
+    return len(page.content) // CHARS_PER_TOKEN
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=Path, default=PAGES_DIR, help="directory of .html files")
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the pages")
+    parser.add_argument("--diff", action="store_true", help="list pages that differ")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    if not pages:
+        print(f"No .html pages found in {args.pages}", file=sys.stderr)
+        return 1
+
+    reference = SoupExtractor()
+    expected = {name: reference.extract(html) for name, html in pages.items()}
+
+    print(f"{len(pages)} pages, {args.repeat} passes\n")
+    reference_tokens = sum(tokens(page) for page in expected.values())
+    print(
+        f"{'backend':<12} {'pages/sec':>10} {'speedup':>8} {'identical':>10} {'min sim':>8}"
+        f" {'tokens/page':>12} {'saved':>7}"
+    )
+    baseline = pages_per_second(reference, pages, args.repeat)
+    for name, cls in EXTRACTORS.items():
+        if not cls.available():
+            print(f"{name:<12} {'not installed':>10}")
+            continue
+        extractor = cls()
+        rate = pages_per_second(extractor, pages, args.repeat)
+        extracted = {page: extractor.extract(html) for page, html in pages.items()}
+        scores = {page: similarity(extracted[page], expected[page]) for page in pages}
+        identical = sum(score == 1.0 for score in scores.values())
+        total_tokens = sum(tokens(page) for page in extracted.values())
+        saved = 1 - total_tokens / reference_tokens if reference_tokens else 0.0
+        print(
+            f"{name:<12} {rate:>10.1f} {rate / baseline:>7.2f}x "
+            f"{identical:>4}/{len(pages):<5} {min(scores.values()):>8.3f}"
+            f" {total_tokens / len(pages):>12.0f} {saved:>7.1%}"
+        )
+        if not args.diff:
+            continue
+        for page, score in scores.items():
+            if score < 1.0:
+                got = asdict(extracted[page])
+                want = asdict(expected[page])
+                fields = [key for key in got if got[key] != want[key]]
+                print(f"  {page}: differs in {', '.join(fields)} (similarity {score:.3f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from pencraft.llm.usage import llm_phase
+
 if TYPE_CHECKING:
     from pencraft.config.settings import Settings
     from pencraft.llm.client import LLMClient
@@ -133,6 +135,7 @@ class BaseAgent(ABC):
         self,
         prompt: str,
         system_prompt: str | None = None,
+        phase: str = "generate",
         **kwargs: Any,
     ) -> str:
         """Generate content using the LLM.
@@ -140,18 +143,21 @@ class BaseAgent(ABC):
         Args:
             prompt: User prompt.
             system_prompt: Optional system prompt.
+            phase: Phase name recorded in the usage accounting.
             **kwargs: Additional arguments for the LLM.
 
         Returns:
             Generated content string.
         """
         self.log(f"Generating content (prompt length: {len(prompt)} chars)")
-        return self.llm.generate(prompt, system_prompt=system_prompt, **kwargs)
+        with llm_phase(phase, agent=self.name):
+            return self.llm.generate(prompt, system_prompt=system_prompt, **kwargs)
 
     async def _agenerate(
         self,
         prompt: str,
         system_prompt: str | None = None,
+        phase: str = "generate",
         **kwargs: Any,
     ) -> str:
         """Generate content using the LLM asynchronously.
@@ -159,10 +165,12 @@ class BaseAgent(ABC):
         Args:
             prompt: User prompt.
             system_prompt: Optional system prompt.
+            phase: Phase name recorded in the usage accounting.
             **kwargs: Additional arguments for the LLM.
 
         Returns:
             Generated content string.
         """
         self.log(f"Generating content async (prompt length: {len(prompt)} chars)")
-        return await self.llm.agenerate(prompt, system_prompt=system_prompt, **kwargs)
+        with llm_phase(phase, agent=self.name):
+            return await self.llm.agenerate(prompt, system_prompt=system_prompt, **kwargs)
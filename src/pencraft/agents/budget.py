@@ -0,0 +1,99 @@
+"""Wall-clock and token budgets for researching a topic."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from pencraft.llm.usage import collect_usage
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import ResearchSettings
+
+
+class ResearchBudget:
+    """Tracks the time and LLM tokens spent researching one topic.
+
+    The clock starts when the budget is created. Tokens are counted for the
+    LLM calls made inside track(). Once either limit is reached the budget
+    is exhausted: no further search rounds start and scraping is cut short.
+    """
+
+    def __init__(self, seconds: float | None = None, tokens: int | None = None) -> None:
+        """Initialize the budget.
+
+        Args:
+            seconds: Wall-clock seconds available (None for no limit).
+            tokens: Prompt+completion tokens available (None for no limit).
+        """
+        self.seconds = seconds
+        self.tokens = tokens
+        self.tokens_used = 0
+        self.start = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: ResearchSettings) -> ResearchBudget:
+        """Create a budget from research settings.
+
+        Args:
+            settings: Research settings.
+
+        Returns:
+            ResearchBudget instance, started now.
+        """
+        return cls(settings.time_budget, settings.token_budget)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the budget was created."""
+        return time.monotonic() - self.start
+
+    def remaining(self) -> float | None:
+        """Get the seconds left, or None without a time limit."""
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - self.elapsed)
+
+    def exhausted(self) -> bool:
+        """Check whether the time or token budget is used up."""
+        if self.seconds is not None and self.elapsed >= self.seconds:
+            return True
+        return self.tokens is not None and self.tokens_used >= self.tokens
+
+    def deadline(self, seconds: float | None) -> float | None:
+        """Shorten a step's deadline to the time left.
+
+        Args:
+            seconds: The step's own deadline (None for none).
+
+        Returns:
+            The smaller of the two, or None if neither is set.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return seconds
+        return remaining if seconds is None else min(seconds, remaining)
+
+    @contextmanager
+    def track(self) -> Generator[None, None, None]:
+        """Count the tokens of the LLM calls made inside the block."""
+        with collect_usage() as usage:
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self.tokens_used += usage.prompt_tokens + usage.completion_tokens
+
+    def describe(self) -> str:
+        """Summarize what was spent, for logs."""
+        spent = f"{self.elapsed:.1f}s"
+        if self.seconds is not None:
+            spent += f" of {self.seconds:g}s"
+        spent += f", {self.tokens_used} tokens"
+        if self.tokens is not None:
+            spent += f" of {self.tokens}"
+        return spent
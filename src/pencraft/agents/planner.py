@@ -36,6 +36,16 @@ class Section:
             "estimated_words": self.estimated_words,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Section:
+        """Create a section from a dictionary produced by to_dict()."""
+        return cls(
+            title=data.get("title", ""),
+            key_points=data.get("key_points", []),
+            subsections=[cls.from_dict(sub) for sub in data.get("subsections", [])],
+            estimated_words=data.get("estimated_words", 0),
+        )
+
 
 @dataclass
 class BlogOutline:
@@ -64,6 +74,27 @@ class BlogOutline:
             "layout_type": self.layout_type,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BlogOutline:
+        """Create an outline from a dictionary produced by to_dict().
+
+        Args:
+            data: Outline dictionary.
+
+        Returns:
+            BlogOutline instance.
+        """
+        return cls(
+            title=data.get("title", "Untitled"),
+            meta_description=data.get("meta_description", ""),
+            sections=[Section.from_dict(s) for s in data.get("sections", [])],
+            tags=data.get("tags", []),
+            categories=data.get("categories", []),
+            target_word_count=data.get("target_word_count", 2000),
+            seo_keywords=data.get("seo_keywords", []),
+            layout_type=data.get("layout_type", "deep-dive"),
+        )
+
     def to_markdown(self) -> str:
         """Convert outline to markdown format."""
         lines = [
@@ -151,6 +182,7 @@ class PlannerAgent(BaseAgent):
             raw_outline = self._generate(
                 prompt,
                 system_prompt=self.settings.prompts.planner_system,
+                phase="outline",
             )
 
             # Parse the outline
@@ -208,6 +240,7 @@ class PlannerAgent(BaseAgent):
             raw_outline = await self._agenerate(
                 prompt,
                 system_prompt=self.settings.prompts.planner_system,
+                phase="outline",
             )
 
             outline = self._parse_outline(
@@ -268,7 +301,7 @@ Return a JSON object with these fields:
 Return only valid JSON, no other text."""
 
         try:
-            json_response = self._generate(structure_prompt, temperature=0.3)
+            json_response = self._generate(structure_prompt, phase="outline_json", temperature=0.3)
 
             # Clean up response - extract JSON if wrapped in markdown
             json_str = json_response.strip()
@@ -360,6 +393,7 @@ Provide an improved outline that addresses the feedback while maintaining the or
             raw_outline = self._generate(
                 prompt,
                 system_prompt=self.settings.prompts.planner_system,
+                phase="outline_refine",
             )
 
             refined = self._parse_outline(
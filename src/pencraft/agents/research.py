@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import itertools
 import logging
-from collections.abc import Callable
+import re
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from pencraft.agents.base import AgentResult, BaseAgent
-from pencraft.llm.prompts import RESEARCH_PROMPT
+from pencraft.agents.budget import ResearchBudget
+from pencraft.llm.prompts import PAGE_NOTES_PROMPT, RESEARCH_PROMPT
+from pencraft.llm.usage import CHARS_PER_TOKEN
+from pencraft.tools.coverage import SnippetCoverage, snippet_coverage
+from pencraft.tools.dedup import NearDuplicates
+from pencraft.tools.domain_rules import DomainRules
+from pencraft.tools.http_cache import HTTPCache
+from pencraft.tools.notes_cache import NotesCache
+from pencraft.tools.ranking import ResultRanker
 from pencraft.tools.scraper import ScrapedContent, WebScraper
 from pencraft.tools.search import SearchResult, SearchTool
+from pencraft.tools.search_cache import SearchCache
 from pencraft.tools.trends import TrendsData, TrendsTool
+from pencraft.tools.trends_cache import TrendsCache
+from pencraft.tools.trends_scheduler import get_trends_scheduler
 
 if TYPE_CHECKING:
     from pencraft.config.settings import Settings
@@ -19,6 +38,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Follow-up queries searched per extra round of research
+FOLLOW_UP_QUERIES = 3
+
+# Bullets and numbering the LLM may put before each query
+_LIST_MARKER = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+")
+
 
 @dataclass
 class ResearchData:
@@ -31,6 +56,7 @@ class ResearchData:
     search_results: list[SearchResult] = field(default_factory=list)
     scraped_content: list[ScrapedContent] = field(default_factory=list)
     trends_data: TrendsData | None = None
+    coverage: SnippetCoverage | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -42,8 +68,32 @@ class ResearchData:
             "search_results": [r.to_dict() for r in self.search_results],
             "scraped_content": [c.to_dict() for c in self.scraped_content],
             "trends_data": self.trends_data.to_dict() if self.trends_data else None,
+            "coverage": self.coverage.to_dict() if self.coverage else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ResearchData:
+        """Create research data from a dictionary produced by to_dict().
+
+        Args:
+            data: Dictionary representation.
+
+        Returns:
+            ResearchData instance.
+        """
+        trends = data.get("trends_data")
+        coverage = data.get("coverage")
+        return cls(
+            topic=data.get("topic", ""),
+            summary=data.get("summary", ""),
+            sources=data.get("sources", []),
+            key_points=data.get("key_points", []),
+            search_results=[SearchResult(**r) for r in data.get("search_results", [])],
+            scraped_content=[ScrapedContent(**c) for c in data.get("scraped_content", [])],
+            trends_data=TrendsData(**trends) if trends else None,
+            coverage=SnippetCoverage.from_dict(coverage) if coverage else None,
+        )
+
 
 class ResearchAgent(BaseAgent):
     """Agent for researching topics and gathering information.
@@ -74,10 +124,54 @@ class ResearchAgent(BaseAgent):
         super().__init__(llm_client, settings, name="ResearchAgent", on_progress=on_progress)
 
         self.search_tool = search_tool or SearchTool(
-            max_results=self.settings.research.max_search_results
+            max_results=self.settings.research.max_search_results,
+            max_workers=self.settings.research.search_concurrency,
+            cache=(
+                SearchCache.from_settings(self.settings.cache)
+                if self.settings.cache.search_enabled
+                else None
+            ),
+        )
+        research_settings = self.settings.research
+        self.scraper = scraper or WebScraper(
+            max_concurrency=research_settings.scrape_concurrency,
+            per_host_limit=research_settings.scrape_per_host,
+            http2=research_settings.scrape_http2,
+            max_bytes=research_settings.scrape_max_bytes,
+            extractor=research_settings.scrape_extractor,
+            domain_rules=DomainRules.from_settings(self.settings.cache, research_settings),
+            parse_workers=research_settings.parse_workers,
+            parse_pool=research_settings.parse_pool,
+            parse_queue=research_settings.parse_queue,
+            cache=(
+                HTTPCache.from_settings(self.settings.cache)
+                if self.settings.cache.http_enabled
+                else None
+            ),
+        )
+        self.trends_tool = trends_tool or TrendsTool(
+            cache=(
+                TrendsCache.from_settings(self.settings.cache)
+                if self.settings.cache.trends_enabled
+                else None
+            ),
+            scheduler=get_trends_scheduler(
+                research_settings.trends_requests_per_minute,
+                research_settings.trends_max_requests_per_minute,
+            ),
+        )
+        self.ranker = ResultRanker.from_settings(research_settings)
+        if research_settings.synthesis_mode not in ("single", "map_reduce"):
+            raise ValueError(
+                f"Unknown synthesis mode: {research_settings.synthesis_mode} "
+                "(expected single or map_reduce)"
+            )
+        self.notes_cache = (
+            NotesCache.from_settings(self.settings.cache)
+            if self.settings.cache.notes_enabled
+            and research_settings.synthesis_mode == "map_reduce"
+            else None
         )
-        self.scraper = scraper or WebScraper()
-        self.trends_tool = trends_tool or TrendsTool()
 
     def execute(
         self,
@@ -102,60 +196,70 @@ class ResearchAgent(BaseAgent):
         """
         try:
             self.log(f"Starting research on: {topic}")
+            budget = ResearchBudget.from_settings(self.settings.research)
+
+            # Fetch Google Trends data in the background while queries are generated
+            pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trends")
+            try:
+                trends_future = (
+                    pool.submit(self.fetch_trends, topic, self.settings.research.trends_deadline)
+                    if use_trends
+                    else None
+                )
+                trends_started = time.monotonic()
 
-            # Fetch Google Trends data first
-            trends_data: TrendsData | None = None
-            trends_queries: list[str] = []
-            if use_trends:
-                self.log("📊 Fetching Google Trends data...")
-                try:
-                    trends_data = self.trends_tool.get_trends_data(topic)
-                    if trends_data.interest_score > 0:
-                        self.log(f"   Interest score: {trends_data.interest_score}/100")
-                    if trends_data.is_trending:
-                        self.log("   📈 Topic is currently trending!")
-                    # Use rising queries to enhance search
-                    trends_queries = trends_data.rising_queries[:3]
-                    if trends_queries:
-                        self.log(f"   Found {len(trends_data.rising_queries)} rising queries")
-                except Exception as e:
-                    self.log(f"   ⚠️ Trends lookup failed: {e}")
-
-            # Generate search queries if not provided
-            if not search_queries:
-                search_queries = self._generate_search_queries(topic)
-                # Enhance with trends-based queries
-                if trends_queries:
-                    search_queries = search_queries[:3] + trends_queries
-
-            # Perform searches
-            all_results: list[SearchResult] = []
-            for query in search_queries:
-                self.log(f"🔍 Searching: {query}")
-                results = self.search_tool.search(query)
-                all_results.extend(results)
-                self.log(f"   Found {len(results)} results")
-
-            # Deduplicate by URL
-            seen_urls: set[str] = set()
-            unique_results: list[SearchResult] = []
-            for result in all_results:
-                if result.url not in seen_urls:
-                    seen_urls.add(result.url)
-                    unique_results.append(result)
-
-            self.log(f"Total unique results: {len(unique_results)}")
-
-            # Scrape top results for full content
+                # Generate search queries if not provided
+                generated = not search_queries
+                if not search_queries:
+                    with budget.track():
+                        search_queries = self._generate_search_queries(topic)
+
+                trends_data = (
+                    self._trends_result(trends_future, trends_started) if trends_future else None
+                )
+            finally:
+                # A lookup past its deadline sends no further requests
+                pool.shutdown(wait=False)
+
+            # Enhance generated queries with rising trends queries
+            if generated and trends_data is not None and trends_data.rising_queries:
+                search_queries = search_queries[:3] + trends_data.rising_queries[:3]
+
+            # Perform searches concurrently
+            self.log(f"🔍 Searching {len(search_queries)} queries...")
+            results_by_query = self.search_tool.multi_search(
+                search_queries,
+                max_results_per_query=self.settings.research.max_search_results,
+                max_workers=self.settings.research.search_concurrency,
+            )
+            for query, results in results_by_query.items():
+                self.log(f"   {query}: {len(results)} results")
+
+            # Deduplicate by URL and rank by relevance
+            unique_results = self._merge_results(
+                results_by_query.values(), [topic, *search_queries]
+            )
+
+            # Search again for what the first round missed (search_depth > 1)
+            unique_results = self._follow_up(topic, search_queries, unique_results, budget)
+
+            # Scrape the best results that load for full content, unless
+            # the snippets already cover the topic
+            scrape_pages, coverage = self._plan_scrape(
+                unique_results, [topic, *search_queries], scrape_top_n, budget
+            )
             scraped_content: list[ScrapedContent] = []
-            for result in unique_results[:scrape_top_n]:
-                self.log(f"🌐 Scraping: {result.url}")
-                content = self.scraper.scrape(result.url)
-                if content.success:
-                    scraped_content.append(content)
-                    self.log(f"   ✓ {content.word_count} words extracted")
-                else:
-                    self.log("   ✗ Failed to scrape")
+            if scrape_pages:
+                candidates = self._scrape_candidates(unique_results, scrape_pages)
+                self.log(f"🌐 Scraping up to {scrape_pages} of {len(candidates)} pages...")
+                scraped_content = self.scraper.scrape_many(
+                    candidates,
+                    first_k=scrape_pages,
+                    deadline=budget.deadline(self.settings.research.scrape_deadline),
+                    dedup=self._near_duplicates(),
+                )
+            for content in scraped_content:
+                self.log(f"   ✓ {content.url}: {content.word_count} words extracted")
 
             # Synthesize research using LLM
             self.log("✍️ Synthesizing research summary...")
@@ -165,6 +269,7 @@ class ResearchAgent(BaseAgent):
                 scraped_content=scraped_content,
                 additional_context=additional_context,
                 trends_data=trends_data,
+                budget=budget,
             )
 
             # Extract sources for citations
@@ -178,9 +283,10 @@ class ResearchAgent(BaseAgent):
                 search_results=unique_results[: self.settings.research.max_sources],
                 scraped_content=scraped_content,
                 trends_data=trends_data,
+                coverage=coverage,
             )
 
-            self.log("Research completed successfully")
+            self.log(f"Research completed successfully ({budget.describe()})")
 
             return AgentResult(
                 success=True,
@@ -198,6 +304,7 @@ class ResearchAgent(BaseAgent):
         additional_context: str = "",
         search_queries: list[str] | None = None,
         scrape_top_n: int = 3,
+        use_trends: bool = True,
     ) -> AgentResult:
         """Execute research asynchronously.
 
@@ -206,37 +313,50 @@ class ResearchAgent(BaseAgent):
             additional_context: Additional context or requirements.
             search_queries: Custom search queries (auto-generated if None).
             scrape_top_n: Number of top results to scrape for content.
+            use_trends: Whether to fetch Google Trends data.
 
         Returns:
             AgentResult with ResearchData in metadata.
         """
         try:
             self.log(f"Starting async research on: {topic}")
+            budget = ResearchBudget.from_settings(self.settings.research)
 
-            # Generate search queries if not provided
+            # Fetch Google Trends data while queries are generated
+            trends_task = asyncio.create_task(self._afetch_trends(topic)) if use_trends else None
+            generated = not search_queries
             if not search_queries:
-                search_queries = await self._agenerate_search_queries(topic)
-
-            # Perform searches (sync for now, DuckDuckGo doesn't have async)
-            all_results: list[SearchResult] = []
-            for query in search_queries:
-                results = self.search_tool.search(query)
-                all_results.extend(results)
-
-            # Deduplicate
-            seen_urls: set[str] = set()
-            unique_results: list[SearchResult] = []
-            for result in all_results:
-                if result.url not in seen_urls:
-                    seen_urls.add(result.url)
-                    unique_results.append(result)
-
-            # Scrape asynchronously
+                with budget.track():
+                    search_queries = await self._agenerate_search_queries(topic)
+            trends_data = await trends_task if trends_task else None
+
+            if generated and trends_data is not None and trends_data.rising_queries:
+                search_queries = search_queries[:3] + trends_data.rising_queries[:3]
+
+            # Perform searches concurrently (DuckDuckGo has no async API)
+            results_by_query = await self.search_tool.amulti_search(
+                search_queries,
+                max_results_per_query=self.settings.research.max_search_results,
+                max_workers=self.settings.research.search_concurrency,
+            )
+            # Deduplicate and rank by relevance
+            unique_results = self._merge_results(
+                results_by_query.values(), [topic, *search_queries]
+            )
+            unique_results = await self._afollow_up(topic, search_queries, unique_results, budget)
+
+            # Scrape asynchronously, unless the snippets already cover the topic
+            scrape_pages, coverage = self._plan_scrape(
+                unique_results, [topic, *search_queries], scrape_top_n, budget
+            )
             scraped_content: list[ScrapedContent] = []
-            for result in unique_results[:scrape_top_n]:
-                content = await self.scraper.ascrape(result.url)
-                if content.success:
-                    scraped_content.append(content)
+            if scrape_pages:
+                scraped_content = await self.scraper.ascrape_many(
+                    self._scrape_candidates(unique_results, scrape_pages),
+                    first_k=scrape_pages,
+                    deadline=budget.deadline(self.settings.research.scrape_deadline),
+                    dedup=self._near_duplicates(),
+                )
 
             # Synthesize research
             research_summary = await self._asynthesize_research(
@@ -244,7 +364,10 @@ class ResearchAgent(BaseAgent):
                 search_results=unique_results,
                 scraped_content=scraped_content,
                 additional_context=additional_context,
+                trends_data=trends_data,
+                budget=budget,
             )
+            self.log(f"Research completed ({budget.describe()})")
 
             sources = self._extract_sources(unique_results, scraped_content)
 
@@ -254,6 +377,8 @@ class ResearchAgent(BaseAgent):
                 sources=sources,
                 search_results=unique_results[: self.settings.research.max_sources],
                 scraped_content=scraped_content,
+                trends_data=trends_data,
+                coverage=coverage,
             )
 
             return AgentResult(
@@ -265,6 +390,274 @@ class ResearchAgent(BaseAgent):
         except Exception as e:
             return self._handle_error(e, "Async research execution failed")
 
+    def _merge_results(
+        self, result_lists: Iterable[list[SearchResult]], queries: list[str]
+    ) -> list[SearchResult]:
+        """Deduplicate search results by URL and snippet and rank them.
+
+        Args:
+            result_lists: Results of each search, in query order.
+            queries: Topic and search queries, for relevance ranking.
+
+        Returns:
+            Unique results, best first when research.rank_results is on.
+        """
+        seen_urls: set[str] = set()
+        unique_results: list[SearchResult] = []
+        for result in itertools.chain.from_iterable(result_lists):
+            if result.url not in seen_urls:
+                seen_urls.add(result.url)
+                unique_results.append(result)
+        self.log(f"Total unique results: {len(unique_results)}")
+
+        if self.settings.research.rank_results:
+            unique_results = self.ranker.rank(unique_results, queries)
+
+        # Drop syndicated copies, keeping the best ranked one
+        dedup = self._near_duplicates()
+        if dedup is not None:
+            distinct = [r for r in unique_results if dedup.check(r.url, r.snippet) is None]
+            if len(distinct) < len(unique_results):
+                self.log(f"Dropped {len(unique_results) - len(distinct)} near-duplicate results")
+            unique_results = distinct
+        return unique_results
+
+    def _near_duplicates(self) -> NearDuplicates | None:
+        """Create a near-duplicate detector, or None if dedup is disabled."""
+        research = self.settings.research
+        if not research.dedup_enabled:
+            return None
+        return NearDuplicates(max_distance=research.dedup_max_distance)
+
+    def _follow_up_prompt(self, topic: str, queries: list[str], results: list[SearchResult]) -> str:
+        """Build the prompt asking for queries that fill the gaps of the results so far."""
+        found = "\n".join(f"- {r.title}: {r.snippet[:150]}" for r in results[:10])
+        searched = "\n".join(f"- {q}" for q in queries)
+        return f"""You are researching the following topic for a blog post:
+
+Topic: {topic}
+
+Queries searched so far:
+{searched}
+
+Best results found so far:
+{found or "- nothing"}
+
+Which important aspects of the topic do these results miss? Write up to {FOLLOW_UP_QUERIES} new search queries that would fill those gaps.
+
+Return only the search queries, one per line, without numbering or explanation. Return nothing if the results already cover the topic well."""
+
+    def _follow_up_queries(self, response: str, searched: list[str]) -> list[str]:
+        """Parse follow-up queries, dropping ones already searched."""
+        seen = {q.strip().lower() for q in searched}
+        queries = []
+        for line in response.splitlines():
+            query = _LIST_MARKER.sub("", line).strip()
+            if query and query.lower() not in seen:
+                seen.add(query.lower())
+                queries.append(query)
+        return queries[:FOLLOW_UP_QUERIES]
+
+    def _follow_up(
+        self,
+        topic: str,
+        queries: list[str],
+        results: list[SearchResult],
+        budget: ResearchBudget,
+    ) -> list[SearchResult]:
+        """Run follow-up search rounds until search_depth or the budget is reached.
+
+        Args:
+            topic: Research topic.
+            queries: Queries of the first round.
+            results: Ranked results of the first round.
+            budget: Research budget.
+
+        Returns:
+            Ranked results of all rounds.
+        """
+        searched = list(queries)
+        for round_number in range(2, self.settings.research.search_depth + 1):
+            if budget.exhausted():
+                self.log(f"⏱️ Research budget used up ({budget.describe()}), no more rounds")
+                break
+            try:
+                with budget.track():
+                    response = self._generate(
+                        self._follow_up_prompt(topic, searched, results), phase="follow_up"
+                    )
+            except Exception as e:
+                self.log(f"   ⚠️ Follow-up queries failed: {e}")
+                break
+            follow_ups = self._follow_up_queries(response, searched)
+            if not follow_ups:
+                break
+
+            self.log(f"🔍 Round {round_number}: searching {len(follow_ups)} follow-up queries...")
+            results_by_query = self.search_tool.multi_search(
+                follow_ups,
+                max_results_per_query=self.settings.research.max_search_results,
+                max_workers=self.settings.research.search_concurrency,
+            )
+            searched += follow_ups
+            results = self._merge_results([results, *results_by_query.values()], [topic, *searched])
+        return results
+
+    async def _afollow_up(
+        self,
+        topic: str,
+        queries: list[str],
+        results: list[SearchResult],
+        budget: ResearchBudget,
+    ) -> list[SearchResult]:
+        """Run follow-up search rounds asynchronously (see _follow_up)."""
+        searched = list(queries)
+        for round_number in range(2, self.settings.research.search_depth + 1):
+            if budget.exhausted():
+                self.log(f"⏱️ Research budget used up ({budget.describe()}), no more rounds")
+                break
+            try:
+                with budget.track():
+                    response = await self._agenerate(
+                        self._follow_up_prompt(topic, searched, results), phase="follow_up"
+                    )
+            except Exception as e:
+                self.log(f"   ⚠️ Follow-up queries failed: {e}")
+                break
+            follow_ups = self._follow_up_queries(response, searched)
+            if not follow_ups:
+                break
+
+            self.log(f"🔍 Round {round_number}: searching {len(follow_ups)} follow-up queries...")
+            results_by_query = await self.search_tool.amulti_search(
+                follow_ups,
+                max_results_per_query=self.settings.research.max_search_results,
+                max_workers=self.settings.research.search_concurrency,
+            )
+            searched += follow_ups
+            results = self._merge_results([results, *results_by_query.values()], [topic, *searched])
+        return results
+
+    def _plan_scrape(
+        self,
+        results: list[SearchResult],
+        queries: list[str],
+        scrape_top_n: int,
+        budget: ResearchBudget | None = None,
+    ) -> tuple[int, SnippetCoverage | None]:
+        """Decide how many pages to scrape from the coverage of the snippets.
+
+        Args:
+            results: Ranked search results.
+            queries: Topic and search queries.
+            scrape_top_n: Pages requested.
+            budget: Research budget; nothing is scraped once its time is up.
+
+        Returns:
+            Tuple of (pages to scrape, coverage or None when
+            research.snippet_fast_path is off).
+        """
+        if budget is not None and budget.remaining() == 0:
+            self.log(f"⏱️ Research time budget used up ({budget.describe()}), not scraping")
+            return 0, None
+
+        research = self.settings.research
+        if not research.snippet_fast_path:
+            return scrape_top_n, None
+
+        # Synthesis sees the first ten results, so only those count
+        coverage = snippet_coverage(results[:10], queries)
+        if coverage.score >= research.coverage_skip_score:
+            pages = 0
+        elif coverage.score >= research.coverage_shrink_score:
+            pages = min(scrape_top_n, max(1, scrape_top_n // 2))
+        else:
+            pages = scrape_top_n
+        coverage.requested_pages = scrape_top_n
+        coverage.planned_pages = pages
+        self.log(
+            f"📋 Snippet coverage {coverage.score:.2f}: scraping {pages} of {scrape_top_n} pages"
+        )
+        return pages, coverage
+
+    def _scrape_candidates(self, results: list[SearchResult], scrape_top_n: int) -> list[str]:
+        """Get the URLs tried when scraping the top results.
+
+        Args:
+            results: Ranked search results, best first.
+            scrape_top_n: Number of pages wanted.
+
+        Returns:
+            URLs of the first results, with spares for pages that fail to load.
+        """
+        count = max(scrape_top_n, self.settings.research.scrape_candidates)
+        return [r.url for r in results[:count]]
+
+    def fetch_trends(self, topic: str, deadline: float | None = None) -> TrendsData | None:
+        """Fetch Google Trends data for a topic, logging the highlights.
+
+        Args:
+            topic: Topic to look up.
+            deadline: Seconds after which requests not yet sent are abandoned.
+
+        Returns:
+            TrendsData, or None if the lookup failed.
+        """
+        self.log("📊 Fetching Google Trends data...")
+        try:
+            trends_data = self.trends_tool.get_trends_data(topic, deadline=deadline)
+        except Exception as e:
+            self.log(f"   ⚠️ Trends lookup failed: {e}")
+            return None
+
+        if trends_data.interest_score > 0:
+            self.log(f"   Interest score: {trends_data.interest_score}/100")
+        if trends_data.is_trending:
+            self.log("   📈 Topic is currently trending!")
+        if trends_data.rising_queries:
+            self.log(f"   Found {len(trends_data.rising_queries)} rising queries")
+        return trends_data
+
+    def _trends_result(
+        self, future: Future[TrendsData | None], started: float
+    ) -> TrendsData | None:
+        """Wait for a background trends lookup until trends_deadline.
+
+        Args:
+            future: Lookup submitted at ``started``.
+            started: Monotonic time the lookup started.
+
+        Returns:
+            TrendsData, or None if the lookup failed or is not ready in time.
+        """
+        deadline = self.settings.research.trends_deadline
+        timeout = None if deadline is None else max(0.0, deadline - (time.monotonic() - started))
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self.log(f"   ⚠️ Trends not ready after {deadline:g}s, continuing without them")
+            return None
+
+    async def _afetch_trends(self, topic: str) -> TrendsData | None:
+        """Fetch Google Trends data off the event loop, until trends_deadline.
+
+        The lookup gets the same deadline, so its thread abandons requests
+        still queued then; only a request already sent runs past it.
+
+        Args:
+            topic: Topic to look up.
+
+        Returns:
+            TrendsData, or None if the lookup failed or is not ready in time.
+        """
+        deadline = self.settings.research.trends_deadline
+        lookup = asyncio.ensure_future(asyncio.to_thread(self.fetch_trends, topic, deadline))
+        done, _ = await asyncio.wait({lookup}, timeout=deadline)
+        if lookup in done:
+            return lookup.result()
+        self.log(f"   ⚠️ Trends not ready after {deadline:g}s, continuing without them")
+        return None
+
     def _generate_search_queries(self, topic: str) -> list[str]:
         """Generate search queries for a topic.
 
@@ -282,7 +675,7 @@ Topic: {topic}
 Return only the search queries, one per line, without numbering or explanation."""
 
         try:
-            response = self._generate(prompt)
+            response = self._generate(prompt, phase="search_queries")
             queries = [q.strip() for q in response.strip().split("\n") if q.strip()]
             return queries[:5] if queries else [topic]
         except Exception:
@@ -302,7 +695,7 @@ Topic: {topic}
 Return only the search queries, one per line, without numbering or explanation."""
 
         try:
-            response = await self._agenerate(prompt)
+            response = await self._agenerate(prompt, phase="search_queries")
             queries = [q.strip() for q in response.strip().split("\n") if q.strip()]
             return queries[:5] if queries else [topic]
         except Exception:
@@ -315,40 +708,111 @@ Return only the search queries, one per line, without numbering or explanation."
         scraped_content: list[ScrapedContent],
         additional_context: str,
         trends_data: TrendsData | None = None,
+        budget: ResearchBudget | None = None,
     ) -> str:
         """Synthesize research data into a summary.
 
+        In map_reduce mode, notes are first taken on every page
+        concurrently and the summary is written from the notes.
+
         Args:
             topic: Research topic.
             search_results: Search results.
             scraped_content: Scraped web content.
             additional_context: Additional context.
             trends_data: Optional Google Trends data.
+            budget: Research budget charged with every call, including notes.
 
         Returns:
             Synthesized research summary.
         """
-        # Prepare context from search results
-        search_context = self.search_tool.format_results_for_llm(search_results[:10])
+        notes = None
+        if self.settings.research.synthesis_mode == "map_reduce":
+            notes = self._take_notes(scraped_content, budget)
+
+        with self._track(budget):
+            return self._generate(
+                self._synthesis_prompt(
+                    topic, search_results, scraped_content, additional_context, trends_data, notes
+                ),
+                system_prompt=self.settings.prompts.research_system,
+                phase="synthesis",
+            )
 
-        # Prepare context from scraped content
-        scraped_context = "\n\n".join(
-            f"**Source: {c.title}** ({c.url})\n{c.content[:2000]}..."
-            for c in scraped_content
-            if c.success
-        )
+    async def _asynthesize_research(
+        self,
+        topic: str,
+        search_results: list[SearchResult],
+        scraped_content: list[ScrapedContent],
+        additional_context: str,
+        trends_data: TrendsData | None = None,
+        budget: ResearchBudget | None = None,
+    ) -> str:
+        """Synthesize research asynchronously."""
+        notes = None
+        if self.settings.research.synthesis_mode == "map_reduce":
+            notes = await self._atake_notes(scraped_content, budget)
+
+        with self._track(budget):
+            return await self._agenerate(
+                self._synthesis_prompt(
+                    topic, search_results, scraped_content, additional_context, trends_data, notes
+                ),
+                system_prompt=self.settings.prompts.research_system,
+                phase="synthesis",
+            )
 
-        # Prepare trends context
-        trends_context = ""
-        if trends_data and trends_data.interest_score > 0:
-            trends_context = trends_data.to_research_context()
+    @staticmethod
+    def _track(budget: ResearchBudget | None) -> AbstractContextManager[None]:
+        """Charge the calls made inside the block to the budget, if there is one."""
+        return budget.track() if budget is not None else nullcontext()
+
+    def _synthesis_prompt(
+        self,
+        topic: str,
+        search_results: list[SearchResult],
+        scraped_content: list[ScrapedContent],
+        additional_context: str,
+        trends_data: TrendsData | None,
+        notes: str | None,
+    ) -> str:
+        """Build the prompt that writes the research summary.
+
+        Args:
+            topic: Research topic.
+            search_results: Search results.
+            scraped_content: Scraped web content.
+            additional_context: Additional context.
+            trends_data: Optional Google Trends data.
+            notes: Notes taken on the pages (the start of each page is used
+                if None).
+
+        Returns:
+            Synthesis prompt.
+        """
+        # Prepare context from search results
+        search_context = self.search_tool.format_results_for_llm(search_results[:10])
 
         prompt = RESEARCH_PROMPT.format(
             topic=topic,
             additional_context=additional_context or "No additional context provided.",
         )
 
-        full_prompt = f"""{prompt}
+        if notes is not None:
+            full_prompt = f"""{prompt}
+
+## Search Results:
+{search_context}
+
+## Source Notes:
+{notes}"""
+        else:
+            scraped_context = "\n\n".join(
+                f"**Source: {c.title}** ({c.url})\n{c.content[:2000]}..."
+                for c in scraped_content
+                if c.success
+            )
+            full_prompt = f"""{prompt}
 
 ## Search Results:
 {search_context}
@@ -356,52 +820,186 @@ Return only the search queries, one per line, without numbering or explanation."
 ## Scraped Content:
 {scraped_context}"""
 
-        if trends_context:
+        if trends_data and trends_data.interest_score > 0:
             full_prompt += f"""
 
 ## Google Trends Insights:
-{trends_context}
+{trends_data.to_research_context()}
 
 Use these trending queries and topics to ensure the content covers what readers are actively searching for."""
 
-        return self._generate(
-            full_prompt,
-            system_prompt=self.settings.prompts.research_system,
-        )
+        return full_prompt
 
-    async def _asynthesize_research(
-        self,
-        topic: str,
-        search_results: list[SearchResult],
-        scraped_content: list[ScrapedContent],
-        additional_context: str,
-    ) -> str:
-        """Synthesize research asynchronously."""
-        search_context = self.search_tool.format_results_for_llm(search_results[:10])
+    def _note_chunks(
+        self, scraped_content: list[ScrapedContent]
+    ) -> list[tuple[ScrapedContent, str]]:
+        """Split the scraped pages into the chunks notes are taken on.
 
-        scraped_context = "\n\n".join(
-            f"**Source: {c.title}** ({c.url})\n{c.content[:2000]}..."
-            for c in scraped_content
-            if c.success
-        )
+        At most notes_max_chunks chunks are kept. They are shared out a
+        chunk at a time in page order, so every page keeps its opening and
+        the ends of the longest pages are left out.
 
-        prompt = RESEARCH_PROMPT.format(
-            topic=topic,
-            additional_context=additional_context or "No additional context provided.",
+        Args:
+            scraped_content: Scraped pages; failed ones are skipped.
+
+        Returns:
+            (page, chunk) pairs in page order.
+        """
+        max_chars = self.settings.research.notes_chunk_tokens * CHARS_PER_TOKEN
+        by_page: list[list[tuple[ScrapedContent, str]]] = []
+        for page in scraped_content:
+            if not (page.success and page.content.strip()):
+                continue
+            chunks: list[tuple[ScrapedContent, str]] = []
+            by_page.append(chunks)
+            current = ""
+            for line in page.content.splitlines():
+                # Paragraphs longer than a chunk are cut mid-way
+                while len(line) > max_chars:
+                    if current:
+                        chunks.append((page, current))
+                        current = ""
+                    chunks.append((page, line[:max_chars]))
+                    line = line[max_chars:]
+                if current and len(current) + len(line) + 1 > max_chars:
+                    chunks.append((page, current))
+                    current = ""
+                current = f"{current}\n{line}" if current else line
+            if current.strip():
+                chunks.append((page, current))
+
+        max_chunks = self.settings.research.notes_max_chunks
+        total = sum(len(chunks) for chunks in by_page)
+        if total <= max_chunks:
+            return [chunk for chunks in by_page for chunk in chunks]
+        # Give every page its next chunk in turn until the cap is reached
+        per_page = [0] * len(by_page)
+        kept = 0
+        while kept < max_chunks:
+            for index, chunks in enumerate(by_page):
+                if kept < max_chunks and per_page[index] < len(chunks):
+                    per_page[index] += 1
+                    kept += 1
+        self.log(f"   Taking notes on {max_chunks} of {total} chunks, leaving out page ends")
+        return [chunk for count, chunks in zip(per_page, by_page) for chunk in chunks[:count]]
+
+    def _notes_request(self, page: ScrapedContent, chunk: str) -> tuple[str, str | None]:
+        """Get the note-taking prompt of a chunk and its cache key (None without cache)."""
+        prompt = PAGE_NOTES_PROMPT.format(title=page.title, url=page.url, content=chunk)
+        if self.notes_cache is None:
+            return prompt, None
+        key = self.notes_cache.key(page.url, chunk, self.settings.llm.model, PAGE_NOTES_PROMPT)
+        return prompt, key
+
+    def _chunk_notes(
+        self, page: ScrapedContent, chunk: str, budget: ResearchBudget | None = None
+    ) -> str:
+        """Take notes on one chunk of a page, or reuse cached ones."""
+        prompt, key = self._notes_request(page, chunk)
+        if key is not None and self.notes_cache is not None:
+            cached = self.notes_cache.get(key)
+            if cached is not None:
+                return cached
+        if budget is not None and budget.exhausted():
+            self.log(f"   ⏱️ Research budget used up, using the text of {page.url}")
+            return chunk[:2000]
+        try:
+            with self._track(budget):
+                notes = self._generate(prompt, phase="notes")
+        except Exception as e:
+            self.log(f"   ⚠️ Notes on {page.url} failed, using its text: {e}")
+            return chunk[:2000]
+        if key is not None and self.notes_cache is not None:
+            self.notes_cache.put(key, notes)
+        return notes
+
+    async def _achunk_notes(
+        self, page: ScrapedContent, chunk: str, budget: ResearchBudget | None = None
+    ) -> str:
+        """Take notes on one chunk of a page asynchronously, or reuse cached ones."""
+        prompt, key = self._notes_request(page, chunk)
+        if key is not None and self.notes_cache is not None:
+            cached = await asyncio.to_thread(self.notes_cache.get, key)
+            if cached is not None:
+                return cached
+        if budget is not None and budget.exhausted():
+            self.log(f"   ⏱️ Research budget used up, using the text of {page.url}")
+            return chunk[:2000]
+        try:
+            with self._track(budget):
+                notes = await self._agenerate(prompt, phase="notes")
+        except Exception as e:
+            self.log(f"   ⚠️ Notes on {page.url} failed, using its text: {e}")
+            return chunk[:2000]
+        if key is not None and self.notes_cache is not None:
+            await asyncio.to_thread(self.notes_cache.put, key, notes)
+        return notes
+
+    @staticmethod
+    def _join_notes(chunks: list[tuple[ScrapedContent, str]], notes: list[str]) -> str:
+        """Group the notes of each chunk under their page."""
+        by_page: dict[str, list[str]] = {}
+        titles: dict[str, str] = {}
+        for (page, _), page_notes in zip(chunks, notes, strict=True):
+            by_page.setdefault(page.url, []).append(page_notes.strip())
+            titles[page.url] = page.title
+        return "\n\n".join(
+            f"**Source: {titles[url]}** ({url})\n" + "\n\n".join(parts)
+            for url, parts in by_page.items()
         )
 
-        full_prompt = f"""{prompt}
+    def _take_notes(
+        self, scraped_content: list[ScrapedContent], budget: ResearchBudget | None = None
+    ) -> str:
+        """Take notes on every scraped page concurrently (the map step).
 
-## Search Results:
-{search_context}
+        Args:
+            scraped_content: Scraped pages.
+            budget: Research budget; once it is used up, chunks are passed
+                on as text instead of being summarized.
 
-## Scraped Content:
-{scraped_context}"""
+        Returns:
+            Notes of all pages, grouped by page.
+        """
+        chunks = self._note_chunks(scraped_content)
+        if not chunks:
+            return ""
+        self.log(f"🗒️ Taking notes on {len(chunks)} chunks of scraped pages...")
+        workers = min(self.settings.research.notes_concurrency, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notes") as pool:
+            # Each call runs in a copy of this context so its usage is recorded
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._chunk_notes, page, chunk, budget)
+                for page, chunk in chunks
+            ]
+            notes = [future.result() for future in futures]
+        return self._join_notes(chunks, notes)
 
-        return await self._agenerate(
-            full_prompt,
-            system_prompt=self.settings.prompts.research_system,
-        )
+    async def _atake_notes(
+        self, scraped_content: list[ScrapedContent], budget: ResearchBudget | None = None
+    ) -> str:
+        """Take notes on every scraped page concurrently (the map step).
+
+        Args:
+            scraped_content: Scraped pages.
+            budget: Research budget; once it is used up, chunks are passed
+                on as text instead of being summarized.
+
+        Returns:
+            Notes of all pages, grouped by page.
+        """
+        chunks = self._note_chunks(scraped_content)
+        if not chunks:
+            return ""
+        self.log(f"🗒️ Taking notes on {len(chunks)} chunks of scraped pages...")
+        limit = asyncio.Semaphore(self.settings.research.notes_concurrency)
+
+        async def bounded(page: ScrapedContent, chunk: str) -> str:
+            async with limit:
+                return await self._achunk_notes(page, chunk, budget)
+
+        notes = await asyncio.gather(*(bounded(page, chunk) for page, chunk in chunks))
+        return self._join_notes(chunks, list(notes))
 
     def _extract_sources(
         self,
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -13,12 +15,16 @@ from pencraft.config.defaults import AI_DETECTOR_BLACKLIST
 from pencraft.llm.prompts import (
     CONCLUSION_PROMPT,
     INTRODUCTION_PROMPT,
+    OUTLINE_SECTION_PROMPT,
     SECTION_PROMPT,
+    TRANSITION_PROMPT,
 )
+from pencraft.llm.usage import collect_usage
 
 if TYPE_CHECKING:
     from pencraft.config.settings import Settings
     from pencraft.llm.client import LLMClient
+    from pencraft.tools.research_index import ResearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +83,10 @@ class WriterAgent(BaseAgent):
         research_summary: str,
         *,
         sources: list[dict[str, Any]] | None = None,
+        research_index: ResearchIndex | None = None,
         _style_notes: str = "",
+        completed_sections: dict[str, str] | None = None,
+        on_section: Callable[[str, str], None] | None = None,
     ) -> AgentResult:
         """Write a complete blog post.
 
@@ -85,7 +94,12 @@ class WriterAgent(BaseAgent):
             outline: Blog outline to follow.
             research_summary: Research data to incorporate.
             sources: Source citations to include.
+            research_index: Passages each section retrieves its research notes
+                from (research_summary is used without one).
             style_notes: Additional style guidance.
+            completed_sections: Parts written by an earlier run, keyed by
+                "introduction", "conclusion" or section title; these are reused.
+            on_section: Called with (key, content) after each part is written.
 
         Returns:
             AgentResult with BlogPost in metadata.
@@ -94,6 +108,7 @@ class WriterAgent(BaseAgent):
             self.log(f"Writing blog post: {outline.title} ({outline.layout_type} layout)")
 
             sources = sources or []
+            completed = completed_sections or {}
             sections: dict[str, str] = {}
             content_parts: list[str] = []
 
@@ -102,34 +117,49 @@ class WriterAgent(BaseAgent):
             words_per_section = outline.target_word_count // num_sections
 
             # Write introduction
-            self.log("Writing introduction...")
-            intro = self._write_introduction(outline, words_per_section)
-            self._check_style(intro, "Introduction")
+            intro = completed.get("introduction")
+            if intro is None:
+                self.log("Writing introduction...")
+                intro = self._write_introduction(outline, words_per_section)
+                self._check_style(intro, "Introduction")
+                if on_section:
+                    on_section("introduction", intro)
             sections["introduction"] = intro
             content_parts.append(intro)
 
             # Write each section
             previous_content = intro
             for i, section in enumerate(outline.sections):
-                self.log(f"Writing section {i + 1}/{len(outline.sections)}: {section.title}")
-
-                section_content = self._write_section(
-                    outline=outline,
-                    section=section,
-                    research_summary=research_summary,
-                    previous_content=previous_content,
-                    target_words=words_per_section,
-                )
-                self._check_style(section_content, f"Section: {section.title}")
+                section_content = completed.get(section.title)
+                if section_content is None:
+                    self.log(f"Writing section {i + 1}/{len(outline.sections)}: {section.title}")
+
+                    section_content = self._write_section(
+                        outline=outline,
+                        section=section,
+                        research_summary=research_summary,
+                        previous_content=previous_content,
+                        target_words=words_per_section,
+                        research_index=research_index,
+                    )
+                    self._check_style(section_content, f"Section: {section.title}")
+                    if on_section:
+                        on_section(section.title, section_content)
+                else:
+                    self.log(f"Reusing section {i + 1}/{len(outline.sections)}: {section.title}")
 
                 sections[section.title] = section_content
                 content_parts.append(f"\n## {section.title}\n\n{section_content}")
                 previous_content += section_content
 
             # Write conclusion
-            self.log("Writing conclusion...")
-            conclusion = self._write_conclusion(outline, content_parts)
-            self._check_style(conclusion, "Conclusion")
+            conclusion = completed.get("conclusion")
+            if conclusion is None:
+                self.log("Writing conclusion...")
+                conclusion = self._write_conclusion(outline, content_parts)
+                self._check_style(conclusion, "Conclusion")
+                if on_section:
+                    on_section("conclusion", conclusion)
             sections["conclusion"] = conclusion
             content_parts.append(f"\n## Conclusion\n\n{conclusion}")
 
@@ -171,7 +201,13 @@ class WriterAgent(BaseAgent):
         research_summary: str,
         *,
         sources: list[dict[str, Any]] | None = None,
+        research_index: ResearchIndex | None = None,
         _style_notes: str = "",
+        parallel: bool | None = None,
+        max_concurrency: int | None = None,
+        smooth_transitions: bool | None = None,
+        completed_sections: dict[str, str] | None = None,
+        on_section: Callable[[str, str], None] | None = None,
     ) -> AgentResult:
         """Write a complete blog post asynchronously.
 
@@ -179,15 +215,44 @@ class WriterAgent(BaseAgent):
             outline: Blog outline to follow.
             research_summary: Research data to incorporate.
             sources: Source citations to include.
+            research_index: Passages each section retrieves its research notes
+                from (research_summary is used without one).
             style_notes: Additional style guidance.
+            completed_sections: Parts written by an earlier run, keyed by
+                "introduction", "conclusion" or section title; these are reused.
+            on_section: Called with (key, content) after each part is written.
+            parallel: Write all sections concurrently from the outline
+                (defaults to settings.blog.parallel_sections).
+            max_concurrency: Maximum sections written at once in parallel mode
+                (defaults to settings.blog.section_concurrency).
+            smooth_transitions: Smooth section openings after parallel writing
+                (defaults to settings.blog.smooth_transitions).
 
         Returns:
             AgentResult with BlogPost in metadata.
         """
+        blog_settings = self.settings.blog
+        if parallel is None:
+            parallel = blog_settings.parallel_sections
+        if parallel:
+            if smooth_transitions is None:
+                smooth_transitions = blog_settings.smooth_transitions
+            return await self._awrite_parallel(
+                outline,
+                research_summary,
+                sources=sources or [],
+                research_index=research_index,
+                max_concurrency=max_concurrency or blog_settings.section_concurrency,
+                smooth_transitions=smooth_transitions,
+                completed_sections=completed_sections or {},
+                on_section=on_section,
+            )
+
         try:
             self.log(f"Writing blog post async: {outline.title}")
 
             sources = sources or []
+            completed = completed_sections or {}
             sections: dict[str, str] = {}
             content_parts: list[str] = []
 
@@ -195,27 +260,40 @@ class WriterAgent(BaseAgent):
             words_per_section = outline.target_word_count // num_sections
 
             # Write introduction
-            intro = await self._awrite_introduction(outline, words_per_section)
+            intro = completed.get("introduction")
+            if intro is None:
+                intro = await self._awrite_introduction(outline, words_per_section)
+                if on_section:
+                    on_section("introduction", intro)
             sections["introduction"] = intro
             content_parts.append(intro)
 
             # Write each section
             previous_content = intro
             for section in outline.sections:
-                section_content = await self._awrite_section(
-                    outline=outline,
-                    section=section,
-                    research_summary=research_summary,
-                    previous_content=previous_content,
-                    target_words=words_per_section,
-                )
+                section_content = completed.get(section.title)
+                if section_content is None:
+                    section_content = await self._awrite_section(
+                        outline=outline,
+                        section=section,
+                        research_summary=research_summary,
+                        previous_content=previous_content,
+                        target_words=words_per_section,
+                        research_index=research_index,
+                    )
+                    if on_section:
+                        on_section(section.title, section_content)
 
                 sections[section.title] = section_content
                 content_parts.append(f"\n## {section.title}\n\n{section_content}")
                 previous_content += section_content
 
             # Write conclusion
-            conclusion = await self._awrite_conclusion(outline, content_parts)
+            conclusion = completed.get("conclusion")
+            if conclusion is None:
+                conclusion = await self._awrite_conclusion(outline, content_parts)
+                if on_section:
+                    on_section("conclusion", conclusion)
             sections["conclusion"] = conclusion
             content_parts.append(f"\n## Conclusion\n\n{conclusion}")
 
@@ -247,6 +325,326 @@ class WriterAgent(BaseAgent):
         except Exception as e:
             return self._handle_error(e, "Async writing failed")
 
+    async def _awrite_parallel(
+        self,
+        outline: BlogOutline,
+        research_summary: str,
+        *,
+        sources: list[dict[str, Any]],
+        research_index: ResearchIndex | None,
+        max_concurrency: int,
+        smooth_transitions: bool,
+        completed_sections: dict[str, str],
+        on_section: Callable[[str, str], None] | None,
+    ) -> AgentResult:
+        """Write the introduction, sections and conclusion concurrently.
+
+        Sections are written from the outline (their neighbours' titles and
+        key points) rather than the previous section's text, so they do not
+        depend on each other. An optional transition pass then rewrites each
+        section's opening paragraph against the text that precedes it.
+
+        Args:
+            outline: Blog outline to follow.
+            research_summary: Research data to incorporate.
+            sources: Source citations to include.
+            research_index: Passages each section retrieves its research notes from.
+            max_concurrency: Maximum LLM calls in flight at once.
+            smooth_transitions: Whether to run the transition pass.
+            completed_sections: Finished parts to reuse, keyed like BlogPost.sections.
+            on_section: Called with (key, content) once a part is final.
+
+        Returns:
+            AgentResult with BlogPost and timing information in metadata.
+        """
+        try:
+            self.log(
+                f"Writing blog post in parallel: {outline.title} "
+                f"({len(outline.sections)} sections, concurrency {max_concurrency})"
+            )
+
+            num_sections = len(outline.sections) + 2
+            words_per_section = outline.target_word_count // num_sections
+            semaphore = asyncio.Semaphore(max_concurrency)
+            completed = completed_sections
+
+            async def bounded(
+                key: str, final: bool, write: Callable[..., Awaitable[str]], *args: Any
+            ) -> str:
+                if key in completed:
+                    return completed[key]
+                async with semaphore:
+                    content = await write(*args)
+                if final and on_section:
+                    on_section(key, content)
+                return content
+
+            # Section drafts are final unless the transition pass rewrites them
+            drafts_final = not smooth_transitions
+            start = time.monotonic()
+            with collect_usage() as usage:
+                intro, conclusion, *bodies = await asyncio.gather(
+                    bounded(
+                        "introduction", True, self._awrite_introduction, outline, words_per_section
+                    ),
+                    bounded("conclusion", True, self._awrite_conclusion, outline, []),
+                    *(
+                        bounded(
+                            section.title,
+                            drafts_final,
+                            self._awrite_section_from_outline,
+                            outline,
+                            index,
+                            research_summary,
+                            words_per_section,
+                            research_index,
+                        )
+                        for index, section in enumerate(outline.sections)
+                    ),
+                )
+
+                if smooth_transitions and bodies:
+                    self.log("Smoothing section transitions...")
+                    previous = [intro, *bodies[:-1]]
+                    bodies = list(
+                        await asyncio.gather(
+                            *(
+                                bounded(
+                                    section.title,
+                                    True,
+                                    self._asmooth_transition,
+                                    outline,
+                                    section,
+                                    body,
+                                    prev,
+                                )
+                                for section, body, prev in zip(
+                                    outline.sections, bodies, previous, strict=True
+                                )
+                            )
+                        )
+                    )
+            wall_time = time.monotonic() - start
+
+            for section, body in zip(outline.sections, bodies, strict=True):
+                self._check_style(body, f"Section: {section.title}")
+
+            references = ""
+            if self.settings.blog.include_citations and sources:
+                references = self._format_references(sources)
+
+            # Sections are assembled in outline order regardless of finish order
+            full_content, sections = self.assemble_content(
+                outline, intro, bodies, conclusion, references
+            )
+            word_count = len(full_content.split())
+
+            blog_post = BlogPost(
+                title=outline.title,
+                content=full_content,
+                meta_description=outline.meta_description,
+                tags=outline.tags,
+                categories=outline.categories,
+                sources=sources,
+                word_count=word_count,
+                sections=sections,
+            )
+
+            # Sequential writing would have taken roughly the summed LLM latency
+            speedup = usage.latency / wall_time if wall_time > 0 else 1.0
+            self.log(
+                f"Blog post complete: {word_count} words in {wall_time:.1f}s "
+                f"({usage.latency:.1f}s of LLM time, {speedup:.1f}x speedup)"
+            )
+
+            return AgentResult(
+                success=True,
+                content=full_content,
+                metadata={
+                    "blog_post": blog_post.to_dict(),
+                    "parallel": {
+                        "wall_time": wall_time,
+                        "sequential_time": usage.latency,
+                        "speedup": speedup,
+                        "llm_calls": len(usage.calls),
+                        "max_concurrency": max_concurrency,
+                        "smooth_transitions": smooth_transitions,
+                    },
+                },
+            )
+
+        except Exception as e:
+            return self._handle_error(e, "Parallel writing failed")
+
+    @staticmethod
+    def assemble_content(
+        outline: BlogOutline,
+        introduction: str,
+        bodies: list[str],
+        conclusion: str,
+        references: str = "",
+    ) -> tuple[str, dict[str, str]]:
+        """Join separately written parts into the post body.
+
+        Args:
+            outline: Blog outline (gives the section order and titles).
+            introduction: Introduction text.
+            bodies: Section texts in outline order.
+            conclusion: Conclusion text.
+            references: Formatted references (omitted if empty).
+
+        Returns:
+            Tuple of (full content, sections keyed by title).
+        """
+        sections: dict[str, str] = {"introduction": introduction}
+        content_parts = [introduction]
+        for section, body in zip(outline.sections, bodies, strict=True):
+            sections[section.title] = body
+            content_parts.append(f"\n## {section.title}\n\n{body}")
+
+        sections["conclusion"] = conclusion
+        content_parts.append(f"\n## Conclusion\n\n{conclusion}")
+
+        if references:
+            content_parts.append(f"\n## References\n\n{references}")
+
+        return "\n".join(content_parts), sections
+
+    @staticmethod
+    def _section_brief(section: Section) -> str:
+        """Format a section's key points and subsections for a prompt."""
+        return "\n".join(
+            [f"Key points: {', '.join(section.key_points)}"]
+            + [f"  - Subsection: {sub.title}" for sub in section.subsections]
+        )
+
+    def _research_notes(
+        self, section: Section, research_summary: str, research_index: ResearchIndex | None
+    ) -> str:
+        """Get the research notes for a section's prompt.
+
+        Args:
+            section: Section being written.
+            research_summary: Research summary (its start is the fallback).
+            research_index: Passages to search with the section's title,
+                key points and subsection titles.
+
+        Returns:
+            Research notes text.
+        """
+        if research_index is not None:
+            query = " ".join(
+                [section.title, *section.key_points, *(sub.title for sub in section.subsections)]
+            )
+            blog_settings = self.settings.blog
+            notes = research_index.notes(
+                query,
+                k=blog_settings.research_passages,
+                max_tokens=blog_settings.research_notes_tokens,
+            )
+            if notes:
+                return notes
+        return research_summary[:2000]
+
+    async def _awrite_section_from_outline(
+        self,
+        outline: BlogOutline,
+        index: int,
+        research_summary: str,
+        target_words: int,
+        research_index: ResearchIndex | None = None,
+    ) -> str:
+        """Write a section using only the outline for context.
+
+        Args:
+            outline: Full blog outline.
+            index: Index of the section to write.
+            research_summary: Research data.
+            target_words: Target word count.
+            research_index: Passages to retrieve the section's research notes from.
+
+        Returns:
+            Section content.
+        """
+        section = outline.sections[index]
+
+        position = []
+        if index > 0:
+            prev = outline.sections[index - 1]
+            position.append(f"Previous section: {prev.title} ({', '.join(prev.key_points[:3])})")
+        else:
+            position.append("Previous section: the introduction")
+        if index + 1 < len(outline.sections):
+            nxt = outline.sections[index + 1]
+            position.append(f"Next section: {nxt.title} ({', '.join(nxt.key_points[:3])})")
+        else:
+            position.append("Next section: the conclusion")
+
+        prompt = OUTLINE_SECTION_PROMPT.format(
+            title=outline.title,
+            section_title=section.title,
+            section_outline=self._section_brief(section),
+            position="\n".join(position),
+            research_notes=self._research_notes(section, research_summary, research_index),
+            word_count=target_words,
+        )
+
+        return await self._agenerate(
+            prompt,
+            system_prompt=self.settings.prompts.writer_system,
+            phase=f"section:{section.title}",
+        )
+
+    async def _asmooth_transition(
+        self,
+        outline: BlogOutline,
+        section: Section,
+        content: str,
+        previous_content: str,
+    ) -> str:
+        """Rewrite a section's opening paragraph to follow the text before it.
+
+        Only the opening paragraph is sent and regenerated, which keeps the
+        pass cheap. Sections that open with a heading, list or code block
+        are left as they are.
+
+        Args:
+            outline: Blog outline.
+            section: Section being smoothed.
+            content: Section content.
+            previous_content: Content that precedes the section.
+
+        Returns:
+            Section content with the rewritten opening paragraph.
+        """
+        opening, sep, rest = content.strip().partition("\n\n")
+        if not opening or opening.lstrip().startswith(("#", "-", "*", "```", ">", "|")):
+            return content
+
+        previous_ending = previous_content.strip().rsplit("\n\n", 1)[-1]
+        prompt = TRANSITION_PROMPT.format(
+            title=outline.title,
+            previous_ending=previous_ending[-800:],
+            section_title=section.title,
+            opening=opening,
+        )
+
+        try:
+            rewritten = await self._agenerate(
+                prompt,
+                system_prompt=self.settings.prompts.writer_system,
+                phase=f"transition:{section.title}",
+                max_tokens=max(200, len(opening.split()) * 3),
+            )
+        except Exception as e:
+            self.log(f"Transition pass failed for {section.title}: {e}", logging.WARNING)
+            return content
+
+        rewritten = rewritten.strip()
+        if not rewritten:
+            return content
+        return f"{rewritten}{sep}{rest}"
+
     def _write_introduction(self, outline: BlogOutline, _target_words: int) -> str:
         """Write the introduction section.
 
@@ -270,6 +668,7 @@ class WriterAgent(BaseAgent):
         return self._generate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
+            phase="introduction",
         )
 
     async def _awrite_introduction(self, outline: BlogOutline, _target_words: int) -> str:
@@ -287,6 +686,7 @@ class WriterAgent(BaseAgent):
         return await self._agenerate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
+            phase="introduction",
         )
 
     def _write_section(
@@ -296,6 +696,7 @@ class WriterAgent(BaseAgent):
         research_summary: str,
         previous_content: str,
         target_words: int,
+        research_index: ResearchIndex | None = None,
     ) -> str:
         """Write a single section.
 
@@ -305,6 +706,7 @@ class WriterAgent(BaseAgent):
             research_summary: Research data.
             previous_content: Previously written content.
             target_words: Target word count.
+            research_index: Passages to retrieve the section's research notes from.
 
         Returns:
             Section content.
@@ -324,13 +726,14 @@ class WriterAgent(BaseAgent):
             section_title=section.title,
             section_outline=section_outline,
             previous_content=prev_summary,
-            research_notes=research_summary[:2000],
+            research_notes=self._research_notes(section, research_summary, research_index),
             word_count=target_words,
         )
 
         return self._generate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
+            phase=f"section:{section.title}",
         )
 
     async def _awrite_section(
@@ -340,6 +743,7 @@ class WriterAgent(BaseAgent):
         research_summary: str,
         previous_content: str,
         target_words: int,
+        research_index: ResearchIndex | None = None,
     ) -> str:
         """Write a section asynchronously."""
         section_outline = "\n".join(
@@ -356,13 +760,14 @@ class WriterAgent(BaseAgent):
             section_title=section.title,
             section_outline=section_outline,
             previous_content=prev_summary,
-            research_notes=research_summary[:2000],
+            research_notes=self._research_notes(section, research_summary, research_index),
             word_count=target_words,
         )
 
         return await self._agenerate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
+            phase=f"section:{section.title}",
         )
 
     def _write_conclusion(self, outline: BlogOutline, _content_parts: list[str]) -> str:
@@ -387,6 +792,7 @@ class WriterAgent(BaseAgent):
         return self._generate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
+            phase="conclusion",
         )
 
     async def _awrite_conclusion(self, outline: BlogOutline, _content_parts: list[str]) -> str:
@@ -402,6 +808,7 @@ class WriterAgent(BaseAgent):
         return await self._agenerate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
+            phase="conclusion",
         )
 
     def _format_references(self, sources: list[dict[str, Any]]) -> str:
@@ -465,6 +872,7 @@ Write engaging, informative content using proper markdown formatting."""
         return self._generate(
             prompt,
             system_prompt=self.settings.prompts.writer_system,
+            phase=f"section:{section_title}",
         )
 
     def _check_style(self, content: str, section_name: str) -> None:
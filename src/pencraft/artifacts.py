@@ -0,0 +1,294 @@
+"""Checkpoint store for the intermediate outputs of a blog run."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pencraft.agents.planner import BlogOutline
+from pencraft.agents.research import ResearchData
+from pencraft.utils.cache import make_cache_key
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Research settings that change what is searched, kept or written. Limits
+# on concurrency, deadlines and request rates only change how fast a run
+# goes, so changing them must not orphan its artifacts.
+CONTENT_RESEARCH_FIELDS = (
+    "max_search_results",
+    "max_sources",
+    "search_depth",
+    "time_budget",
+    "token_budget",
+    "include_snippets",
+    "rank_results",
+    "allow_domains",
+    "deny_domains",
+    "max_results_per_domain",
+    "snippet_fast_path",
+    "coverage_skip_score",
+    "coverage_shrink_score",
+    "dedup_enabled",
+    "dedup_max_distance",
+    "scrape_candidates",
+    "scrape_max_bytes",
+    "scrape_extractor",
+    "synthesis_mode",
+    "notes_chunk_tokens",
+    "domain_selectors",
+)
+
+
+def run_key(topic: str, settings: Settings) -> str:
+    """Build the identifier of a run from its topic and content settings.
+
+    Only settings that change the generated text are included (see
+    CONTENT_RESEARCH_FIELDS), so the research, outline and write commands
+    for one topic share a run.
+
+    Args:
+        topic: Blog topic.
+        settings: Settings used for the run.
+
+    Returns:
+        Short hex digest.
+    """
+    return make_cache_key(
+        " ".join(topic.lower().split()),
+        settings.llm.model,
+        settings.llm.temperature,
+        settings.llm.max_tokens,
+        settings.research.model_dump(include=set(CONTENT_RESEARCH_FIELDS)),
+        settings.prompts.model_dump(),
+    )[:16]
+
+
+class ArtifactStore:
+    """Persists research, outline, sections and frontmatter of one run.
+
+    Every artifact is a JSON file written atomically, so a run that dies
+    part-way leaves the completed steps intact. Artifacts record the inputs
+    they were built from and are only handed back when those still match:
+    an outline for another word count, or sections written against another
+    outline, are ignored. Nothing is written to disk until the first
+    artifact is saved.
+    """
+
+    def __init__(self, run_dir: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            run_dir: Directory holding the run's artifacts.
+        """
+        self.run_dir = Path(run_dir)
+        self.topic: str | None = None
+
+    @classmethod
+    def for_run(cls, topic: str, settings: Settings) -> ArtifactStore:
+        """Get the store of a topic under ``<cache.directory>/runs``.
+
+        Runs not written to for cache.artifacts_max_age_days are deleted.
+
+        Args:
+            topic: Blog topic.
+            settings: Settings used for the run.
+
+        Returns:
+            ArtifactStore for the run.
+        """
+        slug = re.sub(r"[^a-z0-9]+", "-", topic.lower()).strip("-")[:50] or "run"
+        base_dir = Path(settings.cache.directory).expanduser() / "runs"
+        cls.prune(base_dir, settings.cache.artifacts_max_age_days * 86400)
+        store = cls(base_dir / f"{slug}-{run_key(topic, settings)}")
+        store.topic = topic
+        return store
+
+    @staticmethod
+    def prune(base_dir: Path, max_age: float) -> int:
+        """Delete runs whose artifacts were all written more than max_age ago.
+
+        Args:
+            base_dir: Directory holding one subdirectory per run.
+            max_age: Age in seconds.
+
+        Returns:
+            Number of runs deleted.
+        """
+        if not base_dir.is_dir():
+            return 0
+
+        cutoff = time.time() - max_age
+        deleted = 0
+        for run_dir in base_dir.iterdir():
+            if not run_dir.is_dir():
+                continue
+            try:
+                newest = max(
+                    (p.stat().st_mtime for p in run_dir.rglob("*")), default=run_dir.stat().st_mtime
+                )
+                if newest < cutoff:
+                    shutil.rmtree(run_dir)
+                    deleted += 1
+            except OSError as e:
+                logger.warning(f"Could not prune run artifacts in {run_dir}: {e}")
+        if deleted:
+            logger.info(f"Deleted {deleted} expired runs from {base_dir}")
+        return deleted
+
+    def _write(self, name: str, data: dict[str, Any]) -> None:
+        """Atomically write a JSON artifact."""
+        if self.topic is not None and not (self.run_dir / "run.json").exists():
+            self._write_file("run.json", {"topic": self.topic})
+        self._write_file(name, data)
+
+    def _write_file(self, name: str, data: dict[str, Any]) -> None:
+        """Atomically write one JSON file of the run."""
+        path = self.run_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {**data, "saved_at": datetime.now(timezone.utc).isoformat()}
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _read(self, name: str) -> dict[str, Any] | None:
+        """Read a JSON artifact, or None if it is missing or unreadable."""
+        path = self.run_dir / name
+        if not path.exists():
+            return None
+        try:
+            data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+            return data
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable artifact {path}: {e}")
+            return None
+
+    def save_research(self, research: ResearchData, additional_context: str = "") -> None:
+        """Save research data.
+
+        Args:
+            research: Research data.
+            additional_context: Extra context the research was run with.
+        """
+        self._write(
+            "research.json",
+            {"additional_context": additional_context, "research": research.to_dict()},
+        )
+
+    def load_research(self, additional_context: str | None = None) -> ResearchData | None:
+        """Load research data.
+
+        Args:
+            additional_context: Required context, or None to accept any.
+
+        Returns:
+            ResearchData, or None if missing or built from other context.
+        """
+        data = self._read("research.json")
+        if data is None:
+            return None
+        if additional_context is not None and data.get("additional_context") != additional_context:
+            return None
+        return ResearchData.from_dict(data["research"])
+
+    def save_outline(self, outline: BlogOutline) -> None:
+        """Save a blog outline.
+
+        Args:
+            outline: Outline to save.
+        """
+        self._write("outline.json", {"outline": outline.to_dict()})
+
+    def load_outline(self, target_word_count: int | None = None) -> BlogOutline | None:
+        """Load the blog outline.
+
+        Args:
+            target_word_count: Required word count, or None to accept any.
+
+        Returns:
+            BlogOutline, or None if missing or planned for another length.
+        """
+        data = self._read("outline.json")
+        if data is None:
+            return None
+        outline = BlogOutline.from_dict(data["outline"])
+        if target_word_count is not None and outline.target_word_count != target_word_count:
+            return None
+        return outline
+
+    @staticmethod
+    def outline_key(outline: BlogOutline) -> str:
+        """Fingerprint an outline so sections can be matched to it."""
+        return make_cache_key(outline.to_dict())[:16]
+
+    def save_section(self, outline: BlogOutline, key: str, content: str) -> None:
+        """Save a written part of the post.
+
+        Args:
+            outline: Outline the part was written for.
+            key: "introduction", "conclusion" or the section title.
+            content: Written content.
+        """
+        self._write(
+            f"sections/{make_cache_key(key)[:16]}.json",
+            {"outline": self.outline_key(outline), "key": key, "content": content},
+        )
+
+    def load_sections(self, outline: BlogOutline) -> dict[str, str]:
+        """Load the parts already written for an outline.
+
+        Args:
+            outline: Outline of the run.
+
+        Returns:
+            Written content keyed by "introduction", "conclusion" or section title.
+        """
+        sections_dir = self.run_dir / "sections"
+        if not sections_dir.is_dir():
+            return {}
+
+        fingerprint = self.outline_key(outline)
+        sections: dict[str, str] = {}
+        for path in sorted(sections_dir.glob("*.json")):
+            data = self._read(f"sections/{path.name}")
+            if data is not None and data.get("outline") == fingerprint:
+                sections[data["key"]] = data["content"]
+        return sections
+
+    def save_frontmatter(self, frontmatter: str, params: dict[str, Any]) -> None:
+        """Save generated frontmatter.
+
+        Args:
+            frontmatter: Frontmatter text.
+            params: Inputs it was generated from (title, tags, author, ...).
+        """
+        self._write(
+            "frontmatter.json",
+            {"params": make_cache_key(params), "frontmatter": frontmatter},
+        )
+
+    def load_frontmatter(self, params: dict[str, Any]) -> str | None:
+        """Load frontmatter generated from the same inputs.
+
+        Keeps the post date stable when a run is resumed.
+
+        Args:
+            params: Inputs the frontmatter would be generated from.
+
+        Returns:
+            Frontmatter text, or None if missing or built from other inputs.
+        """
+        data = self._read("frontmatter.json")
+        if data is None or data.get("params") != make_cache_key(params):
+            return None
+        frontmatter: str = data["frontmatter"]
+        return frontmatter
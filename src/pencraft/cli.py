@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
@@ -11,6 +12,9 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from pencraft.llm.usage import UsageSummary
+
 app = typer.Typer(
     name="pencraft",
     help="AI-powered blog writing toolkit",
@@ -30,6 +34,48 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def print_usage(usage: UsageSummary | None) -> None:
+    """Print per-phase LLM token usage and latency."""
+    if usage is None or not usage.calls:
+        return
+
+    table = Table(title="LLM Usage", show_header=True)
+    table.add_column("Agent", style="cyan")
+    table.add_column("Phase")
+    table.add_column("Calls", justify="right")
+    table.add_column("Prompt", justify="right")
+    table.add_column("Completion", justify="right")
+    table.add_column("Latency", justify="right", style="yellow")
+    table.add_column("TTFT", justify="right")
+
+    for phase in usage.by_phase():
+        calls = str(phase.calls)
+        if phase.cached_calls:
+            calls += f" ({phase.cached_calls} cached)"
+        ttft = phase.time_to_first_token
+        table.add_row(
+            phase.agent or "-",
+            phase.phase or "-",
+            calls,
+            str(phase.prompt_tokens),
+            str(phase.completion_tokens),
+            f"{phase.latency:.2f}s",
+            f"{ttft:.2f}s" if ttft is not None else "-",
+        )
+
+    table.add_row(
+        "[bold]Total[/bold]",
+        "",
+        str(len(usage.calls)),
+        str(usage.prompt_tokens),
+        str(usage.completion_tokens),
+        f"{usage.latency:.2f}s",
+        "",
+    )
+    console.print()
+    console.print(table)
+
+
 @app.callback()
 def main(
     version: Annotated[
@@ -85,6 +131,14 @@ def write(
         str | None,
         typer.Option("--cover-image", help="Cover image URL"),
     ] = None,
+    parallel: Annotated[
+        bool,
+        typer.Option("--parallel", help="Write sections concurrently"),
+    ] = False,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Reuse research, outline and sections from an earlier run"),
+    ] = False,
     config_file: Annotated[
         Path | None,
         typer.Option("--config", help="Path to config file"),
@@ -116,6 +170,8 @@ def write(
 
     # Load settings
     settings = load_settings(config_file=config_file, verbose=verbose, debug=debug)
+    if parallel:
+        settings.blog.parallel_sections = True
 
     console.print(
         Panel(
@@ -143,17 +199,20 @@ def write(
                 """Update spinner description."""
                 progress.update(task, description=msg)
 
-            blog = generator.generate(
-                topic=topic,
-                target_word_count=words,
-                tags=tag_list,
-                categories=category_list,
-                author=author,
-                draft=draft,
-                output_dir=output,
-                skip_research=skip_research,
-                cover_image=cover_image,
-                progress_callback=update_spinner,
+            blog = asyncio.run(
+                generator.agenerate(
+                    topic=topic,
+                    target_word_count=words,
+                    tags=tag_list,
+                    categories=category_list,
+                    author=author,
+                    draft=draft,
+                    output_dir=output,
+                    skip_research=skip_research,
+                    cover_image=cover_image,
+                    progress_callback=update_spinner,
+                    resume=resume,
+                )
             )
 
             progress.update(task, completed=True)
@@ -175,6 +234,74 @@ def write(
         if blog.sources:
             console.print(f"\n[dim]Sources used: {len(blog.sources)}[/dim]")
 
+        if blog.pipeline is not None:
+            path = " → ".join(
+                f"{t.name} ({t.duration:.1f}s)" for t in blog.pipeline.critical_path()
+            )
+            console.print(f"[dim]Critical path: {path}[/dim]")
+
+        if blog.parallel is not None:
+            console.print(
+                f"[dim]Parallel sections: {blog.parallel['speedup']:.1f}x speedup "
+                f"({blog.parallel['sequential_time']:.1f}s of writing in "
+                f"{blog.parallel['wall_time']:.1f}s)[/dim]"
+            )
+
+        print_usage(blog.usage)
+
+        if generator.llm.cache is not None:
+            stats = generator.llm.cache.stats
+            console.print(
+                f"[dim]LLM cache: {stats.hits} hits, {stats.misses} misses "
+                f"({stats.tokens_saved} tokens, {stats.seconds_saved:.1f}s saved)[/dim]"
+            )
+
+        search_tool = generator.research_agent.search_tool
+        if search_tool.cache is not None:
+            search_stats = search_tool.cache.stats
+            console.print(
+                f"[dim]Search cache: {search_stats.hits} hits, {search_stats.misses} misses, "
+                f"{search_tool.coalesced} coalesced[/dim]"
+            )
+
+        trends_cache = generator.research_agent.trends_tool.cache
+        if trends_cache is not None and (trends_cache.stats.hits or trends_cache.stats.misses):
+            console.print(
+                f"[dim]Trends cache: {trends_cache.stats.hits} hits, "
+                f"{trends_cache.stats.misses} misses[/dim]"
+            )
+
+        trends_scheduler = generator.research_agent.trends_tool.scheduler
+        if trends_scheduler is not None and trends_scheduler.stats.requests:
+            trends_stats = trends_scheduler.stats
+            console.print(
+                f"[dim]Google Trends: {trends_stats.requests} requests, "
+                f"{trends_stats.throttled} throttled, "
+                f"{trends_stats.abandoned} abandoned, "
+                f"now {trends_scheduler.rate:.0f} requests/min[/dim]"
+            )
+
+        notes_cache = generator.research_agent.notes_cache
+        if notes_cache is not None and (notes_cache.stats.hits or notes_cache.stats.misses):
+            console.print(
+                f"[dim]Notes cache: {notes_cache.stats.hits} hits, "
+                f"{notes_cache.stats.misses} misses[/dim]"
+            )
+
+        scraper = generator.research_agent.scraper
+        if scraper.cache is not None:
+            page_stats = scraper.cache.stats
+            console.print(
+                f"[dim]Page cache: {page_stats.hits} hits, {page_stats.revalidated} revalidated, "
+                f"{page_stats.misses} misses, {page_stats.negative_hits} skipped failures[/dim]"
+            )
+        rule_stats = scraper.domain_rules.stats if scraper.domain_rules is not None else None
+        if rule_stats is not None and (rule_stats.fast_path or rule_stats.learned):
+            console.print(
+                f"[dim]Domain rules: {rule_stats.fast_path} pages on the fast path, "
+                f"{rule_stats.learned} learned, {rule_stats.invalidated} invalidated[/dim]"
+            )
+
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(code=1) from e
@@ -344,6 +471,8 @@ def show_config(
         table.add_row("LLM Model", settings.llm.model)
         table.add_row("LLM Temperature", str(settings.llm.temperature))
         table.add_row("LLM Max Tokens", str(settings.llm.max_tokens))
+        table.add_row("LLM Extra Endpoints", str(len(settings.llm.endpoints)))
+        table.add_row("LLM Cache", str(settings.cache.llm_enabled))
 
         table.add_row("", "")  # Spacer
 
@@ -472,6 +601,7 @@ def enhance(
                     border_style="green",
                 )
             )
+            print_usage(result.usage)
 
         else:
             # Directory enhancement
@@ -523,6 +653,10 @@ def enhance(
             )
             console.print(f"[bold]Total words:[/bold] {total_before} → {total_after}")
 
+            from pencraft.llm.usage import UsageSummary
+
+            print_usage(UsageSummary.merge(r.usage for r in results))
+
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(code=1) from e
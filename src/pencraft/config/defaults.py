@@ -15,6 +15,10 @@ DEFAULT_LLM_MAX_TOKENS = 4096
 DEFAULT_MAX_SEARCH_RESULTS = 10
 DEFAULT_MAX_SOURCES = 5
 DEFAULT_SEARCH_DEPTH = 2
+DEFAULT_SEARCH_CONCURRENCY = 4
+
+# Default cache settings
+DEFAULT_CACHE_DIR = "~/.cache/pencraft"
 
 # Default output settings
 DEFAULT_OUTPUT_DIR = "./output"
@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from pencraft.config.defaults import (
+    DEFAULT_CACHE_DIR,
     DEFAULT_FRONTMATTER_TEMPLATE,
     DEFAULT_HUGO_FRONTMATTER_FORMAT,
     DEFAULT_LLM_BASE_URL,
@@ -24,11 +25,42 @@ from pencraft.config.defaults import (
     DEFAULT_OUTPUT_FORMAT,
     DEFAULT_PLANNER_SYSTEM_PROMPT,
     DEFAULT_RESEARCH_SYSTEM_PROMPT,
+    DEFAULT_SEARCH_CONCURRENCY,
     DEFAULT_SEARCH_DEPTH,
     DEFAULT_WRITER_SYSTEM_PROMPT,
 )
 
 
+class EndpointSettings(BaseModel):
+    """An additional OpenAI-compatible endpoint in the LLM pool."""
+
+    base_url: str = Field(
+        description="Base URL for the OpenAI-compatible API endpoint",
+    )
+    api_key: str | None = Field(
+        default=None,
+        description="API key for this endpoint (defaults to llm.api_key)",
+    )
+    model: str | None = Field(
+        default=None,
+        description="Model served by this endpoint (defaults to the requested model)",
+    )
+    weight: float = Field(
+        default=1.0,
+        gt=0,
+        description="Relative capacity used when balancing load",
+    )
+    max_in_flight: int | None = Field(
+        default=None,
+        gt=0,
+        description="In-flight requests at which the endpoint counts as saturated",
+    )
+    fallback: bool = Field(
+        default=False,
+        description="Only use this endpoint when every primary endpoint is saturated or down",
+    )
+
+
 class LLMSettings(BaseModel):
     """Settings for the LLM client."""
 
@@ -65,6 +97,61 @@ class LLMSettings(BaseModel):
         ge=0,
         description="Maximum number of retries for failed requests",
     )
+    requests_per_minute: int | None = Field(
+        default=None,
+        gt=0,
+        description="Maximum requests per minute to the endpoint (process-wide)",
+    )
+    tokens_per_minute: int | None = Field(
+        default=None,
+        gt=0,
+        description="Maximum prompt+completion tokens per minute (process-wide)",
+    )
+    max_concurrent_requests: int | None = Field(
+        default=None,
+        gt=0,
+        description="Maximum requests in flight to the endpoint (process-wide)",
+    )
+    max_in_flight: int | None = Field(
+        default=None,
+        gt=0,
+        description="In-flight requests at which base_url counts as saturated in the pool",
+    )
+    endpoints: list[EndpointSettings] = Field(
+        default_factory=list,
+        description="Additional endpoints pooled with base_url",
+    )
+    unhealthy_after: int = Field(
+        default=3,
+        gt=0,
+        description="Consecutive failures before an endpoint is taken out of rotation",
+    )
+    probe_interval: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds before an unhealthy endpoint is probed again",
+    )
+    hedge_enabled: bool = Field(
+        default=False,
+        description="Send a duplicate async request to another endpoint when one stalls",
+    )
+    hedge_percentile: float = Field(
+        default=95.0,
+        gt=0,
+        lt=100,
+        description="Latency percentile of recent requests after which a hedge is sent",
+    )
+    hedge_budget: float = Field(
+        default=0.05,
+        ge=0,
+        le=1,
+        description="Maximum hedged requests as a fraction of all requests",
+    )
+    hedge_min_delay: float = Field(
+        default=1.0,
+        ge=0,
+        description="Minimum seconds to wait before hedging a request",
+    )
 
 
 class ResearchSettings(BaseModel):
@@ -84,12 +171,252 @@ class ResearchSettings(BaseModel):
         default=DEFAULT_SEARCH_DEPTH,
         ge=1,
         le=5,
-        description="Depth of search (1-5, higher = more thorough)",
+        description="Search rounds (1-5); rounds after the first search for gaps in the results",
+    )
+    time_budget: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds of research per topic before follow-up rounds and scraping stop",
+    )
+    token_budget: int | None = Field(
+        default=None,
+        gt=0,
+        description="LLM tokens of research per topic before follow-up rounds stop",
+    )
+    trends_deadline: float | None = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds research waits for Google Trends data before going on without it",
+    )
+    trends_requests_per_minute: float = Field(
+        default=60.0,
+        gt=0,
+        description="Starting Google Trends request rate, halved on each 429 response",
+    )
+    trends_max_requests_per_minute: float = Field(
+        default=120.0,
+        gt=0,
+        description="Highest Google Trends request rate reached after successful requests",
     )
     include_snippets: bool = Field(
         default=True,
         description="Include text snippets from sources",
     )
+    search_concurrency: int = Field(
+        default=DEFAULT_SEARCH_CONCURRENCY,
+        gt=0,
+        description="Maximum number of web searches run at once",
+    )
+    rank_results: bool = Field(
+        default=True,
+        description="Rank search results by relevance (BM25) before scraping",
+    )
+    allow_domains: list[str] = Field(
+        default_factory=list,
+        description="Domains whose results are ranked first (subdomains included)",
+    )
+    deny_domains: list[str] = Field(
+        default_factory=list,
+        description="Domains whose results are dropped (subdomains included)",
+    )
+    max_results_per_domain: int = Field(
+        default=2,
+        ge=0,
+        description="Ranked results per domain before the rest go last (0 = no limit)",
+    )
+    snippet_fast_path: bool = Field(
+        default=False,
+        description="Scrape fewer or no pages when search snippets already cover the topic",
+    )
+    coverage_skip_score: float = Field(
+        default=0.9,
+        ge=0.0,
+        le=1.0,
+        description="Snippet coverage score at which scraping is skipped",
+    )
+    coverage_shrink_score: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="Snippet coverage score at which half the pages are scraped",
+    )
+    dedup_enabled: bool = Field(
+        default=True,
+        description="Drop near-duplicate search results and scraped pages (SimHash)",
+    )
+    dedup_max_distance: int = Field(
+        default=10,
+        ge=0,
+        le=64,
+        description="Most fingerprint bits (of 64) in which near-duplicates differ",
+    )
+    scrape_concurrency: int = Field(
+        default=8,
+        gt=0,
+        description="Maximum number of pages scraped at once",
+    )
+    scrape_per_host: int = Field(
+        default=2,
+        gt=0,
+        description="Maximum number of pages scraped at once from one host",
+    )
+    scrape_candidates: int = Field(
+        default=6,
+        gt=0,
+        description="Search results tried to collect the pages to scrape",
+    )
+    scrape_deadline: float = Field(
+        default=20.0,
+        gt=0,
+        description="Seconds after which pages still loading are skipped",
+    )
+    scrape_max_bytes: int = Field(
+        default=2_000_000,
+        gt=0,
+        description="Stop downloading a page after this many bytes",
+    )
+    scrape_http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for scraping (requires the http2 extra)",
+    )
+    scrape_extractor: str = Field(
+        default="readability",
+        description="HTML extraction backend (readability, auto, lxml, soup)",
+    )
+    parse_workers: int = Field(
+        default=2,
+        ge=0,
+        description="Pages parsed at once off the event loop during async scraping (0 = inline)",
+    )
+    parse_pool: str = Field(
+        default="thread",
+        description="Where pages are parsed: thread or process",
+    )
+    parse_queue: int = Field(
+        default=8,
+        ge=0,
+        description="Downloaded pages that may wait for a parse worker",
+    )
+    synthesis_mode: str = Field(
+        default="single",
+        description="Research synthesis: single (one call over page excerpts) or map_reduce",
+    )
+    notes_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Pages summarized into notes at once in map_reduce synthesis",
+    )
+    notes_chunk_tokens: int = Field(
+        default=3000,
+        gt=0,
+        description="Longer pages are split into chunks of this many tokens for note taking",
+    )
+    notes_max_chunks: int = Field(
+        default=12,
+        gt=0,
+        description="Most chunks notes are taken on per topic; the ends of long pages go first",
+    )
+    domain_selectors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Main content selector per domain (e.g. {'example.com': 'div.post-body'})",
+    )
+
+    @model_validator(mode="after")
+    def check_coverage_scores(self) -> ResearchSettings:
+        """Check that shrinking the scrape starts at or below the skip score."""
+        if self.coverage_shrink_score > self.coverage_skip_score:
+            raise ValueError(
+                f"coverage_shrink_score ({self.coverage_shrink_score}) must not be above "
+                f"coverage_skip_score ({self.coverage_skip_score})"
+            )
+        return self
+
+
+class CacheSettings(BaseModel):
+    """Settings for on-disk caches."""
+
+    directory: str = Field(
+        default=DEFAULT_CACHE_DIR,
+        description="Directory holding the cache databases",
+    )
+    llm_enabled: bool = Field(
+        default=False,
+        description="Cache LLM responses keyed on the full request",
+    )
+    llm_max_size_mb: float = Field(
+        default=512.0,
+        gt=0,
+        description="Maximum size of the LLM response cache in megabytes",
+    )
+    llm_max_age_days: float = Field(
+        default=30.0,
+        gt=0,
+        description="Maximum age of cached LLM responses in days",
+    )
+    search_enabled: bool = Field(
+        default=True,
+        description="Cache web search results keyed on the normalized query",
+    )
+    search_ttl_hours: float = Field(
+        default=24.0,
+        gt=0,
+        description="Hours before cached search results expire",
+    )
+    trends_enabled: bool = Field(
+        default=True,
+        description="Cache Google Trends data keyed on the normalized search term",
+    )
+    trends_ttl_hours: float = Field(
+        default=24.0,
+        gt=0,
+        description="Hours before cached Google Trends data expires",
+    )
+    http_enabled: bool = Field(
+        default=True,
+        description="Cache scraped pages and recently failed URLs",
+    )
+    http_default_ttl_hours: float = Field(
+        default=6.0,
+        gt=0,
+        description="Hours a page without caching headers stays fresh",
+    )
+    http_negative_ttl_minutes: float = Field(
+        default=30.0,
+        gt=0,
+        description="Minutes a URL that timed out or returned an error is skipped",
+    )
+    http_max_size_mb: float = Field(
+        default=256.0,
+        gt=0,
+        description="Maximum size of the page cache in megabytes",
+    )
+    http_max_age_days: float = Field(
+        default=7.0,
+        gt=0,
+        description="Days a cached page is kept for revalidation",
+    )
+    artifacts_enabled: bool = Field(
+        default=True,
+        description="Save research, outline and sections of each run so it can be resumed",
+    )
+    artifacts_max_age_days: float = Field(
+        default=14.0,
+        gt=0,
+        description="Days after its last write before a run's saved artifacts are deleted",
+    )
+    domain_rules_enabled: bool = Field(
+        default=True,
+        description="Remember which container holds the main content on each scraped domain",
+    )
+    notes_enabled: bool = Field(
+        default=True,
+        description="Cache the notes taken on each page in map_reduce synthesis",
+    )
+    notes_ttl_days: float = Field(
+        default=30.0,
+        gt=0,
+        description="Days before cached page notes expire",
+    )
 
 
 class OutputSettings(BaseModel):
@@ -167,6 +494,29 @@ class BlogSettings(BaseModel):
         default_factory=list,
         description="Default categories for all posts",
     )
+    parallel_sections: bool = Field(
+        default=False,
+        description="Write sections concurrently from the outline (async generation only)",
+    )
+    section_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum sections written at once in parallel mode",
+    )
+    smooth_transitions: bool = Field(
+        default=True,
+        description="Run a transition-smoothing pass after parallel section writing",
+    )
+    research_passages: int = Field(
+        default=5,
+        gt=0,
+        description="Research passages retrieved for each section",
+    )
+    research_notes_tokens: int = Field(
+        default=500,
+        gt=0,
+        description="Token budget of the research passages given to each section",
+    )
 
 
 class PromptSettings(BaseModel):
@@ -199,6 +549,7 @@ class Settings(BaseSettings):
     # Nested settings
     llm: LLMSettings = Field(default_factory=LLMSettings)
     research: ResearchSettings = Field(default_factory=ResearchSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     output: OutputSettings = Field(default_factory=OutputSettings)
     hugo: HugoSettings = Field(default_factory=HugoSettings)
     blog: BlogSettings = Field(default_factory=BlogSettings)
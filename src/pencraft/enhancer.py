@@ -19,7 +19,10 @@ from pencraft.agents.enhancement_prompts import (
 )
 from pencraft.formatters.frontmatter import FrontmatterGenerator
 from pencraft.llm.client import LLMClient
+from pencraft.llm.usage import UsageSummary, collect_usage, llm_phase
 from pencraft.tools.trends import TrendsData, TrendsTool
+from pencraft.tools.trends_cache import TrendsCache
+from pencraft.tools.trends_scheduler import get_trends_scheduler
 
 if TYPE_CHECKING:
     from pencraft.config.settings import Settings
@@ -39,6 +42,7 @@ class EnhancedBlog:
     backup_path: Path | None = None
     improvements_made: list[str] = field(default_factory=list)
     trends_data: TrendsData | None = None
+    usage: UsageSummary | None = None
     error: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
@@ -49,6 +53,7 @@ class EnhancedBlog:
             "enhanced_word_count": self.enhanced_word_count,
             "backup_path": str(self.backup_path) if self.backup_path else None,
             "improvements_made": self.improvements_made,
+            "usage": self.usage.to_dict() if self.usage else None,
             "error": self.error,
         }
 
@@ -100,8 +105,20 @@ class BlogEnhancer:
         from pencraft.config.settings import Settings as SettingsClass
 
         self.settings = settings or SettingsClass()
-        self.llm_client = llm_client or LLMClient(self.settings.llm)
-        self.trends_tool = trends_tool or TrendsTool()
+        self.llm_client = llm_client or LLMClient.from_settings(self.settings)
+        self.trends_tool = trends_tool or TrendsTool(
+            cache=(
+                TrendsCache.from_settings(self.settings.cache)
+                if self.settings.cache.trends_enabled
+                else None
+            ),
+            scheduler=get_trends_scheduler(
+                self.settings.research.trends_requests_per_minute,
+                self.settings.research.trends_max_requests_per_minute,
+            ),
+        )
+        # Trends fetched ahead of time by enhance_directory(), keyed by search term
+        self._prefetched_trends: dict[str, TrendsData] = {}
         self.frontmatter_gen = FrontmatterGenerator(format=self.settings.hugo.frontmatter_format)
         self.on_progress = on_progress or (lambda _msg: None)
 
@@ -152,6 +169,49 @@ class BlogEnhancer:
         logger.info(f"Backed up to: {backup_path}")
         return backup_path
 
+    def _trends_search_term(self, title: str) -> str:
+        """Build the Google Trends search term for a title.
+
+        Args:
+            title: Blog title/topic.
+
+        Returns:
+            The title's first 2-3 meaningful keywords.
+        """
+        # Remove common words to get better trend matches
+        stopwords = {
+            "the",
+            "a",
+            "an",
+            "is",
+            "are",
+            "how",
+            "to",
+            "what",
+            "why",
+            "when",
+            "your",
+            "you",
+            "and",
+            "or",
+            "for",
+            "with",
+            "from",
+            "in",
+            "on",
+            "at",
+            "by",
+            "of",
+            "that",
+            "this",
+            "it",
+        }
+        words = title.lower().split()
+        keywords = [w for w in words if w not in stopwords and len(w) > 2]
+
+        # Use first 2-3 meaningful keywords
+        return " ".join(keywords[:3])
+
     def _get_trends_context(self, title: str) -> tuple[TrendsData | None, str]:
         """Fetch Google Trends data for topic.
 
@@ -164,40 +224,10 @@ class BlogEnhancer:
         try:
             self._report_progress("Fetching Google Trends data...")
             # Extract key terms from title
-            # Remove common words to get better trend matches
-            stopwords = {
-                "the",
-                "a",
-                "an",
-                "is",
-                "are",
-                "how",
-                "to",
-                "what",
-                "why",
-                "when",
-                "your",
-                "you",
-                "and",
-                "or",
-                "for",
-                "with",
-                "from",
-                "in",
-                "on",
-                "at",
-                "by",
-                "of",
-                "that",
-                "this",
-                "it",
-            }
-            words = title.lower().split()
-            keywords = [w for w in words if w not in stopwords and len(w) > 2]
-
-            # Use first 2-3 meaningful keywords
-            search_term = " ".join(keywords[:3])
-            trends_data = self.trends_tool.get_trends_data(search_term)
+            search_term = self._trends_search_term(title)
+            trends_data = self._prefetched_trends.get(search_term)
+            if trends_data is None:
+                trends_data = self.trends_tool.get_trends_data(search_term)
 
             if trends_data.error:
                 logger.warning(f"Trends error: {trends_data.error}")
@@ -240,7 +270,8 @@ class BlogEnhancer:
             trends_data=trends_data,
         )
 
-        response = self.llm_client.generate(prompt)
+        with llm_phase("analysis", agent="BlogEnhancer"):
+            response = self.llm_client.generate(prompt)
 
         return ContentAnalysis(
             title=title,
@@ -285,7 +316,8 @@ class BlogEnhancer:
             specific_issues=specific_issues,
         )
 
-        enhanced = self.llm_client.generate(prompt)
+        with llm_phase("enhancement", agent="BlogEnhancer"):
+            enhanced = self.llm_client.generate(prompt)
 
         # Clean up any artifacts
         enhanced = self._clean_enhanced_content(enhanced)
@@ -348,7 +380,8 @@ class BlogEnhancer:
             keywords=", ".join(keywords[:5]),
         )
 
-        description = self.llm_client.generate(prompt)
+        with llm_phase("meta_description", agent="BlogEnhancer"):
+            description = self.llm_client.generate(prompt)
 
         # Clean and truncate
         description = description.strip().strip('"').strip()
@@ -392,7 +425,8 @@ class BlogEnhancer:
             current_categories=", ".join(current_categories) if current_categories else "None",
         )
 
-        response = self.llm_client.generate(prompt)
+        with llm_phase("tags", agent="BlogEnhancer"):
+            response = self.llm_client.generate(prompt)
 
         # Parse JSON response
         try:
@@ -488,118 +522,156 @@ class BlogEnhancer:
         improvements_made: list[str] = []
         backup_path = None
 
-        try:
-            # Read original content
-            original_content = file_path.read_text(encoding="utf-8")
-            original_word_count = self._count_words(original_content)
-
-            # Parse frontmatter and body
-            frontmatter, body_content = self.frontmatter_gen.parse(original_content)
-            title = frontmatter.get("title", self._extract_title_from_content(original_content))
-
-            # Backup if requested
-            if backup:
-                backup_path = self._backup_file(file_path, backup_dir)
-                improvements_made.append("Created backup")
-
-            # Fetch trends data if requested
-            trends_data = None
-            trends_context = "No Google Trends data."
-            trending_keywords: list[str] = []
-            if use_trends:
-                trends_data, trends_context = self._get_trends_context(title)
-                if trends_data:
-                    trending_keywords = (
-                        trends_data.rising_queries[:5] + trends_data.related_queries[:5]
+        with collect_usage() as usage:
+            try:
+                # Read original content
+                original_content = file_path.read_text(encoding="utf-8")
+                original_word_count = self._count_words(original_content)
+
+                # Parse frontmatter and body
+                frontmatter, body_content = self.frontmatter_gen.parse(original_content)
+                title = frontmatter.get("title", self._extract_title_from_content(original_content))
+
+                # Backup if requested
+                if backup:
+                    backup_path = self._backup_file(file_path, backup_dir)
+                    improvements_made.append("Created backup")
+
+                # Fetch trends data if requested
+                trends_data = None
+                trends_context = "No Google Trends data."
+                trending_keywords: list[str] = []
+                if use_trends:
+                    trends_data, trends_context = self._get_trends_context(title)
+                    if trends_data:
+                        trending_keywords = (
+                            trends_data.rising_queries[:5] + trends_data.related_queries[:5]
+                        )
+                        improvements_made.append("Integrated Google Trends data")
+
+                # Analyze content
+                analysis = self._analyze_content(
+                    body_content, title, target_word_count, trends_context
+                )
+
+                # Enhance content
+                enhanced_body = self._enhance_content(
+                    original_content,
+                    body_content,
+                    analysis,
+                    trends_context,
+                    target_word_count,
+                    trending_keywords,
+                )
+                improvements_made.append("Enhanced content quality")
+
+                # Generate/improve meta description if SEO enabled
+                description = frontmatter.get("description", "")
+                if improve_seo:
+                    description = self._generate_meta_description(
+                        title, enhanced_body, trending_keywords
                     )
-                    improvements_made.append("Integrated Google Trends data")
-
-            # Analyze content
-            analysis = self._analyze_content(body_content, title, target_word_count, trends_context)
-
-            # Enhance content
-            enhanced_body = self._enhance_content(
-                original_content,
-                body_content,
-                analysis,
-                trends_context,
-                target_word_count,
-                trending_keywords,
-            )
-            improvements_made.append("Enhanced content quality")
-
-            # Generate/improve meta description if SEO enabled
-            description = frontmatter.get("description", "")
-            if improve_seo:
-                description = self._generate_meta_description(
-                    title, enhanced_body, trending_keywords
+                    improvements_made.append("Optimized meta description")
+
+                # Suggest improved tags
+                current_tags = frontmatter.get("tags", [])
+                current_categories = frontmatter.get("categories", [])
+                new_tags, new_categories = self._suggest_tags(
+                    title, enhanced_body, trends_data, current_tags, current_categories
                 )
-                improvements_made.append("Optimized meta description")
-
-            # Suggest improved tags
-            current_tags = frontmatter.get("tags", [])
-            current_categories = frontmatter.get("categories", [])
-            new_tags, new_categories = self._suggest_tags(
-                title, enhanced_body, trends_data, current_tags, current_categories
-            )
-            if new_tags != current_tags or new_categories != current_categories:
-                improvements_made.append("Updated tags/categories")
-
-            # Fix frontmatter
-            if fix_frontmatter:
-                fixed_frontmatter = self._fix_frontmatter(
-                    frontmatter, title, description, new_tags, new_categories
+                if new_tags != current_tags or new_categories != current_categories:
+                    improvements_made.append("Updated tags/categories")
+
+                # Fix frontmatter
+                if fix_frontmatter:
+                    fixed_frontmatter = self._fix_frontmatter(
+                        frontmatter, title, description, new_tags, new_categories
+                    )
+                    improvements_made.append("Fixed frontmatter")
+                else:
+                    fixed_frontmatter = frontmatter
+
+                # Generate new frontmatter string
+                new_frontmatter = self.frontmatter_gen.generate(
+                    title=fixed_frontmatter.get("title", title),
+                    description=fixed_frontmatter.get("description", description),
+                    date=fixed_frontmatter.get("date"),
+                    draft=fixed_frontmatter.get("draft", False),
+                    tags=fixed_frontmatter.get("tags", []),
+                    categories=fixed_frontmatter.get("categories", []),
+                    author=fixed_frontmatter.get("author"),
+                    slug=fixed_frontmatter.get("slug"),
+                    featured_image=fixed_frontmatter.get("featured_image"),
+                    toc=fixed_frontmatter.get("toc", True),
+                    lastmod=fixed_frontmatter.get("lastmod"),
+                )
+
+                # Combine frontmatter and enhanced body
+                enhanced_content = f"{new_frontmatter}\n{enhanced_body}"
+                enhanced_word_count = self._count_words(enhanced_content)
+
+                # Write enhanced content
+                file_path.write_text(enhanced_content, encoding="utf-8")
+
+                self._report_progress(
+                    f"Enhanced: {original_word_count} → {enhanced_word_count} words"
+                )
+
+                return EnhancedBlog(
+                    file_path=file_path,
+                    original_word_count=original_word_count,
+                    enhanced_word_count=enhanced_word_count,
+                    original_content=original_content,
+                    enhanced_content=enhanced_content,
+                    backup_path=backup_path,
+                    improvements_made=improvements_made,
+                    trends_data=trends_data,
+                    usage=usage,
+                )
+
+            except Exception as e:
+                logger.error(f"Enhancement failed: {e}")
+                return EnhancedBlog(
+                    file_path=file_path,
+                    original_word_count=0,
+                    enhanced_word_count=0,
+                    original_content="",
+                    enhanced_content="",
+                    backup_path=backup_path,
+                    usage=usage,
+                    error=str(e),
                 )
-                improvements_made.append("Fixed frontmatter")
-            else:
-                fixed_frontmatter = frontmatter
-
-            # Generate new frontmatter string
-            new_frontmatter = self.frontmatter_gen.generate(
-                title=fixed_frontmatter.get("title", title),
-                description=fixed_frontmatter.get("description", description),
-                date=fixed_frontmatter.get("date"),
-                draft=fixed_frontmatter.get("draft", False),
-                tags=fixed_frontmatter.get("tags", []),
-                categories=fixed_frontmatter.get("categories", []),
-                author=fixed_frontmatter.get("author"),
-                slug=fixed_frontmatter.get("slug"),
-                featured_image=fixed_frontmatter.get("featured_image"),
-                toc=fixed_frontmatter.get("toc", True),
-                lastmod=fixed_frontmatter.get("lastmod"),
-            )
-
-            # Combine frontmatter and enhanced body
-            enhanced_content = f"{new_frontmatter}\n{enhanced_body}"
-            enhanced_word_count = self._count_words(enhanced_content)
-
-            # Write enhanced content
-            file_path.write_text(enhanced_content, encoding="utf-8")
-
-            self._report_progress(f"Enhanced: {original_word_count} → {enhanced_word_count} words")
-
-            return EnhancedBlog(
-                file_path=file_path,
-                original_word_count=original_word_count,
-                enhanced_word_count=enhanced_word_count,
-                original_content=original_content,
-                enhanced_content=enhanced_content,
-                backup_path=backup_path,
-                improvements_made=improvements_made,
-                trends_data=trends_data,
-            )
 
+    def _prefetch_trends(self, files: list[Path]) -> None:
+        """Fetch Google Trends data for every file's search term up front.
+
+        Posts often share a search term, and distinct terms are looked up
+        several per request, so this makes far fewer requests than one
+        lookup per file.
+
+        Args:
+            files: Blog files about to be enhanced.
+        """
+        terms: list[str] = []
+        for file_path in files:
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"Could not read {file_path.name} for trends: {e}")
+                continue
+            frontmatter, _ = self.frontmatter_gen.parse(content)
+            title = frontmatter.get("title", self._extract_title_from_content(content))
+            terms.append(self._trends_search_term(title))
+
+        terms = list(dict.fromkeys(terms))
+        if not terms:
+            return
+
+        self._report_progress(f"Fetching Google Trends data for {len(terms)} search terms...")
+        try:
+            self._prefetched_trends = self.trends_tool.get_trends_data_many(terms)
         except Exception as e:
-            logger.error(f"Enhancement failed: {e}")
-            return EnhancedBlog(
-                file_path=file_path,
-                original_word_count=0,
-                enhanced_word_count=0,
-                original_content="",
-                enhanced_content="",
-                backup_path=backup_path,
-                error=str(e),
-            )
+            logger.warning(f"Failed to prefetch trends: {e}")
 
     def enhance_directory(
         self,
@@ -608,7 +680,7 @@ class BlogEnhancer:
         pattern: str = "*.md",
         recursive: bool = False,
         skip_on_error: bool = True,
-        delay_seconds: float = 2.0,
+        delay_seconds: float = 0.0,
         **enhance_kwargs: Any,
     ) -> list[EnhancedBlog]:
         """Enhance all matching files in a directory.
@@ -618,7 +690,8 @@ class BlogEnhancer:
             pattern: Glob pattern for matching files.
             recursive: Whether to search subdirectories.
             skip_on_error: Whether to continue if one file fails.
-            delay_seconds: Delay between processing files.
+            delay_seconds: Delay between processing files (Google Trends requests
+                are already paced by the trends scheduler).
             **enhance_kwargs: Additional arguments for enhance().
 
         Returns:
@@ -638,6 +711,9 @@ class BlogEnhancer:
 
         self._report_progress(f"Found {len(files)} files to enhance")
 
+        if enhance_kwargs.get("use_trends", True):
+            self._prefetch_trends(files)
+
         results: list[EnhancedBlog] = []
 
         for i, file_path in enumerate(files, 1):
@@ -677,6 +753,8 @@ class BlogEnhancer:
             if i < len(files) and delay_seconds > 0:
                 time.sleep(delay_seconds)
 
+        self._prefetched_trends.clear()
+
         # Summary
         successful = sum(1 for r in results if not r.error)
         failed = len(results) - successful
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -9,15 +11,24 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pencraft.agents.planner import BlogOutline, PlannerAgent
-from pencraft.agents.research import ResearchAgent
+from pencraft.agents.budget import ResearchBudget
+from pencraft.agents.planner import BlogOutline, PlannerAgent, Section
+from pencraft.agents.research import ResearchAgent, ResearchData
 from pencraft.agents.writer import WriterAgent
+from pencraft.artifacts import ArtifactStore
 from pencraft.formatters.frontmatter import FrontmatterGenerator
 from pencraft.formatters.markdown import MarkdownFormatter
 from pencraft.llm.client import LLMClient
+from pencraft.llm.usage import UsageSummary, collect_usage
+from pencraft.pipeline import PipelineReport, TaskGraph
+from pencraft.tools.research_index import ResearchIndex
 
 if TYPE_CHECKING:
     from pencraft.config.settings import Settings
+    from pencraft.tools.coverage import SnippetCoverage
+    from pencraft.tools.scraper import ScrapedContent
+    from pencraft.tools.search import SearchResult
+    from pencraft.tools.trends import TrendsData
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +47,9 @@ class GeneratedBlog:
     sources: list[dict[str, Any]] = field(default_factory=list)
     word_count: int = 0
     generation_time: float = 0.0
+    usage: UsageSummary | None = None
+    pipeline: PipelineReport | None = None
+    parallel: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -48,6 +62,9 @@ class GeneratedBlog:
             "sources": self.sources,
             "word_count": self.word_count,
             "generation_time": self.generation_time,
+            "usage": self.usage.to_dict() if self.usage else None,
+            "pipeline": self.pipeline.to_dict() if self.pipeline else None,
+            "parallel": self.parallel,
         }
 
 
@@ -77,7 +94,7 @@ class BlogGenerator:
         self.settings = settings
 
         if llm_client is None:
-            llm_client = LLMClient(settings=settings.llm)
+            llm_client = LLMClient.from_settings(settings)
 
         self.llm = llm_client
 
@@ -110,6 +127,7 @@ class BlogGenerator:
         custom_research: str | None = None,
         cover_image: str | None = None,
         progress_callback: Callable[[str], None] | None = None,
+        resume: bool = False,
     ) -> GeneratedBlog:
         """Generate a complete blog post.
 
@@ -128,6 +146,8 @@ class BlogGenerator:
             custom_outline: Skip planning, use this outline.
             custom_research: Skip research, use this summary.
             cover_image: Cover image URL.
+            resume: Reuse the research, outline, sections and frontmatter saved
+                by an earlier run of the same topic and settings.
 
         Returns:
             GeneratedBlog with complete content.
@@ -151,67 +171,93 @@ class BlogGenerator:
             self.planner_agent.on_progress = progress_callback
             self.writer_agent.on_progress = progress_callback
 
-        # Phase 1: Research
-        if custom_research:
-            research_summary = custom_research
-            sources: list[dict[str, Any]] = []
-            logger.info("Using provided custom research")
-        elif skip_research:
-            research_summary = f"Topic: {topic}\n\n{additional_context}"
-            sources = []
-            logger.info("Skipping research phase")
-        else:
-            logger.info("Phase 1: Researching topic...")
-            research_result = self.research_agent.execute(
-                topic=topic,
-                additional_context=additional_context,
-            )
-            if not research_result.success:
-                raise RuntimeError(f"Research failed: {research_result.error}")
-
-            research_summary = research_result.content
-            sources = research_result.metadata.get("research_data", {}).get("sources", [])
-            logger.info(f"Research complete: {len(sources)} sources found")
+        store = self.artifact_store(topic)
+
+        with collect_usage() as usage:
+            # Phase 1: Research
+            research_pages: list[ScrapedContent] = []
+            if custom_research:
+                research_summary = custom_research
+                sources: list[dict[str, Any]] = []
+                logger.info("Using provided custom research")
+            elif skip_research:
+                research_summary = f"Topic: {topic}\n\n{additional_context}"
+                sources = []
+                logger.info("Skipping research phase")
+            elif resume and store and (saved := store.load_research(additional_context)):
+                research_summary = saved.summary
+                sources = saved.sources
+                research_pages = saved.scraped_content
+                logger.info("Reusing saved research")
+            else:
+                logger.info("Phase 1: Researching topic...")
+                research_result = self.research_agent.execute(
+                    topic=topic,
+                    additional_context=additional_context,
+                )
+                if not research_result.success:
+                    raise RuntimeError(f"Research failed: {research_result.error}")
 
-        # Phase 2: Planning
-        if custom_outline:
-            outline = custom_outline
-            logger.info("Using provided custom outline")
-        else:
-            logger.info("Phase 2: Creating outline...")
-            outline_result = self.planner_agent.execute(
-                topic=topic,
+                research_data = ResearchData.from_dict(
+                    research_result.metadata.get("research_data", {})
+                )
+                research_summary = research_result.content
+                sources = research_data.sources
+                research_pages = research_data.scraped_content
+                if store:
+                    store.save_research(research_data, additional_context)
+                logger.info(f"Research complete: {len(sources)} sources found")
+
+            research_index = ResearchIndex.build(research_summary, research_pages)
+
+            # Phase 2: Planning
+            if custom_outline:
+                outline = custom_outline
+                logger.info("Using provided custom outline")
+            elif resume and store and (saved_outline := store.load_outline(target_word_count)):
+                outline = saved_outline
+                logger.info("Reusing saved outline")
+            else:
+                logger.info("Phase 2: Creating outline...")
+                outline_result = self.planner_agent.execute(
+                    topic=topic,
+                    research_summary=research_summary,
+                    target_word_count=target_word_count,
+                    suggested_tags=tags,
+                    suggested_categories=categories,
+                )
+                if not outline_result.success:
+                    raise RuntimeError(f"Planning failed: {outline_result.error}")
+
+                outline_data = outline_result.metadata.get("outline", {})
+                outline = self._dict_to_outline(outline_data)
+                if store:
+                    store.save_outline(outline)
+                logger.info(f"Outline created: {len(outline.sections)} sections")
+
+            # Phase 3: Writing
+            logger.info("Phase 3: Writing content...")
+            write_result = self.writer_agent.execute(
+                outline=outline,
                 research_summary=research_summary,
-                target_word_count=target_word_count,
-                suggested_tags=tags,
-                suggested_categories=categories,
+                sources=sources,
+                research_index=research_index,
+                completed_sections=store.load_sections(outline) if resume and store else None,
+                on_section=functools.partial(store.save_section, outline) if store else None,
             )
-            if not outline_result.success:
-                raise RuntimeError(f"Planning failed: {outline_result.error}")
-
-            outline_data = outline_result.metadata.get("outline", {})
-            outline = self._dict_to_outline(outline_data)
-            logger.info(f"Outline created: {len(outline.sections)} sections")
-
-        # Phase 3: Writing
-        logger.info("Phase 3: Writing content...")
-        write_result = self.writer_agent.execute(
-            outline=outline,
-            research_summary=research_summary,
-            sources=sources,
-        )
-        if not write_result.success:
-            raise RuntimeError(f"Writing failed: {write_result.error}")
+            if not write_result.success:
+                raise RuntimeError(f"Writing failed: {write_result.error}")
 
         blog_content = write_result.content
         word_count = len(blog_content.split())
         logger.info(f"Writing complete: {word_count} words")
 
         # Generate frontmatter
-        frontmatter = self.frontmatter_gen.generate(
+        frontmatter = self._frontmatter(
+            store,
+            resume,
             title=outline.title,
             description=outline.meta_description,
-            date=datetime.now(),
             draft=draft,
             tags=outline.tags or tags,
             categories=outline.categories or categories,
@@ -247,7 +293,11 @@ class BlogGenerator:
 
         generation_time = time.time() - start_time
 
-        logger.info(f"Blog generation complete in {generation_time:.2f}s")
+        logger.info(
+            f"Blog generation complete in {generation_time:.2f}s "
+            f"({usage.prompt_tokens} prompt + {usage.completion_tokens} completion tokens "
+            f"over {len(usage.calls)} LLM calls)"
+        )
 
         return GeneratedBlog(
             title=outline.title,
@@ -260,6 +310,7 @@ class BlogGenerator:
             sources=sources,
             word_count=word_count,
             generation_time=generation_time,
+            usage=usage,
         )
 
     async def agenerate(
@@ -279,10 +330,20 @@ class BlogGenerator:
         custom_research: str | None = None,
         cover_image: str | None = None,
         progress_callback: Callable[[str], None] | None = None,
+        use_trends: bool = True,
+        resume: bool = False,
     ) -> GeneratedBlog:
         """Generate a blog post asynchronously.
 
-        Same args as generate().
+        The pipeline runs as a graph of tasks (trends, search queries, each
+        search and scrape, synthesis, outline, introduction, sections,
+        conclusion, references, frontmatter and TOC), and every task starts
+        as soon as its inputs are ready. The introduction and conclusion,
+        for example, only wait for the outline. Per-task timings and the
+        critical path are returned in GeneratedBlog.pipeline.
+
+        Same args as generate(), plus:
+            use_trends: Whether to fetch Google Trends data during research.
         """
         import time
 
@@ -301,73 +362,99 @@ class BlogGenerator:
             self.planner_agent.on_progress = progress_callback
             self.writer_agent.on_progress = progress_callback
 
+        store = self.artifact_store(topic)
+        graph = TaskGraph()
+
         # Phase 1: Research
         if custom_research:
-            research_summary = custom_research
-            sources: list[dict[str, Any]] = []
+            graph.add_value("synthesis", custom_research)
+            graph.add_value("sources", [])
+            graph.add_value("scrapes", [])
         elif skip_research:
-            research_summary = f"Topic: {topic}\n\n{additional_context}"
-            sources = []
+            graph.add_value("synthesis", f"Topic: {topic}\n\n{additional_context}")
+            graph.add_value("sources", [])
+            graph.add_value("scrapes", [])
+        elif resume and store and (saved := store.load_research(additional_context)):
+            logger.info("Reusing saved research")
+            graph.add_value("synthesis", saved.summary)
+            graph.add_value("sources", saved.sources)
+            graph.add_value("scrapes", saved.scraped_content)
         else:
-            research_result = await self.research_agent.aexecute(
-                topic=topic,
-                additional_context=additional_context,
-            )
-            if not research_result.success:
-                raise RuntimeError(f"Research failed: {research_result.error}")
+            self._add_research_tasks(graph, topic, additional_context, use_trends, store)
 
-            research_summary = research_result.content
-            sources = research_result.metadata.get("research_data", {}).get("sources", [])
+        # Passages each section retrieves its research notes from
+        graph.add("research_index", ResearchIndex.build, ["synthesis", "scrapes"])
 
-        # Phase 2: Planning
+        graph.add("references", self._format_references, ["sources"])
+
+        # Phase 2: Planning (writing tasks are added once the outline exists)
         if custom_outline:
-            outline = custom_outline
+            graph.add_value("outline", custom_outline)
+            self._add_writing_tasks(graph, custom_outline, store, resume)
+        elif resume and store and (saved_outline := store.load_outline(target_word_count)):
+            logger.info("Reusing saved outline")
+            graph.add_value("outline", saved_outline)
+            self._add_writing_tasks(graph, saved_outline, store, resume)
         else:
-            outline_result = await self.planner_agent.aexecute(
-                topic=topic,
-                research_summary=research_summary,
-                target_word_count=target_word_count,
-                suggested_tags=tags,
-                suggested_categories=categories,
-            )
-            if not outline_result.success:
-                raise RuntimeError(f"Planning failed: {outline_result.error}")
 
-            outline_data = outline_result.metadata.get("outline", {})
-            outline = self._dict_to_outline(outline_data)
+            async def plan(research_summary: str) -> BlogOutline:
+                outline_result = await self.planner_agent.aexecute(
+                    topic=topic,
+                    research_summary=research_summary,
+                    target_word_count=target_word_count,
+                    suggested_tags=tags,
+                    suggested_categories=categories,
+                )
+                if not outline_result.success:
+                    raise RuntimeError(f"Planning failed: {outline_result.error}")
 
-        # Phase 3: Writing
-        write_result = await self.writer_agent.aexecute(
-            outline=outline,
-            research_summary=research_summary,
-            sources=sources,
-        )
-        if not write_result.success:
-            raise RuntimeError(f"Writing failed: {write_result.error}")
+                outline = self._dict_to_outline(outline_result.metadata.get("outline", {}))
+                if store:
+                    store.save_outline(outline)
+                self._add_writing_tasks(graph, outline, store, resume)
+                return outline
 
-        blog_content = write_result.content
-        word_count = len(blog_content.split())
+            graph.add("outline", plan, ["synthesis"])
 
-        # Generate frontmatter
-        frontmatter = self.frontmatter_gen.generate(
-            title=outline.title,
-            description=outline.meta_description,
-            date=datetime.now(),
-            draft=draft,
-            tags=outline.tags or tags,
-            categories=outline.categories or categories,
-            author=author,
-            slug=self.md_formatter.slugify(outline.title),
-            toc=self.settings.blog.include_toc,
-            featured_image=cover_image,
-        )
+        def make_frontmatter(outline: BlogOutline) -> str:
+            return self._frontmatter(
+                store,
+                resume,
+                title=outline.title,
+                description=outline.meta_description,
+                draft=draft,
+                tags=outline.tags or tags,
+                categories=outline.categories or categories,
+                author=author,
+                slug=self.md_formatter.slugify(outline.title),
+                toc=self.settings.blog.include_toc,
+                featured_image=cover_image,
+            )
 
-        # Add TOC if enabled
-        if self.settings.blog.include_toc:
-            toc = self.md_formatter.generate_toc(blog_content)
-            blog_content = f"# {outline.title}\n\n{toc}\n\n{blog_content}"
-        else:
-            blog_content = f"# {outline.title}\n\n{blog_content}"
+        def add_toc(outline: BlogOutline, content: str) -> str:
+            if self.settings.blog.include_toc:
+                toc = self.md_formatter.generate_toc(content)
+                return f"# {outline.title}\n\n{toc}\n\n{content}"
+            return f"# {outline.title}\n\n{content}"
+
+        graph.add("frontmatter", make_frontmatter, ["outline"])
+        graph.add("toc", add_toc, ["outline", "content"])
+
+        scraper = self.research_agent.scraper
+        try:
+            # Every scrape of the run shares the pooled client's connections
+            async with scraper.async_session():
+                with collect_usage() as usage:
+                    results = await graph.run()
+        finally:
+            await scraper.aclose()
+
+        outline = results["outline"]
+        research_summary = results["synthesis"]
+        sources = results["sources"]
+        frontmatter = results["frontmatter"]
+        blog_content = results["toc"]
+        word_count = len(results["content"].split())
 
         full_content = frontmatter + "\n" + blog_content
         full_content = self.md_formatter.clean_content(full_content)
@@ -383,6 +470,15 @@ class BlogGenerator:
 
         generation_time = time.time() - start_time
 
+        parallel = self._writing_speedup(graph.report)
+
+        critical_path = graph.report.critical_path()
+        logger.info(
+            f"Blog generation complete in {generation_time:.2f}s "
+            f"({graph.report.total_task_time:.1f}s of task time); critical path: "
+            + " → ".join(f"{t.name} {t.duration:.1f}s" for t in critical_path)
+        )
+
         return GeneratedBlog(
             title=outline.title,
             content=blog_content,
@@ -394,8 +490,322 @@ class BlogGenerator:
             sources=sources,
             word_count=word_count,
             generation_time=generation_time,
+            usage=usage,
+            pipeline=graph.report,
+            parallel=parallel,
         )
 
+    def _writing_speedup(self, report: PipelineReport) -> dict[str, Any] | None:
+        """Measure how much parallel section writing saved over sequential writing.
+
+        Sequential writing would have taken roughly the summed time of the
+        writing tasks, so the speedup is that sum over the elapsed time of
+        the writing phase.
+
+        Args:
+            report: Timings of the finished pipeline.
+
+        Returns:
+            Writing timings and speedup, or None unless sections were written
+            in parallel.
+        """
+        blog_settings = self.settings.blog
+        if not blog_settings.parallel_sections:
+            return None
+        sequential_time, wall_time = report.span(
+            "introduction", "conclusion", "section:", "transition:"
+        )
+        if wall_time <= 0:
+            return None
+
+        speedup = sequential_time / wall_time
+        logger.info(
+            f"Sections written in {wall_time:.1f}s "
+            f"({sequential_time:.1f}s of writing time, {speedup:.1f}x speedup)"
+        )
+        return {
+            "wall_time": wall_time,
+            "sequential_time": sequential_time,
+            "speedup": speedup,
+            "max_concurrency": blog_settings.section_concurrency,
+            "smooth_transitions": blog_settings.smooth_transitions,
+        }
+
+    def _add_research_tasks(
+        self,
+        graph: TaskGraph,
+        topic: str,
+        additional_context: str,
+        use_trends: bool,
+        store: ArtifactStore | None = None,
+        scrape_top_n: int = 3,
+    ) -> None:
+        """Add the research tasks to the pipeline graph.
+
+        Trends and search query generation run side by side, and research
+        goes on without trends once settings.research.trends_deadline has
+        passed. Each query is searched as its own task as soon as it is
+        known (at most settings.research.search_concurrency at once). As in
+        ResearchAgent, rising trends queries replace the generated queries
+        after the third, so the graph only changes the scheduling. The first
+        top results that load are scraped together once the results are
+        merged.
+        Follow-up search rounds (settings.research.search_depth) run inside
+        the merge task, and every step shares one research budget.
+
+        Args:
+            graph: Graph to add the tasks to.
+            topic: Blog topic.
+            additional_context: Extra context for the synthesis.
+            use_trends: Whether to fetch Google Trends data.
+            store: Artifact store the research is saved to.
+            scrape_top_n: Number of top results to scrape.
+        """
+        agent = self.research_agent
+        search_limit = asyncio.Semaphore(self.settings.research.search_concurrency)
+        budget = ResearchBudget.from_settings(self.settings.research)
+
+        def add_searches(prefix: str, queries: list[str]) -> None:
+            names = []
+            for i, query in enumerate(queries):
+                name = f"search:{prefix}{i}"
+                search = functools.partial(agent.search_tool.search, query)
+                graph.add(name, search, limit=search_limit)
+                names.append(name)
+            graph.depend("search_results", *names)
+
+        async def generate_queries() -> list[str]:
+            with budget.track():
+                queries = await agent._agenerate_search_queries(topic)
+            # The first three are searched whatever trends finds
+            add_searches("", queries[:3])
+            return queries
+
+        async def fetch_trends() -> TrendsData | None:
+            if not use_trends:
+                return None
+            trends_data = await agent._afetch_trends(topic)
+            if trends_data is not None:
+                add_searches("trends", trends_data.rising_queries[:3])
+            return trends_data
+
+        async def plan_searches(queries: list[str], trends_data: TrendsData | None) -> list[str]:
+            # Same choice as ResearchAgent: rising trends queries replace the
+            # generated queries after the third
+            if trends_data is not None and trends_data.rising_queries:
+                return queries[:3] + trends_data.rising_queries[:3]
+            add_searches("more", queries[3:])
+            return queries
+
+        async def merge_results(
+            queries: list[str], *results: list[SearchResult]
+        ) -> list[SearchResult]:
+            merged = agent._merge_results(results, [topic, *queries])
+            return await agent._afollow_up(topic, queries, merged, budget)
+
+        def plan_scrape(
+            queries: list[str], search_results: list[SearchResult]
+        ) -> tuple[int, SnippetCoverage | None]:
+            return agent._plan_scrape(search_results, [topic, *queries], scrape_top_n, budget)
+
+        async def scrape(
+            search_results: list[SearchResult], plan: tuple[int, SnippetCoverage | None]
+        ) -> list[ScrapedContent]:
+            pages, _ = plan
+            if not pages:
+                return []
+            return await agent.scraper.ascrape_many(
+                agent._scrape_candidates(search_results, pages),
+                first_k=pages,
+                deadline=budget.deadline(self.settings.research.scrape_deadline),
+                dedup=agent._near_duplicates(),
+            )
+
+        async def synthesize(
+            search_results: list[SearchResult],
+            scraped_content: list[ScrapedContent],
+            trends_data: TrendsData | None,
+        ) -> str:
+            agent.log("✍️ Synthesizing research summary...")
+            return await agent._asynthesize_research(
+                topic=topic,
+                search_results=search_results,
+                scraped_content=scraped_content,
+                additional_context=additional_context,
+                trends_data=trends_data,
+                budget=budget,
+            )
+
+        graph.add("search_queries", generate_queries)
+        graph.add("trends", fetch_trends)
+        graph.add("search_plan", plan_searches, ["search_queries", "trends"])
+        graph.add("search_results", merge_results, ["search_plan"])
+        graph.add("scrape_plan", plan_scrape, ["search_plan", "search_results"])
+        graph.add("scrapes", scrape, ["search_results", "scrape_plan"])
+        graph.add("synthesis", synthesize, ["search_results", "scrapes", "trends"])
+        graph.add("sources", agent._extract_sources, ["search_results", "scrapes"])
+
+        if store is not None:
+
+            def save_research(
+                search_results: list[SearchResult],
+                scraped_content: list[ScrapedContent],
+                trends_data: TrendsData | None,
+                summary: str,
+                sources: list[dict[str, Any]],
+                plan: tuple[int, SnippetCoverage | None],
+            ) -> None:
+                research = ResearchData(
+                    topic=topic,
+                    summary=summary,
+                    sources=sources,
+                    search_results=search_results[: self.settings.research.max_sources],
+                    scraped_content=scraped_content,
+                    trends_data=trends_data,
+                    coverage=plan[1],
+                )
+                store.save_research(research, additional_context)
+
+            graph.add(
+                "save_research",
+                save_research,
+                ["search_results", "scrapes", "trends", "synthesis", "sources", "scrape_plan"],
+            )
+
+    def _add_writing_tasks(
+        self,
+        graph: TaskGraph,
+        outline: BlogOutline,
+        store: ArtifactStore | None = None,
+        resume: bool = False,
+    ) -> None:
+        """Add the writing tasks for an outline to the pipeline graph.
+
+        The introduction and conclusion depend only on the outline. In
+        sequential mode each section waits for the text before it; in
+        parallel mode (settings.blog.parallel_sections) sections are written
+        from the outline alone, bounded by settings.blog.section_concurrency,
+        and optionally followed by a transition pass.
+
+        Finished parts are saved to the artifact store; when resuming, parts
+        already saved for this outline become plain values instead of tasks.
+
+        Args:
+            graph: Graph to add the tasks to.
+            outline: Blog outline.
+            store: Artifact store for written parts.
+            resume: Reuse parts saved by an earlier run.
+        """
+        writer = self.writer_agent
+        blog_settings = self.settings.blog
+        words_per_section = outline.target_word_count // (len(outline.sections) + 2)
+        completed = store.load_sections(outline) if resume and store else {}
+        if completed:
+            logger.info(f"Reusing {len(completed)} written parts")
+
+        def save(key: str, content: str) -> str:
+            if store is not None:
+                store.save_section(outline, key, content)
+            return content
+
+        async def write_introduction() -> str:
+            writer.log("Writing introduction...")
+            intro = await writer._awrite_introduction(outline, words_per_section)
+            writer._check_style(intro, "Introduction")
+            return save("introduction", intro)
+
+        async def write_conclusion() -> str:
+            writer.log("Writing conclusion...")
+            conclusion = await writer._awrite_conclusion(outline, [])
+            writer._check_style(conclusion, "Conclusion")
+            return save("conclusion", conclusion)
+
+        for key, write in (("introduction", write_introduction), ("conclusion", write_conclusion)):
+            if key in completed:
+                graph.add_value(key, completed[key])
+            else:
+                graph.add(key, write)
+
+        limit = asyncio.Semaphore(blog_settings.section_concurrency)
+        smooth_transitions = blog_settings.parallel_sections and blog_settings.smooth_transitions
+        section_tasks: list[str] = []
+        for i, section in enumerate(outline.sections):
+            name = f"section:{i}"
+            # Transitions read the previous section as drafted, so they do not chain
+            previous = f"section:{i - 1}" if i else "introduction"
+
+            if section.title in completed:
+                graph.add_value(name, completed[section.title])
+                if smooth_transitions:
+                    name = f"transition:{i}"
+                    graph.add_value(name, completed[section.title])
+            elif blog_settings.parallel_sections:
+
+                async def write_parallel(
+                    research_summary: str,
+                    research_index: ResearchIndex,
+                    index: int = i,
+                    section: Section = section,
+                ) -> str:
+                    body = await writer._awrite_section_from_outline(
+                        outline, index, research_summary, words_per_section, research_index
+                    )
+                    # Drafts are only final when no transition pass follows
+                    return body if smooth_transitions else save(section.title, body)
+
+                graph.add(name, write_parallel, ["synthesis", "research_index"], limit=limit)
+
+                if smooth_transitions:
+                    raw_name, name = name, f"transition:{i}"
+
+                    async def smooth(body: str, before: str, section: Section = section) -> str:
+                        smoothed = await writer._asmooth_transition(outline, section, body, before)
+                        return save(section.title, smoothed)
+
+                    graph.add(name, smooth, [raw_name, previous], limit=limit)
+            else:
+
+                async def write_sequential(
+                    research_summary: str,
+                    research_index: ResearchIndex,
+                    *before: str,
+                    section: Section = section,
+                ) -> str:
+                    writer.log(f"Writing section: {section.title}")
+                    body = await writer._awrite_section(
+                        outline=outline,
+                        section=section,
+                        research_summary=research_summary,
+                        previous_content="".join(before),
+                        target_words=words_per_section,
+                        research_index=research_index,
+                    )
+                    return save(section.title, body)
+
+                graph.add(
+                    name,
+                    write_sequential,
+                    ["synthesis", "research_index", "introduction", *section_tasks],
+                )
+
+            section_tasks.append(name)
+
+        def assemble(intro: str, conclusion: str, references: str, *bodies: str) -> str:
+            for section, body in zip(outline.sections, bodies, strict=True):
+                writer._check_style(body, f"Section: {section.title}")
+            content, _ = writer.assemble_content(
+                outline, intro, list(bodies), conclusion, references
+            )
+            return content
+
+        graph.add("content", assemble, ["introduction", "conclusion", "references", *section_tasks])
+
+    def _format_references(self, sources: list[dict[str, Any]]) -> str:
+        """Format references for the post, if citations are enabled."""
+        if not (self.settings.blog.include_citations and sources):
+            return ""
+        return self.writer_agent._format_references(sources)
+
     def _save_to_file(
         self,
         content: str,
@@ -426,6 +836,38 @@ class BlogGenerator:
 
         return file_path
 
+    def artifact_store(self, topic: str) -> ArtifactStore | None:
+        """Get the artifact store for a topic.
+
+        Args:
+            topic: Blog topic.
+
+        Returns:
+            ArtifactStore, or None if artifacts are disabled.
+        """
+        if not self.settings.cache.artifacts_enabled:
+            return None
+        return ArtifactStore.for_run(topic, self.settings)
+
+    def _frontmatter(self, store: ArtifactStore | None, resume: bool, **params: Any) -> str:
+        """Generate frontmatter, reusing a saved one when resuming.
+
+        Args:
+            store: Artifact store of the run.
+            resume: Reuse frontmatter saved by an earlier run.
+            **params: Frontmatter fields (without the date).
+
+        Returns:
+            Frontmatter string.
+        """
+        if resume and store and (saved := store.load_frontmatter(params)):
+            return saved
+
+        frontmatter = self.frontmatter_gen.generate(date=datetime.now(), **params)
+        if store:
+            store.save_frontmatter(frontmatter, params)
+        return frontmatter
+
     def _dict_to_outline(self, data: dict[str, Any]) -> BlogOutline:
         """Convert dictionary to BlogOutline.
 
@@ -435,35 +877,7 @@ class BlogGenerator:
         Returns:
             BlogOutline object.
         """
-        from pencraft.agents.planner import Section
-
-        sections = []
-        for section_data in data.get("sections", []):
-            subsections = []
-            for sub_data in section_data.get("subsections", []):
-                subsections.append(
-                    Section(
-                        title=sub_data.get("title", ""),
-                        key_points=sub_data.get("key_points", []),
-                    )
-                )
-            sections.append(
-                Section(
-                    title=section_data.get("title", ""),
-                    key_points=section_data.get("key_points", []),
-                    subsections=subsections,
-                )
-            )
-
-        return BlogOutline(
-            title=data.get("title", "Untitled"),
-            meta_description=data.get("meta_description", ""),
-            sections=sections,
-            tags=data.get("tags", []),
-            categories=data.get("categories", []),
-            target_word_count=data.get("target_word_count", 2000),
-            seo_keywords=data.get("seo_keywords", []),
-        )
+        return BlogOutline.from_dict(data)
 
     def research_only(
         self,
@@ -489,6 +903,10 @@ class BlogGenerator:
         )
         if not result.success:
             raise RuntimeError(f"Research failed: {result.error}")
+
+        if store := self.artifact_store(topic):
+            research_data = result.metadata.get("research_data", {})
+            store.save_research(ResearchData.from_dict(research_data), additional_context)
         return result.content
 
     def outline_only(
@@ -502,7 +920,8 @@ class BlogGenerator:
 
         Args:
             topic: Blog topic.
-            research_summary: Optional research summary.
+            research_summary: Optional research summary (defaults to the research
+                saved by research_only for the same topic).
             target_word_count: Target word count.
 
         Returns:
@@ -511,6 +930,9 @@ class BlogGenerator:
         if progress_callback:
             self.planner_agent.on_progress = progress_callback
 
+        store = self.artifact_store(topic)
+        if not research_summary and store and (saved := store.load_research()):
+            research_summary = saved.summary
         if not research_summary:
             research_summary = f"Topic: {topic}"
 
@@ -522,4 +944,7 @@ class BlogGenerator:
         if not result.success:
             raise RuntimeError(f"Planning failed: {result.error}")
 
-        return self._dict_to_outline(result.metadata.get("outline", {}))
+        outline = self._dict_to_outline(result.metadata.get("outline", {}))
+        if store:
+            store.save_outline(outline)
+        return outline
@@ -1,5 +1,31 @@
 """LLM client package for Pencraft."""
 
+from pencraft.llm.cache import CacheStats, ResponseCache
 from pencraft.llm.client import LLMClient
+from pencraft.llm.hedging import HedgePolicy, HedgeStats
+from pencraft.llm.pool import Endpoint, EndpointPool
+from pencraft.llm.ratelimit import RateLimiter, get_rate_limiter
+from pencraft.llm.usage import (
+    LLMCallRecord,
+    UsageSummary,
+    collect_usage,
+    estimate_tokens,
+    llm_phase,
+)
 
-__all__ = ["LLMClient"]
+__all__ = [
+    "LLMClient",
+    "ResponseCache",
+    "CacheStats",
+    "RateLimiter",
+    "get_rate_limiter",
+    "Endpoint",
+    "EndpointPool",
+    "HedgePolicy",
+    "HedgeStats",
+    "LLMCallRecord",
+    "UsageSummary",
+    "collect_usage",
+    "estimate_tokens",
+    "llm_phase",
+]
@@ -0,0 +1,159 @@
+"""Content-addressed response cache for LLM chat completions."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from openai.types.chat import ChatCompletion
+
+from pencraft.utils.cache import DiskCache, make_cache_key
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import CacheSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters and the work saved by cache hits."""
+
+    hits: int = 0
+    misses: int = 0
+    prompt_tokens_saved: int = 0
+    completion_tokens_saved: int = 0
+    seconds_saved: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Total prompt and completion tokens not sent to the endpoint."""
+        return self.prompt_tokens_saved + self.completion_tokens_saved
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "prompt_tokens_saved": self.prompt_tokens_saved,
+            "completion_tokens_saved": self.completion_tokens_saved,
+            "seconds_saved": self.seconds_saved,
+        }
+
+
+class ResponseCache:
+    """Persistent cache of chat completions keyed on the full request.
+
+    Entries are keyed on model, messages, temperature, max_tokens and any
+    extra API arguments, so a rerun of the same batch with the same
+    settings is served from disk instead of the inference endpoint.
+    """
+
+    def __init__(self, store: DiskCache) -> None:
+        """Initialize the response cache.
+
+        Args:
+            store: Disk store holding the serialized responses.
+        """
+        self.store = store
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> ResponseCache:
+        """Create a response cache from cache settings.
+
+        Args:
+            settings: Cache settings.
+
+        Returns:
+            ResponseCache backed by ``<directory>/llm.sqlite3``.
+        """
+        store = DiskCache(
+            Path(settings.directory).expanduser() / "llm.sqlite3",
+            max_size_bytes=int(settings.llm_max_size_mb * 1024 * 1024),
+            max_age_seconds=settings.llm_max_age_days * 86400,
+        )
+        return cls(store)
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        extra: dict[str, Any],
+    ) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            model: Resolved model name.
+            messages: Chat messages.
+            temperature: Resolved temperature.
+            max_tokens: Resolved max_tokens.
+            extra: Additional API arguments.
+
+        Returns:
+            Cache key string.
+        """
+        return make_cache_key("chat", model, messages, temperature, max_tokens, extra)
+
+    def get(self, key: str) -> ChatCompletion | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key().
+
+        Returns:
+            Cached ChatCompletion, or None on a miss.
+        """
+        entry = self.store.get(key)
+        if entry is None:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        try:
+            response = ChatCompletion.model_validate(entry["response"])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached response: {e}")
+            self.store.delete(key)
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.seconds_saved += entry.get("latency", 0.0)
+            if response.usage:
+                self.stats.prompt_tokens_saved += response.usage.prompt_tokens
+                self.stats.completion_tokens_saved += response.usage.completion_tokens
+
+        logger.debug(f"LLM cache hit {key[:12]}")
+        return response
+
+    def put(self, key: str, response: ChatCompletion, latency: float) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_key().
+            response: Completion returned by the endpoint.
+            latency: Seconds the endpoint took to produce it.
+        """
+        if not response.choices:
+            return
+        self.store.set(key, {"response": response.model_dump(mode="json"), "latency": latency})
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        self.store.close()
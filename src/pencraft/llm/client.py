@@ -2,25 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from collections.abc import AsyncGenerator, Generator
 from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI, OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+
+from pencraft.config.settings import LLMSettings, get_settings
+from pencraft.llm.cache import ResponseCache
+from pencraft.llm.hedging import HedgePolicy
+from pencraft.llm.pool import Endpoint, EndpointPool
+from pencraft.llm.ratelimit import RateLimiter, get_rate_limiter
+from pencraft.llm.usage import LLMCallRecord, current_labels, record_call
 
 if TYPE_CHECKING:
     from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
-from pencraft.config.settings import LLMSettings, get_settings
+    from pencraft.config.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Errors that say something about the endpoint rather than the request
+FAILOVER_ERRORS = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+
 
 class LLMClient:
     """OpenAI-compatible LLM client with configurable endpoint.
 
     This client wraps the OpenAI SDK to support any OpenAI-compatible API,
     including local endpoints like LM Studio, Ollama, or custom servers.
+    Several endpoints can be pooled, in which case each request goes to the
+    endpoint with the fewest outstanding requests and fails over to the
+    next one on connection errors, timeouts and 429/5xx responses.
     """
 
     def __init__(
@@ -29,6 +51,8 @@ class LLMClient:
         base_url: str | None = None,
         api_key: str | None = None,
         model: str | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         """Initialize the LLM client.
 
@@ -37,6 +61,9 @@ class LLMClient:
             base_url: Override base URL (takes precedence over settings).
             api_key: Override API key (takes precedence over settings).
             model: Override model name (takes precedence over settings).
+            cache: Optional response cache for chat()/achat().
+            rate_limiter: Optional limiter for the primary endpoint (defaults to
+                the shared limiter for base_url when any limit is configured).
         """
         if settings is None:
             settings = get_settings().llm
@@ -48,6 +75,11 @@ class LLMClient:
         self.max_tokens = settings.max_tokens
         self.timeout = settings.timeout
         self.max_retries = settings.max_retries
+        self.cache = cache
+
+        if rate_limiter is None:
+            rate_limiter = self._shared_limiter(settings, self.base_url)
+        self.rate_limiter = rate_limiter
 
         # Initialize sync client
         self._client = OpenAI(
@@ -65,7 +97,314 @@ class LLMClient:
             max_retries=self.max_retries,
         )
 
-        logger.debug(f"LLM client initialized with base_url={self.base_url}, model={self.model}")
+        endpoints = [
+            Endpoint(
+                self.base_url,
+                self.api_key,
+                rate_limiter=self.rate_limiter,
+                client=self._client,
+                async_client=self._async_client,
+            )
+        ]
+        for ep in settings.endpoints:
+            endpoints.append(
+                Endpoint(
+                    ep.base_url,
+                    ep.api_key or self.api_key,
+                    model=ep.model,
+                    weight=ep.weight,
+                    max_in_flight=ep.max_in_flight,
+                    fallback=ep.fallback,
+                    timeout=self.timeout,
+                    max_retries=self.max_retries,
+                    rate_limiter=self._shared_limiter(settings, ep.base_url),
+                )
+            )
+        endpoints[0].max_in_flight = settings.max_in_flight
+        self.pool = EndpointPool(
+            endpoints,
+            unhealthy_after=settings.unhealthy_after,
+            probe_interval=settings.probe_interval,
+        )
+
+        self.hedging = (
+            HedgePolicy(
+                percentile=settings.hedge_percentile,
+                budget=settings.hedge_budget,
+                min_delay=settings.hedge_min_delay,
+            )
+            if settings.hedge_enabled
+            else None
+        )
+
+        logger.debug(
+            f"LLM client initialized with base_url={self.base_url}, model={self.model}, "
+            f"endpoints={len(endpoints)}"
+        )
+
+    @staticmethod
+    def _shared_limiter(settings: LLMSettings, base_url: str) -> RateLimiter | None:
+        """Get the process-wide limiter for an endpoint if any limit is set."""
+        if not (
+            settings.requests_per_minute
+            or settings.tokens_per_minute
+            or settings.max_concurrent_requests
+        ):
+            return None
+        return get_rate_limiter(
+            base_url,
+            requests_per_minute=settings.requests_per_minute,
+            tokens_per_minute=settings.tokens_per_minute,
+            max_concurrent=settings.max_concurrent_requests,
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> LLMClient:
+        """Create a client wired up from the full settings object.
+
+        Args:
+            settings: Main settings object.
+
+        Returns:
+            LLMClient with the optional layers enabled in settings.
+        """
+        cache = ResponseCache.from_settings(settings.cache) if settings.cache.llm_enabled else None
+        return cls(settings=settings.llm, cache=cache)
+
+    def endpoint_stats(self) -> dict[str, dict[str, Any]]:
+        """Get request, health and latency statistics per endpoint.
+
+        Returns:
+            Dictionary mapping endpoint names to their statistics.
+        """
+        return self.pool.stats()
+
+    def _request_params(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None,
+        temperature: float | None,
+        max_tokens: int | None,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Resolve per-request overrides into chat completion arguments."""
+        return {
+            "model": model or self.model,
+            "messages": messages,
+            "temperature": temperature if temperature is not None else self.temperature,
+            "max_tokens": max_tokens or self.max_tokens,
+            **kwargs,
+        }
+
+    def _cache_key(self, params: dict[str, Any]) -> str | None:
+        """Get the response cache key for resolved request arguments."""
+        if self.cache is None or params.get("stream"):
+            return None
+        extra = {
+            k: v
+            for k, v in params.items()
+            if k not in ("model", "messages", "temperature", "max_tokens")
+        }
+        return self.cache.make_key(
+            params["model"],
+            params["messages"],
+            params["temperature"],
+            params["max_tokens"],
+            extra,
+        )
+
+    @staticmethod
+    def _routed_params(endpoint: Endpoint, params: dict[str, Any]) -> dict[str, Any]:
+        """Adapt request arguments to the model served by an endpoint."""
+        if endpoint.model:
+            return {**params, "model": endpoint.model}
+        return params
+
+    def _attempt(self, endpoint: Endpoint, params: dict[str, Any]) -> tuple[ChatCompletion, float]:
+        """Run one request on an endpoint already acquired from the pool.
+
+        Returns:
+            Tuple of (response, latency in seconds).
+        """
+        start = time.monotonic()
+        try:
+            with endpoint.limit() as lease:
+                response = endpoint.client.chat.completions.create(
+                    **self._routed_params(endpoint, params)
+                )
+                lease.tokens = response.usage.total_tokens if response.usage else 0
+        except FAILOVER_ERRORS:
+            self.pool.release(endpoint, time.monotonic() - start, success=False)
+            raise
+        except BaseException:
+            self.pool.release(endpoint, time.monotonic() - start, success=None)
+            raise
+
+        latency = time.monotonic() - start
+        self.pool.release(endpoint, latency, success=True)
+        return response, latency
+
+    async def _aattempt(
+        self, endpoint: Endpoint, params: dict[str, Any]
+    ) -> tuple[ChatCompletion, float]:
+        """Run one async request on an endpoint already acquired from the pool.
+
+        Returns:
+            Tuple of (response, latency in seconds).
+        """
+        start = time.monotonic()
+        try:
+            async with endpoint.alimit() as lease:
+                response = await endpoint.async_client.chat.completions.create(
+                    **self._routed_params(endpoint, params)
+                )
+                lease.tokens = response.usage.total_tokens if response.usage else 0
+        except FAILOVER_ERRORS:
+            self.pool.release(endpoint, time.monotonic() - start, success=False)
+            raise
+        except BaseException:
+            self.pool.release(endpoint, time.monotonic() - start, success=None)
+            raise
+
+        latency = time.monotonic() - start
+        self.pool.release(endpoint, latency, success=True)
+        return response, latency
+
+    def _complete(self, params: dict[str, Any]) -> tuple[ChatCompletion, Endpoint, float]:
+        """Send a request, failing over across endpoints.
+
+        Returns:
+            Tuple of (response, endpoint that served it, latency in seconds).
+        """
+        tried: set[str] = set()
+        last_error: Exception | None = None
+        while (endpoint := self.pool.acquire(exclude=tried)) is not None:
+            tried.add(endpoint.name)
+            try:
+                response, latency = self._attempt(endpoint, params)
+                return response, endpoint, latency
+            except FAILOVER_ERRORS as e:
+                logger.warning(f"LLM endpoint {endpoint.name} failed, failing over: {e}")
+                last_error = e
+
+        raise last_error or RuntimeError("No healthy LLM endpoint available")
+
+    async def _acomplete(
+        self, params: dict[str, Any], tried: set[str] | None = None
+    ) -> tuple[ChatCompletion, Endpoint, float]:
+        """Send an async request, failing over across endpoints.
+
+        Args:
+            params: Resolved request arguments.
+            tried: Set updated with every endpoint name used, so a concurrent
+                hedge can avoid them.
+
+        Returns:
+            Tuple of (response, endpoint that served it, latency in seconds).
+        """
+        tried = tried if tried is not None else set()
+        last_error: Exception | None = None
+        while (endpoint := self.pool.acquire(exclude=tried)) is not None:
+            tried.add(endpoint.name)
+            try:
+                response, latency = await self._aattempt(endpoint, params)
+                return response, endpoint, latency
+            except FAILOVER_ERRORS as e:
+                logger.warning(f"LLM endpoint {endpoint.name} failed, failing over: {e}")
+                last_error = e
+
+        raise last_error or RuntimeError("No healthy LLM endpoint available")
+
+    async def _ahedged_complete(
+        self, params: dict[str, Any]
+    ) -> tuple[ChatCompletion, Endpoint, float]:
+        """Send an async request, hedging it on another endpoint if it stalls.
+
+        Returns:
+            Tuple of (response, endpoint that served it, latency in seconds).
+        """
+        assert self.hedging is not None
+        policy = self.hedging
+        delay = policy.hedge_delay()
+        start = time.monotonic()
+
+        tried: set[str] = set()
+        primary = asyncio.create_task(self._acomplete(params, tried))
+        hedge: asyncio.Task[tuple[ChatCompletion, Endpoint, float]] | None = None
+        try:
+            if delay is None:
+                result = await primary
+                policy.record(time.monotonic() - start)
+                return result
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self.pool.has_available(exclude=tried):
+                if not done:
+                    policy.record_no_endpoint()
+                result = await primary
+                policy.record(time.monotonic() - start)
+                return result
+            if not policy.try_hedge():
+                result = await primary
+                policy.record(time.monotonic() - start)
+                return result
+
+            logger.debug(f"Hedging LLM request after {delay:.2f}s")
+            hedge = asyncio.create_task(self._acomplete(params, set(tried)))
+            pending: set[asyncio.Task[tuple[ChatCompletion, Endpoint, float]]] = {primary, hedge}
+            winner: asyncio.Task[tuple[ChatCompletion, Endpoint, float]] | None = None
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        break
+
+            if winner is None:
+                # Both attempts failed; surface the primary's error
+                return primary.result()
+
+            response, endpoint, _ = winner.result()
+            latency = time.monotonic() - start
+            policy.record(latency, hedged=True, hedge_won=winner is hedge)
+            return response, endpoint, latency
+        finally:
+            # Losing attempts, or all of them if the caller is cancelled, must
+            # not keep their endpoint slots and rate limiter tokens
+            for attempt in (primary, hedge):
+                if attempt is not None and not attempt.done():
+                    attempt.cancel()
+
+    @staticmethod
+    def _record_usage(
+        params: dict[str, Any],
+        response: ChatCompletion,
+        endpoint: str,
+        latency: float,
+        *,
+        cached: bool = False,
+    ) -> None:
+        """Record a finished call under the current agent and phase.
+
+        A non-streamed response arrives whole, so its first token reaches
+        the caller after the full latency; cache hits made no model call
+        and get no time to first token.
+        """
+        agent, phase = current_labels()
+        usage = response.usage
+        record_call(
+            LLMCallRecord(
+                agent=agent,
+                phase=phase,
+                model=response.model or params["model"],
+                endpoint=endpoint,
+                prompt_tokens=usage.prompt_tokens if usage else 0,
+                completion_tokens=usage.completion_tokens if usage else 0,
+                latency=latency,
+                time_to_first_token=None if cached else latency,
+                cached=cached,
+            )
+        )
 
     def chat(
         self,
@@ -88,13 +427,20 @@ class LLMClient:
         Returns:
             ChatCompletion response object.
         """
-        response = self._client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            **kwargs,
-        )
+        params = self._request_params(messages, model, temperature, max_tokens, kwargs)
+        cache_key = self._cache_key(params)
+        if cache_key is not None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._record_usage(params, cached, "cache", 0.0, cached=True)
+                return cached
+
+        response, endpoint, latency = self._complete(params)
+        self._record_usage(params, response, endpoint.name, latency)
+
+        # Never cache a fallback model's answer under the requested model
+        if cache_key is not None and self.cache is not None and not endpoint.model:
+            self.cache.put(cache_key, response, latency)
         return response
 
     async def achat(
@@ -108,6 +454,10 @@ class LLMClient:
     ) -> ChatCompletion:
         """Send an async chat completion request.
 
+        When hedging is enabled, a request that outlives the configured
+        latency percentile is duplicated on another endpoint and the
+        slower copy is cancelled.
+
         Args:
             messages: List of chat messages with 'role' and 'content'.
             model: Override model for this request.
@@ -118,15 +468,95 @@ class LLMClient:
         Returns:
             ChatCompletion response object.
         """
-        response = await self._async_client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            **kwargs,
-        )
+        params = self._request_params(messages, model, temperature, max_tokens, kwargs)
+        cache_key = self._cache_key(params)
+        if cache_key is not None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._record_usage(params, cached, "cache", 0.0, cached=True)
+                return cached
+
+        if self.hedging is not None:
+            response, endpoint, latency = await self._ahedged_complete(params)
+        else:
+            response, endpoint, latency = await self._acomplete(params)
+        self._record_usage(params, response, endpoint.name, latency)
+
+        if cache_key is not None and self.cache is not None and not endpoint.model:
+            self.cache.put(cache_key, response, latency)
         return response
 
+    def _release_stream(
+        self,
+        endpoint: Endpoint,
+        start: float,
+        *,
+        success: bool | None,
+        tokens: int = 0,
+    ) -> None:
+        """Release the pool and rate limiter slots held by a stream."""
+        if endpoint.rate_limiter is not None:
+            endpoint.rate_limiter.release(tokens)
+        self.pool.release(endpoint, time.monotonic() - start, success=success)
+
+    def _open_stream(self, params: dict[str, Any]) -> tuple[Any, Endpoint, float]:
+        """Open a stream, failing over across endpoints until one accepts it.
+
+        Returns:
+            Tuple of (stream, endpoint, start time). The caller must release
+            the endpoint and its rate limiter slot once the stream is drained.
+        """
+        tried: set[str] = set()
+        last_error: Exception | None = None
+        while (endpoint := self.pool.acquire(exclude=tried)) is not None:
+            tried.add(endpoint.name)
+            if endpoint.rate_limiter is not None:
+                endpoint.rate_limiter.acquire()
+            start = time.monotonic()
+            try:
+                stream = endpoint.client.chat.completions.create(
+                    **self._routed_params(endpoint, params), stream=True
+                )
+                return stream, endpoint, start
+            except FAILOVER_ERRORS as e:
+                self._release_stream(endpoint, start, success=False)
+                logger.warning(f"LLM endpoint {endpoint.name} failed, failing over: {e}")
+                last_error = e
+            except BaseException:
+                self._release_stream(endpoint, start, success=None)
+                raise
+
+        raise last_error or RuntimeError("No healthy LLM endpoint available")
+
+    async def _aopen_stream(self, params: dict[str, Any]) -> tuple[Any, Endpoint, float]:
+        """Open an async stream, failing over across endpoints.
+
+        Returns:
+            Tuple of (stream, endpoint, start time). The caller must release
+            the endpoint and its rate limiter slot once the stream is drained.
+        """
+        tried: set[str] = set()
+        last_error: Exception | None = None
+        while (endpoint := self.pool.acquire(exclude=tried)) is not None:
+            tried.add(endpoint.name)
+            if endpoint.rate_limiter is not None:
+                await endpoint.rate_limiter.aacquire()
+            start = time.monotonic()
+            try:
+                stream = await endpoint.async_client.chat.completions.create(
+                    **self._routed_params(endpoint, params), stream=True
+                )
+                return stream, endpoint, start
+            except FAILOVER_ERRORS as e:
+                self._release_stream(endpoint, start, success=False)
+                logger.warning(f"LLM endpoint {endpoint.name} failed, failing over: {e}")
+                last_error = e
+            except BaseException:
+                self._release_stream(endpoint, start, success=None)
+                raise
+
+        raise last_error or RuntimeError("No healthy LLM endpoint available")
+
     def chat_stream(
         self,
         messages: list[dict[str, str]],
@@ -148,15 +578,24 @@ class LLMClient:
         Yields:
             ChatCompletionChunk objects as they arrive.
         """
-        stream = self._client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            stream=True,
-            **kwargs,
-        )
-        yield from stream  # type: ignore[misc]
+        params = self._request_params(messages, model, temperature, max_tokens, kwargs)
+        stream, endpoint, start = self._open_stream(params)
+        record = self._stream_record(params, endpoint)
+        success: bool | None = None
+        try:
+            for chunk in stream:
+                self._track_stream(record, chunk, start)
+                yield chunk
+            success = True
+        except FAILOVER_ERRORS:
+            success = False
+            raise
+        finally:
+            tokens = record.prompt_tokens + record.completion_tokens
+            self._release_stream(endpoint, start, success=success, tokens=tokens)
+            if success:
+                record.latency = time.monotonic() - start
+                record_call(record)
 
     async def achat_stream(
         self,
@@ -179,16 +618,50 @@ class LLMClient:
         Yields:
             ChatCompletionChunk objects as they arrive.
         """
-        stream = await self._async_client.chat.completions.create(
-            model=model or self.model,
-            messages=messages,  # type: ignore[arg-type]
-            temperature=temperature if temperature is not None else self.temperature,
-            max_tokens=max_tokens or self.max_tokens,
-            stream=True,
-            **kwargs,
+        params = self._request_params(messages, model, temperature, max_tokens, kwargs)
+        stream, endpoint, start = await self._aopen_stream(params)
+        record = self._stream_record(params, endpoint)
+        success: bool | None = None
+        try:
+            async for chunk in stream:
+                self._track_stream(record, chunk, start)
+                yield chunk
+            success = True
+        except FAILOVER_ERRORS:
+            success = False
+            raise
+        finally:
+            tokens = record.prompt_tokens + record.completion_tokens
+            self._release_stream(endpoint, start, success=success, tokens=tokens)
+            if success:
+                record.latency = time.monotonic() - start
+                record_call(record)
+
+    @staticmethod
+    def _stream_record(params: dict[str, Any], endpoint: Endpoint) -> LLMCallRecord:
+        """Start the usage record of a stream under the current agent and phase."""
+        agent, phase = current_labels()
+        return LLMCallRecord(
+            agent=agent,
+            phase=phase,
+            model=endpoint.model or params["model"],
+            endpoint=endpoint.name,
         )
-        async for chunk in stream:  # type: ignore[union-attr]
-            yield chunk
+
+    @staticmethod
+    def _track_stream(record: LLMCallRecord, chunk: ChatCompletionChunk, start: float) -> None:
+        """Update the usage record of a stream with one chunk.
+
+        Uses the usage block when the server sends one, otherwise counts
+        one completion token per content chunk as an estimate.
+        """
+        if chunk.choices and chunk.choices[0].delta.content:
+            if record.time_to_first_token is None:
+                record.time_to_first_token = time.monotonic() - start
+            record.completion_tokens += 1
+        if chunk.usage is not None:
+            record.prompt_tokens = chunk.usage.prompt_tokens
+            record.completion_tokens = chunk.usage.completion_tokens
 
     def generate(
         self,
@@ -242,11 +715,13 @@ class LLMClient:
 
     def close(self) -> None:
         """Close the client connections."""
-        self._client.close()
+        self.pool.close()
+        if self.cache is not None:
+            self.cache.close()
 
     async def aclose(self) -> None:
         """Close the async client connections."""
-        await self._async_client.close()
+        await self.pool.aclose()
 
     def __enter__(self) -> LLMClient:
         """Context manager entry."""
@@ -0,0 +1,126 @@
+"""Request hedging policy for cutting LLM tail latency."""
+
+from __future__ import annotations
+
+import statistics
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class HedgeStats:
+    """Counters showing how often hedges were sent and whether they paid off."""
+
+    requests: int = 0
+    hedges_sent: int = 0
+    hedge_wins: int = 0
+    primary_wins: int = 0
+    skipped_budget: int = 0
+    skipped_no_endpoint: int = 0
+
+    @property
+    def extra_request_ratio(self) -> float:
+        """Extra requests sent by hedging, as a fraction of all requests."""
+        return self.hedges_sent / self.requests if self.requests else 0.0
+
+    @property
+    def hedge_win_rate(self) -> float:
+        """Fraction of hedged requests where the hedge finished first."""
+        return self.hedge_wins / self.hedges_sent if self.hedges_sent else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "hedges_sent": self.hedges_sent,
+            "hedge_wins": self.hedge_wins,
+            "primary_wins": self.primary_wins,
+            "skipped_budget": self.skipped_budget,
+            "skipped_no_endpoint": self.skipped_no_endpoint,
+            "extra_request_ratio": self.extra_request_ratio,
+            "hedge_win_rate": self.hedge_win_rate,
+        }
+
+
+class HedgePolicy:
+    """Decides when to send a duplicate request and tracks the outcome.
+
+    A hedge is fired once a request has been running longer than the
+    configured percentile of recent latencies, as long as hedges stay
+    within ``budget`` (the maximum fraction of extra requests).
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_delay: float = 1.0,
+        min_samples: int = 20,
+        window: int = 256,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent.
+            budget: Maximum hedges as a fraction of all requests.
+            min_delay: Never hedge earlier than this many seconds.
+            min_samples: Latencies to observe before hedging starts.
+            window: Number of recent latencies kept.
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.stats = HedgeStats()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> float | None:
+        """Get how long to wait before hedging a new request.
+
+        Returns:
+            Delay in seconds, or None while there are too few samples.
+        """
+        with self._lock:
+            self.stats.requests += 1
+            if len(self._latencies) < max(self.min_samples, 2):
+                return None
+            cuts = statistics.quantiles(self._latencies, n=100, method="inclusive")
+        index = min(max(int(round(self.percentile)) - 1, 0), len(cuts) - 1)
+        return max(self.min_delay, cuts[index])
+
+    def try_hedge(self) -> bool:
+        """Reserve budget for one hedge.
+
+        Returns:
+            True if the hedge may be sent.
+        """
+        with self._lock:
+            if self.stats.hedges_sent + 1 > self.budget * self.stats.requests:
+                self.stats.skipped_budget += 1
+                return False
+            self.stats.hedges_sent += 1
+            return True
+
+    def record(self, latency: float, *, hedged: bool = False, hedge_won: bool = False) -> None:
+        """Record a finished request.
+
+        Args:
+            latency: End-to-end latency of the request in seconds.
+            hedged: Whether a hedge was sent for it.
+            hedge_won: Whether the hedge produced the response.
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            if hedged:
+                if hedge_won:
+                    self.stats.hedge_wins += 1
+                else:
+                    self.stats.primary_wins += 1
+
+    def record_no_endpoint(self) -> None:
+        """Record a hedge that was skipped because no other endpoint was free."""
+        with self._lock:
+            self.stats.skipped_no_endpoint += 1
@@ -0,0 +1,288 @@
+"""Pool of OpenAI-compatible endpoints with health tracking and routing."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+from openai import AsyncOpenAI, OpenAI
+
+from pencraft.llm.ratelimit import RateLimiter, RateLimitLease
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EndpointStats:
+    """Request, failure and latency statistics for one endpoint."""
+
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    in_flight: int = 0
+    healthy: bool = True
+    last_failure: float = 0.0
+    probing: bool = False
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=256))
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Get a percentile of recent successful request latencies.
+
+        Args:
+            percentile: Percentile between 0 and 100.
+
+        Returns:
+            Latency in seconds, or None without enough samples.
+        """
+        if len(self.latencies) < 2:
+            return None
+        cuts = statistics.quantiles(self.latencies, n=100, method="inclusive")
+        index = min(max(int(round(percentile)) - 1, 0), len(cuts) - 1)
+        return cuts[index]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "healthy": self.healthy,
+            "latency_mean": statistics.fmean(self.latencies) if self.latencies else None,
+            "latency_p50": self.latency_percentile(50),
+            "latency_p95": self.latency_percentile(95),
+        }
+
+
+class Endpoint:
+    """One OpenAI-compatible server in the pool."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        *,
+        model: str | None = None,
+        weight: float = 1.0,
+        max_in_flight: int | None = None,
+        fallback: bool = False,
+        timeout: float = 120.0,
+        max_retries: int = 3,
+        rate_limiter: RateLimiter | None = None,
+        client: OpenAI | None = None,
+        async_client: AsyncOpenAI | None = None,
+    ) -> None:
+        """Initialize the endpoint.
+
+        Args:
+            base_url: Base URL of the API.
+            api_key: API key for the endpoint.
+            model: Model served here (None to use the requested model).
+            weight: Relative capacity used when balancing load.
+            max_in_flight: Requests at which the endpoint counts as saturated.
+            fallback: Only route here when every primary endpoint is unavailable.
+            timeout: Request timeout in seconds.
+            max_retries: SDK retries for failed requests.
+            rate_limiter: Optional limiter for this endpoint.
+            client: Prebuilt sync client (created if None).
+            async_client: Prebuilt async client (created if None).
+        """
+        self.base_url = base_url
+        self.model = model
+        self.weight = weight
+        self.max_in_flight = max_in_flight
+        self.fallback = fallback
+        self.rate_limiter = rate_limiter
+        self.stats = EndpointStats()
+
+        self.client = client or OpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+        )
+        self.async_client = async_client or AsyncOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+        )
+
+    @property
+    def name(self) -> str:
+        """Identifier used in logs and statistics."""
+        return f"{self.base_url}#{self.model}" if self.model else self.base_url
+
+    @property
+    def saturated(self) -> bool:
+        """Whether the endpoint is at its in-flight limit."""
+        return self.max_in_flight is not None and self.stats.in_flight >= self.max_in_flight
+
+    def load(self) -> float:
+        """Weighted outstanding requests, including the one being routed."""
+        return (self.stats.in_flight + 1) / self.weight
+
+    def limit(self) -> Any:
+        """Get a context manager holding this endpoint's rate limiter slot."""
+        if self.rate_limiter is None:
+            return nullcontext(RateLimitLease())
+        return self.rate_limiter.limit()
+
+    def alimit(self) -> Any:
+        """Get an async context manager holding this endpoint's rate limiter slot."""
+        if self.rate_limiter is None:
+            return nullcontext(RateLimitLease())
+        return self.rate_limiter.alimit()
+
+    def close(self) -> None:
+        """Close the sync client."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the async client."""
+        await self.async_client.close()
+
+
+class EndpointPool:
+    """Routes requests to the endpoint with the fewest outstanding requests.
+
+    Endpoints are marked unhealthy after consecutive failures and re-probed
+    with a single request once ``probe_interval`` has passed. Fallback
+    endpoints only receive traffic when every primary endpoint is
+    unhealthy or saturated.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[Endpoint],
+        *,
+        unhealthy_after: int = 3,
+        probe_interval: float = 30.0,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            endpoints: Endpoints to route between (at least one).
+            unhealthy_after: Consecutive failures before an endpoint is taken out.
+            probe_interval: Seconds before an unhealthy endpoint is retried.
+        """
+        if not endpoints:
+            raise ValueError("EndpointPool needs at least one endpoint")
+
+        self.endpoints = endpoints
+        self.unhealthy_after = unhealthy_after
+        self.probe_interval = probe_interval
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self) -> Endpoint:
+        """The first configured endpoint."""
+        return self.endpoints[0]
+
+    def _available(self, endpoint: Endpoint, now: float) -> bool:
+        """Check whether an endpoint is healthy or due for a re-probe."""
+        stats = endpoint.stats
+        if stats.healthy:
+            return True
+        return not stats.probing and now - stats.last_failure >= self.probe_interval
+
+    def has_available(self, exclude: set[str] | None = None) -> bool:
+        """Check whether a request could be routed outside ``exclude``.
+
+        Args:
+            exclude: Endpoint names to skip.
+
+        Returns:
+            True if some other endpoint is healthy (or due for a probe).
+        """
+        exclude = exclude or set()
+        now = time.monotonic()
+        with self._lock:
+            return any(ep.name not in exclude and self._available(ep, now) for ep in self.endpoints)
+
+    def acquire(self, exclude: set[str] | None = None) -> Endpoint | None:
+        """Pick an endpoint and count the request as in flight on it.
+
+        Args:
+            exclude: Endpoint names to skip (e.g. ones that already failed).
+
+        Returns:
+            Chosen endpoint, or None if every endpoint is excluded or down.
+        """
+        exclude = exclude or set()
+        now = time.monotonic()
+
+        with self._lock:
+            available = [
+                ep for ep in self.endpoints if ep.name not in exclude and self._available(ep, now)
+            ]
+            primaries = [ep for ep in available if not ep.fallback]
+            fallbacks = [ep for ep in available if ep.fallback]
+
+            candidates = [ep for ep in primaries if not ep.saturated]
+            if not candidates:
+                candidates = [ep for ep in fallbacks if not ep.saturated]
+            if not candidates:
+                # Everything is saturated: queue on the least loaded endpoint
+                candidates = primaries or fallbacks
+            if not candidates:
+                return None
+
+            endpoint = min(candidates, key=lambda ep: ep.load())
+            if not endpoint.stats.healthy:
+                endpoint.stats.probing = True
+                logger.info(f"Probing unhealthy LLM endpoint {endpoint.name}")
+            endpoint.stats.in_flight += 1
+            endpoint.stats.requests += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, latency: float, success: bool | None) -> None:
+        """Finish a request started with acquire().
+
+        Args:
+            endpoint: Endpoint the request ran on.
+            latency: Request duration in seconds.
+            success: True/False to update health, None if the outcome says
+                nothing about the endpoint (e.g. an invalid request).
+        """
+        with self._lock:
+            stats = endpoint.stats
+            stats.in_flight = max(0, stats.in_flight - 1)
+            stats.probing = False
+
+            if success:
+                stats.latencies.append(latency)
+                stats.consecutive_failures = 0
+                if not stats.healthy:
+                    logger.info(f"LLM endpoint {endpoint.name} is healthy again")
+                stats.healthy = True
+            elif success is False:
+                stats.failures += 1
+                stats.consecutive_failures += 1
+                stats.last_failure = time.monotonic()
+                if stats.healthy and stats.consecutive_failures >= self.unhealthy_after:
+                    stats.healthy = False
+                    logger.warning(
+                        f"LLM endpoint {endpoint.name} marked unhealthy after "
+                        f"{stats.consecutive_failures} consecutive failures"
+                    )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-endpoint statistics keyed by endpoint name."""
+        with self._lock:
+            return {ep.name: ep.stats.to_dict() for ep in self.endpoints}
+
+    def close(self) -> None:
+        """Close every endpoint's sync client."""
+        for endpoint in self.endpoints:
+            endpoint.close()
+
+    async def aclose(self) -> None:
+        """Close every endpoint's async client."""
+        for endpoint in self.endpoints:
+            await endpoint.aclose()
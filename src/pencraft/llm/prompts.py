@@ -44,6 +44,30 @@ Provide a structured research brief with clear sections. Every claim must be sou
 Highlight the 3-5 most compelling insights that would make a reader stop scrolling."""
 
 
+# Notes taken on one scraped page for map-reduce synthesis; topic-independent
+# so the notes can be cached per page and reused across posts
+PAGE_NOTES_PROMPT = """You are a research assistant taking notes on one source for later articles.
+
+**Source:** {title} ({url})
+
+**Text:**
+{content}
+
+Extract what a journalist could cite from this text, as markdown bullet lists under these headings:
+
+### Facts
+Concrete claims, findings and examples.
+
+### Numbers
+Statistics, prices, dates and measurements, with what they measure.
+
+### Quotes
+Verbatim quotes, with who said them.
+
+Keep each bullet to one line and use only what the text says. Leave out navigation, ads and
+boilerplate. Write "None" under a heading with nothing to report."""
+
+
 # Planning prompts - Editorial Director Style
 OUTLINE_PROMPT = """You are an editorial director at a top-tier publication (think NYT, WSJ, The Atlantic).
 
@@ -143,23 +167,8 @@ confident but not arrogant. You respect the reader's intelligence.
 Write the introduction only. No section headers."""
 
 
-SECTION_PROMPT = """You are a senior staff writer continuing a feature article.
-
-**Article Title:** {title}
-**Current Section:** {section_title}
-
-**Section Brief:**
-{section_outline}
-
-**What came before:**
-{previous_content}
-
-**Research to incorporate:**
-{research_notes}
-
-**Target length:** {word_count} words
-
----
+# Writing guidelines shared by the sequential and outline-driven section prompts
+_SECTION_GUIDELINES = """---
 
 ## Writing Guidelines
 
@@ -189,6 +198,65 @@ When referencing sources, use [^1] footnote format naturally in the text.
 
 Write the section content only. Do NOT include the section title as a header."""
 
+SECTION_PROMPT = (
+    """You are a senior staff writer continuing a feature article.
+
+**Article Title:** {title}
+**Current Section:** {section_title}
+
+**Section Brief:**
+{section_outline}
+
+**What came before:**
+{previous_content}
+
+**Research to incorporate:**
+{research_notes}
+
+**Target length:** {word_count} words
+
+"""
+    + _SECTION_GUIDELINES
+)
+
+
+OUTLINE_SECTION_PROMPT = (
+    """You are a senior staff writer on a feature article. Other writers are drafting the neighbouring sections at the same time, so write this section from the outline alone.
+
+**Article Title:** {title}
+**Current Section:** {section_title}
+
+**Section Brief:**
+{section_outline}
+
+**Where this section sits:**
+{position}
+
+**Research to incorporate:**
+{research_notes}
+
+**Target length:** {word_count} words
+
+Pick up where the previous section's key points leave off and hand over naturally to the next section, without repeating their material.
+"""
+    + _SECTION_GUIDELINES
+)
+
+
+TRANSITION_PROMPT = """You are an editor smoothing the joins in a feature article whose sections were drafted separately.
+
+**Article Title:** {title}
+
+**End of the previous part:**
+{previous_ending}
+
+**Opening paragraph of the section "{section_title}":**
+{opening}
+
+Rewrite only the opening paragraph so it follows naturally from the previous part. Keep its facts, meaning, citations and approximate length. Avoid stock connectors like "Furthermore" or "Building on this".
+
+Return only the rewritten paragraph."""
+
 
 CONCLUSION_PROMPT = """You are a senior staff writer wrapping up a feature article.
 
@@ -0,0 +1,303 @@
+"""Process-wide rate limiting for LLM endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager, suppress
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate.
+
+    The level may go negative when actual usage is only known after the
+    fact (e.g. completion tokens), which delays the following acquisitions
+    until the debt has been refilled.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate_per_minute: Refill rate in units per minute.
+            capacity: Maximum burst size (defaults to one minute of refill).
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else float(rate_per_minute)
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+        elapsed = now - self._updated
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Get seconds until ``amount`` units can be taken.
+
+        Args:
+            amount: Units required.
+            now: Current monotonic time.
+
+        Returns:
+            0.0 if available now, otherwise the time to wait.
+        """
+        self._refill(now)
+        needed = min(amount, self.capacity)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) / self.rate
+
+    def take(self, amount: float, now: float) -> None:
+        """Remove units from the bucket (may go negative).
+
+        Args:
+            amount: Units to remove.
+            now: Current monotonic time.
+        """
+        self._refill(now)
+        self.level -= amount
+
+
+@dataclass
+class RateLimiterStats:
+    """Counters describing how much the limiter throttled callers."""
+
+    requests: int = 0
+    tokens: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+    in_flight: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "tokens": self.tokens,
+            "throttled": self.throttled,
+            "wait_seconds": self.wait_seconds,
+            "in_flight": self.in_flight,
+        }
+
+
+class RateLimitLease:
+    """Handle for one admitted request, used to report its token usage."""
+
+    def __init__(self) -> None:
+        """Initialize an empty lease."""
+        self.tokens = 0
+
+
+class RateLimiter:
+    """Limits requests/min, tokens/min and in-flight requests.
+
+    The limiter is thread-safe and usable from both sync and async code,
+    so the same instance can govern every client in the process that talks
+    to a given endpoint. Callers held back by the concurrency cap sleep
+    until a request is released; only rate limits are waited out on a
+    timer, for exactly the time the bucket needs to refill.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_concurrent: int | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum request rate (None for unlimited).
+            tokens_per_minute: Maximum prompt+completion token rate (None for unlimited).
+            max_concurrent: Maximum requests in flight at once (None for unlimited).
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrent = max_concurrent
+
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._cond = threading.Condition()
+        # Async callers waiting for a release, possibly on different event loops
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+        self.stats = RateLimiterStats()
+
+    def _try_acquire(
+        self, waiter: tuple[asyncio.AbstractEventLoop, asyncio.Future[None]] | None = None
+    ) -> float | None:
+        """Admit a request if possible.
+
+        Args:
+            waiter: Event loop and future of an async caller, registered to
+                be woken on the next release if the concurrency cap is hit.
+
+        Returns:
+            0.0 if admitted, None if the caller must wait for a release,
+            otherwise seconds to wait for the rate limits to refill.
+        """
+        now = time.monotonic()
+        with self._cond:
+            if self.max_concurrent is not None and self.stats.in_flight >= self.max_concurrent:
+                if waiter is not None:
+                    self._async_waiters.append(waiter)
+                return None
+
+            wait = 0.0
+            if self._requests is not None:
+                wait = max(wait, self._requests.wait_time(1, now))
+            if self._tokens is not None:
+                # Admit as long as the token budget is not in debt
+                wait = max(wait, self._tokens.wait_time(1, now))
+            if wait > 0:
+                return wait
+
+            if self._requests is not None:
+                self._requests.take(1, now)
+            self.stats.in_flight += 1
+            self.stats.requests += 1
+            return 0.0
+
+    def _record_wait(self, waited: float) -> None:
+        """Record time a caller spent throttled."""
+        with self._cond:
+            self.stats.throttled += 1
+            self.stats.wait_seconds += waited
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._cond:
+            wait = self._try_acquire()
+            if wait == 0:
+                return
+            start = time.monotonic()
+            while wait != 0:
+                # Woken early by release(); None waits for it
+                self._cond.wait(wait)
+                wait = self._try_acquire()
+        self._record_wait(time.monotonic() - start)
+
+    async def aacquire(self) -> None:
+        """Wait asynchronously until a request may be sent."""
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        wait = self._try_acquire((loop, waiter))
+        if wait == 0:
+            return
+        start = time.monotonic()
+        while wait != 0:
+            try:
+                if wait is None:
+                    await waiter
+                else:
+                    await asyncio.sleep(wait)
+            finally:
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+            waiter = loop.create_future()
+            wait = self._try_acquire((loop, waiter))
+        self._record_wait(time.monotonic() - start)
+
+    def release(self, tokens: int = 0) -> None:
+        """Mark a request as finished and charge its token usage.
+
+        Args:
+            tokens: Prompt+completion tokens consumed by the request.
+        """
+        now = time.monotonic()
+        with self._cond:
+            self.stats.in_flight = max(0, self.stats.in_flight - 1)
+            self.stats.tokens += tokens
+            if self._tokens is not None and tokens:
+                self._tokens.take(tokens, now)
+            # Every waiter re-checks, so one that gave up cannot strand the slot
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            # RuntimeError: the waiter's event loop has been closed
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(_wake, waiter)
+
+    @contextmanager
+    def limit(self) -> Generator[RateLimitLease, None, None]:
+        """Hold a request slot for the duration of a sync call.
+
+        Yields:
+            Lease whose ``tokens`` attribute should be set to the usage.
+        """
+        self.acquire()
+        lease = RateLimitLease()
+        try:
+            yield lease
+        finally:
+            self.release(lease.tokens)
+
+    @asynccontextmanager
+    async def alimit(self) -> AsyncGenerator[RateLimitLease, None]:
+        """Hold a request slot for the duration of an async call.
+
+        Yields:
+            Lease whose ``tokens`` attribute should be set to the usage.
+        """
+        await self.aacquire()
+        lease = RateLimitLease()
+        try:
+            yield lease
+        finally:
+            self.release(lease.tokens)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    """Wake an async caller waiting for a release."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str,
+    *,
+    requests_per_minute: int | None = None,
+    tokens_per_minute: int | None = None,
+    max_concurrent: int | None = None,
+) -> RateLimiter:
+    """Get the process-wide limiter for an endpoint, creating it if needed.
+
+    Every client pointing at the same endpoint shares one limiter, so
+    several generators and enhancers in one process cannot overload it
+    together. The limits of the first caller win.
+
+    Args:
+        key: Endpoint identifier (usually its base URL).
+        requests_per_minute: Maximum request rate.
+        tokens_per_minute: Maximum token rate.
+        max_concurrent: Maximum requests in flight.
+
+    Returns:
+        Shared RateLimiter instance.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                max_concurrent=max_concurrent,
+            )
+            _limiters[key] = limiter
+            logger.debug(
+                f"Rate limiter for {key}: rpm={requests_per_minute}, "
+                f"tpm={tokens_per_minute}, concurrency={max_concurrent}"
+            )
+        return limiter
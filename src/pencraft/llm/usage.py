@@ -0,0 +1,211 @@
+"""Per-call token usage and latency accounting for LLM requests."""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+# Characters per token used for estimates (typical of English text)
+CHARS_PER_TOKEN = 4
+
+# (agent, phase) labels applied to calls made in the current context
+_labels: ContextVar[tuple[str, str]] = ContextVar("pencraft_llm_labels", default=("", ""))
+
+# Summaries collecting calls made in the current context (innermost last)
+_collectors: ContextVar[tuple[UsageSummary, ...]] = ContextVar(
+    "pencraft_llm_collectors", default=()
+)
+
+
+@dataclass
+class LLMCallRecord:
+    """Accounting for a single LLM call."""
+
+    agent: str
+    phase: str
+    model: str
+    endpoint: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    # First content chunk of a stream, or the whole response otherwise
+    time_to_first_token: float | None = None
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "agent": self.agent,
+            "phase": self.phase,
+            "model": self.model,
+            "endpoint": self.endpoint,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency": self.latency,
+            "time_to_first_token": self.time_to_first_token,
+            "cached": self.cached,
+        }
+
+
+@dataclass
+class PhaseUsage:
+    """Aggregated usage of all calls in one phase."""
+
+    agent: str
+    phase: str
+    calls: int = 0
+    cached_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency: float = 0.0
+    time_to_first_token: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "agent": self.agent,
+            "phase": self.phase,
+            "calls": self.calls,
+            "cached_calls": self.cached_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency": self.latency,
+            "time_to_first_token": self.time_to_first_token,
+        }
+
+
+@dataclass
+class UsageSummary:
+    """Collection of LLM call records with per-phase aggregation."""
+
+    calls: list[LLMCallRecord] = field(default_factory=list)
+
+    @property
+    def prompt_tokens(self) -> int:
+        """Total prompt tokens."""
+        return sum(c.prompt_tokens for c in self.calls)
+
+    @property
+    def completion_tokens(self) -> int:
+        """Total completion tokens."""
+        return sum(c.completion_tokens for c in self.calls)
+
+    @property
+    def latency(self) -> float:
+        """Total LLM latency in seconds (summed, not wall-clock)."""
+        return sum(c.latency for c in self.calls)
+
+    def by_phase(self) -> list[PhaseUsage]:
+        """Aggregate calls per (agent, phase) in order of first appearance.
+
+        Returns:
+            List of PhaseUsage entries. Time to first token is the mean over
+            the calls that reported one.
+        """
+        phases: dict[tuple[str, str], PhaseUsage] = {}
+        ttfts: dict[tuple[str, str], list[float]] = {}
+        for call in self.calls:
+            key = (call.agent, call.phase)
+            entry = phases.setdefault(key, PhaseUsage(agent=call.agent, phase=call.phase))
+            entry.calls += 1
+            entry.cached_calls += int(call.cached)
+            entry.prompt_tokens += call.prompt_tokens
+            entry.completion_tokens += call.completion_tokens
+            entry.latency += call.latency
+            if call.time_to_first_token is not None:
+                ttfts.setdefault(key, []).append(call.time_to_first_token)
+
+        for key, values in ttfts.items():
+            phases[key].time_to_first_token = sum(values) / len(values)
+        return list(phases.values())
+
+    @classmethod
+    def merge(cls, summaries: Iterable[UsageSummary | None]) -> UsageSummary:
+        """Combine several summaries into one.
+
+        Args:
+            summaries: Summaries to combine (None entries are skipped).
+
+        Returns:
+            New summary holding every call.
+        """
+        merged = cls()
+        for summary in summaries:
+            if summary is not None:
+                merged.calls.extend(summary.calls)
+        return merged
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency": self.latency,
+            "phases": [p.to_dict() for p in self.by_phase()],
+            "calls": [c.to_dict() for c in self.calls],
+        }
+
+
+@contextmanager
+def llm_phase(phase: str, agent: str | None = None) -> Generator[None, None, None]:
+    """Label LLM calls made inside the block with an agent and phase.
+
+    Args:
+        phase: Phase name (e.g. "outline", "section:Getting Started").
+        agent: Agent name (keeps the enclosing agent if None).
+    """
+    current_agent, _ = _labels.get()
+    token = _labels.set((agent if agent is not None else current_agent, phase))
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+
+@contextmanager
+def collect_usage() -> Generator[UsageSummary, None, None]:
+    """Collect every LLM call made inside the block.
+
+    Collection follows the context into asyncio tasks and into threads
+    started with a copied context, and nested collectors all receive the
+    calls made inside them.
+
+    Yields:
+        UsageSummary that is filled in as calls complete.
+    """
+    summary = UsageSummary()
+    token = _collectors.set((*_collectors.get(), summary))
+    try:
+        yield summary
+    finally:
+        _collectors.reset(token)
+
+
+def current_labels() -> tuple[str, str]:
+    """Get the (agent, phase) labels of the current context."""
+    return _labels.get()
+
+
+def record_call(record: LLMCallRecord) -> None:
+    """Add a call record to every active collector.
+
+    Args:
+        record: Record to add.
+    """
+    for summary in _collectors.get():
+        summary.calls.append(record)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the tokens of a text before sending it.
+
+    Args:
+        text: Prompt text.
+
+    Returns:
+        Estimated token count (about four characters per token).
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
@@ -0,0 +1,269 @@
+"""Async DAG executor for the blog generation pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Name of the task whose code is currently running
+_current_task: ContextVar[str | None] = ContextVar("pencraft_pipeline_task", default=None)
+
+
+class PipelineError(RuntimeError):
+    """Raised when the task graph cannot make progress."""
+
+
+@dataclass
+class NodeTiming:
+    """Timing of one task relative to the start of the pipeline."""
+
+    name: str
+    deps: list[str] = field(default_factory=list)
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        """Seconds the task ran."""
+        return self.end - self.start
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "deps": self.deps,
+            "start": self.start,
+            "end": self.end,
+            "duration": self.duration,
+        }
+
+
+@dataclass
+class PipelineReport:
+    """Per-task timings of a finished pipeline run."""
+
+    timings: dict[str, NodeTiming] = field(default_factory=dict)
+    wall_time: float = 0.0
+
+    def critical_path(self) -> list[NodeTiming]:
+        """Get the chain of tasks that determined the total run time.
+
+        Starting from the task that finished last, repeatedly follows the
+        dependency that finished last.
+
+        Returns:
+            Tasks on the critical path, in execution order.
+        """
+        if not self.timings:
+            return []
+
+        node = max(self.timings.values(), key=lambda t: t.end)
+        path = [node]
+        while node.deps:
+            node = max((self.timings[d] for d in node.deps), key=lambda t: t.end)
+            path.append(node)
+        return path[::-1]
+
+    @property
+    def total_task_time(self) -> float:
+        """Sum of all task durations (the run time without any overlap)."""
+        return sum(t.duration for t in self.timings.values())
+
+    def span(self, *prefixes: str) -> tuple[float, float]:
+        """Get the summed and the elapsed time of a group of tasks.
+
+        Args:
+            *prefixes: Name prefixes selecting the tasks. Plain values
+                (add_value) never ran, so they are left out.
+
+        Returns:
+            Tuple of (sum of task durations, time from the first start to
+            the last end), or zeros if no task ran.
+        """
+        group = [t for t in self.timings.values() if t.end > 0 and t.name.startswith(prefixes)]
+        if not group:
+            return 0.0, 0.0
+        total = sum(t.duration for t in group)
+        return total, max(t.end for t in group) - min(t.start for t in group)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "wall_time": self.wall_time,
+            "total_task_time": self.total_task_time,
+            "critical_path": [t.name for t in self.critical_path()],
+            "timings": [t.to_dict() for t in self.timings.values()],
+        }
+
+
+@dataclass
+class _Node:
+    """A task waiting to run."""
+
+    name: str
+    fn: Callable[..., Any]
+    deps: list[str]
+    limit: asyncio.Semaphore | None = None
+    parent: str | None = None
+
+
+class TaskGraph:
+    """Runs a graph of dependent tasks, starting each as soon as it is ready.
+
+    Each task is called with its dependencies' results as positional
+    arguments, in the order the dependencies were declared. Coroutine
+    functions are awaited; plain functions run in a worker thread so that
+    blocking I/O does not stall the event loop.
+
+    Tasks may add further tasks while the graph is running, and may attach
+    new dependencies to tasks that have not started yet. This is how
+    fan-out steps (one search per generated query, one task per outline
+    section) are expressed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty graph."""
+        self._pending: dict[str, _Node] = {}
+        self._results: dict[str, Any] = {}
+        self._running: dict[asyncio.Task[Any], _Node] = {}
+        self._started: set[str] = set()
+        self._origin = 0.0
+        self.report = PipelineReport()
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        deps: Iterable[str] = (),
+        *,
+        limit: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Add a task.
+
+        Dependencies may name tasks that have not been added yet; the task
+        waits until they are added and finished. A task added by another
+        running task also counts that task as a dependency in the timings.
+
+        Args:
+            name: Unique task name.
+            fn: Callable (sync or async) taking the dependency results.
+            deps: Names of the tasks this one depends on.
+            limit: Optional semaphore shared by tasks that must be throttled.
+        """
+        if name in self._pending or name in self._started:
+            raise ValueError(f"Task {name!r} already exists")
+        self._pending[name] = _Node(
+            name=name, fn=fn, deps=list(deps), limit=limit, parent=_current_task.get()
+        )
+
+    def add_value(self, name: str, value: Any) -> None:
+        """Add a task that simply produces a known value.
+
+        Args:
+            name: Unique task name.
+            value: Result of the task.
+        """
+        if name in self._pending or name in self._started:
+            raise ValueError(f"Task {name!r} already exists")
+        self._started.add(name)
+        self._results[name] = value
+        self.report.timings[name] = NodeTiming(name=name)
+
+    def depend(self, name: str, *deps: str) -> None:
+        """Make a task that has not started yet wait for more tasks.
+
+        Extra dependencies are passed after the declared ones.
+
+        Args:
+            name: Task to extend.
+            *deps: Names of additional dependencies.
+        """
+        node = self._pending.get(name)
+        if node is None:
+            raise ValueError(f"Task {name!r} is not pending")
+        node.deps.extend(deps)
+
+    def result(self, name: str) -> Any:
+        """Get the result of a finished task."""
+        return self._results[name]
+
+    async def _run_node(self, node: _Node) -> Any:
+        """Run one task and record its timing."""
+        args = [self._results[d] for d in node.deps]
+        deps = list(node.deps)
+        if node.parent is not None and node.parent not in deps:
+            deps.append(node.parent)
+        timing = NodeTiming(name=node.name, deps=deps)
+        _current_task.set(node.name)
+
+        async def call() -> Any:
+            timing.start = time.monotonic() - self._origin
+            if inspect.iscoroutinefunction(node.fn):
+                result = await node.fn(*args)
+            else:
+                result = await asyncio.to_thread(node.fn, *args)
+            timing.end = time.monotonic() - self._origin
+            return result
+
+        if node.limit is not None:
+            async with node.limit:
+                result = await call()
+        else:
+            result = await call()
+
+        self.report.timings[node.name] = timing
+        logger.debug(f"Task {node.name} finished in {timing.duration:.2f}s")
+        return result
+
+    def _start_ready(self) -> None:
+        """Start every pending task whose dependencies have finished."""
+        for name, node in list(self._pending.items()):
+            if all(d in self._results for d in node.deps):
+                del self._pending[name]
+                self._started.add(name)
+                task = asyncio.create_task(self._run_node(node), name=name)
+                self._running[task] = node
+
+    async def run(self) -> dict[str, Any]:
+        """Run the graph until every task has finished.
+
+        Returns:
+            Results of all tasks keyed by task name.
+
+        Raises:
+            PipelineError: If remaining tasks wait on tasks that never appear.
+            Exception: The first error raised by a task (the rest are cancelled).
+        """
+        self._origin = time.monotonic()
+        try:
+            self._start_ready()
+            while self._running:
+                done, _ = await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = self._running.pop(task)
+                    self._results[node.name] = task.result()
+                self._start_ready()
+        finally:
+            for task in self._running:
+                task.cancel()
+            if self._running:
+                await asyncio.gather(*self._running, return_exceptions=True)
+            self._running.clear()
+            self.report.wall_time = time.monotonic() - self._origin
+
+        if self._pending:
+            missing = {
+                d for node in self._pending.values() for d in node.deps if d not in self._results
+            }
+            raise PipelineError(
+                f"Tasks {sorted(self._pending)} are waiting on unfinished tasks {sorted(missing)}"
+            )
+        return dict(self._results)
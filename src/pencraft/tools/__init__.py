@@ -1,6 +1,24 @@
 """Tools package for Pencraft."""
 
+from pencraft.tools.dedup import NearDuplicates
+from pencraft.tools.domain_rules import DomainRules
+from pencraft.tools.extractors import Extractor, get_extractor
+from pencraft.tools.http_cache import HTTPCache
+from pencraft.tools.ranking import ResultRanker
 from pencraft.tools.scraper import WebScraper
 from pencraft.tools.search import SearchTool
+from pencraft.tools.search_cache import SearchCache
+from pencraft.tools.trends_cache import TrendsCache
 
-__all__ = ["SearchTool", "WebScraper"]
+__all__ = [
+    "DomainRules",
+    "Extractor",
+    "HTTPCache",
+    "NearDuplicates",
+    "ResultRanker",
+    "SearchCache",
+    "SearchTool",
+    "TrendsCache",
+    "WebScraper",
+    "get_extractor",
+]
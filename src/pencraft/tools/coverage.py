@@ -0,0 +1,79 @@
+"""Local estimate of how well search snippets already cover a topic."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from pencraft.tools.ranking import domain_of, tokenize
+
+if TYPE_CHECKING:
+    from pencraft.tools.search import SearchResult
+
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*%?")
+
+# Amounts at which each signal counts as fully covered
+TARGET_TERMS = 120
+TARGET_NUMBERS = 6
+TARGET_DOMAINS = 5
+
+
+@dataclass
+class SnippetCoverage:
+    """How much material the search snippets hold, and the scraping decided on it."""
+
+    score: float
+    query_terms: float
+    distinct_terms: int
+    numbers: int
+    domains: int
+    requested_pages: int = 0
+    planned_pages: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SnippetCoverage:
+        """Create coverage from a dictionary produced by to_dict()."""
+        return cls(**data)
+
+
+def snippet_coverage(results: Sequence[SearchResult], queries: Sequence[str]) -> SnippetCoverage:
+    """Score how well search snippets cover a topic, without any requests.
+
+    The score (0 to 1) weighs the share of topic and query terms found in
+    the snippets (40%) with the number of distinct terms, of distinct
+    numbers (facts such as dates, prices and percentages) and of distinct
+    sites (20% each), each capped at a target amount.
+
+    Args:
+        results: Search results that would be sent to synthesis.
+        queries: Topic and search queries.
+
+    Returns:
+        SnippetCoverage (without a scraping decision).
+    """
+    query_terms = {term for query in queries for term in tokenize(query)}
+    text = " ".join(f"{r.title} {r.snippet}" for r in results)
+    terms = set(tokenize(text))
+    numbers = set(_NUMBER.findall(" ".join(r.snippet for r in results)))
+    domains = {domain_of(r.url) for r in results}
+
+    found = len(query_terms & terms) / len(query_terms) if query_terms else 0.0
+    score = (
+        0.4 * found
+        + 0.2 * min(1.0, len(terms) / TARGET_TERMS)
+        + 0.2 * min(1.0, len(numbers) / TARGET_NUMBERS)
+        + 0.2 * min(1.0, len(domains) / TARGET_DOMAINS)
+    )
+    return SnippetCoverage(
+        score=round(score, 3),
+        query_terms=round(found, 3),
+        distinct_terms=len(terms),
+        numbers=len(numbers),
+        domains=len(domains),
+    )
@@ -0,0 +1,91 @@
+"""Near-duplicate detection with SimHash fingerprints."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from hashlib import blake2b
+
+_WORD = re.compile(r"\w+")
+
+FINGERPRINT_BITS = 64
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """Compute the 64-bit SimHash fingerprint of a text.
+
+    Texts that share most of their word shingles get fingerprints that
+    differ in only a few bits.
+
+    Args:
+        text: Text to fingerprint.
+        shingle_size: Words per shingle.
+
+    Returns:
+        Fingerprint (0 for a text without words).
+    """
+    words = _WORD.findall(text.lower())
+    shingles = Counter(
+        " ".join(words[i : i + shingle_size]) for i in range(max(1, len(words) - shingle_size + 1))
+    )
+    counts = [0] * FINGERPRINT_BITS
+    for shingle, weight in shingles.items():
+        digest = blake2b(shingle.encode(), digest_size=FINGERPRINT_BITS // 8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(FINGERPRINT_BITS):
+            counts[bit] += weight if value >> bit & 1 else -weight
+    return sum(1 << bit for bit, count in enumerate(counts) if count > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count the bits in which two fingerprints differ."""
+    return bin(a ^ b).count("1")
+
+
+class NearDuplicates:
+    """Remembers the texts seen so far and spots near-copies of them.
+
+    Meant for the handful of pages and snippets of one research run, so
+    fingerprints are compared one by one. With so few texts a loose
+    threshold is safe: unrelated texts differ in about half of the bits.
+    """
+
+    def __init__(self, max_distance: int = 10, min_words: int = 8) -> None:
+        """Initialize the detector.
+
+        Args:
+            max_distance: Most fingerprint bits in which near-duplicates differ.
+            min_words: Shorter texts are never treated as duplicates.
+        """
+        self.max_distance = max_distance
+        self.min_words = min_words
+        self._seen: list[tuple[int, str]] = []
+
+    def check(self, key: str, text: str) -> str | None:
+        """Check a text against those seen so far, remembering it if it is new.
+
+        Args:
+            key: Name of the text, such as its URL.
+            text: Text to check.
+
+        Returns:
+            Key of the earlier text it nearly duplicates, or None if it is new.
+        """
+        if len(_WORD.findall(text)) < self.min_words:
+            return None
+        fingerprint = simhash(text)
+        for seen, seen_key in self._seen:
+            if hamming_distance(fingerprint, seen) <= self.max_distance:
+                return seen_key
+        self._seen.append((fingerprint, key))
+        return None
+
+    def copy(self) -> NearDuplicates:
+        """Get a detector that has seen the same texts, for trial checks.
+
+        Returns:
+            New NearDuplicates; checks on it leave this one unchanged.
+        """
+        other = NearDuplicates(self.max_distance, self.min_words)
+        other._seen = list(self._seen)
+        return other
@@ -0,0 +1,247 @@
+"""Per-domain content selectors learned from (or configured for) scraped sites."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from pencraft.tools.extractors import SIMPLE_SELECTOR, ExtractedPage, Extractor
+from pencraft.utils.cache import DiskCache
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import CacheSettings, ResearchSettings
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest page in a rule's average word count
+_WORDS_SMOOTHING = 0.2
+
+
+@dataclass
+class DomainRule:
+    """Where a site keeps its main content."""
+
+    selector: str
+    words: float = 0.0
+    pages: int = 0
+    manual: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DomainRule:
+        """Create a rule from a dictionary produced by to_dict()."""
+        return cls(**data)
+
+
+@dataclass
+class DomainRuleStats:
+    """Counters showing how domain rules were used."""
+
+    fast_path: int = 0
+    learned: int = 0
+    invalidated: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class DomainRules:
+    """Remembers which container holds the main content on each domain.
+
+    When the scoring extractor picks the same container selector on
+    ``min_pages`` pages of a domain, later pages of that domain are
+    extracted from that container directly (the fast path). A learned rule
+    is dropped as soon as it stops working: when the selector matches
+    nothing or the page's word count collapses below ``collapse_ratio``
+    of the domain's average. Configured rules are never dropped, but a
+    page where they fail is extracted normally. With ``learn`` off only the
+    configured rules are used.
+    """
+
+    def __init__(
+        self,
+        store: DiskCache | None = None,
+        manual: dict[str, str] | None = None,
+        *,
+        min_pages: int = 2,
+        collapse_ratio: float = 0.25,
+        learn: bool = True,
+    ) -> None:
+        """Initialize the domain rules.
+
+        Args:
+            store: Disk store for learned rules (None keeps them in memory).
+            manual: Configured selectors by domain.
+            min_pages: Pages that must agree on a selector before it is used.
+            collapse_ratio: Fraction of the average word count below which a
+                page extracted with a rule counts as a failure.
+            learn: Whether to learn rules for domains without a configured one.
+
+        Raises:
+            ValueError: If a configured selector is not a simple selector.
+        """
+        self.store = store
+        self.min_pages = min_pages
+        self.collapse_ratio = collapse_ratio
+        self.learn = learn
+        self.stats = DomainRuleStats()
+        self._lock = threading.Lock()
+        self._rules: dict[str, DomainRule | None] = {}
+        for domain, selector in (manual or {}).items():
+            if not selector or not SIMPLE_SELECTOR.fullmatch(selector):
+                raise ValueError(f"Unsupported selector for {domain}: {selector!r}")
+            self._rules[self.domain(domain)] = DomainRule(selector, manual=True)
+
+    @classmethod
+    def from_settings(cls, cache: CacheSettings, research: ResearchSettings) -> DomainRules | None:
+        """Create domain rules from settings.
+
+        Args:
+            cache: Cache settings (learned rules go to ``<directory>/domains.sqlite3``).
+            research: Research settings with configured selectors.
+
+        Returns:
+            DomainRules instance, holding only the configured selectors when
+            learning is disabled, or None if there is nothing to use.
+        """
+        if not cache.domain_rules_enabled:
+            if not research.domain_selectors:
+                return None
+            return cls(None, research.domain_selectors, learn=False)
+        store = DiskCache(Path(cache.directory).expanduser() / "domains.sqlite3")
+        return cls(store, research.domain_selectors)
+
+    @staticmethod
+    def domain(url: str) -> str:
+        """Get the domain rules are kept for (a URL or a bare host name).
+
+        Args:
+            url: Page URL or host name.
+
+        Returns:
+            Lower-cased host without a leading "www.".
+        """
+        host = urlparse(url).hostname if "//" in url else url.split(":")[0]
+        host = (host or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def get(self, domain: str) -> DomainRule | None:
+        """Get the rule of a domain, whether or not it is in use yet.
+
+        Args:
+            domain: Domain from domain().
+
+        Returns:
+            DomainRule, or None if nothing is known about the domain.
+        """
+        with self._lock:
+            if domain in self._rules:
+                return self._rules[domain]
+
+        rule = None
+        entry = self.store.get(domain) if self.store is not None else None
+        if entry is not None:
+            try:
+                rule = DomainRule.from_dict(entry)
+            except TypeError as e:
+                logger.warning(f"Discarding unreadable domain rule for {domain}: {e}")
+
+        with self._lock:
+            return self._rules.setdefault(domain, rule)
+
+    def _count(self, stat: str) -> None:
+        """Increment a statistics counter."""
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def _save(self, domain: str, rule: DomainRule | None) -> None:
+        """Store or delete a domain's rule."""
+        with self._lock:
+            self._rules[domain] = rule
+        if self.store is None or (rule is not None and rule.manual):
+            return
+        if rule is None:
+            self.store.delete(domain)
+        else:
+            self.store.set(domain, rule.to_dict())
+
+    def invalidate(self, domain: str) -> None:
+        """Forget a domain's learned rule.
+
+        Args:
+            domain: Domain from domain().
+        """
+        self._count("invalidated")
+        self._save(domain, None)
+
+    def extract(self, extractor: Extractor, url: str, html: str) -> ExtractedPage:
+        """Extract a page, using and updating its domain's rule.
+
+        Args:
+            extractor: Extraction backend.
+            url: Page URL.
+            html: Page HTML.
+
+        Returns:
+            ExtractedPage with the page's parts.
+        """
+        domain = self.domain(url)
+        rule = self.get(domain)
+        if rule is not None and (rule.manual or rule.pages >= self.min_pages):
+            page = extractor.extract(html, selector=rule.selector)
+            words = len(page.content.split())
+            if words and words >= rule.words * self.collapse_ratio:
+                self._count("fast_path")
+                self._record(domain, rule, words)
+                return page
+
+            if rule.manual:
+                logger.warning(
+                    f"Configured selector {rule.selector} for {domain} found {words} words "
+                    f"on {url}, extracting it normally"
+                )
+                return extractor.extract(html)
+            logger.info(
+                f"Content rule {rule.selector} for {domain} stopped working "
+                f"({words} words, about {rule.words:.0f} expected), relearning"
+            )
+            self.invalidate(domain)
+            rule = None
+
+        page = extractor.extract(html)
+        if self.learn and page.container and (rule is None or not rule.manual):
+            self._learn(domain, rule, page)
+        return page
+
+    def _record(self, domain: str, rule: DomainRule, words: int) -> None:
+        """Add a page extracted with a rule to its statistics."""
+        with self._lock:
+            if rule.pages:
+                rule.words += (words - rule.words) * _WORDS_SMOOTHING
+            else:
+                rule.words = float(words)
+            rule.pages += 1
+        self._save(domain, rule)
+
+    def _learn(self, domain: str, rule: DomainRule | None, page: ExtractedPage) -> None:
+        """Count a page whose content the extractor found in ``page.container``."""
+        words = len(page.content.split())
+        if rule is None or rule.selector != page.container:
+            rule = DomainRule(page.container)
+        self._record(domain, rule, words)
+        if rule.pages == self.min_pages:
+            self._count("learned")
+            logger.info(f"Learned content rule {rule.selector} for {domain}")
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        if self.store is not None:
+            self.store.close()
@@ -0,0 +1,604 @@
+"""HTML extraction backends used by the web scraper."""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+from pencraft.tools.readability import clean_content, main_content, paragraphs, selector_for
+
+logger = logging.getLogger(__name__)
+
+# Common elements to remove that don't contain main content
+REMOVE_SELECTORS = [
+    "script",
+    "style",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "advertisement",
+    ".ad",
+    ".ads",
+    ".sidebar",
+    ".navigation",
+    ".menu",
+    ".cookie",
+    ".popup",
+    ".modal",
+    "#comments",
+    ".comments",
+    ".social-share",
+    ".related-posts",
+]
+
+# Containers tried in order for the main text
+CONTENT_CONTAINERS = ("article", "main", "body")
+
+HEADING_TAGS = ("h1", "h2", "h3")
+
+# Selectors usable as content containers: a tag and/or classes and ids
+SIMPLE_SELECTOR = re.compile(r"(?:[a-zA-Z][\w-]*)?(?:[.#][\w-]+)*")
+
+
+def clean_text(text: str) -> str:
+    """Collapse runs of blank lines and spaces in extracted text.
+
+    Args:
+        text: Raw text.
+
+    Returns:
+        Cleaned text.
+    """
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = re.sub(r" {2,}", " ", text)
+    return text.strip()
+
+
+def selector_xpath(selector: str) -> str:
+    """Translate a simple selector like ``div.entry-content`` to XPath.
+
+    Args:
+        selector: Tag name, ``.class`` and ``#id`` parts.
+
+    Returns:
+        XPath expression matching the selector anywhere in the document.
+
+    Raises:
+        ValueError: If the selector is not a simple selector.
+    """
+    if not selector or not SIMPLE_SELECTOR.fullmatch(selector):
+        raise ValueError(f"Unsupported selector: {selector!r}")
+    tag, *parts = re.split(r"(?=[.#])", selector)
+    conditions = [
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {part[1:]} ')"
+        if part[0] == "."
+        else f"@id='{part[1:]}'"
+        for part in parts
+    ]
+    return f"//{tag.lower() or '*'}" + "".join(f"[{c}]" for c in conditions)
+
+
+@dataclass
+class ExtractedPage:
+    """Readable parts of an HTML page."""
+
+    title: str = ""
+    meta_description: str = ""
+    headings: list[str] = field(default_factory=list)
+    content: str = ""
+    # Selector of the element the content came from, when it is reusable
+    container: str = ""
+
+
+class Extractor(ABC):
+    """Turns page HTML into title, description, headings and body text.
+
+    Boilerplate matching ``remove_selectors`` is left out of the body text,
+    while the title, description and headings are taken from the whole page.
+    """
+
+    name: str = ""
+
+    def __init__(self, remove_selectors: Sequence[str] = REMOVE_SELECTORS) -> None:
+        """Initialize the extractor.
+
+        Args:
+            remove_selectors: CSS selectors of elements left out of the body text.
+        """
+        self.remove_selectors = list(remove_selectors)
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the libraries this backend needs are installed."""
+        return True
+
+    @abstractmethod
+    def extract(self, html: str, selector: str | None = None) -> ExtractedPage:
+        """Extract the readable parts of a page.
+
+        Args:
+            html: Page HTML.
+            selector: Take the body text from the first element matching
+                this simple selector instead of finding it (empty if none
+                matches).
+
+        Returns:
+            ExtractedPage with the page's parts.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the backend (nothing by default)."""
+
+
+class SoupExtractor(Extractor):
+    """Extractor using BeautifulSoup's pure-Python html.parser.
+
+    Always available, but each selector is a separate walk over the tree.
+    """
+
+    name = "soup"
+
+    def extract(self, html: str, selector: str | None = None) -> ExtractedPage:
+        """Extract the readable parts of a page."""
+        soup = BeautifulSoup(html, "html.parser")
+
+        title = self._extract_title(soup)
+        meta_description = self._extract_meta_description(soup)
+        headings = self._extract_headings(soup)
+
+        # Remove unwanted elements
+        for remove in self.remove_selectors:
+            for element in soup.select(remove):
+                element.decompose()
+
+        if selector:
+            container = soup.select_one(selector)
+            content = (
+                clean_text(container.get_text(separator="\n", strip=True)) if container else ""
+            )
+        else:
+            content = self._extract_content(soup)
+
+        return ExtractedPage(
+            title=title,
+            meta_description=meta_description,
+            headings=headings,
+            content=content,
+            container=selector or "",
+        )
+
+    def _extract_title(self, soup: BeautifulSoup) -> str:
+        """Extract page title.
+
+        Args:
+            soup: BeautifulSoup object.
+
+        Returns:
+            Page title or empty string.
+        """
+        # Try og:title first
+        og_title = soup.find("meta", property="og:title")
+        if og_title and og_title.get("content"):  # type: ignore[union-attr]
+            return str(og_title.get("content", ""))  # type: ignore[union-attr]
+
+        # Try title tag
+        if soup.title and soup.title.string:
+            return soup.title.string.strip()
+
+        # Try h1
+        h1 = soup.find("h1")
+        if h1:
+            return h1.get_text(strip=True)
+
+        return ""
+
+    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
+        """Extract meta description.
+
+        Args:
+            soup: BeautifulSoup object.
+
+        Returns:
+            Meta description or empty string.
+        """
+        # Try og:description
+        og_desc = soup.find("meta", property="og:description")
+        if og_desc and og_desc.get("content"):  # type: ignore[union-attr]
+            return str(og_desc.get("content", ""))  # type: ignore[union-attr]
+
+        # Try meta description
+        meta_desc = soup.find("meta", attrs={"name": "description"})
+        if meta_desc and meta_desc.get("content"):  # type: ignore[union-attr]
+            return str(meta_desc.get("content", ""))  # type: ignore[union-attr]
+
+        return ""
+
+    def _extract_headings(self, soup: BeautifulSoup) -> list[str]:
+        """Extract all headings.
+
+        Args:
+            soup: BeautifulSoup object.
+
+        Returns:
+            List of heading texts.
+        """
+        headings = []
+        for tag in HEADING_TAGS:
+            for heading in soup.find_all(tag):
+                text = heading.get_text(strip=True)
+                if text:
+                    headings.append(text)
+        return headings
+
+    def _extract_content(self, soup: BeautifulSoup) -> str:
+        """Extract main content text.
+
+        Args:
+            soup: BeautifulSoup object.
+
+        Returns:
+            Cleaned content text.
+        """
+        for tag in CONTENT_CONTAINERS:
+            container = soup.find(tag)
+            if container:
+                return clean_text(container.get_text(separator="\n", strip=True))
+        return clean_text(soup.get_text(separator="\n", strip=True))
+
+
+class LxmlExtractor(Extractor):
+    """Extractor using lxml's C parser and a single walk over the tree.
+
+    Boilerplate is pruned, and the title, description, headings and body
+    text are collected, in one traversal. Only simple selectors (``tag``,
+    ``.class`` and ``#id``) are supported.
+    """
+
+    name = "lxml"
+
+    def __init__(self, remove_selectors: Sequence[str] = REMOVE_SELECTORS) -> None:
+        """Initialize the extractor.
+
+        Args:
+            remove_selectors: Selectors of elements left out of the body text.
+
+        Raises:
+            ValueError: If a selector is not a plain tag, class or id.
+        """
+        super().__init__(remove_selectors)
+        self._tags: set[str] = set()
+        self._classes: set[str] = set()
+        self._ids: set[str] = set()
+        for selector in self.remove_selectors:
+            if not re.fullmatch(r"[.#]?[\w-]+", selector):
+                raise ValueError(f"Unsupported selector for the lxml extractor: {selector!r}")
+            if selector[0] == ".":
+                self._classes.add(selector[1:])
+            elif selector[0] == "#":
+                self._ids.add(selector[1:])
+            else:
+                self._tags.add(selector.lower())
+        # lxml parsers must not be shared between threads
+        self._local = threading.local()
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether lxml is installed."""
+        return importlib.util.find_spec("lxml") is not None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the per-thread parsers (for worker processes)."""
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled extractor."""
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _parser(self) -> Any:
+        """Get this thread's HTML parser."""
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            from lxml import html
+
+            # The text is already decoded, so ignore any <meta charset>
+            parser = self._local.parser = html.HTMLParser(encoding="utf-8")
+        return parser
+
+    def _is_removed(self, element: Any) -> bool:
+        """Check whether an element matches one of the remove selectors."""
+        if element.tag in self._tags:
+            return True
+        if self._ids and element.get("id") in self._ids:
+            return True
+        classes = element.get("class")
+        return bool(classes and self._classes.intersection(classes.split()))
+
+    def extract(self, html: str, selector: str | None = None) -> ExtractedPage:
+        """Extract the readable parts of a page."""
+        from lxml import etree
+        from lxml import html as lxml_html
+
+        try:
+            root = lxml_html.document_fromstring(
+                html.encode("utf-8", errors="replace"), parser=self._parser()
+            )
+        except (etree.ParserError, ValueError):
+            return ExtractedPage()
+
+        target = None
+        if selector:
+            target = next(iter(root.xpath(selector_xpath(selector))), None)
+
+        og_title: Any = None
+        title: Any = None
+        og_description: Any = None
+        description: Any = None
+        headings: dict[str, list[str]] = {tag: [] for tag in HEADING_TAGS}
+
+        # Stripped text fragments in document order, and where the first
+        # container of each kind (or the selector's target) that survived
+        # pruning starts and ends
+        fragments: list[str] = []
+        starts: dict[str, tuple[Any, int]] = {}
+        spans: dict[str, tuple[int, int]] = {}
+        removed: list[Any] = []
+        removed_depth = 0
+
+        def add(text: str | None) -> None:
+            if text and removed_depth == 0:
+                text = text.strip()
+                if text:
+                    fragments.append(text)
+
+        for event, element in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions: only the tail is text
+                add(element.tail)
+                continue
+
+            if event == "start":
+                if tag == "meta":
+                    prop = element.get("property")
+                    if prop == "og:title" and og_title is None:
+                        og_title = element
+                    elif prop == "og:description" and og_description is None:
+                        og_description = element
+                    if element.get("name") == "description" and description is None:
+                        description = element
+                elif tag == "title" and title is None:
+                    title = element
+                elif tag in headings:
+                    text = "".join(s.strip() for s in element.itertext())
+                    if text:
+                        headings[tag].append(text)
+
+                if removed_depth or self._is_removed(element):
+                    if not removed_depth:
+                        removed.append(element)
+                    removed_depth += 1
+                    continue
+                if element is target:
+                    starts[selector or ""] = (element, len(fragments))
+                if tag in CONTENT_CONTAINERS and tag not in starts:
+                    starts[tag] = (element, len(fragments))
+                add(element.text)
+            else:
+                if removed_depth:
+                    removed_depth -= 1
+                else:
+                    if element is target:
+                        spans[selector or ""] = (starts[selector or ""][1], len(fragments))
+                    if tag in starts and starts[tag][0] is element:
+                        spans[tag] = (starts[tag][1], len(fragments))
+                add(element.tail)
+
+        content, container = self._content(root, fragments, spans, removed, selector)
+        return ExtractedPage(
+            title=self._title(og_title, title, root),
+            meta_description=self._content_attr(og_description) or self._content_attr(description),
+            headings=[text for tag in HEADING_TAGS for text in headings[tag]],
+            content=content,
+            container=container,
+        )
+
+    def _content(
+        self,
+        root: Any,  # noqa: ARG002
+        fragments: list[str],
+        spans: dict[str, tuple[int, int]],
+        removed: list[Any],  # noqa: ARG002
+        selector: str | None,
+    ) -> tuple[str, str]:
+        """Build the body text from the fragments collected by the walk.
+
+        Args:
+            root: Parsed page.
+            fragments: Text fragments outside removed elements, in document order.
+            spans: Fragment range of the first article, main and body element,
+                and of the selector's target.
+            removed: Outermost elements matching the remove selectors.
+            selector: Selector the content must come from, if any.
+
+        Returns:
+            Tuple of the cleaned content text and the selector it came from.
+        """
+        if selector:
+            if selector not in spans:
+                return "", selector
+            start, end = spans[selector]
+            return clean_text("\n".join(fragments[start:end])), selector
+
+        content_fragments = fragments
+        for tag in CONTENT_CONTAINERS:
+            if tag in spans:
+                start, end = spans[tag]
+                content_fragments = fragments[start:end]
+                break
+        return clean_text("\n".join(content_fragments)), ""
+
+    @staticmethod
+    def _content_attr(meta: Any) -> str:
+        """Get the content attribute of a meta element, if any."""
+        return str(meta.get("content") or "") if meta is not None else ""
+
+    def _title(self, og_title: Any, title: Any, root: Any) -> str:
+        """Pick the page title the same way SoupExtractor does."""
+        if text := self._content_attr(og_title):
+            return text
+        # Only a <title> holding plain text counts, like BeautifulSoup's .string
+        if title is not None and len(title) == 0 and title.text:
+            return str(title.text).strip()
+        h1 = next(root.iter("h1"), None)
+        if h1 is not None:
+            return "".join(s.strip() for s in h1.itertext())
+        return ""
+
+
+class ReadabilityExtractor(LxmlExtractor):
+    """Extractor that scores blocks to find the main content, like Readability.
+
+    Instead of taking the whole article/main/body container, the densest
+    block of paragraph text is kept, and link lists, comments and similar
+    boilerplate inside it are dropped. The content is returned as
+    paragraphs separated by blank lines. Pages without enough paragraph
+    text fall back to the container text.
+
+    When the chosen block has a stable class or id, its selector is
+    reported in ``container`` so it can be reused for the site's other
+    pages; passing it back as ``selector`` skips the scoring.
+    """
+
+    name = "readability"
+
+    # Content shorter than this is not trusted over the container text
+    min_content_length = 140
+
+    def _content(
+        self,
+        root: Any,
+        fragments: list[str],
+        spans: dict[str, tuple[int, int]],
+        removed: list[Any],
+        selector: str | None,
+    ) -> tuple[str, str]:
+        """Build the body text from the highest scoring content block."""
+        for element in removed:
+            if element.getparent() is not None:
+                element.drop_tree()
+
+        if selector:
+            target = next(iter(root.xpath(selector_xpath(selector))), None)
+            if target is None:
+                return "", selector
+            clean_content(target)
+            return paragraphs([target]), selector
+
+        elements = main_content(root)
+        content = paragraphs(elements)
+        if len(content) < self.min_content_length:
+            return super()._content(root, fragments, spans, removed, selector)
+
+        container = ""
+        if len(elements) == 1:
+            # Only reuse selectors that find this same element again
+            candidate = selector_for(elements[0])
+            if candidate and root.xpath(selector_xpath(candidate))[0] is elements[0]:
+                container = candidate
+        return content, container
+
+
+def _run_extractor(extractor: Extractor, html: str, selector: str | None) -> ExtractedPage:
+    """Run an extractor in a worker process."""
+    return extractor.extract(html, selector)
+
+
+class ProcessPoolExtractor(Extractor):
+    """Runs another extractor in worker processes.
+
+    Parsing then holds neither the event loop nor the GIL of the calling
+    process, at the cost of sending each page to a worker. extract()
+    blocks until the worker is done, so call it from a thread.
+    """
+
+    def __init__(self, extractor: Extractor, max_workers: int = 2) -> None:
+        """Initialize the pooled extractor.
+
+        Args:
+            extractor: Extractor run in the workers (must be picklable).
+            max_workers: Worker processes.
+        """
+        super().__init__(extractor.remove_selectors)
+        self.extractor = extractor
+        self.name = extractor.name
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def extract(self, html: str, selector: str | None = None) -> ExtractedPage:
+        """Extract the readable parts of a page in a worker process."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            pool = self._pool
+        return pool.submit(_run_extractor, self.extractor, html, selector).result()
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+# Backends in order of preference for "auto"
+EXTRACTORS: dict[str, type[Extractor]] = {
+    LxmlExtractor.name: LxmlExtractor,
+    SoupExtractor.name: SoupExtractor,
+    ReadabilityExtractor.name: ReadabilityExtractor,
+}
+
+
+def get_extractor(
+    name: str = "auto", remove_selectors: Sequence[str] = REMOVE_SELECTORS
+) -> Extractor:
+    """Create an extraction backend.
+
+    Args:
+        name: Backend name from EXTRACTORS, or "auto" for the fastest installed one.
+        remove_selectors: Selectors of elements left out of the body text.
+
+    Returns:
+        Extractor instance. A backend whose library is missing falls back to
+        the BeautifulSoup one.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name == "auto":
+        for cls in EXTRACTORS.values():
+            if cls.available():
+                return cls(remove_selectors)
+    if name not in EXTRACTORS:
+        raise ValueError(
+            f"Unknown extractor {name!r}, expected one of: auto, {', '.join(EXTRACTORS)}"
+        )
+
+    cls = EXTRACTORS[name]
+    if not cls.available():
+        logger.warning(f"The {name} extractor is not installed, using {SoupExtractor.name}")
+        cls = SoupExtractor
+    return cls(remove_selectors)
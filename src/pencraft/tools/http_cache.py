@@ -0,0 +1,328 @@
+"""HTTP cache for scraped pages with conditional revalidation."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pencraft.tools.scraper import ScrapedContent
+from pencraft.utils.cache import DiskCache, make_cache_key
+
+if TYPE_CHECKING:
+    import httpx
+
+    from pencraft.config.settings import CacheSettings
+
+logger = logging.getLogger(__name__)
+
+# Heuristic freshness is this fraction of the time since Last-Modified (RFC 9111 4.2.2)
+_HEURISTIC_FRACTION = 0.1
+
+_DIRECTIVE = re.compile(r"([a-z-]+)(?:=\"?([^\",]*)\"?)?")
+
+
+def parse_cache_control(value: str) -> dict[str, str | None]:
+    """Parse a Cache-Control header into its directives.
+
+    Args:
+        value: Header value (e.g. "public, max-age=3600").
+
+    Returns:
+        Lower-cased directive names mapped to their values (None if bare).
+    """
+    return {name: arg or None for name, arg in _DIRECTIVE.findall(value.lower())}
+
+
+def _http_date(value: str | None) -> float | None:
+    """Parse an HTTP date header into a timestamp."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: httpx.Headers, default_ttl: float) -> float:
+    """Get how many seconds a response stays fresh.
+
+    Uses max-age/s-maxage, then Expires, then a fraction of the time since
+    Last-Modified (capped at ``default_ttl``), then ``default_ttl``. The
+    Age header is subtracted.
+
+    Args:
+        headers: Response headers.
+        default_ttl: Lifetime when the server gives no hint.
+
+    Returns:
+        Remaining freshness in seconds (0 means revalidate on next use).
+    """
+    directives = parse_cache_control(headers.get("cache-control", ""))
+    if "no-cache" in directives:
+        return 0.0
+
+    date = _http_date(headers.get("date")) or time.time()
+    lifetime: float | None = None
+    for name in ("s-maxage", "max-age"):
+        arg = directives.get(name)
+        if arg and arg.isdigit():
+            lifetime = float(arg)
+            break
+
+    if lifetime is None and "expires" in headers:
+        expires = _http_date(headers.get("expires"))
+        lifetime = max(0.0, expires - date) if expires is not None else 0.0
+
+    if lifetime is None:
+        last_modified = _http_date(headers.get("last-modified"))
+        if last_modified is not None and last_modified < date:
+            lifetime = min(default_ttl, (date - last_modified) * _HEURISTIC_FRACTION)
+        else:
+            lifetime = default_ttl
+
+    age = headers.get("age", "")
+    if age.isdigit():
+        lifetime -= float(age)
+    return max(0.0, lifetime)
+
+
+def is_storable(headers: httpx.Headers) -> bool:
+    """Check whether a response may be stored at all (this is a private cache)."""
+    return "no-store" not in parse_cache_control(headers.get("cache-control", ""))
+
+
+@dataclass
+class CachedPage:
+    """A cached response together with the content extracted from it."""
+
+    url: str
+    body: str
+    content: ScrapedContent
+    parser: str
+    fresh_until: float
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the page can be used without asking the server."""
+        return time.time() < self.fresh_until
+
+    def validators(self) -> dict[str, str]:
+        """Get conditional request headers for revalidating the page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "url": self.url,
+            "body": self.body,
+            "content": self.content.to_dict(),
+            "parser": self.parser,
+            "fresh_until": self.fresh_until,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "stored_at": self.stored_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedPage:
+        """Create a cached page from a dictionary produced by to_dict()."""
+        return cls(**{**data, "content": ScrapedContent(**data["content"])})
+
+
+@dataclass
+class HTTPCacheStats:
+    """Counters showing how scrapes were served."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    negative_hits: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "negative_hits": self.negative_hits,
+        }
+
+
+class HTTPCache:
+    """Persistent cache of scraped pages that follows HTTP caching rules.
+
+    Fresh pages are served without touching the network or re-parsing.
+    Stale pages are revalidated with If-None-Match/If-Modified-Since, so a
+    304 answer costs a round trip but no download or parse. URLs that
+    recently failed (timeouts, 4xx/5xx) are remembered for a while so dead
+    links are not retried on every run.
+    """
+
+    def __init__(
+        self,
+        store: DiskCache,
+        *,
+        default_ttl: float = 6 * 3600,
+        negative_ttl: float = 30 * 60,
+    ) -> None:
+        """Initialize the HTTP cache.
+
+        Args:
+            store: Disk store holding pages and failures.
+            default_ttl: Freshness of pages without caching headers, in seconds.
+            negative_ttl: Seconds a failed URL is skipped for.
+        """
+        self.store = store
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.stats = HTTPCacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> HTTPCache:
+        """Create an HTTP cache from cache settings.
+
+        Args:
+            settings: Cache settings.
+
+        Returns:
+            HTTPCache backed by ``<directory>/http.sqlite3``.
+        """
+        store = DiskCache(
+            Path(settings.directory).expanduser() / "http.sqlite3",
+            max_size_bytes=int(settings.http_max_size_mb * 1024 * 1024),
+            max_age_seconds=settings.http_max_age_days * 86400,
+        )
+        return cls(
+            store,
+            default_ttl=settings.http_default_ttl_hours * 3600,
+            negative_ttl=settings.http_negative_ttl_minutes * 60,
+        )
+
+    def _count(self, stat: str) -> None:
+        """Increment a statistics counter."""
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def get(self, url: str) -> CachedPage | None:
+        """Look up a cached page, fresh or stale.
+
+        Args:
+            url: Page URL.
+
+        Returns:
+            CachedPage, or None if the URL was never stored.
+        """
+        entry = self.store.get(make_cache_key("page", url))
+        if entry is None:
+            self._count("misses")
+            return None
+        try:
+            page = CachedPage.from_dict(entry)
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable cached page {url}: {e}")
+            self.store.delete(make_cache_key("page", url))
+            self._count("misses")
+            return None
+
+        if page.is_fresh:
+            self._count("hits")
+        return page
+
+    def put(
+        self,
+        url: str,
+        response: httpx.Response,
+        body: str,
+        content: ScrapedContent,
+        parser: str,
+    ) -> None:
+        """Store a downloaded page.
+
+        Args:
+            url: Requested URL.
+            response: Successful response.
+            body: Decoded response body.
+            content: Content extracted from the body.
+            parser: Identifier of the parser that produced ``content``.
+        """
+        self.store.delete(make_cache_key("failure", url))
+        if not is_storable(response.headers):
+            return
+        page = CachedPage(
+            url=url,
+            body=body,
+            content=content,
+            parser=parser,
+            fresh_until=time.time() + freshness_lifetime(response.headers, self.default_ttl),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        self.save(page)
+
+    def save(self, page: CachedPage) -> None:
+        """Store a cached page (e.g. after re-parsing it).
+
+        Args:
+            page: Page to store.
+        """
+        self.store.set(make_cache_key("page", page.url), page.to_dict())
+
+    def revalidated(self, page: CachedPage, response: httpx.Response) -> CachedPage:
+        """Refresh a stale page after the server answered 304 Not Modified.
+
+        Args:
+            page: Stale cached page.
+            response: The 304 response.
+
+        Returns:
+            The refreshed page.
+        """
+        self._count("revalidated")
+        page.fresh_until = time.time() + freshness_lifetime(response.headers, self.default_ttl)
+        page.etag = response.headers.get("etag", page.etag)
+        page.last_modified = response.headers.get("last-modified", page.last_modified)
+        self.save(page)
+        return page
+
+    def get_failure(self, url: str) -> str | None:
+        """Get the error of a recent failed fetch.
+
+        Args:
+            url: Page URL.
+
+        Returns:
+            Error message, or None if the URL has not failed recently.
+        """
+        error = self.store.get(make_cache_key("failure", url))
+        if error is None:
+            return None
+        self._count("negative_hits")
+        return str(error)
+
+    def put_failure(self, url: str, error: str) -> None:
+        """Remember that fetching a URL failed.
+
+        Args:
+            url: Page URL.
+            error: Error message.
+        """
+        self.store.set(make_cache_key("failure", url), error, ttl=self.negative_ttl)
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        self.store.close()
@@ -0,0 +1,108 @@
+"""Persistent cache of the research notes taken on scraped pages."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pencraft.utils.cache import DiskCache, make_cache_key
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import CacheSettings
+
+
+@dataclass
+class NotesCacheStats:
+    """Hit/miss counters of the notes cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class NotesCache:
+    """Caches the notes taken on a page, keyed on its URL and content.
+
+    Notes do not depend on the topic being researched, so a popular page
+    is summarized once and reused by every post that scrapes it, for as
+    long as its content stays the same.
+    """
+
+    def __init__(self, store: DiskCache, ttl: float | None = None) -> None:
+        """Initialize the notes cache.
+
+        Args:
+            store: Disk store holding the notes.
+            ttl: Seconds before cached notes expire (None keeps them).
+        """
+        self.store = store
+        self.ttl = ttl
+        self.stats = NotesCacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> NotesCache:
+        """Create a notes cache from cache settings.
+
+        Args:
+            settings: Cache settings.
+
+        Returns:
+            NotesCache backed by ``<directory>/notes.sqlite3``.
+        """
+        store = DiskCache(Path(settings.directory).expanduser() / "notes.sqlite3")
+        return cls(store, ttl=settings.notes_ttl_days * 86400)
+
+    @staticmethod
+    def key(url: str, content: str, model: str, prompt: str) -> str:
+        """Build the cache key of the notes on a page.
+
+        Args:
+            url: Page URL.
+            content: Page text the notes are taken on.
+            model: Model taking the notes.
+            prompt: Prompt template (edits invalidate old notes).
+
+        Returns:
+            Cache key.
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return make_cache_key("notes", url, content_hash, model, prompt)
+
+    def get(self, key: str) -> str | None:
+        """Look up cached notes.
+
+        Args:
+            key: Key from key().
+
+        Returns:
+            Cached notes, or None on a miss.
+        """
+        notes = self.store.get(key)
+        if not isinstance(notes, str):
+            notes = None
+        with self._lock:
+            if notes is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return notes
+
+    def put(self, key: str, notes: str) -> None:
+        """Store notes.
+
+        Args:
+            key: Key from key().
+            notes: Notes taken on the page.
+        """
+        self.store.set(key, notes, ttl=self.ttl)
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        self.store.close()
@@ -0,0 +1,251 @@
+"""Relevance ranking of search results before scraping."""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import ResearchSettings
+    from pencraft.tools.search import SearchResult
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+
+# Common English words that carry no relevance signal
+STOPWORDS = frozenset(
+    [
+        "a",
+        "about",
+        "after",
+        "all",
+        "also",
+        "an",
+        "and",
+        "any",
+        "are",
+        "as",
+        "at",
+        "be",
+        "been",
+        "but",
+        "by",
+        "can",
+        "could",
+        "do",
+        "does",
+        "for",
+        "from",
+        "had",
+        "has",
+        "have",
+        "how",
+        "i",
+        "if",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "just",
+        "more",
+        "most",
+        "my",
+        "no",
+        "not",
+        "of",
+        "on",
+        "or",
+        "our",
+        "out",
+        "so",
+        "than",
+        "that",
+        "the",
+        "their",
+        "them",
+        "then",
+        "there",
+        "these",
+        "they",
+        "this",
+        "to",
+        "up",
+        "us",
+        "was",
+        "we",
+        "what",
+        "when",
+        "where",
+        "which",
+        "who",
+        "why",
+        "will",
+        "with",
+        "you",
+        "your",
+    ]
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-cased terms, without stopwords.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Terms in order of appearance.
+    """
+    return [term for term in _WORD.findall(text.lower()) if len(term) > 1 and term not in STOPWORDS]
+
+
+def domain_of(url: str) -> str:
+    """Get the host of a URL, lower-cased and without a leading "www."."""
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def matches_domain(domain: str, patterns: Iterable[str]) -> bool:
+    """Check whether a domain is one of ``patterns`` or a subdomain of one.
+
+    Args:
+        domain: Domain from domain_of().
+        patterns: Domains such as "python.org" (also matches "docs.python.org").
+
+    Returns:
+        True if any pattern matches.
+    """
+    return any(domain == p or domain.endswith(f".{p}") for p in patterns)
+
+
+class BM25:
+    """Okapi BM25 scoring of a small, fixed set of documents."""
+
+    def __init__(self, documents: Sequence[Sequence[str]], k1: float = 1.5, b: float = 0.75):
+        """Index tokenized documents.
+
+        Args:
+            documents: Terms of each document.
+            k1: Term frequency saturation.
+            b: Document length normalisation.
+        """
+        self.k1 = k1
+        self.b = b
+        self.term_counts = [Counter(doc) for doc in documents]
+        self.lengths = [len(doc) for doc in documents]
+        self.avg_length = sum(self.lengths) / len(documents) if documents else 0.0
+
+        document_frequency: Counter[str] = Counter()
+        for counts in self.term_counts:
+            document_frequency.update(counts.keys())
+        n = len(documents)
+        self.idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def scores(self, query: Sequence[str]) -> list[float]:
+        """Score every document against a query.
+
+        Args:
+            query: Query terms (repeated terms weigh more).
+
+        Returns:
+            One score per document, in index order.
+        """
+        weights = Counter(term for term in query if term in self.idf)
+        results = []
+        for counts, length in zip(self.term_counts, self.lengths, strict=True):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.avg_length or 1))
+            score = 0.0
+            for term, weight in weights.items():
+                tf = counts.get(term, 0)
+                if tf:
+                    score += weight * self.idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            results.append(score)
+        return results
+
+
+class ResultRanker:
+    """Orders search results so the scraping budget goes to the best pages.
+
+    Results are scored with BM25 over their title (counted twice) and
+    snippet against the topic and search queries. Results from denied
+    domains are dropped and allowed domains are moved to the front. At
+    most ``per_domain`` results of one domain are kept in the ranking;
+    the rest are moved to the end, so they are still there as spares.
+    Ties keep the search engine's order.
+    """
+
+    def __init__(
+        self,
+        allow_domains: Sequence[str] = (),
+        deny_domains: Sequence[str] = (),
+        per_domain: int = 2,
+    ) -> None:
+        """Initialize the ranker.
+
+        Args:
+            allow_domains: Preferred domains (and their subdomains).
+            deny_domains: Domains whose results are dropped.
+            per_domain: Results per domain before the rest are moved back
+                (0 for no limit).
+        """
+        self.allow_domains = [d.lower().removeprefix("www.") for d in allow_domains]
+        self.deny_domains = [d.lower().removeprefix("www.") for d in deny_domains]
+        self.per_domain = per_domain
+
+    @classmethod
+    def from_settings(cls, settings: ResearchSettings) -> ResultRanker:
+        """Create a ranker from research settings.
+
+        Args:
+            settings: Research settings.
+
+        Returns:
+            ResultRanker instance.
+        """
+        return cls(
+            allow_domains=settings.allow_domains,
+            deny_domains=settings.deny_domains,
+            per_domain=settings.max_results_per_domain,
+        )
+
+    def rank(self, results: Sequence[SearchResult], queries: Sequence[str]) -> list[SearchResult]:
+        """Rank search results by relevance to the queries.
+
+        Args:
+            results: Deduplicated search results in search engine order.
+            queries: Topic and search queries the results should match.
+
+        Returns:
+            Results best first, without denied domains.
+        """
+        domains = [domain_of(r.url) for r in results]
+        kept = [
+            i for i, domain in enumerate(domains) if not matches_domain(domain, self.deny_domains)
+        ]
+        if len(kept) < len(results):
+            logger.info(f"Dropped {len(results) - len(kept)} results from denied domains")
+
+        bm25 = BM25([tokenize(f"{r.title} {r.title} {r.snippet}") for r in results])
+        scores = bm25.scores([term for query in queries for term in tokenize(query)])
+        kept.sort(key=lambda i: (not matches_domain(domains[i], self.allow_domains), -scores[i]))
+
+        ranked: list[SearchResult] = []
+        overflow: list[SearchResult] = []
+        per_domain: Counter[str] = Counter()
+        for i in kept:
+            per_domain[domains[i]] += 1
+            if self.per_domain and per_domain[domains[i]] > self.per_domain:
+                overflow.append(results[i])
+            else:
+                ranked.append(results[i])
+        return ranked + overflow
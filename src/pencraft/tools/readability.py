@@ -0,0 +1,331 @@
+"""Readability-style detection of the main content of a page.
+
+Paragraph-like elements are scored by their text length and comma count,
+and each score is credited to the paragraph's parent and (at half weight)
+grandparent. Containers are then weighted by their class/id hints and
+penalised by the share of their text that sits inside links. The best
+container, plus any siblings that score nearly as well, is taken as the
+article; navigation, link lists and comment blocks inside it are dropped.
+
+The functions work on lxml.html trees.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+# Elements whose text is scored as a paragraph
+PARAGRAPH_TAGS = ("p", "pre", "td", "blockquote")
+
+# Elements that start a new paragraph in the extracted text
+BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "br",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "figcaption",
+        "figure",
+        "footer",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "td",
+        "th",
+        "tr",
+        "ul",
+    }
+)
+
+# Base scores of candidate containers by tag
+TAG_SCORES = {
+    "article": 5,
+    "div": 5,
+    "section": 5,
+    "pre": 3,
+    "td": 3,
+    "blockquote": 3,
+    "address": -3,
+    "ol": -3,
+    "ul": -3,
+    "dl": -3,
+    "dd": -3,
+    "dt": -3,
+    "li": -3,
+    "form": -3,
+    "h1": -5,
+    "h2": -5,
+    "h3": -5,
+    "h4": -5,
+    "h5": -5,
+    "h6": -5,
+    "th": -5,
+}
+
+POSITIVE_HINTS = re.compile(
+    r"article|body|content|entry|hentry|main|page|post|text|blog|story", re.IGNORECASE
+)
+NEGATIVE_HINTS = re.compile(
+    r"comment|meta|footer|footnote|sidebar|nav|menu|share|social|related|promo|sponsor"
+    r"|widget|banner|masthead|breadcrumb|byline|popup|modal|cookie|newsletter"
+    r"|(?:^|[\s_-])ads?(?:$|[\s_-])",
+    re.IGNORECASE,
+)
+
+# Elements removed from the chosen content outright
+JUNK_TAGS = ("form", "button", "input", "select", "textarea", "iframe", "object", "embed")
+
+# Class and id names usable in selectors
+_NAME = re.compile(r"[\w-]+")
+
+# Paragraphs shorter than this are ignored when scoring
+MIN_PARAGRAPH_LENGTH = 25
+
+# Containers that may be cleaned out of the chosen content
+CLEANABLE_TAGS = (
+    "div",
+    "section",
+    "ul",
+    "ol",
+    "table",
+    "aside",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+)
+
+
+def _text(element: Any) -> str:
+    """Get an element's text with whitespace collapsed."""
+    return " ".join(element.text_content().split())
+
+
+def class_weight(element: Any) -> int:
+    """Score an element's class and id as content (+25) or boilerplate (-25) hints."""
+    weight = 0
+    for value in (element.get("class"), element.get("id")):
+        if value:
+            if NEGATIVE_HINTS.search(value):
+                weight -= 25
+            if POSITIVE_HINTS.search(value):
+                weight += 25
+    return weight
+
+
+def link_density(element: Any, text_length: int | None = None) -> float:
+    """Get the fraction of an element's text that is link text."""
+    if text_length is None:
+        text_length = len(_text(element))
+    if not text_length:
+        return 0.0
+    link_length = sum(len(_text(link)) for link in element.iter("a"))
+    return min(1.0, link_length / text_length)
+
+
+def score_candidates(root: Any) -> dict[Any, float]:
+    """Score the containers of a page's paragraphs.
+
+    Args:
+        root: Root element of the page.
+
+    Returns:
+        Candidate containers mapped to their link-density adjusted scores.
+    """
+    scores: dict[Any, float] = {}
+    for paragraph in root.iter(*PARAGRAPH_TAGS):
+        text = _text(paragraph)
+        if len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+
+        parent = paragraph.getparent()
+        for ancestor, share in (
+            (parent, 1.0),
+            (None if parent is None else parent.getparent(), 0.5),
+        ):
+            if ancestor is None or not isinstance(ancestor.tag, str):
+                break
+            if ancestor not in scores:
+                scores[ancestor] = TAG_SCORES.get(ancestor.tag, 0) + class_weight(ancestor)
+            scores[ancestor] += score * share
+
+    return {element: score * (1 - link_density(element)) for element, score in scores.items()}
+
+
+def _is_related(sibling: Any, top: Any, scores: dict[Any, float], threshold: float) -> bool:
+    """Check whether a sibling of the top candidate belongs to the article."""
+    if sibling is top:
+        return True
+    if scores.get(sibling, 0.0) >= threshold:
+        return True
+    if sibling.tag != "p":
+        return False
+    text = _text(sibling)
+    density = link_density(sibling, len(text))
+    if len(text) >= 80:
+        return density < 0.25
+    return density == 0 and re.search(r"\.( |$)", text) is not None
+
+
+def clean_content(element: Any) -> None:
+    """Drop forms, link lists and boilerplate blocks from chosen content."""
+    for junk in list(element.iter(*JUNK_TAGS)):
+        junk.drop_tree()
+
+    # Innermost first, so a parent is judged on what is left inside it
+    for child in reversed(list(element.iter(*CLEANABLE_TAGS))):
+        if child is element or child.getparent() is None:
+            continue
+        weight = class_weight(child)
+        text = _text(child)
+        density = link_density(child, len(text))
+        if child.tag.startswith("h"):
+            drop = weight < 0 or density > 0.33
+        else:
+            drop = (
+                weight < 0
+                or (text.count(",") < 10 and density > 0.2 and weight < 25)
+                or density > 0.5
+            )
+        if drop:
+            child.drop_tree()
+
+
+def main_content(root: Any) -> list[Any]:
+    """Find the elements that make up the main content of a page.
+
+    Args:
+        root: Root element of the page (boilerplate may already be removed).
+
+    Returns:
+        Content elements in document order, cleaned of link lists and
+        boilerplate, or an empty list if the page has no scoreable text.
+    """
+    scores = score_candidates(root)
+    if not scores:
+        return []
+    top = max(scores, key=scores.__getitem__)
+
+    parent = top.getparent()
+    if parent is None:
+        elements = [top]
+    else:
+        threshold = max(10.0, scores[top] * 0.2)
+        elements = [
+            sibling
+            for sibling in parent
+            if isinstance(sibling.tag, str) and _is_related(sibling, top, scores, threshold)
+        ]
+
+    for element in elements:
+        clean_content(element)
+    return elements
+
+
+def selector_for(element: Any) -> str:
+    """Build a selector that should find the same block on a site's other pages.
+
+    Ids and classes containing digits (e.g. ``post-1234``) are skipped as
+    they usually differ from page to page.
+
+    Args:
+        element: Content element.
+
+    Returns:
+        Selector such as ``div.entry-content``, or "" if the element has no
+        stable id or class.
+    """
+    tag = element.tag
+
+    def stable(name: str) -> bool:
+        return _NAME.fullmatch(name) is not None and not any(c.isdigit() for c in name)
+
+    ident = element.get("id", "")
+    if ident and stable(ident):
+        return f"{tag}#{ident}"
+    classes = [name for name in element.get("class", "").split() if stable(name)]
+    if classes:
+        return tag + "".join(f".{name}" for name in classes)
+    return tag if tag in ("article", "main") else ""
+
+
+def _render(element: Any, blocks: list[str], line: list[str]) -> None:
+    """Append an element's text to ``blocks``, one paragraph per block element."""
+    tag = element.tag
+    if not isinstance(tag, str):
+        # Comments and processing instructions: only the tail is text
+        if element.tail:
+            line.append(element.tail)
+        return
+
+    block = tag in BLOCK_TAGS
+    if block:
+        _flush(blocks, line)
+    start = len(blocks)
+
+    if tag == "pre":
+        text = element.text_content().strip("\n")
+        if text.strip():
+            blocks.append(text)
+    else:
+        if element.text:
+            line.append(element.text)
+        for child in element:
+            _render(child, blocks, line)
+
+    if block:
+        _flush(blocks, line)
+        if tag == "li" and len(blocks) > start:
+            blocks[start] = f"- {blocks[start]}"
+    if element.tail:
+        line.append(element.tail)
+
+
+def _flush(blocks: list[str], line: list[str]) -> None:
+    """Close the paragraph being collected in ``line``."""
+    text = " ".join("".join(line).split())
+    if text:
+        blocks.append(text)
+    line.clear()
+
+
+def paragraphs(elements: list[Any]) -> str:
+    """Render elements as text with a blank line between paragraphs.
+
+    Args:
+        elements: Elements to render, in document order.
+
+    Returns:
+        Paragraph-structured text (list items start with "- ").
+    """
+    blocks: list[str] = []
+    for element in elements:
+        line: list[str] = []
+        # The tail of a content element is outside the content
+        tail, element.tail = element.tail, None
+        _render(element, blocks, line)
+        _flush(blocks, line)
+        element.tail = tail
+    return "\n\n".join(blocks)
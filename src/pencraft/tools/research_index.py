@@ -0,0 +1,220 @@
+"""In-memory passage index over the research of one blog post."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pencraft.llm.usage import estimate_tokens
+from pencraft.tools.ranking import tokenize
+
+if TYPE_CHECKING:
+    from pencraft.tools.scraper import ScrapedContent
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SOURCE = "Research summary"
+
+# Markdown headings ("## Key facts") and bold-only lines ("**Key facts:**")
+_MARKDOWN_HEADING = re.compile(r"#{1,6}\s+(.+?)\s*#*|\*\*(.+?):?\*\*:?")
+
+
+@dataclass
+class Passage:
+    """A heading-scoped piece of research text."""
+
+    text: str
+    source: str
+    url: str = ""
+    heading: str = ""
+
+    def format(self) -> str:
+        """Format the passage for a prompt, with where it came from."""
+        origin = f"{self.source} ({self.url})" if self.url else self.source
+        if self.heading:
+            origin += f" - {self.heading}"
+        return f"[{origin}]\n{self.text}"
+
+
+def _blocks(text: str, headings: set[str], markdown: bool) -> Iterator[tuple[str, str]]:
+    """Yield (heading, paragraph) for each paragraph of a text."""
+    heading = ""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = _MARKDOWN_HEADING.fullmatch(line) if markdown else None
+        if match:
+            heading = match.group(1) or match.group(2)
+        elif line in headings:
+            heading = line
+        else:
+            yield heading, line
+
+
+def split_passages(
+    text: str,
+    source: str,
+    url: str = "",
+    headings: Sequence[str] = (),
+    passage_words: int = 120,
+) -> list[Passage]:
+    """Split a text into passages that never cross a heading.
+
+    Paragraphs under one heading are joined until a passage reaches
+    ``passage_words`` words; longer paragraphs are cut into pieces.
+
+    Args:
+        text: Page content or markdown summary.
+        source: Title of the text's source.
+        url: URL of the source.
+        headings: Heading texts of a scraped page (markdown headings are
+            recognised when no headings are given).
+        passage_words: Target words per passage.
+
+    Returns:
+        Passages in text order.
+    """
+    passages: list[Passage] = []
+    current: list[str] = []
+    current_heading = ""
+
+    def flush() -> None:
+        if current:
+            passages.append(Passage(" ".join(current), source, url, current_heading))
+            current.clear()
+
+    for heading, paragraph in _blocks(text, set(headings), markdown=not headings):
+        if heading != current_heading:
+            flush()
+            current_heading = heading
+        words = paragraph.split()
+        for start in range(0, len(words), passage_words):
+            piece = words[start : start + passage_words]
+            if current and len(current) + len(piece) > passage_words:
+                flush()
+            current.extend(piece)
+    flush()
+    return passages
+
+
+class ResearchIndex:
+    """BM25 index of research passages, for per-section retrieval.
+
+    The research summary and scraped pages are split into passages, and
+    their BM25 term weights are kept in a dense NumPy matrix, so scoring
+    all passages against a query is one matrix-vector product.
+    """
+
+    def __init__(self, passages: list[Passage], k1: float = 1.5, b: float = 0.75) -> None:
+        """Index passages.
+
+        Args:
+            passages: Passages to index.
+            k1: Term frequency saturation.
+            b: Passage length normalisation.
+        """
+        self.passages = passages
+        term_counts = [Counter(tokenize(f"{p.heading} {p.text}")) for p in passages]
+        self.vocabulary: dict[str, int] = {}
+        for counts in term_counts:
+            for term in counts:
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+
+        tf = np.zeros((len(passages), len(self.vocabulary)), dtype=np.float32)
+        for row, counts in enumerate(term_counts):
+            columns = [self.vocabulary[term] for term in counts]
+            tf[row, columns] = list(counts.values())
+
+        lengths = tf.sum(axis=1)
+        avg_length = float(lengths.mean()) if len(passages) else 0.0
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log1p((len(passages) - df + 0.5) / (df + 0.5)).astype(np.float32)
+        norm = k1 * (1 - b + b * lengths / (avg_length or 1.0))
+        self.weights = idf * tf * (k1 + 1) / (tf + norm[:, None])
+
+    @classmethod
+    def build(
+        cls,
+        summary: str,
+        pages: Sequence[ScrapedContent] = (),
+        passage_words: int = 120,
+    ) -> ResearchIndex:
+        """Index a research summary and the pages scraped for it.
+
+        Args:
+            summary: Research summary (markdown).
+            pages: Scraped pages; failed ones are skipped.
+            passage_words: Target words per passage.
+
+        Returns:
+            ResearchIndex instance.
+        """
+        passages = split_passages(summary, SUMMARY_SOURCE, passage_words=passage_words)
+        for page in pages:
+            if page.success and page.content:
+                passages.extend(
+                    split_passages(
+                        page.content,
+                        page.title or page.url,
+                        page.url,
+                        page.headings or (),
+                        passage_words,
+                    )
+                )
+        logger.info(f"Indexed {len(passages)} research passages from {len(pages)} pages")
+        return cls(passages)
+
+    def search(self, query: str, k: int = 5, max_tokens: int | None = None) -> list[Passage]:
+        """Find the passages most relevant to a query.
+
+        Args:
+            query: Query text, such as a section title and key points.
+            k: Maximum passages returned.
+            max_tokens: Token budget of the returned passages; passages that
+                do not fit are skipped in favour of shorter, lower ranked ones.
+
+        Returns:
+            Matching passages, best first.
+        """
+        query_vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for term, count in Counter(tokenize(query)).items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                query_vector[column] = count
+        if not query_vector.any():
+            return []
+
+        scores = self.weights @ query_vector
+        results: list[Passage] = []
+        budget = max_tokens
+        for row in np.argsort(-scores, kind="stable"):
+            if scores[row] <= 0 or len(results) >= k:
+                break
+            passage = self.passages[row]
+            tokens = estimate_tokens(passage.format())
+            if budget is not None:
+                if tokens > budget:
+                    continue
+                budget -= tokens
+            results.append(passage)
+        return results
+
+    def notes(self, query: str, k: int = 5, max_tokens: int | None = None) -> str:
+        """Format the passages found for a query as research notes.
+
+        Args:
+            query: Query text.
+            k: Maximum passages used.
+            max_tokens: Token budget of the notes.
+
+        Returns:
+            Passages separated by blank lines ("" if nothing matched).
+        """
+        return "\n\n".join(p.format() for p in self.search(query, k, max_tokens))
@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import importlib.util
 import logging
-import re
-from dataclasses import dataclass
-from typing import Any
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+
+from pencraft.tools.extractors import (
+    REMOVE_SELECTORS,
+    Extractor,
+    ProcessPoolExtractor,
+    get_extractor,
+)
+from pencraft.utils.cache import make_cache_key
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pencraft.tools.dedup import NearDuplicates
+    from pencraft.tools.domain_rules import DomainRules
+    from pencraft.tools.http_cache import CachedPage, HTTPCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class ScrapedContent:
@@ -25,6 +50,8 @@ class ScrapedContent:
     word_count: int = 0
     success: bool = True
     error: str | None = None
+    truncated: bool = False
+    bytes_fetched: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -37,9 +64,56 @@ class ScrapedContent:
             "word_count": self.word_count,
             "success": self.success,
             "error": self.error,
+            "truncated": self.truncated,
+            "bytes_fetched": self.bytes_fetched,
         }
 
 
+class UnsupportedContentError(Exception):
+    """Raised when a response is not an HTML page."""
+
+
+# Content types parsed as pages (a missing Content-Type is tried as HTML)
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+
+class _CappedBody:
+    """Decodes a streamed response body incrementally, up to a byte cap."""
+
+    def __init__(self, response: httpx.Response, max_bytes: int) -> None:
+        encoding = response.charset_encoding or "utf-8"
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = "utf-8"
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._parts: list[str] = []
+        self.max_bytes = max_bytes
+        self.bytes_fetched = 0
+        self.truncated = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk of the body.
+
+        Args:
+            chunk: Raw bytes.
+
+        Returns:
+            False once the cap is reached and reading should stop.
+        """
+        remaining = self.max_bytes - self.bytes_fetched
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            self.truncated = True
+        self.bytes_fetched += len(chunk)
+        self._parts.append(self._decoder.decode(chunk))
+        return not self.truncated
+
+    def text(self) -> str:
+        """Get the decoded body."""
+        return "".join(self._parts) + self._decoder.decode(b"", final=True)
+
+
 class WebScraper:
     """Web scraper for extracting content from URLs.
 
@@ -48,33 +122,23 @@ class WebScraper:
     """
 
     # Common elements to remove that don't contain main content
-    REMOVE_SELECTORS = [
-        "script",
-        "style",
-        "nav",
-        "header",
-        "footer",
-        "aside",
-        "advertisement",
-        ".ad",
-        ".ads",
-        ".sidebar",
-        ".navigation",
-        ".menu",
-        ".cookie",
-        ".popup",
-        ".modal",
-        "#comments",
-        ".comments",
-        ".social-share",
-        ".related-posts",
-    ]
+    REMOVE_SELECTORS = REMOVE_SELECTORS
 
     def __init__(
         self,
         timeout: float = 30.0,
         max_content_length: int = 50000,
         user_agent: str | None = None,
+        max_concurrency: int = 8,
+        per_host_limit: int = 2,
+        http2: bool = False,
+        cache: HTTPCache | None = None,
+        max_bytes: int = 2_000_000,
+        extractor: Extractor | str = "auto",
+        domain_rules: DomainRules | None = None,
+        parse_workers: int = 2,
+        parse_pool: str = "thread",
+        parse_queue: int = 8,
     ) -> None:
         """Initialize the web scraper.
 
@@ -82,70 +146,157 @@ class WebScraper:
             timeout: Request timeout in seconds.
             max_content_length: Maximum content length to extract.
             user_agent: Custom user agent string.
+            max_concurrency: Pages fetched at once by scrape_many/ascrape_many.
+            per_host_limit: Pages fetched at once from a single host.
+            http2: Use HTTP/2 where servers support it (needs the h2 package).
+            cache: Optional HTTP cache of fetched pages and failed URLs.
+            max_bytes: Stop downloading a page after this many bytes.
+            extractor: HTML extraction backend, or its name ("auto" picks the
+                fastest installed one).
+            domain_rules: Optional per-domain content selectors, used and
+                learned while parsing.
+            parse_workers: Pages parsed at once off the event loop by ascrape
+                (0 parses on the event loop).
+            parse_pool: Run parsing in "thread"s, or in worker "process"es so
+                it does not compete for the GIL either.
+            parse_queue: Downloaded pages that may wait for a parse worker;
+                further downloads pause until the queue has room.
+
+        Raises:
+            ValueError: If parse_pool is not "thread" or "process".
         """
         self.timeout = timeout
         self.max_content_length = max_content_length
         self.user_agent = user_agent or (
             "Mozilla/5.0 (compatible; Pencraft/1.0; +https://github.com/suhaibbinyounis/pencraft)"
         )
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.extractor = (
+            extractor
+            if isinstance(extractor, Extractor)
+            else get_extractor(extractor, self.REMOVE_SELECTORS)
+        )
+        self.domain_rules = domain_rules
+
+        if parse_pool not in ("thread", "process"):
+            raise ValueError(f"parse_pool must be 'thread' or 'process', not {parse_pool!r}")
+        if parse_pool == "process" and parse_workers > 0:
+            self.extractor = ProcessPoolExtractor(self.extractor, parse_workers)
+        self.parse_workers = parse_workers
+        self.parse_queue = parse_queue
+        self._parse_executor: ThreadPoolExecutor | None = None
+        # The parse queue is bound to the event loop it was created in
+        self._parse_slots: asyncio.Semaphore | None = None
+        self._parse_loop: asyncio.AbstractEventLoop | None = None
+
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
 
         self._client = httpx.Client(
             timeout=timeout,
             follow_redirects=True,
             headers={"User-Agent": self.user_agent},
+            http2=http2,
+            limits=self._limits(),
         )
+        # The async client is bound to the event loop it was created in
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_sessions = 0
+
+    def _limits(self) -> httpx.Limits:
+        """Connection pool limits shared by the sync and async clients."""
+        return httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the pooled async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+                http2=self.http2,
+                limits=self._limits(),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator[None]:
+        """Keep the pooled async client open until the block exits.
+
+        ascrape() and ascrape_many() open a session themselves. The client is
+        closed when the outermost session exits, while its event loop is
+        still running, so calls made in separate asyncio.run() loops do not
+        leak connections. Wrap several calls in one session to share
+        connections between them.
+        """
+        self._async_sessions += 1
+        try:
+            yield
+        finally:
+            self._async_sessions -= 1
+            if self._async_sessions == 0:
+                await self._close_async_client()
+
+    async def _close_async_client(self) -> None:
+        """Close the pooled async client if it belongs to the running loop."""
+        if self._async_client is not None and self._async_loop is asyncio.get_running_loop():
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+
+    @cached_property
+    def parser_key(self) -> str:
+        """Identifier of the extraction settings, stored with cached pages."""
+        return make_cache_key(
+            type(self).__name__,
+            self.extractor.name,
+            self.extractor.remove_selectors,
+            self.max_content_length,
+        )[:16]
 
     def scrape(self, url: str) -> ScrapedContent:
         """Scrape content from a URL.
 
+        The body is streamed and reading stops at max_bytes; responses that
+        are not HTML are rejected from their headers, before the download.
+
         Args:
             url: URL to scrape.
 
         Returns:
             ScrapedContent object with extracted content.
         """
-        try:
-            response = self._client.get(url)
-            response.raise_for_status()
+        cached, page = self._from_cache(url)
+        if cached is not None:
+            return cached
+        if page is not None and page.is_fresh:
+            return self._cached_content(page)
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Extract title
-            title = self._extract_title(soup)
-
-            # Extract meta description
-            meta_description = self._extract_meta_description(soup)
-
-            # Extract headings
-            headings = self._extract_headings(soup)
-
-            # Remove unwanted elements
-            for selector in self.REMOVE_SELECTORS:
-                for element in soup.select(selector):
-                    element.decompose()
-
-            # Extract main content
-            content = self._extract_content(soup)
-
-            # Truncate if too long
-            if len(content) > self.max_content_length:
-                content = content[: self.max_content_length] + "..."
-
-            word_count = len(content.split())
-
-            logger.info(f"Scraped {url}: {word_count} words")
-
-            return ScrapedContent(
-                url=url,
-                title=title,
-                content=content,
-                meta_description=meta_description,
-                headings=headings,
-                word_count=word_count,
-            )
-
-        except httpx.HTTPError as e:
+        try:
+            headers = page.validators() if page else None
+            with self._client.stream("GET", url, headers=headers) as response:
+                if (revalidated := self._not_modified(response, page)) is not None:
+                    return revalidated
+                body = self._start_body(response)
+                for chunk in response.iter_bytes():
+                    if not body.feed(chunk):
+                        break
+            return self._handle_body(url, response, body)
+
+        except (httpx.HTTPError, UnsupportedContentError) as e:
             logger.error(f"HTTP error scraping {url}: {e}")
+            self._remember_failure(url, e)
             return ScrapedContent(
                 url=url,
                 title="",
@@ -166,51 +317,42 @@ class WebScraper:
     async def ascrape(self, url: str) -> ScrapedContent:
         """Scrape content from a URL asynchronously.
 
+        Uses a pooled client, so repeated calls reuse open connections. The
+        body is streamed with the same limits as scrape().
+
         Args:
             url: URL to scrape.
 
         Returns:
             ScrapedContent object with extracted content.
         """
-        try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": self.user_agent},
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                title = self._extract_title(soup)
-                meta_description = self._extract_meta_description(soup)
-                headings = self._extract_headings(soup)
+        cached, page = self._from_cache(url)
+        if cached is not None:
+            return cached
+        # Re-parsing a cached page goes to the parse pool like a fresh fetch
+        if page is not None and page.is_fresh:
+            return await self._in_parse_pool(self._cached_content, page)
 
-                for selector in self.REMOVE_SELECTORS:
-                    for element in soup.select(selector):
-                        element.decompose()
-
-                content = self._extract_content(soup)
-
-                if len(content) > self.max_content_length:
-                    content = content[: self.max_content_length] + "..."
-
-                word_count = len(content.split())
-
-                logger.info(f"Scraped async {url}: {word_count} words")
-
-                return ScrapedContent(
-                    url=url,
-                    title=title,
-                    content=content,
-                    meta_description=meta_description,
-                    headings=headings,
-                    word_count=word_count,
-                )
+        try:
+            headers = page.validators() if page else None
+            async with (
+                self.async_session(),
+                self._get_async_client().stream("GET", url, headers=headers) as response,
+            ):
+                if page is not None and response.status_code == 304:
+                    revalidated = await self._in_parse_pool(self._not_modified, response, page)
+                    if revalidated is not None:
+                        return revalidated
+                body = self._start_body(response)
+                async for chunk in response.aiter_bytes():
+                    if not body.feed(chunk):
+                        break
+            return await self._ahandle_body(url, response, body)
 
         except Exception as e:
             logger.error(f"Error async scraping {url}: {e}")
+            if isinstance(e, (httpx.HTTPError, UnsupportedContentError)):
+                self._remember_failure(url, e)
             return ScrapedContent(
                 url=url,
                 title="",
@@ -219,115 +361,414 @@ class WebScraper:
                 error=str(e),
             )
 
-    def scrape_multiple(self, urls: list[str]) -> list[ScrapedContent]:
-        """Scrape multiple URLs.
+    def _from_cache(self, url: str) -> tuple[ScrapedContent | None, CachedPage | None]:
+        """Look a URL up in the HTTP cache.
 
         Args:
-            urls: List of URLs to scrape.
+            url: URL to scrape.
 
         Returns:
-            List of ScrapedContent objects.
+            Tuple of the content to return without fetching (a fresh page or
+            a recent failure) and a cached page to use instead: a stale one
+            to revalidate, or a fresh one parsed with other extraction
+            settings, to re-parse with _cached_content().
         """
-        return [self.scrape(url) for url in urls]
+        if self.cache is None:
+            return None, None
+
+        error = self.cache.get_failure(url)
+        if error is not None:
+            logger.info(f"Skipping {url}, it failed recently: {error}")
+            return (
+                ScrapedContent(
+                    url=url,
+                    title="",
+                    content="",
+                    success=False,
+                    error=f"{error} (cached failure)",
+                ),
+                None,
+            )
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract page title.
+        page = self.cache.get(url)
+        if page is None:
+            return None, None
+        if page.is_fresh:
+            logger.debug(f"HTTP cache hit for {url}")
+            if page.parser == self.parser_key:
+                return page.content, None
+        return None, page
+
+    def _cached_content(self, page: CachedPage) -> ScrapedContent:
+        """Get the content of a cached page, re-parsing it if extraction changed."""
+        if page.parser != self.parser_key and self.cache is not None:
+            page.content = self._parse(page.url, page.body)
+            page.parser = self.parser_key
+            self.cache.save(page)
+        return page.content
+
+    def _not_modified(
+        self, response: httpx.Response, stale: CachedPage | None
+    ) -> ScrapedContent | None:
+        """Get the cached content if the server confirmed it is unchanged.
 
         Args:
-            soup: BeautifulSoup object.
+            response: Server response (headers only).
+            stale: Cached page the request revalidated, if any.
 
         Returns:
-            Page title or empty string.
+            Cached content on 304 Not Modified, else None.
         """
-        # Try og:title first
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):  # type: ignore[union-attr]
-            return str(og_title.get("content", ""))  # type: ignore[union-attr]
+        if stale is None or self.cache is None or response.status_code != 304:
+            return None
+        logger.debug(f"Revalidated cached page {stale.url}")
+        return self._cached_content(self.cache.revalidated(stale, response))
 
-        # Try title tag
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+    def _start_body(self, response: httpx.Response) -> _CappedBody:
+        """Check a response's headers before its body is downloaded.
 
-        # Try h1
-        h1 = soup.find("h1")
-        if h1:
-            return h1.get_text(strip=True)
+        Args:
+            response: Server response (headers only).
 
-        return ""
+        Returns:
+            Reader for the body.
+
+        Raises:
+            httpx.HTTPStatusError: For error status codes.
+            UnsupportedContentError: If the response is not an HTML page.
+        """
+        response.raise_for_status()
 
-    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
-        """Extract meta description.
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            raise UnsupportedContentError(f"Unsupported content type: {content_type}")
+
+        length = response.headers.get("content-length", "")
+        if length.isdigit() and int(length) > self.max_bytes:
+            logger.info(
+                f"{response.url} is {int(length)} bytes, reading the first {self.max_bytes}"
+            )
+        return _CappedBody(response, self.max_bytes)
+
+    def _handle_body(self, url: str, response: httpx.Response, body: _CappedBody) -> ScrapedContent:
+        """Parse a downloaded body and store it in the HTTP cache.
 
         Args:
-            soup: BeautifulSoup object.
+            url: Requested URL.
+            response: Server response.
+            body: Downloaded body.
 
         Returns:
-            Meta description or empty string.
+            ScrapedContent object with extracted content.
         """
-        # Try og:description
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):  # type: ignore[union-attr]
-            return str(og_desc.get("content", ""))  # type: ignore[union-attr]
+        html = body.text()
+        content = self._parse(url, html)
+        content.truncated = content.truncated or body.truncated
+        content.bytes_fetched = body.bytes_fetched
+        if self.cache is not None:
+            self.cache.put(url, response, html, content, self.parser_key)
+        return content
+
+    async def _ahandle_body(
+        self, url: str, response: httpx.Response, body: _CappedBody
+    ) -> ScrapedContent:
+        """Parse a downloaded body on the parse pool instead of the event loop.
+
+        At most parse_workers pages are parsed at once and parse_queue more
+        wait for a worker; beyond that, callers wait here for room.
 
-        # Try meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):  # type: ignore[union-attr]
-            return str(meta_desc.get("content", ""))  # type: ignore[union-attr]
+        Args:
+            url: Requested URL.
+            response: Server response.
+            body: Downloaded body.
 
-        return ""
+        Returns:
+            ScrapedContent object with extracted content.
+        """
+        return await self._in_parse_pool(self._handle_body, url, response, body)
 
-    def _extract_headings(self, soup: BeautifulSoup) -> list[str]:
-        """Extract all headings.
+    async def _in_parse_pool(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run parsing work on the parse pool, waiting for room in its queue.
 
         Args:
-            soup: BeautifulSoup object.
+            fn: Function parsing (and caching) a page.
+            *args: Arguments for ``fn``.
 
         Returns:
-            List of heading texts.
+            What ``fn`` returns.
         """
-        headings = []
-        for tag in ["h1", "h2", "h3"]:
-            for heading in soup.find_all(tag):
-                text = heading.get_text(strip=True)
-                if text:
-                    headings.append(text)
-        return headings
+        if self.parse_workers <= 0:
+            return fn(*args)
+
+        loop = asyncio.get_running_loop()
+        if self._parse_slots is None or self._parse_loop is not loop:
+            self._parse_slots = asyncio.Semaphore(self.parse_workers + self.parse_queue)
+            self._parse_loop = loop
+        if self._parse_executor is None:
+            self._parse_executor = ThreadPoolExecutor(
+                max_workers=self.parse_workers, thread_name_prefix="parse"
+            )
+
+        async with self._parse_slots:
+            return await loop.run_in_executor(self._parse_executor, fn, *args)
+
+    def _remember_failure(self, url: str, error: Exception) -> None:
+        """Add a timed-out or erroring URL to the negative cache."""
+        if self.cache is not None:
+            self.cache.put_failure(url, f"{type(error).__name__}: {error}")
 
-    def _extract_content(self, soup: BeautifulSoup) -> str:
-        """Extract main content text.
+    def _parse(self, url: str, html: str) -> ScrapedContent:
+        """Extract the readable content of a fetched page.
 
         Args:
-            soup: BeautifulSoup object.
+            url: Page URL.
+            html: Page HTML.
 
         Returns:
-            Cleaned content text.
+            ScrapedContent object with extracted content.
         """
-        # Try common article containers
-        article = soup.find("article")
-        if article:
-            text = article.get_text(separator="\n", strip=True)
+        if self.domain_rules is not None:
+            page = self.domain_rules.extract(self.extractor, url, html)
         else:
-            # Try main tag
-            main = soup.find("main")
-            if main:
-                text = main.get_text(separator="\n", strip=True)
-            else:
-                # Fall back to body
-                body = soup.find("body")
-                if body:
-                    text = body.get_text(separator="\n", strip=True)
-                else:
-                    text = soup.get_text(separator="\n", strip=True)
-
-        # Clean up whitespace
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        text = re.sub(r" {2,}", " ", text)
-
-        return text.strip()
+            page = self.extractor.extract(html)
+        content = page.content
+
+        # Truncate if too long
+        truncated = len(content) > self.max_content_length
+        if truncated:
+            content = content[: self.max_content_length] + "..."
+
+        word_count = len(content.split())
+
+        logger.info(f"Scraped {url}: {word_count} words")
+
+        return ScrapedContent(
+            url=url,
+            title=page.title,
+            content=content,
+            meta_description=page.meta_description,
+            headings=page.headings,
+            word_count=word_count,
+            truncated=truncated,
+        )
+
+    def scrape_multiple(self, urls: list[str]) -> list[ScrapedContent]:
+        """Scrape multiple URLs.
+
+        Args:
+            urls: List of URLs to scrape.
+
+        Returns:
+            List of ScrapedContent objects.
+        """
+        return self.scrape_many(urls)
+
+    def scrape_many(
+        self,
+        urls: list[str],
+        *,
+        first_k: int | None = None,
+        deadline: float | None = None,
+        dedup: NearDuplicates | None = None,
+    ) -> list[ScrapedContent]:
+        """Scrape several URLs concurrently on a thread pool.
+
+        At most max_concurrency pages are fetched at once, and at most
+        per_host_limit from any one host. A host's next page is only handed
+        to the pool when one of its fetches finishes, so no worker sits
+        waiting for a busy host.
+
+        Args:
+            urls: URLs to scrape (duplicates are fetched once).
+            first_k: Stop once this many pages were scraped successfully.
+            deadline: Seconds after which pages still loading are abandoned.
+            dedup: Near-duplicate detector; pages that nearly duplicate a
+                better-ranked page count as failed, so first_k takes another.
+
+        Returns:
+            Scraped pages in URL order. Pages unfinished at the deadline are
+            left out; with first_k, only successful pages are returned.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return []
+
+        hosts: dict[str, deque[int]] = {}
+        for i, url in enumerate(urls):
+            hosts.setdefault(urlparse(url).netloc, deque()).append(i)
+
+        results: dict[int, ScrapedContent] = {}
+        futures: dict[Future[ScrapedContent], int] = {}
+        pending: set[Future[ScrapedContent]] = set()
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(urls)), thread_name_prefix="scrape"
+        )
+
+        def submit_next(host: str) -> None:
+            if hosts[host]:
+                i = hosts[host].popleft()
+                future = pool.submit(self.scrape, urls[i])
+                futures[future] = i
+                pending.add(future)
+
+        end = None if deadline is None else time.monotonic() + deadline
+        try:
+            for host in hosts:
+                for _ in range(self.per_host_limit):
+                    submit_next(host)
+            while pending:
+                timeout = None if end is None else max(0.0, end - time.monotonic())
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.warning(
+                        f"Scrape deadline of {deadline}s reached, "
+                        f"{len(urls) - len(results)} of {len(urls)} pages unfinished"
+                    )
+                    break
+                pending -= done
+                for future in done:
+                    i = futures[future]
+                    results[i] = future.result()
+                    submit_next(urlparse(urls[i]).netloc)
+                if first_k is not None and self._distinct_successes(results, dedup) >= first_k:
+                    break
+        finally:
+            # Running fetches finish in the background; queued ones never start
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return self._collect(results, first_k, dedup)
+
+    async def ascrape_many(
+        self,
+        urls: list[str],
+        *,
+        first_k: int | None = None,
+        deadline: float | None = None,
+        dedup: NearDuplicates | None = None,
+    ) -> list[ScrapedContent]:
+        """Scrape several URLs concurrently with the pooled async client.
+
+        At most max_concurrency pages are fetched at once, and at most
+        per_host_limit from any one host. Fetches still running when the
+        deadline passes or first_k pages succeeded are cancelled.
+
+        Args:
+            urls: URLs to scrape (duplicates are fetched once).
+            first_k: Stop once this many pages were scraped successfully.
+            deadline: Seconds after which pages still loading are abandoned.
+            dedup: Near-duplicate detector; pages that nearly duplicate a
+                better-ranked page count as failed, so first_k takes another.
+
+        Returns:
+            Scraped pages in URL order. Pages unfinished at the deadline are
+            left out; with first_k, only successful pages are returned.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return []
+
+        limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(url: str) -> ScrapedContent:
+            host_limit = host_limits.setdefault(
+                urlparse(url).netloc, asyncio.Semaphore(self.per_host_limit)
+            )
+            # Wait for the host first so a busy host does not hold global slots
+            async with host_limit, limit:
+                return await self.ascrape(url)
+
+        loop = asyncio.get_running_loop()
+        end = None if deadline is None else loop.time() + deadline
+        results: dict[int, ScrapedContent] = {}
+        # One session keeps the client open across all fetches
+        async with self.async_session():
+            tasks = {asyncio.create_task(fetch(url)): i for i, url in enumerate(urls)}
+            pending = set(tasks)
+            try:
+                while pending:
+                    timeout = None if end is None else max(0.0, end - loop.time())
+                    done, pending = await asyncio.wait(
+                        pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        logger.warning(
+                            f"Scrape deadline of {deadline}s reached, "
+                            f"{len(pending)} of {len(urls)} pages unfinished"
+                        )
+                        break
+                    for task in done:
+                        results[tasks[task]] = task.result()
+                    if first_k is not None and self._distinct_successes(results, dedup) >= first_k:
+                        break
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+        return self._collect(results, first_k, dedup)
+
+    @staticmethod
+    def _distinct_successes(
+        results: dict[int, ScrapedContent], dedup: NearDuplicates | None
+    ) -> int:
+        """Count finished pages that succeeded and are not near-copies of better-ranked ones."""
+        checker = dedup.copy() if dedup is not None else None
+        return sum(
+            1
+            for i in sorted(results)
+            if results[i].success
+            and (checker is None or checker.check(results[i].url, results[i].content) is None)
+        )
+
+    @staticmethod
+    def _check_duplicate(page: ScrapedContent, dedup: NearDuplicates | None) -> ScrapedContent:
+        """Mark a page as failed if it nearly duplicates a page scraped before."""
+        if dedup is None or not page.success:
+            return page
+        original = dedup.check(page.url, page.content)
+        if original is None:
+            return page
+        logger.info(f"Skipping {page.url}, a near duplicate of {original}")
+        return replace(page, success=False, error=f"Near duplicate of {original}")
+
+    @classmethod
+    def _collect(
+        cls,
+        results: dict[int, ScrapedContent],
+        first_k: int | None,
+        dedup: NearDuplicates | None,
+    ) -> list[ScrapedContent]:
+        """Order finished scrapes by URL position, drop near-copies and apply first_k.
+
+        Near-duplicates are resolved in URL (rank) order rather than the
+        order pages finished in, so the better-ranked copy is the one kept.
+        """
+        pages = [cls._check_duplicate(results[i], dedup) for i in sorted(results)]
+        if first_k is not None:
+            pages = [p for p in pages if p.success][:first_k]
+        return pages
+
+    def _close_parse_pool(self) -> None:
+        """Shut down the parse workers (they are restarted when needed)."""
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
+        self.extractor.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and the parse workers."""
         self._client.close()
+        self._close_parse_pool()
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client and the parse workers."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
+        self._close_parse_pool()
 
     def __enter__(self) -> WebScraper:
         """Context manager entry."""
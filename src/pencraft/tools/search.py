@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ddgs import DDGS
 
+from pencraft.utils.cache import make_cache_key
+from pencraft.utils.singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from pencraft.tools.search_cache import SearchCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +39,11 @@ class SearchResult:
         }
 
 
+# Shared by every search tool, so identical searches from generators running
+# side by side in one process (e.g. a batch of topics) make one request
+_search_flight: SingleFlight[list[SearchResult]] = SingleFlight()
+
+
 class SearchTool:
     """Web search tool using DuckDuckGo API.
 
@@ -41,6 +55,9 @@ class SearchTool:
         max_results: int = 10,
         region: str = "wt-wt",
         safesearch: str = "moderate",
+        max_workers: int = 4,
+        cache: SearchCache | None = None,
+        flight: SingleFlight[list[SearchResult]] | None = None,
     ) -> None:
         """Initialize the search tool.
 
@@ -48,10 +65,18 @@ class SearchTool:
             max_results: Maximum number of results to return.
             region: Region for search results (wt-wt = worldwide).
             safesearch: SafeSearch setting (off, moderate, strict).
+            max_workers: Searches run at once by multi_search.
+            cache: Optional cache of search results.
+            flight: Coalescing of identical in-flight searches (defaults to
+                the one shared by every search tool in the process).
         """
         self.max_results = max_results
         self.region = region
         self.safesearch = safesearch
+        self.max_workers = max_workers
+        self.cache = cache
+        # Identical searches running at the same time share one request
+        self._flight = flight if flight is not None else _search_flight
 
     def search(
         self,
@@ -71,34 +96,14 @@ class SearchTool:
             List of SearchResult objects.
         """
         max_results = max_results or self.max_results
-        results: list[SearchResult] = []
 
         try:
-            with DDGS() as ddgs:
-                search_results = ddgs.text(
-                    query,
-                    region=self.region,
-                    safesearch=self.safesearch,
-                    timelimit=time_range,
-                    max_results=max_results,
-                )
-
-                for result in search_results:
-                    results.append(
-                        SearchResult(
-                            title=result.get("title", ""),
-                            url=result.get("href", result.get("link", "")),
-                            snippet=result.get("body", result.get("snippet", "")),
-                            source=self._extract_source(result.get("href", "")),
-                        )
-                    )
-
+            results = self._cached_search("text", query, max_results, time_range, self._text)
             logger.info(f"Search for '{query}' returned {len(results)} results")
-
+            return results
         except Exception as e:
             logger.error(f"Search error for '{query}': {e}")
-
-        return results
+            return []
 
     def search_news(
         self,
@@ -118,56 +123,174 @@ class SearchTool:
             List of SearchResult objects.
         """
         max_results = max_results or self.max_results
-        results: list[SearchResult] = []
 
         try:
-            with DDGS() as ddgs:
-                news_results = ddgs.news(
-                    query,
-                    region=self.region,
-                    safesearch=self.safesearch,
-                    timelimit=time_range,
-                    max_results=max_results,
-                )
-
-                for result in news_results:
-                    results.append(
-                        SearchResult(
-                            title=result.get("title", ""),
-                            url=result.get("url", ""),
-                            snippet=result.get("body", ""),
-                            source=result.get("source", ""),
-                        )
-                    )
-
+            results = self._cached_search("news", query, max_results, time_range, self._news)
             logger.info(f"News search for '{query}' returned {len(results)} results")
-
+            return results
         except Exception as e:
             logger.error(f"News search error for '{query}': {e}")
+            return []
 
-        return results
+    @property
+    def coalesced(self) -> int:
+        """Number of searches that shared another identical in-flight search.
+
+        Counts every search tool sharing this tool's flight.
+        """
+        return self._flight.coalesced
+
+    def request_key(self, kind: str, query: str, max_results: int, time_range: str | None) -> str:
+        """Build the key identifying a search request.
+
+        Args:
+            kind: Search type ("text" or "news").
+            query: Search query (case and whitespace are ignored).
+            max_results: Number of results requested.
+            time_range: Time range filter.
+
+        Returns:
+            Key string.
+        """
+        normalized = " ".join(query.lower().split())
+        return make_cache_key(
+            "search", kind, normalized, self.region, self.safesearch, time_range, max_results
+        )
+
+    def _cached_search(
+        self,
+        kind: str,
+        query: str,
+        max_results: int,
+        time_range: str | None,
+        fetch: Callable[[str, int, str | None], list[SearchResult]],
+    ) -> list[SearchResult]:
+        """Run a search through the cache and request coalescing.
+
+        Args:
+            kind: Search type ("text" or "news").
+            query: Search query.
+            max_results: Number of results requested.
+            time_range: Time range filter.
+            fetch: Function querying the search engine.
+
+        Returns:
+            Search results.
+        """
+        key = self.request_key(kind, query, max_results, time_range)
+
+        def load() -> list[SearchResult]:
+            if self.cache is not None and (cached := self.cache.get(key)) is not None:
+                logger.debug(f"Search cache hit for '{query}'")
+                return cached
+            results = fetch(query, max_results, time_range)
+            # Empty answers are often throttling, so they are not cached
+            if self.cache is not None and results:
+                self.cache.put(key, results)
+            return results
+
+        return list(self._flight.do(key, load))
+
+    def _text(self, query: str, max_results: int, time_range: str | None) -> list[SearchResult]:
+        """Query DuckDuckGo text search."""
+        with DDGS() as ddgs:
+            search_results = ddgs.text(
+                query,
+                region=self.region,
+                safesearch=self.safesearch,
+                timelimit=time_range,
+                max_results=max_results,
+            )
+
+            return [
+                SearchResult(
+                    title=result.get("title", ""),
+                    url=result.get("href", result.get("link", "")),
+                    snippet=result.get("body", result.get("snippet", "")),
+                    source=self._extract_source(result.get("href", "")),
+                )
+                for result in search_results
+            ]
+
+    def _news(self, query: str, max_results: int, time_range: str | None) -> list[SearchResult]:
+        """Query DuckDuckGo news search."""
+        with DDGS() as ddgs:
+            news_results = ddgs.news(
+                query,
+                region=self.region,
+                safesearch=self.safesearch,
+                timelimit=time_range,
+                max_results=max_results,
+            )
+
+            return [
+                SearchResult(
+                    title=result.get("title", ""),
+                    url=result.get("url", ""),
+                    snippet=result.get("body", ""),
+                    source=result.get("source", ""),
+                )
+                for result in news_results
+            ]
 
     def multi_search(
         self,
         queries: list[str],
         *,
         max_results_per_query: int = 5,
+        max_workers: int | None = None,
+    ) -> dict[str, list[SearchResult]]:
+        """Perform multiple searches concurrently and aggregate results.
+
+        DuckDuckGo has no async API, so searches run in a thread pool.
+
+        Args:
+            queries: List of search queries.
+            max_results_per_query: Max results per individual query.
+            max_workers: Searches to run at once (uses self.max_workers if None).
+
+        Returns:
+            Dictionary mapping queries to their results, in query order.
+        """
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return {}
+
+        workers = min(max_workers or self.max_workers, len(queries))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search") as pool:
+            results = pool.map(
+                lambda query: self.search(query, max_results=max_results_per_query), queries
+            )
+            return dict(zip(queries, results, strict=True))
+
+    async def amulti_search(
+        self,
+        queries: list[str],
+        *,
+        max_results_per_query: int = 5,
+        max_workers: int | None = None,
     ) -> dict[str, list[SearchResult]]:
-        """Perform multiple searches and aggregate results.
+        """Perform multiple searches concurrently without blocking the event loop.
 
         Args:
             queries: List of search queries.
             max_results_per_query: Max results per individual query.
+            max_workers: Searches to run at once (uses self.max_workers if None).
 
         Returns:
-            Dictionary mapping queries to their results.
+            Dictionary mapping queries to their results, in query order.
         """
-        all_results: dict[str, list[SearchResult]] = {}
+        queries = list(dict.fromkeys(queries))
+        limit = asyncio.Semaphore(max_workers or self.max_workers)
 
-        for query in queries:
-            all_results[query] = self.search(query, max_results=max_results_per_query)
+        async def run(query: str) -> list[SearchResult]:
+            async with limit:
+                return await asyncio.to_thread(
+                    self.search, query, max_results=max_results_per_query
+                )
 
-        return all_results
+        results = await asyncio.gather(*(run(query) for query in queries))
+        return dict(zip(queries, results, strict=True))
 
     def _extract_source(self, url: str) -> str:
         """Extract source domain from URL.
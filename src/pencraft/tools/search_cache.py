@@ -0,0 +1,107 @@
+"""Persistent cache of web search results."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pencraft.tools.search import SearchResult
+from pencraft.utils.cache import DiskCache
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import CacheSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SearchCacheStats:
+    """Hit/miss counters of the search cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+
+class SearchCache:
+    """Caches search results per query with a time-to-live.
+
+    Entries are keyed on the normalized query and every search parameter
+    (region, safesearch, time range, result count), so a batch of posts
+    on related topics only asks the search engine once per distinct query.
+    """
+
+    def __init__(self, store: DiskCache, ttl: float | None = None) -> None:
+        """Initialize the search cache.
+
+        Args:
+            store: Disk store holding the results.
+            ttl: Seconds before cached results expire (None keeps them).
+        """
+        self.store = store
+        self.ttl = ttl
+        self.stats = SearchCacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> SearchCache:
+        """Create a search cache from cache settings.
+
+        Args:
+            settings: Cache settings.
+
+        Returns:
+            SearchCache backed by ``<directory>/search.sqlite3``.
+        """
+        store = DiskCache(Path(settings.directory).expanduser() / "search.sqlite3")
+        return cls(store, ttl=settings.search_ttl_hours * 3600)
+
+    def get(self, key: str) -> list[SearchResult] | None:
+        """Look up cached results.
+
+        Args:
+            key: Key from SearchTool.request_key().
+
+        Returns:
+            Cached results, or None on a miss.
+        """
+        entry = self.store.get(key)
+        results = None
+        if entry is not None:
+            try:
+                results = [SearchResult(**r) for r in entry]
+            except TypeError as e:
+                logger.warning(f"Discarding unreadable cached search results: {e}")
+                self.store.delete(key)
+
+        with self._lock:
+            if results is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return results
+
+    def put(self, key: str, results: list[SearchResult]) -> None:
+        """Store search results.
+
+        Args:
+            key: Key from SearchTool.request_key().
+            results: Results returned by the search engine.
+        """
+        self.store.set(key, [r.to_dict() for r in results], ttl=self.ttl)
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        self.store.close()
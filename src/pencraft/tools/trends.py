@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
-from typing import Any
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from pytrends.request import TrendReq
 from urllib3.util import retry
 
+from pencraft.utils.cache import make_cache_key
+
+if TYPE_CHECKING:
+    from pencraft.tools.trends_cache import TrendsCache
+    from pencraft.tools.trends_scheduler import TrendsScheduler
+
 # Monkeypatch Retry to support method_whitelist (deprecated in urllib3 2.0)
 if not hasattr(retry.Retry, "method_whitelist"):
     _original_init = retry.Retry.__init__
@@ -22,6 +30,11 @@ if not hasattr(retry.Retry, "method_whitelist"):
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Keywords Google Trends compares in one payload
+MAX_KEYWORDS = 5
+
 
 @dataclass
 class TrendsData:
@@ -107,32 +120,99 @@ class TrendsTool:
         timezone: int = 360,
         retries: int = 3,
         backoff_factor: float = 0.5,
+        cache: TrendsCache | None = None,
+        scheduler: TrendsScheduler | None = None,
     ) -> None:
         """Initialize the trends tool.
 
         Args:
             language: Language for Google Trends (e.g., 'en-US').
             timezone: Timezone offset in minutes from UTC.
-            retries: Number of retries for failed requests.
-            backoff_factor: Backoff factor for retries.
+            retries: Number of retries for failed requests (without a scheduler).
+            backoff_factor: Backoff factor for retries (without a scheduler).
+            cache: Optional cache of trends data.
+            scheduler: Optional scheduler pacing the requests. It takes over
+                from urllib3's fixed-backoff retries, so that 429 responses
+                reach it and slow every lookup down.
         """
         self.language = language
         self.timezone = timezone
         self.retries = retries
         self.backoff_factor = backoff_factor
+        self.cache = cache
+        self.scheduler = scheduler
         self._pytrends: TrendReq | None = None
 
-    def _get_client(self) -> TrendReq:
+    def _get_client(self, expires_at: float | None = None) -> TrendReq:
         """Get or create the pytrends client."""
         if self._pytrends is None:
-            self._pytrends = TrendReq(
+            scheduled = self.scheduler is not None
+            # Creating the client fetches a cookie from Google
+            self._pytrends = self._request(
+                TrendReq,
+                expires_at=expires_at,
                 hl=self.language,
                 tz=self.timezone,
-                retries=self.retries,
-                backoff_factor=self.backoff_factor,
+                retries=0 if scheduled else self.retries,
+                backoff_factor=0 if scheduled else self.backoff_factor,
             )
         return self._pytrends
 
+    def _request(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        expires_at: float | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Make a Google Trends request, through the scheduler if there is one.
+
+        Raises:
+            TimeoutError: If the request could not be sent by ``expires_at``
+                (a monotonic time).
+        """
+        if self.scheduler is not None:
+            return self.scheduler.run(fn, *args, expires_at=expires_at, **kwargs)
+        if expires_at is not None and time.monotonic() >= expires_at:
+            raise TimeoutError("Trends request abandoned at its deadline")
+        return fn(*args, **kwargs)
+
+    def request_key(self, topic: str, timeframe: str, geo: str, include_regional: bool) -> str:
+        """Build the key identifying a trends lookup.
+
+        Args:
+            topic: Search term (case and whitespace are ignored).
+            timeframe: Time range.
+            geo: Geographic region.
+            include_regional: Whether regional interest is fetched.
+
+        Returns:
+            Key string.
+        """
+        normalized = " ".join(topic.lower().split())
+        return make_cache_key(
+            "trends", normalized, timeframe, geo, include_regional, self.language, self.timezone
+        )
+
+    @staticmethod
+    def batch_keys(keys: list[str]) -> list[str]:
+        """Scope the keys of lookups fetched together to their batch.
+
+        Interest scores from one payload are scaled against each other, so
+        they may only be reused for the same batch, never for a lone lookup
+        of one of its terms. A batch of one keeps the plain key.
+
+        Args:
+            keys: request_key() of every term in the batch.
+
+        Returns:
+            Cache key per term, in the same order.
+        """
+        if len(keys) == 1:
+            return keys
+        batch = sorted(keys)
+        return [make_cache_key("trends-batch", key, batch) for key in keys]
+
     def get_trends_data(
         self,
         topic: str,
@@ -140,6 +220,7 @@ class TrendsTool:
         timeframe: str = "today 3-m",
         geo: str = "",
         include_regional: bool = True,
+        deadline: float | None = None,
     ) -> TrendsData:
         """Fetch comprehensive trends data for a topic.
 
@@ -148,92 +229,225 @@ class TrendsTool:
             timeframe: Time range (e.g., 'today 3-m', 'today 12-m', 'now 7-d').
             geo: Geographic region (e.g., 'US', 'GB', '' for worldwide).
             include_regional: Whether to fetch regional interest data.
+            deadline: Seconds after which requests not yet sent are abandoned.
 
         Returns:
             TrendsData object with all available trends information.
         """
-        trends_data = TrendsData(topic=topic)
+        return self.get_trends_data_many(
+            [topic],
+            timeframe=timeframe,
+            geo=geo,
+            include_regional=include_regional,
+            deadline=deadline,
+        )[topic]
+
+    def get_trends_data_many(
+        self,
+        topics: list[str],
+        *,
+        timeframe: str = "today 3-m",
+        geo: str = "",
+        include_regional: bool = True,
+        deadline: float | None = None,
+    ) -> dict[str, TrendsData]:
+        """Fetch trends data for several topics in as few requests as possible.
+
+        Cached topics are answered from the cache. The rest are looked up
+        MAX_KEYWORDS at a time, sharing one payload and one set of requests
+        per batch. Google Trends scales the interest of a batch's keywords
+        against each other, so a topic's interest score depends on the
+        topics it was fetched with, and batched data is only cached for
+        that same batch (see batch_keys()).
+
+        Requests still waiting for their turn at the deadline are abandoned,
+        leaving the data they would have filled in empty (and uncached).
+
+        Args:
+            topics: Topics to research.
+            timeframe: Time range (e.g., 'today 3-m', 'today 12-m', 'now 7-d').
+            geo: Geographic region (e.g., 'US', 'GB', '' for worldwide).
+            include_regional: Whether to fetch regional interest data.
+            deadline: Seconds after which requests not yet sent are abandoned.
+
+        Returns:
+            TrendsData for every topic, keyed by topic.
+        """
+        expires_at = None if deadline is None else time.monotonic() + deadline
+        results: dict[str, TrendsData] = {}
+        # Topics differing only in case or spacing share one lookup
+        pending: dict[str, list[str]] = {}
+        for topic in dict.fromkeys(topics):
+            key = self.request_key(topic, timeframe, geo, include_regional)
+            if key not in pending and self.cache is not None:
+                cached = self.cache.get(key, topic)
+                if cached is not None:
+                    logger.debug(f"Trends cache hit for '{topic}'")
+                    results[topic] = cached
+                    continue
+            pending.setdefault(key, []).append(topic)
+
+        keys = list(pending)
+        for start in range(0, len(keys), MAX_KEYWORDS):
+            batch = {pending[key][0]: key for key in keys[start : start + MAX_KEYWORDS]}
+            cache_keys = dict(zip(batch, self.batch_keys(list(batch.values())), strict=True))
+            # A lone term's plain key was already looked up above
+            fetched = self._cached_batch(cache_keys) if len(batch) > 1 else None
+            if fetched is None:
+                fetched, complete = self._fetch_batch(
+                    list(batch), timeframe, geo, include_regional, expires_at
+                )
+                # Partial answers are often throttling, so they are not cached
+                if self.cache is not None and complete:
+                    for topic, cache_key in cache_keys.items():
+                        self.cache.put(cache_key, fetched[topic])
+            for topic, key in batch.items():
+                data = fetched[topic]
+                for alias in pending[key]:
+                    results[alias] = data if alias == topic else replace(data, topic=alias)
+
+        return {topic: results[topic] for topic in topics}
+
+    def _cached_batch(self, cache_keys: dict[str, str]) -> dict[str, TrendsData] | None:
+        """Get a batch's data from the cache, if every term of it is there.
+
+        Args:
+            cache_keys: Cache key per topic, from batch_keys().
+
+        Returns:
+            TrendsData per topic, or None if any is missing.
+        """
+        if self.cache is None:
+            return None
+        results: dict[str, TrendsData] = {}
+        for topic, key in cache_keys.items():
+            cached = self.cache.get(key, topic)
+            if cached is None:
+                return None
+            results[topic] = cached
+        logger.debug(f"Trends cache hit for the batch {', '.join(repr(t) for t in cache_keys)}")
+        return results
+
+    def _fetch_batch(
+        self,
+        batch: list[str],
+        timeframe: str,
+        geo: str,
+        include_regional: bool,
+        expires_at: float | None = None,
+    ) -> tuple[dict[str, TrendsData], bool]:
+        """Look up up to MAX_KEYWORDS topics with one payload.
+
+        Args:
+            batch: Topics to look up.
+            timeframe: Time range.
+            geo: Geographic region.
+            include_regional: Whether to fetch regional interest data.
+            expires_at: Monotonic time after which requests are abandoned.
+
+        Returns:
+            Tuple of (TrendsData per topic, whether every request succeeded).
+        """
+        results = {topic: TrendsData(topic=topic) for topic in batch}
+        complete = True
 
         try:
-            pytrends = self._get_client()
+            pytrends = self._get_client(expires_at)
 
-            # Build payload for the topic
-            pytrends.build_payload([topic], timeframe=timeframe, geo=geo)
+            # Build payload for the batch
+            self._request(
+                pytrends.build_payload, batch, expires_at=expires_at, timeframe=timeframe, geo=geo
+            )
 
             # Get interest over time
             try:
-                interest_df = pytrends.interest_over_time()
-                if not interest_df.empty and topic in interest_df.columns:
-                    # Calculate average interest score
-                    trends_data.interest_score = int(interest_df[topic].mean())
-                    # Check if trending (recent values higher than average)
-                    recent = interest_df[topic].tail(4).mean()
-                    overall = interest_df[topic].mean()
-                    trends_data.is_trending = recent > overall * 1.2
-                    logger.info(f"Interest score for '{topic}': {trends_data.interest_score}")
+                interest_df = self._request(pytrends.interest_over_time, expires_at=expires_at)
+                for topic, trends_data in results.items():
+                    if not interest_df.empty and topic in interest_df.columns:
+                        # Calculate average interest score
+                        trends_data.interest_score = int(interest_df[topic].mean())
+                        # Check if trending (recent values higher than average)
+                        recent = interest_df[topic].tail(4).mean()
+                        overall = interest_df[topic].mean()
+                        trends_data.is_trending = recent > overall * 1.2
+                        logger.info(f"Interest score for '{topic}': {trends_data.interest_score}")
             except Exception as e:
                 logger.warning(f"Could not fetch interest over time: {e}")
+                complete = False
 
             # Get related queries
             try:
-                related = pytrends.related_queries()
-                if topic in related and related[topic]:
-                    # Top queries
-                    top_df = related[topic].get("top")
-                    if top_df is not None and not top_df.empty:
-                        trends_data.related_queries = top_df["query"].tolist()[:10]
-
-                    # Rising queries
-                    rising_df = related[topic].get("rising")
-                    if rising_df is not None and not rising_df.empty:
-                        trends_data.rising_queries = rising_df["query"].tolist()[:10]
-                        logger.info(f"Found {len(trends_data.rising_queries)} rising queries")
+                related = self._request(pytrends.related_queries, expires_at=expires_at)
+                for topic, trends_data in results.items():
+                    if topic in related and related[topic]:
+                        # Top queries
+                        top_df = related[topic].get("top")
+                        if top_df is not None and not top_df.empty:
+                            trends_data.related_queries = top_df["query"].tolist()[:10]
+
+                        # Rising queries
+                        rising_df = related[topic].get("rising")
+                        if rising_df is not None and not rising_df.empty:
+                            trends_data.rising_queries = rising_df["query"].tolist()[:10]
+                            logger.info(
+                                f"Found {len(trends_data.rising_queries)} rising queries "
+                                f"for '{topic}'"
+                            )
             except Exception as e:
                 logger.warning(f"Could not fetch related queries: {e}")
+                complete = False
 
             # Get related topics
             try:
-                topics = pytrends.related_topics()
-                if topic in topics and topics[topic]:
-                    # Top topics
-                    top_topics_df = topics[topic].get("top")
-                    if (
-                        top_topics_df is not None
-                        and not top_topics_df.empty
-                        and "topic_title" in top_topics_df.columns
-                    ):
-                        trends_data.related_topics = top_topics_df["topic_title"].tolist()[:5]
-
-                    # Rising topics
-                    rising_topics_df = topics[topic].get("rising")
-                    if (
-                        rising_topics_df is not None
-                        and not rising_topics_df.empty
-                        and "topic_title" in rising_topics_df.columns
-                    ):
-                        trends_data.rising_topics = rising_topics_df["topic_title"].tolist()[:5]
+                related_topics = self._request(pytrends.related_topics, expires_at=expires_at)
+                for topic, trends_data in results.items():
+                    if topic in related_topics and related_topics[topic]:
+                        # Top topics
+                        top_topics_df = related_topics[topic].get("top")
+                        if (
+                            top_topics_df is not None
+                            and not top_topics_df.empty
+                            and "topic_title" in top_topics_df.columns
+                        ):
+                            trends_data.related_topics = top_topics_df["topic_title"].tolist()[:5]
+
+                        # Rising topics
+                        rising_topics_df = related_topics[topic].get("rising")
+                        if (
+                            rising_topics_df is not None
+                            and not rising_topics_df.empty
+                            and "topic_title" in rising_topics_df.columns
+                        ):
+                            trends_data.rising_topics = rising_topics_df["topic_title"].tolist()[:5]
             except IndexError:
                 logger.info("No related topics found (empty response).")
             except Exception as e:
                 logger.warning(f"Could not fetch related topics: {e}")
+                complete = False
 
             # Get regional interest
             if include_regional:
                 try:
-                    regional_df = pytrends.interest_by_region(resolution="COUNTRY")
-                    if not regional_df.empty and topic in regional_df.columns:
-                        # Filter to regions with some interest
-                        regional_series = regional_df[topic]
-                        regional_with_interest = regional_series[regional_series > 0]
-                        trends_data.regional_interest = regional_with_interest.to_dict()
+                    regional_df = self._request(
+                        pytrends.interest_by_region, expires_at=expires_at, resolution="COUNTRY"
+                    )
+                    for topic, trends_data in results.items():
+                        if not regional_df.empty and topic in regional_df.columns:
+                            # Filter to regions with some interest
+                            regional_series = regional_df[topic]
+                            regional_with_interest = regional_series[regional_series > 0]
+                            trends_data.regional_interest = regional_with_interest.to_dict()
                 except Exception as e:
                     logger.warning(f"Could not fetch regional interest: {e}")
+                    complete = False
 
         except Exception as e:
-            logger.error(f"Trends lookup failed for '{topic}': {e}")
-            trends_data.error = str(e)
+            logger.error(f"Trends lookup failed for {', '.join(repr(t) for t in batch)}: {e}")
+            for trends_data in results.values():
+                trends_data.error = str(e)
+            complete = False
 
-        return trends_data
+        return results, complete
 
     def get_related_queries(self, topic: str) -> list[str]:
         """Get related search queries for a topic.
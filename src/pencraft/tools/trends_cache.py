@@ -0,0 +1,104 @@
+"""Persistent cache of Google Trends lookups."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pencraft.tools.trends import TrendsData
+from pencraft.utils.cache import DiskCache
+
+if TYPE_CHECKING:
+    from pencraft.config.settings import CacheSettings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TrendsCacheStats:
+    """Hit/miss counters of the trends cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class TrendsCache:
+    """Caches Google Trends data per search term with a time-to-live.
+
+    Entries are keyed on the normalized term, timeframe, region and whether
+    regional interest was fetched, so posts sharing a search term only ask
+    Google Trends once. Terms fetched in one payload are keyed on their
+    whole batch too, as their interest scores are relative to each other. Trends move slowly, and Google throttles clients
+    hard, so a day-old answer is usually the better one.
+    """
+
+    def __init__(self, store: DiskCache, ttl: float | None = None) -> None:
+        """Initialize the trends cache.
+
+        Args:
+            store: Disk store holding the trends data.
+            ttl: Seconds before cached data expires (None keeps it).
+        """
+        self.store = store
+        self.ttl = ttl
+        self.stats = TrendsCacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> TrendsCache:
+        """Create a trends cache from cache settings.
+
+        Args:
+            settings: Cache settings.
+
+        Returns:
+            TrendsCache backed by ``<directory>/trends.sqlite3``.
+        """
+        store = DiskCache(Path(settings.directory).expanduser() / "trends.sqlite3")
+        return cls(store, ttl=settings.trends_ttl_hours * 3600)
+
+    def get(self, key: str, topic: str) -> TrendsData | None:
+        """Look up cached trends data.
+
+        Args:
+            key: Key from TrendsTool.request_key() or batch_keys().
+            topic: Topic to report the data under.
+
+        Returns:
+            Cached data, or None on a miss.
+        """
+        entry = self.store.get(key)
+        data = None
+        if entry is not None:
+            try:
+                data = TrendsData(**{**entry, "topic": topic})
+            except TypeError as e:
+                logger.warning(f"Discarding unreadable cached trends data: {e}")
+                self.store.delete(key)
+
+        with self._lock:
+            if data is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return data
+
+    def put(self, key: str, data: TrendsData) -> None:
+        """Store trends data.
+
+        Args:
+            key: Key from TrendsTool.request_key() or batch_keys().
+            data: Data returned by Google Trends.
+        """
+        self.store.set(key, data.to_dict(), ttl=self.ttl)
+
+    def close(self) -> None:
+        """Close the underlying store."""
+        self.store.close()
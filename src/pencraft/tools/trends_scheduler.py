@@ -0,0 +1,217 @@
+"""Adaptive pacing of Google Trends requests."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from pytrends.exceptions import TooManyRequestsError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def is_throttled(error: BaseException) -> bool:
+    """Check whether an error is Google Trends answering 429 Too Many Requests.
+
+    Args:
+        error: Exception raised by a pytrends call.
+
+    Returns:
+        True for throttling responses.
+    """
+    if isinstance(error, TooManyRequestsError):
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+@dataclass
+class TrendsSchedulerStats:
+    """Counters describing the requests sent through the scheduler."""
+
+    requests: int = 0
+    throttled: int = 0
+    abandoned: int = 0
+    wait_seconds: float = 0.0
+    peak_queue_depth: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "abandoned": self.abandoned,
+            "wait_seconds": self.wait_seconds,
+            "peak_queue_depth": self.peak_queue_depth,
+        }
+
+
+class TrendsScheduler:
+    """Sends Google Trends requests one at a time at an adaptive rate.
+
+    Callers queue up in arrival order, whatever topic they are looking up,
+    and requests are spaced by the current rate. The rate follows AIMD:
+    every successful request raises it by a fixed step up to the maximum,
+    and every 429 response halves it down to the minimum, so the scheduler
+    settles just below the rate Google tolerates instead of retrying at a
+    fixed backoff. A request given a deadline gives up its place in the
+    queue rather than being sent after it.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60.0,
+        *,
+        min_requests_per_minute: float = 2.0,
+        max_requests_per_minute: float = 120.0,
+        increase: float = 2.0,
+        decrease: float = 0.5,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            requests_per_minute: Starting request rate.
+            min_requests_per_minute: Rate never lowered below this.
+            max_requests_per_minute: Rate never raised above this.
+            increase: Requests/min added after each successful request.
+            decrease: Factor applied to the rate after each 429 response.
+        """
+        self.min_rate = min_requests_per_minute
+        self.max_rate = max_requests_per_minute
+        self.rate = min(max(requests_per_minute, self.min_rate), self.max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.stats = TrendsSchedulerStats()
+
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        self._abandoned: set[int] = set()
+        self._next_at = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for their turn, excluding the one being sent."""
+        with self._cond:
+            return max(0, self._next_ticket - self._serving - len(self._abandoned) - 1)
+
+    def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        expires_at: float | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Send one request when its turn comes.
+
+        Args:
+            fn: pytrends call making the request.
+            *args: Positional arguments for ``fn``.
+            expires_at: Monotonic time after which the request is abandoned
+                instead of sent (None waits as long as it takes).
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            What ``fn`` returns.
+
+        Raises:
+            TimeoutError: If the request could not be sent by ``expires_at``.
+            Exception: Whatever ``fn`` raises, after adjusting the rate.
+        """
+        start = time.monotonic()
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            depth = ticket - self._serving
+            self.stats.peak_queue_depth = max(self.stats.peak_queue_depth, depth)
+            if depth:
+                logger.debug(f"Trends request queued behind {depth}")
+            while ticket != self._serving:
+                timeout = None if expires_at is None else expires_at - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    # Whoever is served before this ticket skips it
+                    self._abandoned.add(ticket)
+                    self.stats.abandoned += 1
+                    raise TimeoutError("Trends request abandoned in the queue at its deadline")
+                self._cond.wait(timeout)
+
+        sent = False
+        try:
+            delay = self._next_at - time.monotonic()
+            if expires_at is not None and time.monotonic() + max(delay, 0.0) > expires_at:
+                raise TimeoutError("Trends request abandoned, its turn comes after its deadline")
+            if delay > 0:
+                time.sleep(delay)
+            sent = True
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if is_throttled(e):
+                    self._throttled()
+                raise
+            self._succeeded()
+            return result
+        finally:
+            with self._cond:
+                if sent:
+                    self.stats.requests += 1
+                    self.stats.wait_seconds += time.monotonic() - start
+                    self._next_at = time.monotonic() + 60.0 / self.rate
+                else:
+                    self.stats.abandoned += 1
+                self._serving += 1
+                while self._serving in self._abandoned:
+                    self._abandoned.remove(self._serving)
+                    self._serving += 1
+                self._cond.notify_all()
+
+    def _succeeded(self) -> None:
+        """Raise the rate additively after a successful request."""
+        with self._cond:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def _throttled(self) -> None:
+        """Cut the rate multiplicatively after a 429 response."""
+        with self._cond:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.stats.throttled += 1
+        logger.warning(f"Google Trends throttled, slowing to {self.rate:.1f} requests/min")
+
+
+_scheduler: TrendsScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_trends_scheduler(
+    requests_per_minute: float = 60.0,
+    max_requests_per_minute: float = 120.0,
+) -> TrendsScheduler:
+    """Get the process-wide trends scheduler, creating it if needed.
+
+    Google throttles by client address, so every trends tool in the process
+    shares one queue and one rate. The limits of the first caller win.
+
+    Args:
+        requests_per_minute: Starting request rate.
+        max_requests_per_minute: Highest rate the scheduler may reach.
+
+    Returns:
+        Shared TrendsScheduler instance.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TrendsScheduler(
+                requests_per_minute, max_requests_per_minute=max_requests_per_minute
+            )
+            logger.debug(
+                f"Trends scheduler: {requests_per_minute} requests/min, "
+                f"up to {max_requests_per_minute}"
+            )
+        return _scheduler
@@ -1,5 +1,6 @@
 """Utilities package for Pencraft."""
 
+from pencraft.utils.cache import DiskCache
 from pencraft.utils.logging import configure_logging
 
-__all__ = ["configure_logging"]
+__all__ = ["configure_logging", "DiskCache"]
@@ -0,0 +1,212 @@
+"""SQLite-backed on-disk cache shared by Pencraft's caching layers."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    expires_at REAL
+)
+"""
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable content-addressed key from JSON-serializable parts.
+
+    Args:
+        *parts: Values identifying the cached item.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding of ``parts``.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """Persistent key/value store with TTL and size/age-based LRU eviction.
+
+    Values are stored as JSON in a single SQLite file, so the cache can be
+    shared between threads and between processes working on the same batch.
+    """
+
+    # Run eviction once every this many writes to amortize its cost
+    EVICT_EVERY = 64
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_size_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file (created if missing).
+            max_size_bytes: Evict least recently used entries above this size.
+            max_age_seconds: Evict entries older than this, regardless of use.
+        """
+        self.path = Path(path).expanduser()
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self.evict()
+
+    def get(self, key: str) -> Any | None:
+        """Get a value, refreshing its LRU position.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Decoded value, or None if missing or expired.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at, expires_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created_at, expires_at = row
+            expired = expires_at is not None and expires_at <= now
+            too_old = self.max_age_seconds is not None and now - created_at > self.max_age_seconds
+            if expired or too_old:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            logger.warning(f"Discarding corrupt cache entry {key[:12]} in {self.path}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key.
+            value: JSON-serializable value.
+            ttl: Optional time-to-live in seconds for this entry.
+        """
+        encoded = json.dumps(value, default=str, ensure_ascii=False)
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, value, size, created_at, accessed_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, encoded, len(encoded.encode("utf-8")), now, now, expires_at),
+            )
+            self._writes += 1
+            should_evict = self._writes % self.EVICT_EVERY == 0
+
+        if should_evict:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def evict(self) -> int:
+        """Drop expired, too old and least recently used entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        now = time.time()
+        removed = 0
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,),
+            )
+            removed += cursor.rowcount
+
+            if self.max_age_seconds is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM entries WHERE created_at < ?",
+                    (now - self.max_age_seconds,),
+                )
+                removed += cursor.rowcount
+
+            if self.max_size_bytes is not None:
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[
+                    0
+                ]
+                if total > self.max_size_bytes:
+                    rows = self._conn.execute(
+                        "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+                    ).fetchall()
+                    stale: list[tuple[str]] = []
+                    for key, size in rows:
+                        if total <= self.max_size_bytes:
+                            break
+                        stale.append((key,))
+                        total -= size
+                    self._conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+                    removed += len(stale)
+
+        if removed:
+            logger.debug(f"Evicted {removed} entries from {self.path}")
+        return removed
+
+    def size_bytes(self) -> int:
+        """Get the total size of stored values in bytes."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def __len__(self) -> int:
+        """Get the number of stored entries."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
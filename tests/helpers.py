@@ -0,0 +1,38 @@
+"""Shared helpers for Pencraft tests."""
+
+from openai.types.chat import ChatCompletion
+
+
+def completion(
+    content: str = "Hello", *, prompt_tokens: int = 10, completion_tokens: int = 5
+) -> ChatCompletion:
+    """Build a minimal chat completion for faking LLM responses.
+
+    Args:
+        content: Text of the assistant message.
+        prompt_tokens: Prompt tokens reported in the usage.
+        completion_tokens: Completion tokens reported in the usage.
+
+    Returns:
+        ChatCompletion with one choice.
+    """
+    return ChatCompletion.model_validate(
+        {
+            "id": "cmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test-model",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": content},
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+    )
@@ -0,0 +1,157 @@
+"""Tests for the run artifact store."""
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from pencraft.agents.planner import BlogOutline, Section
+from pencraft.agents.research import ResearchData
+from pencraft.artifacts import CONTENT_RESEARCH_FIELDS, ArtifactStore
+from pencraft.config.settings import ResearchSettings, Settings
+from pencraft.generator import BlogGenerator
+from pencraft.llm.client import LLMClient
+from pencraft.tools.search import SearchResult
+from tests.helpers import completion
+
+
+def _outline(word_count: int = 2000) -> BlogOutline:
+    """Build an outline with numbered sections."""
+    return BlogOutline(
+        title="Checkpoints",
+        meta_description="About checkpoints",
+        sections=[Section(title=f"Part {i}", key_points=[f"point {i}"]) for i in range(3)],
+        target_word_count=word_count,
+    )
+
+
+class TestArtifactStore:
+    """Test cases for ArtifactStore."""
+
+    def test_run_directory_depends_on_topic_and_settings(self, tmp_path: Path) -> None:
+        """Test runs are keyed by normalized topic and content settings."""
+        settings = Settings(cache={"directory": str(tmp_path)})
+        store = ArtifactStore.for_run("Python  Tips", settings)
+
+        assert store.run_dir.parent == tmp_path / "runs"
+        assert store.run_dir.name.startswith("python-tips-")
+        assert ArtifactStore.for_run("python tips", settings).run_dir == store.run_dir
+
+        other = Settings(cache={"directory": str(tmp_path)}, llm={"temperature": 0.1})
+        assert ArtifactStore.for_run("Python Tips", other).run_dir != store.run_dir
+
+        faster = Settings(
+            cache={"directory": str(tmp_path)},
+            research={"scrape_concurrency": 16, "trends_deadline": 1.0},
+        )
+        assert ArtifactStore.for_run("Python Tips", faster).run_dir == store.run_dir
+        deeper = Settings(cache={"directory": str(tmp_path)}, research={"search_depth": 3})
+        assert ArtifactStore.for_run("Python Tips", deeper).run_dir != store.run_dir
+
+    def test_content_fields_exist(self) -> None:
+        """Test every field in the run key allow-list is a research setting."""
+        assert set(CONTENT_RESEARCH_FIELDS) <= set(ResearchSettings.model_fields)
+
+    def test_written_lazily_and_pruned(self, tmp_path: Path) -> None:
+        """Test nothing is written before the first artifact and old runs expire."""
+        settings = Settings(cache={"directory": str(tmp_path)})
+        store = ArtifactStore.for_run("Python Tips", settings)
+        assert not store.run_dir.exists()
+
+        store.save_outline(_outline())
+        assert (store.run_dir / "run.json").exists()
+
+        old = time.time() - 15 * 86400
+        for path in [*store.run_dir.rglob("*"), store.run_dir]:
+            os.utime(path, (old, old))
+        ArtifactStore.for_run("Other topic", settings)
+        assert not store.run_dir.exists()
+
+    def test_research_roundtrip(self, tmp_path: Path) -> None:
+        """Test research is restored only for the same additional context."""
+        store = ArtifactStore(tmp_path)
+        research = ResearchData(
+            topic="t",
+            summary="Summary",
+            sources=[{"title": "A", "url": "https://a.example"}],
+            search_results=[SearchResult(title="A", url="https://a.example", snippet="s")],
+        )
+        store.save_research(research, "ctx")
+
+        loaded = store.load_research("ctx")
+        assert loaded is not None
+        assert loaded.to_dict() == research.to_dict()
+        assert store.load_research("other") is None
+        assert store.load_research() is not None
+
+    def test_outline_and_sections_match_inputs(self, tmp_path: Path) -> None:
+        """Test outlines and sections are ignored when their inputs changed."""
+        store = ArtifactStore(tmp_path)
+        outline = _outline()
+        store.save_outline(outline)
+        store.save_section(outline, "Part 0", "Body 0")
+        store.save_section(outline, "introduction", "Intro")
+
+        loaded = store.load_outline(2000)
+        assert loaded is not None
+        assert loaded.to_dict() == outline.to_dict()
+        assert store.load_outline(3000) is None
+
+        assert store.load_sections(loaded) == {"Part 0": "Body 0", "introduction": "Intro"}
+        assert store.load_sections(_outline(3000)) == {}
+
+    def test_unreadable_artifact_is_ignored(self, tmp_path: Path) -> None:
+        """Test a corrupt artifact behaves like a missing one."""
+        store = ArtifactStore(tmp_path)
+        (tmp_path / "outline.json").write_text("{not json", encoding="utf-8")
+        assert store.load_outline() is None
+
+
+class TestResume:
+    """Test cases for resuming an interrupted generation."""
+
+    async def test_resume_reuses_written_sections(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test a rerun after a failed section only writes what is missing."""
+        settings = Settings(
+            blog={"include_toc": False}, cache={"directory": str(tmp_path / "cache")}
+        )
+        client = LLMClient(settings.llm)
+        prompts: list[str] = []
+        fail_part = True
+
+        async def fake_create(**params: Any) -> ChatCompletion:
+            prompt = params["messages"][-1]["content"]
+            prompts.append(prompt)
+            if "**Current Section:**" in prompt:
+                section = prompt.split("**Current Section:** ")[1].split("\n")[0]
+                if section == "Part 2" and fail_part:
+                    raise RuntimeError("connection dropped")
+                return completion(f"Body of {section}.")
+            return completion("Intro or conclusion.")
+
+        monkeypatch.setattr(client._async_client.chat.completions, "create", fake_create)
+        generator = BlogGenerator(settings=settings, llm_client=client)
+        outline = _outline()
+
+        with pytest.raises(RuntimeError):
+            await generator.agenerate(
+                "checkpoints", skip_research=True, custom_outline=outline, output_dir=tmp_path
+            )
+
+        fail_part = False
+        prompts.clear()
+        blog = await generator.agenerate(
+            "checkpoints",
+            skip_research=True,
+            custom_outline=outline,
+            output_dir=tmp_path,
+            resume=True,
+        )
+
+        assert len(prompts) == 1
+        assert "**Current Section:** Part 2" in prompts[0]
+        for i in range(3):
+            assert f"Body of Part {i}." in blog.content
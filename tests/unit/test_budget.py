@@ -0,0 +1,98 @@
+"""Tests for budgeted, multi-round research."""
+
+import time
+from pathlib import Path
+from typing import Any
+
+from openai.types.chat import ChatCompletion
+
+from pencraft.agents.budget import ResearchBudget
+from pencraft.agents.research import ResearchAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from pencraft.tools.search import SearchResult
+from tests.helpers import completion
+
+
+def _agent(tmp_path: Path, searched: list[str], **research: Any) -> ResearchAgent:
+    """Build a research agent whose LLM suggests two new queries per round."""
+    settings = Settings(research=research, cache={"directory": str(tmp_path / "cache")})
+    client = LLMClient(settings.llm)
+    rounds = 0
+
+    async def fake_create(**_: Any) -> ChatCompletion:
+        nonlocal rounds
+        rounds += 1
+        return completion(
+            f"1. gap {rounds}a\n2. gap {rounds}b\n- sourdough",
+            prompt_tokens=100,
+            completion_tokens=0,
+        )
+
+    async def fake_search(queries: list[str], **_: Any) -> dict[str, list[SearchResult]]:
+        searched.extend(queries)
+        return {
+            q: [SearchResult(q, f"https://{q.replace(' ', '-')}.example/", "Snippet")]
+            for q in queries
+        }
+
+    client._async_client.chat.completions.create = fake_create  # type: ignore[method-assign]
+    agent = ResearchAgent(client, settings)
+    agent.search_tool.amulti_search = fake_search  # type: ignore[method-assign]
+    return agent
+
+
+FIRST_ROUND = [SearchResult("Sourdough", "https://first.example/", "Snippet")]
+
+
+class TestResearchBudget:
+    """Test cases for ResearchBudget."""
+
+    def test_limits(self) -> None:
+        """Test the budget runs out on time or tokens and caps deadlines."""
+        assert not ResearchBudget().exhausted()
+        assert ResearchBudget().deadline(20.0) == 20.0
+
+        timed = ResearchBudget(seconds=0.05)
+        assert timed.deadline(20.0) is not None and timed.deadline(20.0) <= 0.05
+        time.sleep(0.06)
+        assert timed.exhausted() and timed.remaining() == 0
+
+        tokens = ResearchBudget(tokens=100)
+        tokens.tokens_used = 100
+        assert tokens.exhausted()
+
+
+class TestFollowUpRounds:
+    """Test cases for follow-up search rounds."""
+
+    async def test_rounds_follow_search_depth(self, tmp_path: Path) -> None:
+        """Test each extra round searches the new gap queries only."""
+        searched: list[str] = []
+        agent = _agent(tmp_path, searched, search_depth=3)
+
+        results = await agent._afollow_up("sourdough", ["sourdough"], FIRST_ROUND, ResearchBudget())
+
+        assert searched == ["gap 1a", "gap 1b", "gap 2a", "gap 2b"]
+        assert len(results) == 5
+
+    async def test_token_budget_stops_rounds(self, tmp_path: Path) -> None:
+        """Test no round starts once the token budget is spent."""
+        searched: list[str] = []
+        agent = _agent(tmp_path, searched, search_depth=5)
+        budget = ResearchBudget(tokens=150)
+
+        await agent._afollow_up("sourdough", ["sourdough"], FIRST_ROUND, budget)
+
+        # The second suggestion call crosses the budget, so its queries still run
+        assert searched == ["gap 1a", "gap 1b", "gap 2a", "gap 2b"]
+        assert budget.tokens_used == 200 and budget.exhausted()
+
+    async def test_depth_one_makes_no_calls(self, tmp_path: Path) -> None:
+        """Test depth 1 keeps the first round's results as they are."""
+        searched: list[str] = []
+        agent = _agent(tmp_path, searched, search_depth=1)
+
+        results = await agent._afollow_up("sourdough", ["sourdough"], FIRST_ROUND, ResearchBudget())
+
+        assert results == FIRST_ROUND and searched == []
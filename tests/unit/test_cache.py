@@ -0,0 +1,85 @@
+"""Tests for the on-disk caches."""
+
+from pathlib import Path
+from typing import Any
+
+from openai.types.chat import ChatCompletion
+
+from pencraft.config.settings import Settings
+from pencraft.llm.cache import ResponseCache
+from pencraft.llm.client import LLMClient
+from pencraft.utils.cache import DiskCache, make_cache_key
+from tests.helpers import completion
+
+
+class TestDiskCache:
+    """Test cases for DiskCache."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Test storing and loading values."""
+        cache = DiskCache(tmp_path / "c.sqlite3")
+        cache.set("a", {"x": [1, 2]})
+
+        assert cache.get("a") == {"x": [1, 2]}
+        assert cache.get("missing") is None
+        assert len(cache) == 1
+
+    def test_ttl_expiry(self, tmp_path: Path) -> None:
+        """Test entries expire after their TTL."""
+        cache = DiskCache(tmp_path / "c.sqlite3")
+        cache.set("a", 1, ttl=-1)
+
+        assert cache.get("a") is None
+
+    def test_lru_size_eviction(self, tmp_path: Path) -> None:
+        """Test least recently used entries are evicted first."""
+        cache = DiskCache(tmp_path / "c.sqlite3", max_size_bytes=250)
+        cache.set("old", "x" * 100)
+        cache.set("new", "y" * 100)
+        cache.get("old")  # refresh
+        cache.set("newest", "z" * 100)
+        cache.evict()
+
+        assert cache.get("old") is not None
+        assert cache.get("new") is None
+        assert cache.get("newest") is not None
+
+    def test_make_cache_key_is_order_independent(self) -> None:
+        """Test keys ignore dict ordering."""
+        assert make_cache_key({"a": 1, "b": 2}) == make_cache_key({"b": 2, "a": 1})
+        assert make_cache_key("x") != make_cache_key("y")
+
+
+class TestResponseCache:
+    """Test cases for LLM response caching."""
+
+    def test_chat_served_from_cache(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test identical requests only hit the endpoint once."""
+        cache = ResponseCache(DiskCache(tmp_path / "llm.sqlite3"))
+        client = LLMClient(Settings().llm, cache=cache)
+        calls: list[dict[str, Any]] = []
+
+        def fake_create(**params: Any) -> ChatCompletion:
+            calls.append(params)
+            return completion()
+
+        monkeypatch.setattr(client._client.chat.completions, "create", fake_create)
+
+        assert client.generate("hi") == "Hello"
+        assert client.generate("hi") == "Hello"
+        assert client.generate("hi", temperature=0.1) == "Hello"
+
+        assert len(calls) == 2
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+        assert cache.stats.tokens_saved == 15
+
+    def test_from_settings(self, tmp_path: Path) -> None:
+        """Test the client factory only enables the cache when configured."""
+        settings = Settings(cache={"directory": str(tmp_path)})
+        assert LLMClient.from_settings(settings).cache is None
+
+        settings = Settings(cache={"directory": str(tmp_path), "llm_enabled": True})
+        client = LLMClient.from_settings(settings)
+        assert client.cache is not None
+        assert (tmp_path / "llm.sqlite3").exists()
@@ -0,0 +1,76 @@
+"""Tests for snippet coverage and the scraping fast path."""
+
+from pathlib import Path
+
+from pencraft.agents.research import ResearchAgent, ResearchData
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from pencraft.tools.coverage import snippet_coverage
+from pencraft.tools.search import SearchResult
+
+QUERIES = ["sourdough starter", "sourdough starter feeding schedule"]
+
+FACTS = [
+    "Feed a sourdough starter every 12 hours at 24 degrees with 50 grams each of flour and water.",
+    "A mature starter doubles within 4 to 8 hours; rye flour ferments faster than bleached white.",
+    "Refrigerated starters need feeding weekly, and recover after two or three warm feeding cycles.",
+    "Hooch, the grey liquid on top, signals hunger; stir it back or pour it off before the schedule.",
+    "Bakers keep 100% hydration starters; stiffer 60% levains give milder, less acidic loaves.",
+    "Chlorinated tap water can slow fermentation, so filtered or rested water is often recommended.",
+    "Bubbles, a domed surface and a tangy yoghurt aroma show the culture is ready for baking bread.",
+    "Discard keeps jars manageable and makes pancakes, crackers, waffles, pizza crust or flatbreads.",
+    "Wild yeast and lactobacillus bacteria cooperate; the acids protect against mould and spoilage.",
+    "Starting from scratch takes roughly 7 to 14 days before a reliable rise on the feeding timetable.",
+]
+
+
+def _results(facts: list[str], sites: int) -> list[SearchResult]:
+    """Build search results spread over a number of sites."""
+    return [
+        SearchResult(f"Sourdough starter guide {i}", f"https://site{i % sites}.example/{i}", fact)
+        for i, fact in enumerate(facts)
+    ]
+
+
+def _agent(tmp_path: Path, **research: object) -> ResearchAgent:
+    """Build a research agent with caches under tmp_path."""
+    settings = Settings(research=research, cache={"directory": str(tmp_path / "cache")})
+    return ResearchAgent(LLMClient(settings.llm), settings)
+
+
+class TestSnippetCoverage:
+    """Test cases for snippet_coverage()."""
+
+    def test_rich_snippets_score_high(self) -> None:
+        """Test varied snippets with facts from many sites score near the top."""
+        coverage = snippet_coverage(_results(FACTS, sites=5), QUERIES)
+
+        assert coverage.query_terms == 1.0
+        assert coverage.numbers >= 6 and coverage.domains == 5
+        assert coverage.score >= 0.9
+
+    def test_thin_snippets_score_low(self) -> None:
+        """Test a couple of vague snippets from one site score low."""
+        thin = ["Everything about bread.", "Our favourite recipes."]
+
+        assert snippet_coverage(_results(thin, sites=1), QUERIES).score < 0.7
+
+
+class TestScrapePlan:
+    """Test cases for ResearchAgent._plan_scrape."""
+
+    def test_fast_path_skips_or_keeps_scraping(self, tmp_path: Path) -> None:
+        """Test scraping is skipped for covered topics and the decision is kept."""
+        agent = _agent(tmp_path, snippet_fast_path=True)
+
+        pages, coverage = agent._plan_scrape(_results(FACTS, sites=5), QUERIES, 3)
+        thin_pages, _ = agent._plan_scrape(_results(FACTS[:1], sites=1), QUERIES, 3)
+
+        assert pages == 0 and thin_pages == 3
+        assert coverage is not None and coverage.planned_pages == 0
+        data = ResearchData.from_dict(ResearchData("t", "s", coverage=coverage).to_dict())
+        assert data.coverage == coverage
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test every requested page is scraped when the fast path is off."""
+        assert _agent(tmp_path)._plan_scrape(_results(FACTS, sites=5), QUERIES, 3) == (3, None)
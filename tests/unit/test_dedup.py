@@ -0,0 +1,97 @@
+"""Tests for near-duplicate detection."""
+
+import asyncio
+from typing import Any
+
+from pencraft.tools.dedup import NearDuplicates, hamming_distance, simhash
+from pencraft.tools.scraper import ScrapedContent, WebScraper
+
+ARTICLE = " ".join(
+    f"Step {i}: feed the sourdough starter with equal weights of rye flour and water, "
+    f"then leave it somewhere warm until it has doubled in size."
+    for i in range(12)
+)
+SYNDICATED = (
+    ARTICLE.replace("somewhere warm", "in a warm spot", 1) + " Originally published on a blog."
+)
+OTHER = " ".join(
+    f"Tip {i}: a baking stone stores heat, so preheat the oven for a full hour "
+    f"before the loaf goes in and bake it with steam for the first twenty minutes."
+    for i in range(12)
+)
+
+
+class TestSimHash:
+    """Test cases for simhash()."""
+
+    def test_near_copies_have_close_fingerprints(self) -> None:
+        """Test a lightly edited copy is much closer than an unrelated text."""
+        near = hamming_distance(simhash(ARTICLE), simhash(SYNDICATED))
+        far = hamming_distance(simhash(ARTICLE), simhash(OTHER))
+
+        assert near <= 10 < far
+        assert simhash(ARTICLE) == simhash(ARTICLE.upper())
+
+
+class TestNearDuplicates:
+    """Test cases for NearDuplicates."""
+
+    def test_check_returns_the_original(self) -> None:
+        """Test the first text is kept and later near-copies point back to it."""
+        dedup = NearDuplicates()
+
+        assert dedup.check("https://a.example/", ARTICLE) is None
+        assert dedup.check("https://b.example/", OTHER) is None
+        assert dedup.check("https://mirror.example/", SYNDICATED) == "https://a.example/"
+
+    def test_short_texts_are_never_duplicates(self) -> None:
+        """Test empty or very short snippets are all kept."""
+        dedup = NearDuplicates()
+
+        assert dedup.check("a", "") is None
+        assert dedup.check("b", "") is None
+        assert dedup.check("c", "Sourdough starter guide") is None
+
+    async def test_scraper_takes_next_candidate(self, monkeypatch: Any) -> None:
+        """Test a near-duplicate page is replaced by the next successful page."""
+        scraper = WebScraper()
+        texts = {
+            "https://a.example/": ARTICLE,
+            "https://mirror.example/": SYNDICATED,
+            "https://b.example/": OTHER,
+        }
+
+        async def fake_ascrape(url: str) -> ScrapedContent:
+            # Finish in URL order so the original is seen first
+            await asyncio.sleep(0.02 * list(texts).index(url))
+            return ScrapedContent(url=url, title=url, content=texts[url])
+
+        monkeypatch.setattr(scraper, "ascrape", fake_ascrape)
+
+        pages = await scraper.ascrape_many(list(texts), first_k=2, dedup=NearDuplicates())
+
+        assert [p.url for p in pages] == ["https://a.example/", "https://b.example/"]
+
+    async def test_better_ranked_copy_is_kept(self, monkeypatch: Any) -> None:
+        """Test a mirror finishing first does not displace the original."""
+        scraper = WebScraper()
+        texts = {
+            "https://a.example/": ARTICLE,
+            "https://mirror.example/": SYNDICATED,
+            "https://b.example/": OTHER,
+        }
+
+        async def fake_ascrape(url: str) -> ScrapedContent:
+            # The mirror finishes before the original
+            delays = {"https://mirror.example/": 0.01, "https://a.example/": 0.03}
+            await asyncio.sleep(delays.get(url, 0.06))
+            return ScrapedContent(url=url, title=url, content=texts[url])
+
+        monkeypatch.setattr(scraper, "ascrape", fake_ascrape)
+
+        pages = await scraper.ascrape_many(list(texts), first_k=2, dedup=NearDuplicates())
+        assert [p.url for p in pages] == ["https://a.example/", "https://b.example/"]
+
+        pages = await scraper.ascrape_many(list(texts), dedup=NearDuplicates())
+        assert [p.success for p in pages] == [True, False, True]
+        assert pages[1].error == "Near duplicate of https://a.example/"
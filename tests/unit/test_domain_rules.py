@@ -0,0 +1,131 @@
+"""Tests for per-domain content rules."""
+
+from pathlib import Path
+
+import pytest
+
+from pencraft.config.settings import CacheSettings, ResearchSettings
+from pencraft.tools.domain_rules import DomainRules
+from pencraft.tools.extractors import ExtractedPage, ReadabilityExtractor
+from pencraft.tools.scraper import WebScraper
+from pencraft.utils.cache import DiskCache
+
+if not ReadabilityExtractor.available():
+    pytest.skip("lxml is not installed", allow_module_level=True)
+
+SENTENCE = "Bread needs time, warmth and patience, and a lively starter helps a lot. "
+
+POST = """
+<html><body>
+  <div class="top"><a href="/">Home</a> <a href="/shop">Shop</a></div>
+  <div class="entry-content post-{n}"><p>{text}</p><p>{text}</p></div>
+  <div class="widget"><a href="/a">Recent</a> <a href="/b">Posts</a></div>
+</body></html>
+"""
+
+REDESIGNED = """
+<html><body>
+  <div class="story"><p>{text}</p><p>{text}</p></div>
+</body></html>
+"""
+
+
+class SpyExtractor(ReadabilityExtractor):
+    """Readability extractor recording the selectors it was given."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.selectors: list[str | None] = []
+
+    def extract(self, html: str, selector: str | None = None) -> ExtractedPage:
+        self.selectors.append(selector)
+        return super().extract(html, selector)
+
+
+def _post(n: int, sentences: int = 6) -> str:
+    """Build a page of the example blog."""
+    return POST.format(n=n, text=SENTENCE * sentences)
+
+
+class TestDomainRules:
+    """Test cases for DomainRules."""
+
+    def test_rule_is_learned_then_used(self) -> None:
+        """Test a selector seen on two pages becomes the domain's fast path."""
+        rules = DomainRules()
+        extractor = SpyExtractor()
+
+        pages = [
+            rules.extract(extractor, f"https://www.blog.example/post/{n}", _post(n))
+            for n in range(3)
+        ]
+
+        assert extractor.selectors == [None, None, "div.entry-content"]
+        assert pages[2].content == pages[0].content
+        rule = rules.get("blog.example")
+        assert rule is not None and rule.selector == "div.entry-content"
+        assert rules.stats.learned == 1
+        assert rules.stats.fast_path == 1
+
+    def test_collapsed_extraction_invalidates_rule(self) -> None:
+        """Test a redesign that breaks the selector drops the rule and re-extracts."""
+        rules = DomainRules()
+        extractor = SpyExtractor()
+        for n in range(2):
+            rules.extract(extractor, f"https://blog.example/post/{n}", _post(n))
+
+        page = rules.extract(
+            extractor, "https://blog.example/new", REDESIGNED.format(text=SENTENCE * 6)
+        )
+
+        assert extractor.selectors[-2:] == ["div.entry-content", None]
+        assert page.content.startswith("Bread needs time")
+        assert rules.stats.invalidated == 1
+        rule = rules.get("blog.example")
+        assert rule is not None and rule.selector == "div.story" and rule.pages == 1
+
+    def test_rules_persist_and_manual_rules_win(self, tmp_path: Path) -> None:
+        """Test learned rules survive a restart and configured ones are always used."""
+        path = tmp_path / "domains.sqlite3"
+        rules = DomainRules(DiskCache(path))
+        for n in range(2):
+            rules.extract(SpyExtractor(), f"https://blog.example/post/{n}", _post(n))
+        rules.close()
+
+        reloaded = DomainRules(DiskCache(path), {"www.docs.example": "div.top"})
+        extractor = SpyExtractor()
+        reloaded.extract(extractor, "https://blog.example/post/9", _post(9))
+        manual = reloaded.extract(extractor, "https://docs.example/", _post(1))
+
+        assert extractor.selectors == ["div.entry-content", "div.top"]
+        assert manual.content == "Home Shop"
+        with pytest.raises(ValueError, match="Unsupported selector"):
+            DomainRules(manual={"docs.example": "div > p"})
+
+    def test_disabled_rules_do_not_learn(self, tmp_path: Path) -> None:
+        """Test disabling domain rules keeps only the configured selectors."""
+        cache = CacheSettings(directory=str(tmp_path), domain_rules_enabled=False)
+        assert DomainRules.from_settings(cache, ResearchSettings()) is None
+
+        research = ResearchSettings(domain_selectors={"docs.example": "div.top"})
+        rules = DomainRules.from_settings(cache, research)
+        assert rules is not None
+        extractor = SpyExtractor()
+        for n in range(3):
+            rules.extract(extractor, f"https://blog.example/post/{n}", _post(n))
+        rules.extract(extractor, "https://docs.example/", _post(1))
+
+        assert extractor.selectors == [None, None, None, "div.top"]
+        assert rules.get("blog.example") is None
+        assert not (tmp_path / "domains.sqlite3").exists()
+
+    def test_scraper_uses_rules(self) -> None:
+        """Test WebScraper parses pages through its domain rules."""
+        rules = DomainRules(min_pages=1)
+        scraper = WebScraper(extractor="readability", domain_rules=rules)
+
+        scraper._parse("https://blog.example/1", _post(1))
+        content = scraper._parse("https://blog.example/2", _post(2))
+
+        assert rules.stats.fast_path == 1
+        assert content.word_count > 20
@@ -0,0 +1,99 @@
+"""Tests for the HTML extraction backends."""
+
+import pytest
+
+from pencraft.tools.extractors import (
+    LxmlExtractor,
+    SoupExtractor,
+    get_extractor,
+)
+
+PAGES = {
+    "article": """
+        <html><head>
+          <title> Page title </title>
+          <meta name="description" content="Plain description">
+          <meta property="og:description" content="OG description">
+        </head><body>
+          <header><h1>Site name</h1><nav><a href="/">Home</a></nav></header>
+          <div class="sidebar">Popular posts</div>
+          <article>
+            <h1>Main heading</h1>
+            <p>First <b>bold</b> paragraph<!-- note -->after comment.</p>
+            <div class="ad big">Buy now</div> tail after ad
+            <h2>Section <em>two</em></h2>
+            <p>Second     paragraph.</p>
+            <div id="comments"><h3>Comments</h3><p>Nice post</p></div>
+            <script>var x = 1;</script>
+          </article>
+          <footer>Copyright</footer>
+        </body></html>
+    """,
+    "main": """
+        <html><head><meta property="og:title" content="OG title"></head><body>
+          <aside>Ignore me</aside>
+          <main><p>Main text</p><ul class="menu"><li>Menu</li></ul></main>
+          <p>Outside main</p>
+        </body></html>
+    """,
+    "body": """
+        <html><head><title></title></head><body>
+          <h1>Fallback <span>title</span></h1>
+          <p>Body text</p>
+          <div class="cookie popup">Accept cookies</div>
+        </body></html>
+    """,
+}
+
+
+def _backends() -> list[type]:
+    """Get the backends installed here."""
+    return [cls for cls in (SoupExtractor, LxmlExtractor) if cls.available()]
+
+
+class TestExtractors:
+    """Test cases for the extraction backends."""
+
+    @pytest.mark.parametrize("backend", _backends())
+    def test_article_page(self, backend: type) -> None:
+        """Test boilerplate is pruned and the page parts are found."""
+        page = backend().extract(PAGES["article"])
+
+        assert page.title == "Page title"
+        assert page.meta_description == "OG description"
+        assert page.headings == ["Site name", "Main heading", "Sectiontwo", "Comments"]
+        assert page.content == (
+            "Main heading\nFirst\nbold\nparagraph\nafter comment.\ntail after ad\n"
+            "Section\ntwo\nSecond paragraph."
+        )
+
+    @pytest.mark.parametrize("backend", _backends())
+    def test_container_and_title_fallbacks(self, backend: type) -> None:
+        """Test main/body are used without an article, and og:title/h1 for the title."""
+        main = backend().extract(PAGES["main"])
+        body = backend().extract(PAGES["body"])
+
+        assert main.title == "OG title"
+        assert main.content == "Main text"
+        assert body.title == "Fallbacktitle"
+        assert body.content == "Fallback\ntitle\nBody text"
+
+    def test_backends_agree(self) -> None:
+        """Test the lxml backend matches BeautifulSoup output."""
+        if not LxmlExtractor.available():
+            pytest.skip("lxml is not installed")
+        for html in PAGES.values():
+            assert LxmlExtractor().extract(html) == SoupExtractor().extract(html)
+
+    def test_get_extractor(self) -> None:
+        """Test backends are picked by name."""
+        assert get_extractor("soup").name == "soup"
+        expected = "lxml" if LxmlExtractor.available() else "soup"
+        assert get_extractor("auto").name == expected
+        with pytest.raises(ValueError, match="Unknown extractor"):
+            get_extractor("regex")
+
+    def test_lxml_rejects_complex_selectors(self) -> None:
+        """Test selectors the single-pass matcher cannot handle are refused."""
+        with pytest.raises(ValueError, match="Unsupported selector"):
+            LxmlExtractor(["div > p"])
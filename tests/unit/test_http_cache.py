@@ -0,0 +1,171 @@
+"""Tests for the scraper's HTTP cache."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from pencraft.tools.http_cache import HTTPCache, freshness_lifetime
+from pencraft.tools.scraper import ScrapedContent, WebScraper
+from pencraft.utils.cache import DiskCache
+
+PAGE = (
+    "<html><head><title>Cached</title></head><body><article>Some page text</article></body></html>"
+)
+
+
+def _scraper(tmp_path: Path, handler: Any) -> tuple[WebScraper, list[httpx.Request]]:
+    """Build a cached scraper whose requests go to ``handler``."""
+    requests: list[httpx.Request] = []
+
+    def recording(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response: httpx.Response = handler(request)
+        return response
+
+    scraper = WebScraper(cache=HTTPCache(DiskCache(tmp_path / "http.sqlite3")))
+    scraper._client = httpx.Client(transport=httpx.MockTransport(recording))
+    return scraper, requests
+
+
+class TestFreshness:
+    """Test cases for freshness_lifetime."""
+
+    def test_header_precedence(self) -> None:
+        """Test max-age, Expires, Age and the Last-Modified heuristic."""
+        now = datetime.now(timezone.utc)
+        date = format_datetime(now, usegmt=True)
+
+        assert freshness_lifetime(httpx.Headers({"cache-control": "max-age=600"}), 60) == 600
+        assert (
+            freshness_lifetime(httpx.Headers({"cache-control": "max-age=600", "age": "100"}), 60)
+            == 500
+        )
+        assert (
+            freshness_lifetime(httpx.Headers({"cache-control": "no-cache, max-age=600"}), 60) == 0
+        )
+
+        expires = httpx.Headers(
+            {"date": date, "expires": format_datetime(now + timedelta(seconds=300), usegmt=True)}
+        )
+        assert 299 <= freshness_lifetime(expires, 60) <= 300
+
+        modified = httpx.Headers(
+            {"date": date, "last-modified": format_datetime(now - timedelta(days=1), usegmt=True)}
+        )
+        assert 8630 <= freshness_lifetime(modified, 86400) <= 8641
+        assert freshness_lifetime(modified, 3600) == 3600
+        assert freshness_lifetime(httpx.Headers(), 42) == 42
+
+
+class TestScraperCache:
+    """Test cases for WebScraper with an HTTP cache."""
+
+    def test_fresh_page_skips_network_and_parsing(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test a fresh cached page is returned without a request or parse."""
+        scraper, requests = _scraper(
+            tmp_path,
+            lambda _: httpx.Response(200, text=PAGE, headers={"cache-control": "max-age=3600"}),
+        )
+        first = scraper.scrape("https://docs.example/page")
+
+        parses = 0
+        original = scraper._parse
+
+        def counting_parse(url: str, html: str) -> Any:
+            nonlocal parses
+            parses += 1
+            return original(url, html)
+
+        monkeypatch.setattr(scraper, "_parse", counting_parse)
+        second = scraper.scrape("https://docs.example/page")
+
+        assert len(requests) == 1
+        assert parses == 0
+        assert second == first
+        assert second.title == "Cached"
+
+    def test_stale_page_is_revalidated(self, tmp_path: Path) -> None:
+        """Test a stale page sends validators and reuses content on 304."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(
+                200, text=PAGE, headers={"etag": '"v1"', "cache-control": "no-cache"}
+            )
+
+        scraper, requests = _scraper(tmp_path, handler)
+        scraper.scrape("https://docs.example/page")
+        content = scraper.scrape("https://docs.example/page")
+
+        assert len(requests) == 2
+        assert requests[1].headers["if-none-match"] == '"v1"'
+        assert content.success and content.title == "Cached"
+        assert scraper.cache is not None and scraper.cache.stats.revalidated == 1
+
+    def test_failed_url_is_skipped(self, tmp_path: Path) -> None:
+        """Test errors are cached so dead URLs are not fetched again."""
+        scraper, requests = _scraper(tmp_path, lambda _: httpx.Response(404))
+
+        first = scraper.scrape("https://gone.example/")
+        second = scraper.scrape("https://gone.example/")
+
+        assert not first.success and not second.success
+        assert second.error is not None and "cached failure" in second.error
+        assert len(requests) == 1
+
+    def test_no_store_is_not_cached(self, tmp_path: Path) -> None:
+        """Test responses marked no-store are fetched every time."""
+        scraper, requests = _scraper(
+            tmp_path,
+            lambda _: httpx.Response(200, text=PAGE, headers={"cache-control": "no-store"}),
+        )
+        scraper.scrape("https://private.example/")
+        scraper.scrape("https://private.example/")
+
+        assert len(requests) == 2
+
+    def test_extraction_change_reparses_cached_body(self, tmp_path: Path) -> None:
+        """Test a scraper with other extraction settings re-parses stored HTML offline."""
+        scraper, requests = _scraper(
+            tmp_path,
+            lambda _: httpx.Response(200, text=PAGE, headers={"cache-control": "max-age=3600"}),
+        )
+        scraper.scrape("https://docs.example/page")
+
+        other = WebScraper(max_content_length=4, cache=scraper.cache)
+        other._client = scraper._client
+        content = other.scrape("https://docs.example/page")
+
+        assert len(requests) == 1
+        assert content.content == "Some..."
+
+    async def test_async_reparse_runs_on_parse_pool(self, tmp_path: Path) -> None:
+        """Test re-parsing a cached page in ascrape() stays off the event loop."""
+        scraper, requests = _scraper(
+            tmp_path,
+            lambda _: httpx.Response(200, text=PAGE, headers={"cache-control": "max-age=3600"}),
+        )
+        scraper.scrape("https://docs.example/page")
+
+        other = WebScraper(max_content_length=4, cache=scraper.cache)
+        other._async_loop = asyncio.get_running_loop()
+        threads: list[str] = []
+        original = other._parse
+
+        def spy_parse(url: str, html: str) -> ScrapedContent:
+            threads.append(threading.current_thread().name)
+            return original(url, html)
+
+        other._parse = spy_parse  # type: ignore[method-assign]
+        content = await other.ascrape("https://docs.example/page")
+        await other.aclose()
+
+        assert len(requests) == 1
+        assert content.content == "Some..."
+        assert len(threads) == 1 and threads[0].startswith("parse")
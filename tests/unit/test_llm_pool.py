@@ -0,0 +1,192 @@
+"""Tests for the LLM endpoint pool."""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from openai import APIConnectionError
+from openai.types.chat import ChatCompletion
+
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from pencraft.llm.pool import Endpoint, EndpointPool
+from tests.helpers import completion
+
+
+def _endpoint(url: str, **kwargs: Any) -> Endpoint:
+    """Create an endpoint without network access."""
+    return Endpoint(url, "key", **kwargs)
+
+
+class TestEndpointPool:
+    """Test cases for EndpointPool routing and health."""
+
+    def test_least_outstanding_routing(self) -> None:
+        """Test requests spread to the least loaded endpoint."""
+        pool = EndpointPool([_endpoint("http://a"), _endpoint("http://b")])
+
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert first is not None and second is not None
+        assert first.name != second.name
+
+    def test_weights(self) -> None:
+        """Test heavier endpoints take proportionally more requests."""
+        pool = EndpointPool([_endpoint("http://a", weight=3.0), _endpoint("http://b")])
+        chosen = [pool.acquire() for _ in range(4)]
+
+        assert sum(1 for ep in chosen if ep is not None and ep.base_url == "http://a") == 3
+
+    def test_unhealthy_and_reprobe(self) -> None:
+        """Test endpoints are taken out after failures and probed again later."""
+        a, b = _endpoint("http://a"), _endpoint("http://b")
+        pool = EndpointPool([a, b], unhealthy_after=2, probe_interval=0.0)
+
+        for _ in range(2):
+            pool.release(a, 0.1, success=False)
+        assert a.stats.healthy is False
+
+        # Probe interval elapsed: a single probe is allowed through
+        probe = pool.acquire(exclude={b.name})
+        assert probe is a
+        assert pool.acquire(exclude={b.name}) is None
+
+        pool.release(a, 0.1, success=True)
+        assert a.stats.healthy is True
+
+    def test_fallback_when_saturated(self) -> None:
+        """Test the fallback endpoint only serves when primaries are saturated."""
+        primary = _endpoint("http://a", max_in_flight=1)
+        fallback = _endpoint("http://small", model="small", fallback=True)
+        pool = EndpointPool([primary, fallback])
+
+        assert pool.acquire() is primary
+        assert pool.acquire() is fallback
+
+    def test_latency_stats(self) -> None:
+        """Test per-endpoint latency statistics are exposed."""
+        a = _endpoint("http://a")
+        pool = EndpointPool([a])
+        for latency in (1.0, 2.0, 3.0):
+            pool.acquire()
+            pool.release(a, latency, success=True)
+
+        stats = pool.stats()["http://a"]
+        assert stats["requests"] == 3
+        assert stats["latency_mean"] == 2.0
+        assert stats["latency_p50"] == pytest.approx(2.0)
+
+
+class TestClientFailover:
+    """Test cases for LLMClient failover across endpoints."""
+
+    def test_fails_over_to_next_endpoint(self, monkeypatch: Any) -> None:
+        """Test a connection error on one endpoint retries on another."""
+        settings = Settings(llm={"endpoints": [{"base_url": "http://b"}]})
+        client = LLMClient(settings.llm)
+        primary, secondary = client.pool.endpoints
+
+        def broken(**_params: Any) -> ChatCompletion:
+            raise APIConnectionError(request=httpx.Request("POST", "http://a"))
+
+        monkeypatch.setattr(primary.client.chat.completions, "create", broken)
+        monkeypatch.setattr(
+            secondary.client.chat.completions, "create", lambda **_: completion("from b")
+        )
+
+        assert client.generate("hi") == "from b"
+        assert primary.stats.failures == 1
+        assert secondary.stats.requests == 1
+
+
+class TestHedging:
+    """Test cases for hedged async requests."""
+
+    async def test_hedge_wins_over_stalled_primary(self, monkeypatch: Any) -> None:
+        """Test a stalled request is hedged and the loser cancelled."""
+        settings = Settings(
+            llm={
+                "endpoints": [{"base_url": "http://b"}],
+                "hedge_enabled": True,
+                "hedge_budget": 1.0,
+                "hedge_min_delay": 0.0,
+            }
+        )
+        client = LLMClient(settings.llm)
+        assert client.hedging is not None
+        client.hedging._latencies.extend([0.01] * 30)
+        primary, secondary = client.pool.endpoints
+        cancelled = False
+
+        async def stalled(**_params: Any) -> ChatCompletion:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return completion("slow")
+
+        async def fast(**_params: Any) -> ChatCompletion:
+            return completion("fast")
+
+        monkeypatch.setattr(primary.async_client.chat.completions, "create", stalled)
+        monkeypatch.setattr(secondary.async_client.chat.completions, "create", fast)
+
+        assert await client.agenerate("hi") == "fast"
+        await asyncio.sleep(0)
+
+        stats = client.hedging.stats
+        assert stats.hedges_sent == 1
+        assert stats.hedge_wins == 1
+        assert cancelled
+        assert primary.stats.in_flight == 0
+
+    async def test_cancelled_caller_cancels_attempts(self, monkeypatch: Any) -> None:
+        """Test cancelling the caller before the hedge delay frees the endpoint."""
+        settings = Settings(
+            llm={
+                "endpoints": [{"base_url": "http://b"}],
+                "hedge_enabled": True,
+                "hedge_budget": 1.0,
+            }
+        )
+        client = LLMClient(settings.llm)
+        assert client.hedging is not None
+        client.hedging._latencies.extend([1.0] * 30)
+        primary = client.pool.endpoints[0]
+        cancelled = False
+
+        async def stalled(**_params: Any) -> ChatCompletion:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return completion("slow")
+
+        monkeypatch.setattr(primary.async_client.chat.completions, "create", stalled)
+
+        caller = asyncio.create_task(client.agenerate("hi"))
+        await asyncio.sleep(0.05)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        assert cancelled
+        assert primary.stats.in_flight == 0
+
+    async def test_budget_limits_hedges(self) -> None:
+        """Test no hedge is sent beyond the budget."""
+        from pencraft.llm.hedging import HedgePolicy
+
+        policy = HedgePolicy(budget=0.1)
+        for _ in range(5):
+            policy.hedge_delay()
+
+        assert policy.try_hedge() is False
+        assert policy.stats.skipped_budget == 1
@@ -0,0 +1,215 @@
+"""Tests for the pipeline task graph."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from pencraft.agents.planner import BlogOutline, Section
+from pencraft.config.settings import Settings
+from pencraft.generator import BlogGenerator
+from pencraft.llm.client import LLMClient
+from pencraft.pipeline import PipelineError, TaskGraph
+from pencraft.tools.search import SearchResult
+from pencraft.tools.trends import TrendsData, TrendsTool
+from tests.helpers import completion
+
+
+class TestTaskGraph:
+    """Test cases for TaskGraph scheduling."""
+
+    async def test_dependencies_and_results(self) -> None:
+        """Test tasks receive their dependencies' results in order."""
+        graph = TaskGraph()
+        graph.add_value("a", 2)
+        graph.add("b", lambda a: a * 10, ["a"])
+
+        async def combine(a: int, b: int) -> int:
+            return a + b
+
+        graph.add("c", combine, ["a", "b"])
+
+        results = await graph.run()
+
+        assert results["c"] == 22
+
+    async def test_independent_tasks_overlap(self) -> None:
+        """Test ready tasks run concurrently."""
+        graph = TaskGraph()
+
+        async def slow() -> None:
+            await asyncio.sleep(0.05)
+
+        for name in ("x", "y", "z"):
+            graph.add(name, slow)
+
+        start = time.monotonic()
+        await graph.run()
+
+        assert time.monotonic() - start < 0.12
+        assert graph.report.total_task_time >= 0.15
+
+    async def test_dynamic_fan_out(self) -> None:
+        """Test tasks can add tasks and extend pending dependencies."""
+        graph = TaskGraph()
+
+        async def plan() -> int:
+            for i in range(3):
+                graph.add(f"part:{i}", lambda i=i: i * i)
+            graph.depend("total", "part:0", "part:1", "part:2")
+            return 3
+
+        graph.add("plan", plan)
+        graph.add("total", lambda count, *parts: (count, sum(parts)), ["plan"])
+
+        results = await graph.run()
+
+        assert results["total"] == (3, 5)
+        assert "plan" in graph.report.timings["part:0"].deps
+
+    async def test_critical_path(self) -> None:
+        """Test the critical path follows the slowest chain."""
+        graph = TaskGraph()
+        graph.add("fast", lambda: None)
+        graph.add("slow", lambda: time.sleep(0.05))
+        graph.add("end", lambda *_: None, ["fast", "slow"])
+
+        await graph.run()
+
+        assert [t.name for t in graph.report.critical_path()] == ["slow", "end"]
+
+    async def test_errors(self) -> None:
+        """Test task errors propagate and unsatisfiable graphs are reported."""
+        graph = TaskGraph()
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        graph.add("fail", fail)
+        with pytest.raises(ValueError, match="boom"):
+            await graph.run()
+
+        graph = TaskGraph()
+        graph.add("orphan", lambda _: None, ["missing"])
+        with pytest.raises(PipelineError):
+            await graph.run()
+
+
+class TestGeneratorPipeline:
+    """Test cases for BlogGenerator.agenerate on the task graph."""
+
+    async def test_intro_and_conclusion_do_not_wait_for_sections(
+        self, tmp_path: Path, monkeypatch: Any
+    ) -> None:
+        """Test writing tasks overlap and the post is assembled in order."""
+        settings = Settings(
+            blog={"include_toc": False}, cache={"directory": str(tmp_path / "cache")}
+        )
+        client = LLMClient(settings.llm)
+
+        async def fake_create(**params: Any) -> ChatCompletion:
+            prompt = params["messages"][-1]["content"]
+            await asyncio.sleep(0.02)
+            if "**Current Section:**" in prompt:
+                section = prompt.split("**Current Section:** ")[1].split("\n")[0]
+                return completion(f"Body of {section}.")
+            return completion("Intro or conclusion.")
+
+        monkeypatch.setattr(client._async_client.chat.completions, "create", fake_create)
+        generator = BlogGenerator(settings=settings, llm_client=client)
+        outline = BlogOutline(
+            title="Pipelines",
+            meta_description="About pipelines",
+            sections=[Section(title=f"Part {i}") for i in range(3)],
+        )
+
+        blog = await generator.agenerate(
+            "pipelines", skip_research=True, custom_outline=outline, output_dir=tmp_path
+        )
+
+        assert blog.pipeline is not None
+        timings = blog.pipeline.timings
+        assert timings["conclusion"].start < timings["section:0"].end
+        assert timings["section:1"].start >= timings["section:0"].end
+        positions = [blog.content.index(f"## Part {i}") for i in range(3)]
+        assert positions == sorted(positions)
+        assert blog.content.index("## Part 2") < blog.content.index("## Conclusion")
+        assert blog.file_path is not None
+        assert blog.usage is not None and len(blog.usage.calls) == 5
+        assert blog.parallel is None
+
+    async def test_parallel_sections_report_speedup(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test the graph path measures the speedup of parallel section writing."""
+        settings = Settings(
+            blog={"include_toc": False, "parallel_sections": True, "smooth_transitions": False},
+            cache={"directory": str(tmp_path / "cache")},
+        )
+        client = LLMClient(settings.llm)
+
+        async def fake_create(**_: Any) -> ChatCompletion:
+            await asyncio.sleep(0.05)
+            return completion("Some text.")
+
+        monkeypatch.setattr(client._async_client.chat.completions, "create", fake_create)
+        generator = BlogGenerator(settings=settings, llm_client=client)
+        outline = BlogOutline(
+            title="Pipelines",
+            meta_description="About pipelines",
+            sections=[Section(title=f"Part {i}") for i in range(4)],
+        )
+
+        blog = await generator.agenerate("pipelines", skip_research=True, custom_outline=outline)
+
+        assert blog.parallel is not None
+        assert blog.parallel["sequential_time"] >= 6 * 0.05
+        assert blog.parallel["speedup"] > 2
+        assert blog.to_dict()["parallel"] == blog.parallel
+
+    @pytest.mark.parametrize(
+        ("rising", "expected"),
+        [
+            (["r0", "r1", "r2", "r3"], ["q0", "q1", "q2", "r0", "r1", "r2"]),
+            ([], ["q0", "q1", "q2", "q3", "q4"]),
+        ],
+    )
+    async def test_graph_searches_match_research_agent(
+        self, tmp_path: Path, monkeypatch: Any, rising: list[str], expected: list[str]
+    ) -> None:
+        """Test rising trends queries replace generated ones as in ResearchAgent."""
+        settings = Settings(
+            research={"search_depth": 1}, cache={"directory": str(tmp_path / "cache")}
+        )
+        client = LLMClient(settings.llm)
+
+        async def fake_create(**_: Any) -> ChatCompletion:
+            return completion("q0\nq1\nq2\nq3\nq4")
+
+        class _Trends(TrendsTool):
+            def get_trends_data(self, topic: str, **_: Any) -> TrendsData:
+                return TrendsData(topic=topic, rising_queries=rising)
+
+        monkeypatch.setattr(client._async_client.chat.completions, "create", fake_create)
+        generator = BlogGenerator(settings=settings, llm_client=client)
+        agent = generator.research_agent
+        agent.trends_tool = _Trends()
+        searched: list[str] = []
+
+        def fake_search(query: str) -> list[SearchResult]:
+            searched.append(query)
+            return [SearchResult(query, f"https://{query}.example/", "Snippet")]
+
+        async def no_scraping(*_: Any, **__: Any) -> list[Any]:
+            return []
+
+        monkeypatch.setattr(agent.search_tool, "search", fake_search)
+        monkeypatch.setattr(agent.scraper, "ascrape_many", no_scraping)
+        graph = TaskGraph()
+        generator._add_research_tasks(graph, "topic", "", use_trends=True)
+
+        results = await graph.run()
+
+        assert sorted(searched) == sorted(expected)
+        assert results["search_plan"] == expected
@@ -0,0 +1,77 @@
+"""Tests for search result ranking."""
+
+from pencraft.tools.ranking import BM25, ResultRanker, tokenize
+from pencraft.tools.search import SearchResult
+
+QUERIES = ["sourdough starter", "how to feed a sourdough starter"]
+
+
+def _filler(n: int) -> list[SearchResult]:
+    """Build search results unrelated to the queries, each on its own site."""
+    return [
+        SearchResult(f"Kitchen gadget review {i}", f"https://site{i}.example/", "Best buys.")
+        for i in range(n)
+    ]
+
+
+class TestBM25:
+    """Test cases for BM25."""
+
+    def test_rarer_terms_weigh_more(self) -> None:
+        """Test a match on a rare term beats a match on a common one."""
+        bm25 = BM25([["bread", "starter"], ["bread", "flour"], ["bread", "oven"]])
+
+        scores = bm25.scores(["bread", "starter"])
+
+        assert scores[0] > scores[1] == scores[2] > 0
+
+    def test_tokenize_drops_stopwords(self) -> None:
+        """Test tokenize lower-cases and drops stopwords and single letters."""
+        assert tokenize("How to Feed a Starter?") == ["feed", "starter"]
+
+
+class TestResultRanker:
+    """Test cases for ResultRanker."""
+
+    def test_relevant_result_moves_to_the_front(self) -> None:
+        """Test a relevant result found late by the search engine is ranked first."""
+        relevant = SearchResult(
+            "Feeding a sourdough starter",
+            "https://bakery.example/starter",
+            "How often to feed your sourdough starter.",
+        )
+        results = [*_filler(11), relevant]
+
+        ranked = ResultRanker().rank(results, QUERIES)
+
+        assert ranked[0] is relevant
+        assert ranked[1:] == results[:11]
+
+    def test_deny_and_allow_domains(self) -> None:
+        """Test denied domains are dropped and allowed domains go first."""
+        results = [
+            SearchResult("Sourdough starter pins", "https://www.pinterest.com/x", "Starter"),
+            SearchResult("Sourdough starter guide", "https://blog.example/a", "Starter"),
+            SearchResult("Kitchen gadgets", "https://docs.kingarthur.example/b", "Tools"),
+        ]
+        ranker = ResultRanker(allow_domains=["kingarthur.example"], deny_domains=["pinterest.com"])
+
+        ranked = ranker.rank(results, QUERIES)
+
+        assert [r.url for r in ranked] == [
+            "https://docs.kingarthur.example/b",
+            "https://blog.example/a",
+        ]
+
+    def test_per_domain_cap_moves_extras_last(self) -> None:
+        """Test results beyond the per-domain cap are kept at the end."""
+        same_site = [
+            SearchResult(f"Sourdough starter part {i}", f"https://blog.example/{i}", "Starter")
+            for i in range(3)
+        ]
+        results = [*same_site, *_filler(2)]
+
+        ranked = ResultRanker(per_domain=2).rank(results, QUERIES)
+
+        assert ranked == [same_site[0], same_site[1], *results[3:], same_site[2]]
+        assert ResultRanker(per_domain=0).rank(results, QUERIES) == results
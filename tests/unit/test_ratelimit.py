@@ -0,0 +1,116 @@
+"""Tests for the LLM rate limiter."""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+from pencraft.llm.ratelimit import RateLimiter, TokenBucket, get_rate_limiter
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_wait_time_after_debt(self) -> None:
+        """Test a bucket in debt reports the time to refill it."""
+        bucket = TokenBucket(rate_per_minute=60)
+        now = time.monotonic()
+        bucket.take(61, now)
+
+        assert abs(bucket.wait_time(1, now) - 2.0) < 0.01
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    def test_concurrency_cap(self) -> None:
+        """Test no more than max_concurrent requests run at once."""
+        limiter = RateLimiter(max_concurrent=2)
+        peak = 0
+        lock = threading.Lock()
+
+        def worker() -> None:
+            nonlocal peak
+            with limiter.limit():
+                with lock:
+                    peak = max(peak, limiter.stats.in_flight)
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == 2
+        assert limiter.stats.requests == 6
+        assert limiter.stats.in_flight == 0
+        assert limiter.stats.throttled > 0
+
+    async def test_async_concurrency_cap(self) -> None:
+        """Test the async path honors the same cap."""
+        limiter = RateLimiter(max_concurrent=1)
+        active = 0
+        peak = 0
+
+        async def worker() -> None:
+            nonlocal active, peak
+            async with limiter.alimit() as lease:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                lease.tokens = 10
+
+        await asyncio.gather(*(worker() for _ in range(4)))
+
+        assert peak == 1
+        assert limiter.stats.tokens == 40
+
+    async def test_waiters_are_woken_on_release(self) -> None:
+        """Test callers over the cap sleep until a release instead of polling."""
+        limiter = RateLimiter(max_concurrent=1)
+        attempts = 0
+        original = limiter._try_acquire
+
+        def counting(*args: Any) -> float | None:
+            nonlocal attempts
+            attempts += 1
+            return original(*args)
+
+        limiter._try_acquire = counting  # type: ignore[method-assign]
+        limiter.acquire()
+        attempts = 0
+
+        def release_later() -> None:
+            time.sleep(0.3)
+            limiter.release()
+
+        releaser = threading.Thread(target=release_later)
+        releaser.start()
+        await limiter.aacquire()
+        releaser.join()
+        assert attempts == 2
+
+        attempts = 0
+        threading.Timer(0.3, limiter.release).start()
+        limiter.acquire()
+        limiter.release()
+        assert attempts == 2
+        assert limiter.stats.in_flight == 0
+
+    def test_token_debt_blocks(self) -> None:
+        """Test token usage beyond the budget delays the next request."""
+        limiter = RateLimiter(tokens_per_minute=60)
+        with limiter.limit() as lease:
+            lease.tokens = 120
+
+        assert limiter._try_acquire() > 0
+
+    def test_shared_per_endpoint(self) -> None:
+        """Test limiters are shared process-wide per endpoint key."""
+        first = get_rate_limiter("http://shared-test", max_concurrent=3)
+        second = get_rate_limiter("http://shared-test", max_concurrent=9)
+
+        assert first is second
+        assert second.max_concurrent == 3
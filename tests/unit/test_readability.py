@@ -0,0 +1,63 @@
+"""Tests for readability-style content extraction."""
+
+import pytest
+
+from pencraft.tools.extractors import LxmlExtractor, ReadabilityExtractor
+
+if not ReadabilityExtractor.available():
+    pytest.skip("lxml is not installed", allow_module_level=True)
+
+PARAGRAPH = (
+    "Wild yeast is most active between 24 and 27 degrees, so in a cold kitchen, "
+    "keep the jar somewhere warm and expect slower rises."
+)
+
+DIV_PAGE = f"""
+<html><head><title>Starter tips</title></head><body>
+  <div class="top-bar"><a href="/">Home</a> <a href="/recipes">Recipes</a> <a href="/shop">Shop</a></div>
+  <div class="site-content">
+    <div class="entry-content">
+      <p>{PARAGRAPH}</p>
+      <h2>Flour</h2>
+      <p>Whole grain rye carries more <b>wild yeast</b>, bacteria and nutrients than white flour.</p>
+      <ul><li>Use rye, or whole wheat</li><li>Feed twice a day</li></ul>
+      <div class="share-links"><a href="#">Share</a> <a href="#">Tweet</a></div>
+    </div>
+    <div class="discussion">
+      <ol class="comment-list"><li><p>Mine took two weeks to get going, thanks for this.</p></li></ol>
+    </div>
+    <div class="widget-area"><a href="/a">Baguettes at home</a> <a href="/b">Focaccia</a></div>
+  </div>
+  <div class="site-info"><a href="/privacy">Privacy</a> Powered by a blog platform.</div>
+</body></html>
+"""
+
+
+class TestReadabilityExtractor:
+    """Test cases for ReadabilityExtractor."""
+
+    def test_keeps_main_content_only(self) -> None:
+        """Test navigation, comments and widgets around the article are dropped."""
+        content = ReadabilityExtractor().extract(DIV_PAGE).content
+
+        assert content == (
+            f"{PARAGRAPH}\n\nFlour\n\n"
+            "Whole grain rye carries more wild yeast, bacteria and nutrients than white flour.\n\n"
+            "- Use rye, or whole wheat\n\n- Feed twice a day"
+        )
+
+    def test_uses_fewer_tokens_than_container_text(self) -> None:
+        """Test the extracted text is shorter than the whole-body text."""
+        readable = ReadabilityExtractor().extract(DIV_PAGE)
+        whole = LxmlExtractor().extract(DIV_PAGE)
+
+        assert len(readable.content) < len(whole.content)
+        assert "Privacy" in whole.content and "Privacy" not in readable.content
+        assert readable.title == whole.title == "Starter tips"
+        assert readable.headings == whole.headings
+
+    def test_short_page_falls_back_to_container_text(self) -> None:
+        """Test pages without enough paragraph text keep the container text."""
+        html = "<html><body><main><p>Short note.</p><span>More</span></main></body></html>"
+
+        assert ReadabilityExtractor().extract(html).content == "Short note.\nMore"
@@ -0,0 +1,75 @@
+"""Tests for the research passage index."""
+
+from pencraft.agents.planner import Section
+from pencraft.agents.writer import WriterAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from pencraft.tools.research_index import ResearchIndex, split_passages
+from pencraft.tools.scraper import ScrapedContent
+
+SUMMARY = """## Overview
+Sourdough is bread leavened by a culture of wild yeast and lactic acid bacteria.
+
+## Key facts
+**Starter care:**
+A starter is fed equal weights of flour and water once or twice a day.
+"""
+
+PAGE = ScrapedContent(
+    url="https://bakery.example/oven",
+    title="Baking sourdough at home",
+    content=(
+        "Shaping\n\nTighten the dough into a round and let it proof in a banneton.\n\n"
+        "Baking\n\nPreheat a dutch oven to 250 degrees and bake covered for 20 minutes "
+        "so the steam gives the crust its oven spring."
+    ),
+    headings=["Shaping", "Baking"],
+)
+
+
+class TestSplitPassages:
+    """Test cases for split_passages()."""
+
+    def test_passages_follow_headings(self) -> None:
+        """Test markdown and page headings start new passages."""
+        summary = split_passages(SUMMARY, "Research summary")
+        page = split_passages(PAGE.content, PAGE.title, PAGE.url, PAGE.headings or [])
+
+        assert [p.heading for p in summary] == ["Overview", "Starter care"]
+        assert [p.heading for p in page] == ["Shaping", "Baking"]
+        assert page[1].text.startswith("Preheat a dutch oven")
+
+    def test_long_paragraphs_are_cut(self) -> None:
+        """Test a paragraph over the passage size is split into pieces."""
+        passages = split_passages("word " * 250, "Notes", passage_words=100)
+
+        assert [len(p.text.split()) for p in passages] == [100, 100, 50]
+
+
+class TestResearchIndex:
+    """Test cases for ResearchIndex."""
+
+    def test_search_finds_matching_passages_within_budget(self) -> None:
+        """Test each query gets its own passages, best first and within budget."""
+        index = ResearchIndex.build(SUMMARY, [PAGE])
+
+        oven = index.search("baking in a dutch oven", k=2)
+        starter = index.search("feeding the starter", k=2)
+
+        assert oven[0].url == PAGE.url and oven[0].heading == "Baking"
+        assert starter[0].heading == "Starter care"
+        assert index.search("dutch oven", max_tokens=5) == []
+        assert index.search("unrelated words only") == []
+
+    def test_writer_uses_section_passages(self) -> None:
+        """Test sections get retrieved notes, and the summary start without an index."""
+        settings = Settings()
+        writer = WriterAgent(LLMClient(settings.llm), settings)
+        section = Section(title="Baking the loaf", key_points=["dutch oven", "oven spring"])
+        index = ResearchIndex.build(SUMMARY, [PAGE])
+
+        notes = writer._research_notes(section, SUMMARY, index)
+
+        assert notes.startswith(f"[Baking sourdough at home ({PAGE.url}) - Baking]")
+        assert "Starter care" not in notes
+        assert writer._research_notes(section, SUMMARY, None) == SUMMARY
@@ -0,0 +1,315 @@
+"""Tests for the web scraper."""
+
+import asyncio
+import gc
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import httpx
+
+from pencraft.tools.extractors import ProcessPoolExtractor
+from pencraft.tools.scraper import ScrapedContent, WebScraper
+
+PAGE = "<html><head><title>{title}</title></head><body><article>{body}</article></body></html>"
+
+
+def _page(url: str, *, success: bool = True) -> ScrapedContent:
+    """Build a scraped page result."""
+    return ScrapedContent(url=url, title=url, content="text", word_count=1, success=success)
+
+
+class TestAsyncScrapeMany:
+    """Test cases for WebScraper.ascrape_many."""
+
+    async def test_pooled_client_is_reused(self) -> None:
+        """Test pages are parsed and share one async client."""
+        scraper = WebScraper()
+        clients: set[int] = set()
+        original = scraper._get_async_client
+
+        def tracking_client() -> httpx.AsyncClient:
+            client = original()
+            clients.add(id(client))
+            return client
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            title = request.url.path.strip("/")
+            return httpx.Response(200, text=PAGE.format(title=title, body="some words here"))
+
+        scraper._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._async_loop = asyncio.get_running_loop()
+        scraper._get_async_client = tracking_client  # type: ignore[method-assign]
+
+        pages = await scraper.ascrape_many(["https://a.example/one", "https://b.example/two"])
+        await scraper.aclose()
+
+        assert [p.title for p in pages] == ["one", "two"]
+        assert pages[0].word_count == 3
+        assert len(clients) == 1
+
+    async def test_client_closed_with_outermost_session(self) -> None:
+        """Test the pooled client is closed before its event loop can end."""
+        scraper = WebScraper()
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, text=PAGE))
+        )
+        scraper._async_client = client
+        scraper._async_loop = asyncio.get_running_loop()
+
+        async with scraper.async_session():
+            await scraper.ascrape_many(["https://a.example/", "https://b.example/"])
+            assert not client.is_closed
+        assert client.is_closed
+        assert scraper._async_client is None
+
+    async def test_first_k_and_per_host_limit(self, monkeypatch: Any) -> None:
+        """Test scraping stops after K successes and throttles each host."""
+        scraper = WebScraper(per_host_limit=1)
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def fake_ascrape(url: str) -> ScrapedContent:
+            host = httpx.URL(url).host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(1.0 if "slow" in url else 0.01)
+            in_flight[host] -= 1
+            return _page(url, success="broken" not in url)
+
+        monkeypatch.setattr(scraper, "ascrape", fake_ascrape)
+        urls = [
+            "https://slow.example/1",
+            "https://a.example/broken",
+            "https://a.example/2",
+            "https://b.example/3",
+            "https://b.example/4",
+        ]
+
+        start = time.monotonic()
+        pages = await scraper.ascrape_many(urls, first_k=2)
+
+        assert time.monotonic() - start < 0.5
+        assert [p.url for p in pages] == ["https://a.example/2", "https://b.example/3"]
+        assert peak["a.example"] == 1
+
+    async def test_deadline_returns_finished_pages(self, monkeypatch: Any) -> None:
+        """Test pages still loading at the deadline are dropped."""
+        scraper = WebScraper()
+
+        async def fake_ascrape(url: str) -> ScrapedContent:
+            await asyncio.sleep(1.0 if "slow" in url else 0.01)
+            return _page(url)
+
+        monkeypatch.setattr(scraper, "ascrape", fake_ascrape)
+
+        start = time.monotonic()
+        pages = await scraper.ascrape_many(
+            ["https://slow.example/", "https://fast.example/"], deadline=0.1
+        )
+
+        assert time.monotonic() - start < 0.5
+        assert [p.url for p in pages] == ["https://fast.example/"]
+
+
+class TestScrapeMany:
+    """Test cases for WebScraper.scrape_many."""
+
+    def test_concurrent_with_deadline(self, monkeypatch: Any) -> None:
+        """Test sync scraping runs in parallel and honours the deadline."""
+        scraper = WebScraper(max_concurrency=4)
+
+        def fake_scrape(url: str) -> ScrapedContent:
+            time.sleep(1.0 if "slow" in url else 0.05)
+            return _page(url)
+
+        monkeypatch.setattr(scraper, "scrape", fake_scrape)
+        urls = [f"https://site{i}.example/" for i in range(3)] + ["https://slow.example/"]
+
+        # Free earlier tests' clients now, not in a collection inside the measured window
+        gc.collect()
+        start = time.monotonic()
+        pages = scraper.scrape_many(urls, deadline=0.3)
+
+        assert time.monotonic() - start < 0.5
+        assert [p.url for p in pages] == urls[:3]
+
+    def test_busy_host_does_not_hold_workers(self, monkeypatch: Any) -> None:
+        """Test pages of other hosts go ahead while one host is at its limit."""
+        scraper = WebScraper(max_concurrency=2, per_host_limit=1)
+        finished: dict[str, float] = {}
+        start = time.monotonic()
+
+        def fake_scrape(url: str) -> ScrapedContent:
+            time.sleep(0.2 if "slow" in url else 0.01)
+            finished[url] = time.monotonic() - start
+            return _page(url)
+
+        monkeypatch.setattr(scraper, "scrape", fake_scrape)
+        urls = [f"https://slow.example/{i}" for i in range(3)] + ["https://fast.example/"]
+
+        pages = scraper.scrape_many(urls)
+
+        assert [p.url for p in pages] == urls
+        assert finished["https://fast.example/"] < 0.15
+
+
+class TestStreaming:
+    """Test cases for streamed page downloads."""
+
+    def _scraper(self, handler: Any, **kwargs: Any) -> WebScraper:
+        """Build a scraper whose requests go to ``handler``."""
+        scraper = WebScraper(**kwargs)
+        scraper._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return scraper
+
+    def test_byte_cap_truncates_download(self) -> None:
+        """Test reading stops at max_bytes and the result is flagged."""
+        chunks_read = 0
+
+        def body() -> Iterator[bytes]:
+            nonlocal chunks_read
+            yield b"<html><body><article>"
+            for _ in range(1000):
+                chunks_read += 1
+                yield b"word " * 200
+
+        scraper = self._scraper(
+            lambda _: httpx.Response(200, headers={"content-type": "text/html"}, content=body()),
+            max_bytes=5000,
+        )
+        content = scraper.scrape("https://big.example/")
+
+        assert content.success
+        assert content.truncated
+        assert content.bytes_fetched == 5000
+        assert chunks_read < 10
+
+    def test_non_html_is_rejected_before_download(self) -> None:
+        """Test a PDF is skipped from its headers alone."""
+        consumed = False
+
+        def body() -> Iterator[bytes]:
+            nonlocal consumed
+            consumed = True
+            yield b"%PDF-1.7"
+
+        scraper = self._scraper(
+            lambda _: httpx.Response(
+                200, headers={"content-type": "application/pdf"}, content=body()
+            )
+        )
+        content = scraper.scrape("https://docs.example/paper.pdf")
+
+        assert not content.success
+        assert content.error is not None and "application/pdf" in content.error
+        assert not consumed
+
+    async def test_incremental_decoding_across_chunks(self) -> None:
+        """Test multi-byte characters split between chunks decode correctly."""
+        encoded = PAGE.format(title="Café", body="naïve façade").encode("utf-8")
+
+        async def body() -> AsyncIterator[bytes]:
+            for i in range(0, len(encoded), 3):
+                yield encoded[i : i + 3]
+
+        def handler(_: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "text/html; charset=utf-8"}, content=body()
+            )
+
+        scraper = WebScraper()
+        scraper._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        scraper._async_loop = asyncio.get_running_loop()
+        content = await scraper.ascrape("https://accents.example/")
+        await scraper.aclose()
+
+        assert content.title == "Café"
+        assert content.content == "naïve façade"
+        assert content.bytes_fetched == len(encoded)
+        assert not content.truncated
+
+
+class TestParseOffload:
+    """Test cases for parsing pages off the event loop."""
+
+    def _scraper(self, **kwargs: Any) -> WebScraper:
+        """Build a scraper serving a small page for every URL."""
+
+        def handler(_: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/html"},
+                text=PAGE.format(title="t", body="text"),
+            )
+
+        scraper = WebScraper(**kwargs)
+        scraper._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return scraper
+
+    async def test_slow_parse_does_not_block_the_loop(self, monkeypatch: Any) -> None:
+        """Test parsing runs on the parse threads while the loop keeps ticking."""
+        scraper = self._scraper(parse_workers=2)
+        scraper._async_loop = asyncio.get_running_loop()
+        threads: set[str] = set()
+        original = scraper._parse
+
+        def slow_parse(url: str, html: str) -> ScrapedContent:
+            threads.add(threading.current_thread().name)
+            time.sleep(0.2)
+            return original(url, html)
+
+        monkeypatch.setattr(scraper, "_parse", slow_parse)
+
+        # Free earlier tests' clients now, not in a collection inside the measured window
+        gc.collect()
+        lag = 0.0
+        done = False
+
+        async def ticker() -> None:
+            nonlocal lag
+            loop = asyncio.get_running_loop()
+            while not done:
+                start = loop.time()
+                await asyncio.sleep(0.01)
+                lag = max(lag, loop.time() - start - 0.01)
+
+        tick = asyncio.create_task(ticker())
+        pages = await scraper.ascrape_many([f"https://site{i}.example/" for i in range(4)])
+        done = True
+        await tick
+        await scraper.aclose()
+
+        assert len(pages) == 4 and all(p.success for p in pages)
+        assert all(name.startswith("parse") for name in threads)
+        assert lag < 0.1
+
+    async def test_inline_parsing_when_disabled(self, monkeypatch: Any) -> None:
+        """Test parse_workers=0 parses on the event loop thread."""
+        scraper = self._scraper(parse_workers=0)
+        scraper._async_loop = asyncio.get_running_loop()
+        threads: list[str] = []
+        original = scraper._parse
+
+        def recording_parse(url: str, html: str) -> ScrapedContent:
+            threads.append(threading.current_thread().name)
+            return original(url, html)
+
+        monkeypatch.setattr(scraper, "_parse", recording_parse)
+        await scraper.ascrape("https://site.example/")
+        await scraper.aclose()
+
+        assert threads == [threading.current_thread().name]
+
+    def test_process_pool_matches_inline_extraction(self) -> None:
+        """Test extraction in worker processes gives the same page."""
+        html = PAGE.format(title="Pooled", body="naïve text")
+        scraper = WebScraper(parse_pool="process", parse_workers=1)
+        try:
+            assert isinstance(scraper.extractor, ProcessPoolExtractor)
+            assert scraper._parse("https://a.example/", html) == WebScraper()._parse(
+                "https://a.example/", html
+            )
+        finally:
+            scraper.close()
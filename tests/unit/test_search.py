@@ -0,0 +1,158 @@
+"""Tests for the search tool."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from pencraft.tools.search import SearchResult, SearchTool
+from pencraft.tools.search_cache import SearchCache
+from pencraft.utils.cache import DiskCache
+from pencraft.utils.singleflight import SingleFlight
+
+
+class _SlowSearchTool(SearchTool):
+    """Search tool that sleeps instead of calling DuckDuckGo."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def search(
+        self,
+        query: str,
+        *,
+        max_results: int | None = None,
+        time_range: str | None = None,  # noqa: ARG002
+    ) -> list[SearchResult]:
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self._lock:
+            self.in_flight -= 1
+        return [
+            SearchResult(title=query, url=f"https://example.com/{query}/{i}", snippet="")
+            for i in range(max_results or self.max_results)
+        ]
+
+
+class TestMultiSearch:
+    """Test cases for concurrent multi-query search."""
+
+    def test_runs_queries_concurrently_in_order(self) -> None:
+        """Test searches overlap, respect the width and keep query order."""
+        tool = _SlowSearchTool(max_workers=3)
+        queries = [f"q{i}" for i in range(6)]
+
+        start = time.monotonic()
+        results = tool.multi_search(queries, max_results_per_query=2)
+        elapsed = time.monotonic() - start
+
+        assert list(results) == queries
+        assert all(len(r) == 2 for r in results.values())
+        assert tool.peak == 3
+        assert elapsed < 0.05 * len(queries)
+
+    async def test_async_respects_width(self) -> None:
+        """Test the async variant bounds concurrency and skips duplicates."""
+        tool = _SlowSearchTool()
+        results = await tool.amulti_search(["a", "b", "a", "c"], max_workers=2)
+
+        assert list(results) == ["a", "b", "c"]
+        assert tool.peak == 2
+
+
+class TestSearchCache:
+    """Test cases for search result caching and coalescing."""
+
+    def _tool(
+        self, tmp_path: Path, monkeypatch: Any, ttl: float = 3600, wait_for_coalesced: int = 0
+    ) -> tuple[SearchTool, list[str]]:
+        """Build a search tool whose engine calls are recorded."""
+        tool = SearchTool(
+            cache=SearchCache(DiskCache(tmp_path / "search.sqlite3"), ttl=ttl),
+            flight=SingleFlight(),
+        )
+        calls: list[str] = []
+
+        def fake_text(query: str, max_results: int, _time_range: str | None) -> list[SearchResult]:
+            calls.append(query)
+            # Optionally stay in flight until the expected callers have joined
+            deadline = time.monotonic() + 5
+            while tool.coalesced < wait_for_coalesced and time.monotonic() < deadline:
+                time.sleep(0.01)
+            if "nothing" in query:
+                return []
+            return [
+                SearchResult(title=query, url=f"https://example.com/{i}", snippet="")
+                for i in range(max_results)
+            ]
+
+        monkeypatch.setattr(tool, "_text", fake_text)
+        return tool, calls
+
+    def test_normalized_query_hits_cache(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test case and whitespace variants are served from the cache."""
+        tool, calls = self._tool(tmp_path, monkeypatch)
+
+        first = tool.search("Python  Asyncio", max_results=2)
+        second = tool.search("python asyncio", max_results=2)
+        tool.search("python asyncio", max_results=3)
+
+        assert second == first
+        assert len(calls) == 2
+        assert tool.cache is not None and tool.cache.stats.hits == 1
+
+    def test_empty_results_and_expiry(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test empty answers are not cached and entries expire."""
+        tool, calls = self._tool(tmp_path, monkeypatch, ttl=0.05)
+
+        tool.search("nothing here")
+        tool.search("nothing here")
+        tool.search("topic")
+        time.sleep(0.1)
+        tool.search("topic")
+
+        assert calls == ["nothing here", "nothing here", "topic", "topic"]
+
+    def test_concurrent_identical_searches_coalesce(self, tmp_path: Path, monkeypatch: Any) -> None:
+        """Test equivalent queries in flight together make one request."""
+        tool, calls = self._tool(tmp_path, monkeypatch, wait_for_coalesced=2)
+
+        results = tool.multi_search(["Rust", "rust", " RUST "], max_results_per_query=1)
+
+        assert len(calls) == 1
+        assert tool.coalesced == 2
+        assert all(len(r) == 1 for r in results.values())
+
+    def test_searches_coalesce_across_tools(self) -> None:
+        """Test separate search tools in one process share in-flight searches."""
+        first, second = SearchTool(), SearchTool()
+        joined = first.coalesced + 1
+        calls: list[str] = []
+
+        def fake_text(query: str, *_: Any) -> list[SearchResult]:
+            calls.append(query)
+            deadline = time.monotonic() + 5
+            while first.coalesced < joined and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return [SearchResult(title=query, url="https://example.com/", snippet="")]
+
+        first._text = fake_text  # type: ignore[method-assign]
+        second._text = fake_text  # type: ignore[method-assign]
+        results: list[list[SearchResult]] = []
+        threads = [
+            threading.Thread(target=lambda t=tool: results.append(t.search("batch topic guide")))
+            for tool in (first, second)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["batch topic guide"]
+        assert results[0] == results[1] and len(results[0]) == 1
+        assert second.coalesced == first.coalesced == joined
@@ -1,5 +1,8 @@
 """Tests for configuration settings."""
 
+import pytest
+from pydantic import ValidationError
+
 from pencraft.config.settings import Settings, load_settings
 
 
@@ -74,6 +77,18 @@ class TestLLMSettings:
         assert settings.llm.api_key == "dummy-api-key"
 
 
+class TestResearchSettings:
+    """Test cases for research settings."""
+
+    def test_coverage_scores_must_be_ordered(self) -> None:
+        """Test the shrink score may not be above the skip score."""
+        settings = Settings(research={"coverage_skip_score": 0.5, "coverage_shrink_score": 0.5})
+        assert settings.research.coverage_shrink_score == 0.5
+
+        with pytest.raises(ValidationError, match="coverage_shrink_score"):
+            Settings(research={"coverage_skip_score": 0.6, "coverage_shrink_score": 0.8})
+
+
 class TestHugoSettings:
     """Test cases for Hugo settings."""
 
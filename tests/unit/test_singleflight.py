@@ -0,0 +1,52 @@
+"""Tests for request coalescing."""
+
+import threading
+import time
+
+import pytest
+
+from pencraft.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_threads_share_one_call(self) -> None:
+        """Test callers arriving during a call wait for its result."""
+        flight: SingleFlight[int] = SingleFlight()
+        calls = 0
+        results: list[int] = []
+
+        def work() -> int:
+            nonlocal calls
+            calls += 1
+            # Stay in flight until every other caller has joined
+            deadline = time.monotonic() + 5
+            while flight.coalesced < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return 42
+
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("k", work))) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == 1
+        assert results == [42] * 5
+        assert flight.coalesced == 4
+        # Nothing is remembered once the call finished
+        assert flight.do("k", lambda: 7) == 7
+
+    def test_errors_are_not_remembered(self) -> None:
+        """Test a failed call raises for its caller and the next call runs again."""
+        flight: SingleFlight[int] = SingleFlight()
+
+        def fail() -> int:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: 1) == 1
@@ -0,0 +1,111 @@
+"""Tests for research synthesis."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from pencraft.agents.budget import ResearchBudget
+from pencraft.agents.research import ResearchAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from pencraft.tools.scraper import ScrapedContent
+from tests.helpers import completion
+
+
+def _agent(tmp_path: Path, prompts: list[str], **research: Any) -> ResearchAgent:
+    """Build a research agent whose LLM records prompts and answers with notes."""
+    settings = Settings(
+        research={"synthesis_mode": "map_reduce", **research},
+        cache={"directory": str(tmp_path / "cache")},
+    )
+    client = LLMClient(settings.llm)
+
+    async def fake_create(**params: Any) -> ChatCompletion:
+        prompt = params["messages"][-1]["content"]
+        prompts.append(prompt)
+        if prompt.startswith("You are a research assistant"):
+            url = prompt.split("(", 1)[1].split(")", 1)[0]
+            return completion(f"### Facts\n- Noted {url}")
+        return completion("Research brief.")
+
+    client._async_client.chat.completions.create = fake_create  # type: ignore[method-assign]
+    return ResearchAgent(client, settings)
+
+
+PAGES = [
+    ScrapedContent(url="https://a.example/", title="A", content="First paragraph.\nSecond."),
+    ScrapedContent(url="https://b.example/", title="B", content="x" * 30 + "\n" + "y" * 30),
+    ScrapedContent(url="https://c.example/", title="C", content="", success=False),
+]
+
+
+class TestMapReduceSynthesis:
+    """Test cases for map_reduce synthesis."""
+
+    async def test_notes_are_reduced_and_cached_across_topics(self, tmp_path: Path) -> None:
+        """Test every chunk gets notes once, and the brief is written from them."""
+        prompts: list[str] = []
+        agent = _agent(tmp_path, prompts, notes_chunk_tokens=10)
+
+        summary = await agent._asynthesize_research("bread", [], PAGES, "")
+
+        assert summary == "Research brief."
+        notes_prompts, (reduce_prompt,) = prompts[:-1], prompts[-1:]
+        # Page B is longer than one 40-character chunk
+        assert len(notes_prompts) == 3
+        assert "## Source Notes:" in reduce_prompt
+        assert "**Source: B** (https://b.example/)" in reduce_prompt
+        assert reduce_prompt.count("- Noted https://b.example/") == 2
+
+        prompts.clear()
+        other = _agent(tmp_path, prompts, notes_chunk_tokens=10)
+        await other._asynthesize_research("pastry", [], PAGES, "")
+
+        assert len(prompts) == 1
+        assert other.notes_cache is not None and other.notes_cache.stats.hits == 3
+
+    def test_long_paragraphs_are_cut_into_chunks(self, tmp_path: Path) -> None:
+        """Test chunks respect the token budget even inside one paragraph."""
+        agent = _agent(tmp_path, [], notes_chunk_tokens=5)
+        page = ScrapedContent(url="https://a.example/", title="A", content="z" * 45)
+
+        assert [len(chunk) for _, chunk in agent._note_chunks([page])] == [20, 20, 5]
+
+    def test_chunk_count_is_capped_across_pages(self, tmp_path: Path) -> None:
+        """Test the cap keeps every page's opening chunks before any page's end."""
+        agent = _agent(tmp_path, [], notes_chunk_tokens=5, notes_max_chunks=4)
+        pages = [
+            ScrapedContent(url="https://a.example/", title="A", content="a" * 60),
+            ScrapedContent(url="https://b.example/", title="B", content="b" * 10),
+            ScrapedContent(url="https://c.example/", title="C", content="c" * 45),
+        ]
+
+        chunks = agent._note_chunks(pages)
+
+        assert [(page.title, len(chunk)) for page, chunk in chunks] == [
+            ("A", 20),
+            ("A", 20),
+            ("B", 10),
+            ("C", 20),
+        ]
+
+    async def test_note_calls_are_charged_to_the_budget(self, tmp_path: Path) -> None:
+        """Test note calls count against the budget and stop once it is used up."""
+        prompts: list[str] = []
+        agent = _agent(tmp_path, prompts, notes_chunk_tokens=10, notes_concurrency=1)
+        budget = ResearchBudget(tokens=30)
+
+        await agent._asynthesize_research("bread", [], PAGES, "", budget=budget)
+
+        # Two note calls use the budget up; the last chunk goes in as text
+        notes_prompts, (reduce_prompt,) = prompts[:-1], prompts[-1:]
+        assert len(notes_prompts) == 2
+        assert "y" * 30 in reduce_prompt
+        assert budget.tokens_used == 45
+
+    def test_unknown_mode_is_rejected(self, tmp_path: Path) -> None:
+        """Test a misspelled synthesis mode fails early."""
+        with pytest.raises(ValueError, match="Unknown synthesis mode"):
+            _agent(tmp_path, [], synthesis_mode="mapreduce")
@@ -0,0 +1,104 @@
+"""Tests for the Google Trends tool."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from pencraft.tools.trends import TrendsTool
+from pencraft.tools.trends_cache import TrendsCache
+from pencraft.utils.cache import DiskCache
+
+
+class _FakeTrendReq:
+    """pytrends client answering every keyword with a fixed series."""
+
+    def __init__(self, fail_related: bool = False) -> None:
+        self.payloads: list[list[str]] = []
+        self.fail_related = fail_related
+        self.kw_list: list[str] = []
+
+    def build_payload(self, kw_list: list[str], **_: str) -> None:
+        self.payloads.append(list(kw_list))
+        self.kw_list = list(kw_list)
+
+    def interest_over_time(self) -> pd.DataFrame:
+        # Each keyword's interest is 10 times its position in the payload
+        return pd.DataFrame({kw: [10 * (i + 1)] * 8 for i, kw in enumerate(self.kw_list)})
+
+    def related_queries(self) -> dict[str, dict[str, pd.DataFrame]]:
+        if self.fail_related:
+            raise RuntimeError("429 Too Many Requests")
+        return {
+            kw: {"top": pd.DataFrame({"query": [f"{kw} tips"]}), "rising": None}
+            for kw in self.kw_list
+        }
+
+    def related_topics(self) -> dict[str, dict[str, None]]:
+        return {kw: {"top": None, "rising": None} for kw in self.kw_list}
+
+    def interest_by_region(self, **_: str) -> pd.DataFrame:
+        return pd.DataFrame({kw: [50, 0] for kw in self.kw_list}, index=["Norway", "Peru"])
+
+
+def _tool(tmp_path: Path, client: _FakeTrendReq) -> TrendsTool:
+    """Build a trends tool using the fake client and a cache under tmp_path."""
+    tool = TrendsTool(cache=TrendsCache(DiskCache(tmp_path / "trends.sqlite3"), ttl=3600))
+    tool._pytrends = client  # type: ignore[assignment]
+    return tool
+
+
+class TestBatchedLookups:
+    """Test cases for TrendsTool.get_trends_data_many."""
+
+    def test_topics_share_payloads_and_split_back(self, tmp_path: Path) -> None:
+        """Test topics go five to a payload and each gets its own column."""
+        client = _FakeTrendReq()
+        topics = [f"topic {i}" for i in range(7)]
+
+        data = _tool(tmp_path, client).get_trends_data_many([*topics, "Topic  1"])
+
+        assert client.payloads == [topics[:5], topics[5:]]
+        assert list(data) == [*topics, "Topic  1"]
+        assert [data[t].interest_score for t in topics] == [10, 20, 30, 40, 50, 10, 20]
+        assert data["topic 6"].related_queries == ["topic 6 tips"]
+        assert data["topic 6"].regional_interest == {"Norway": 50}
+        assert data["Topic  1"].topic == "Topic  1"
+        assert data["Topic  1"].interest_score == 20
+
+
+class TestTrendsCache:
+    """Test cases for caching trends data."""
+
+    def test_complete_lookups_are_reused(self, tmp_path: Path) -> None:
+        """Test a later tool answers a cached term without any request."""
+        _tool(tmp_path, _FakeTrendReq()).get_trends_data("sourdough")
+        client = _FakeTrendReq()
+        tool = _tool(tmp_path, client)
+
+        data = tool.get_trends_data("Sourdough")
+
+        assert client.payloads == []
+        assert data.topic == "Sourdough" and data.interest_score == 10
+        assert tool.cache is not None and tool.cache.stats.hits == 1
+
+    def test_batched_scores_are_reused_only_by_their_batch(self, tmp_path: Path) -> None:
+        """Test a term's batch-relative score never answers a lone lookup of it."""
+        _tool(tmp_path, _FakeTrendReq()).get_trends_data_many(["rye", "spelt"])
+        client = _FakeTrendReq()
+        tool = _tool(tmp_path, client)
+
+        batched = tool.get_trends_data_many(["Rye", "spelt"])
+        alone = tool.get_trends_data("spelt")
+
+        assert client.payloads == [["spelt"]]
+        assert batched["spelt"].interest_score == 20
+        assert alone.interest_score == 10
+
+    def test_partial_lookups_are_not_cached(self, tmp_path: Path) -> None:
+        """Test a throttled request leaves the term to be fetched again."""
+        _tool(tmp_path, _FakeTrendReq(fail_related=True)).get_trends_data("sourdough")
+        client = _FakeTrendReq()
+
+        _tool(tmp_path, client).get_trends_data("sourdough")
+
+        assert client.payloads == [["sourdough"]]
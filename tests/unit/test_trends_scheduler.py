@@ -0,0 +1,164 @@
+"""Tests for the Google Trends request scheduler."""
+
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pytrends.exceptions import TooManyRequestsError
+
+from pencraft.agents.research import ResearchAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from pencraft.tools.trends import TrendsData, TrendsTool
+from pencraft.tools.trends_scheduler import TrendsScheduler
+
+
+class _Response:
+    """Stand-in for the requests response attached to pytrends errors."""
+
+    status_code = 429
+
+
+def _throttle() -> None:
+    """Fail like pytrends does on a 429 response."""
+    raise TooManyRequestsError("The request failed: Google returned 429", _Response())
+
+
+class TestTrendsScheduler:
+    """Test cases for TrendsScheduler."""
+
+    def test_rate_follows_aimd(self) -> None:
+        """Test successes add to the rate and 429 responses halve it."""
+        scheduler = TrendsScheduler(6000, max_requests_per_minute=6004, increase=2)
+
+        assert scheduler.run(lambda x: x * 2, 21) == 42
+        assert scheduler.rate == 6002
+
+        with pytest.raises(TooManyRequestsError):
+            scheduler.run(_throttle)
+        assert scheduler.rate == 3001
+        assert scheduler.stats.requests == 2 and scheduler.stats.throttled == 1
+
+        for _ in range(3):
+            scheduler.run(lambda: None)
+        assert scheduler.rate == 3007
+
+    def test_requests_queue_and_are_spaced(self) -> None:
+        """Test concurrent lookups wait their turn at the current rate."""
+        scheduler = TrendsScheduler(1200, max_requests_per_minute=1200)
+        sent: list[float] = []
+        depths: list[int] = []
+
+        def request() -> None:
+            sent.append(time.monotonic())
+            depths.append(scheduler.queue_depth)
+
+        threads = [threading.Thread(target=scheduler.run, args=(request,)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        gaps = [later - earlier for earlier, later in zip(sent, sent[1:], strict=False)]
+        assert len(sent) == 4 and min(gaps) >= 0.045
+        assert scheduler.stats.peak_queue_depth >= 1
+        assert depths[-1] == 0
+
+    def test_requests_are_abandoned_at_their_deadline(self) -> None:
+        """Test a request gives up its place in the queue at its deadline."""
+        scheduler = TrendsScheduler(6000, max_requests_per_minute=6000)
+        sent: list[str] = []
+
+        def request(name: str, seconds: float = 0.0) -> None:
+            time.sleep(seconds)
+            sent.append(name)
+
+        def run(name: str, seconds: float = 0.0, expires_in: float | None = None) -> None:
+            expires_at = None if expires_in is None else time.monotonic() + expires_in
+            try:
+                scheduler.run(request, name, seconds, expires_at=expires_at)
+            except TimeoutError:
+                sent.append(f"{name} abandoned")
+
+        threads = [threading.Thread(target=run, args=("slow", 0.3))]
+        threads[0].start()
+        time.sleep(0.05)
+        threads.append(threading.Thread(target=run, args=("late",), kwargs={"expires_in": 0.05}))
+        threads[1].start()
+        time.sleep(0.05)
+        threads.append(threading.Thread(target=run, args=("patient",)))
+        threads[2].start()
+        for t in threads:
+            t.join(timeout=2)
+
+        assert sent == ["late abandoned", "slow", "patient"]
+        assert scheduler.stats.requests == 2 and scheduler.stats.abandoned == 1
+        assert scheduler.queue_depth == 0
+
+        slow = TrendsScheduler(1, min_requests_per_minute=1, max_requests_per_minute=1)
+        slow.run(lambda: None)
+        with pytest.raises(TimeoutError):
+            slow.run(lambda: None, expires_at=time.monotonic() + 0.1)
+        assert slow.stats.abandoned == 1
+
+
+class _SlowTrendsTool(TrendsTool):
+    """Trends tool whose lookups take longer than research waits."""
+
+    def get_trends_data(self, topic: str, **_: Any) -> TrendsData:
+        time.sleep(0.5)
+        return TrendsData(topic=topic, rising_queries=["late"])
+
+
+class TestTrendsDeadline:
+    """Test cases for research going on without late trends data."""
+
+    def _agent(self, tmp_path: Path) -> ResearchAgent:
+        """Build a research agent waiting 50ms for trends."""
+        settings = Settings(
+            research={"trends_deadline": 0.05}, cache={"directory": str(tmp_path / "cache")}
+        )
+        return ResearchAgent(LLMClient(settings.llm), settings, trends_tool=_SlowTrendsTool())
+
+    async def test_async_lookup_is_abandoned(self, tmp_path: Path) -> None:
+        """Test the async path returns without trends at the deadline."""
+        agent = self._agent(tmp_path)
+        start = time.monotonic()
+
+        assert await agent._afetch_trends("sourdough") is None
+        assert time.monotonic() - start < 0.4
+
+    def test_sync_lookup_is_abandoned(self, tmp_path: Path) -> None:
+        """Test the sync path stops waiting at the deadline."""
+        agent = self._agent(tmp_path)
+        # A lookup that never finishes
+        future: Future[TrendsData | None] = Future()
+        start = time.monotonic()
+
+        assert agent._trends_result(future, time.monotonic()) is None
+        assert time.monotonic() - start < 0.4
+
+    def test_lookup_stops_at_the_deadline(self) -> None:
+        """Test a lookup queued behind slow requests gives up instead of finishing late."""
+        scheduler = TrendsScheduler(1, min_requests_per_minute=1, max_requests_per_minute=1)
+        tool = TrendsTool(scheduler=scheduler)
+        # pytrends client whose requests are never sent
+        tool._pytrends = SimpleNamespace(  # type: ignore[assignment]
+            build_payload=_throttle,
+            interest_over_time=_throttle,
+            related_queries=_throttle,
+            related_topics=_throttle,
+            interest_by_region=_throttle,
+        )
+        # The next request may only go out in a minute
+        scheduler.run(lambda: None)
+        start = time.monotonic()
+
+        data = tool.get_trends_data("sourdough", deadline=0.05)
+
+        assert time.monotonic() - start < 0.4
+        assert data.error is not None and "deadline" in data.error
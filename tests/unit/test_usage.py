@@ -0,0 +1,96 @@
+"""Tests for LLM usage accounting."""
+
+import asyncio
+from typing import Any
+
+from openai.types.chat import ChatCompletion
+
+from pencraft.agents.base import AgentResult, BaseAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from pencraft.llm.usage import LLMCallRecord, UsageSummary, collect_usage, llm_phase
+from tests.helpers import completion
+
+
+class _EchoAgent(BaseAgent):
+    """Minimal agent used to exercise phase labelling."""
+
+    def execute(self, **_kwargs: Any) -> AgentResult:
+        return AgentResult(success=True, content=self._generate("hi", phase="outline"))
+
+    async def aexecute(self, **_kwargs: Any) -> AgentResult:
+        return AgentResult(success=True, content=await self._agenerate("hi", phase="outline"))
+
+
+class TestUsageSummary:
+    """Test cases for UsageSummary aggregation."""
+
+    def test_by_phase(self) -> None:
+        """Test calls are grouped per agent and phase in order."""
+        summary = UsageSummary(
+            calls=[
+                LLMCallRecord("Writer", "introduction", "m", "e", 10, 20, 1.0),
+                LLMCallRecord("Writer", "section:A", "m", "e", 5, 5, 2.0, 0.5),
+                LLMCallRecord("Writer", "introduction", "m", "e", 1, 2, 0.5, cached=True),
+                LLMCallRecord("Writer", "section:A", "m", "e", 5, 5, 2.0, 1.5),
+            ]
+        )
+        phases = summary.by_phase()
+
+        assert [p.phase for p in phases] == ["introduction", "section:A"]
+        assert phases[0].calls == 2
+        assert phases[0].cached_calls == 1
+        assert phases[0].prompt_tokens == 11
+        assert phases[0].time_to_first_token is None
+        assert phases[1].time_to_first_token == 1.0
+        assert summary.completion_tokens == 32
+
+    def test_merge(self) -> None:
+        """Test merging skips missing summaries."""
+        a = UsageSummary(calls=[LLMCallRecord("A", "p", "m", "e", 1, 1)])
+        merged = UsageSummary.merge([a, None, a])
+
+        assert len(merged.calls) == 2
+
+
+class TestUsageRecording:
+    """Test cases for recording calls from the client."""
+
+    def test_agent_calls_are_labelled(self, monkeypatch: Any) -> None:
+        """Test agent calls carry the agent name, phase and token counts."""
+        client = LLMClient(Settings().llm)
+        monkeypatch.setattr(client._client.chat.completions, "create", lambda **_: completion())
+        agent = _EchoAgent(client, Settings(), name="Echo")
+
+        with collect_usage() as usage:
+            agent.execute()
+        client.generate("outside any phase")
+
+        assert len(usage.calls) == 1
+        call = usage.calls[0]
+        assert (call.agent, call.phase) == ("Echo", "outline")
+        assert (call.prompt_tokens, call.completion_tokens) == (10, 5)
+        assert call.model == "test-model"
+        assert call.time_to_first_token is not None
+        assert call.time_to_first_token == call.latency
+        assert usage.by_phase()[0].time_to_first_token is not None
+
+    async def test_concurrent_collectors_are_isolated(self, monkeypatch: Any) -> None:
+        """Test concurrent generations each collect only their own calls."""
+        client = LLMClient(Settings().llm)
+
+        async def fake_create(**_: Any) -> ChatCompletion:
+            await asyncio.sleep(0.01)
+            return completion()
+
+        monkeypatch.setattr(client._async_client.chat.completions, "create", fake_create)
+
+        async def run(phase: str, calls: int) -> UsageSummary:
+            with collect_usage() as usage, llm_phase(phase, agent="Test"):
+                await asyncio.gather(*(client.agenerate("hi") for _ in range(calls)))
+            return usage
+
+        first, second = await asyncio.gather(run("a", 2), run("b", 3))
+
+        assert [c.phase for c in first.calls] == ["a", "a"]
+        assert [c.phase for c in second.calls] == ["b", "b", "b"]
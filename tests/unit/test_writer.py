@@ -0,0 +1,81 @@
+"""Tests for the writer agent."""
+
+import asyncio
+from typing import Any
+
+from openai.types.chat import ChatCompletion
+
+from pencraft.agents.planner import BlogOutline, Section
+from pencraft.agents.writer import WriterAgent
+from pencraft.config.settings import Settings
+from pencraft.llm.client import LLMClient
+from tests.helpers import completion
+
+
+def _outline(sections: int) -> BlogOutline:
+    """Build an outline with numbered sections."""
+    return BlogOutline(
+        title="Test Post",
+        meta_description="A test post",
+        sections=[Section(title=f"Part {i}", key_points=[f"point {i}"]) for i in range(sections)],
+    )
+
+
+class TestParallelWriting:
+    """Test cases for parallel section writing."""
+
+    async def test_order_concurrency_and_transitions(self, monkeypatch: Any) -> None:
+        """Test sections stay in outline order while running concurrently."""
+        settings = Settings(blog={"include_citations": False})
+        client = LLMClient(settings.llm)
+        in_flight = 0
+        peak = 0
+
+        async def fake_create(**params: Any) -> ChatCompletion:
+            nonlocal in_flight, peak
+            prompt = params["messages"][-1]["content"]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later sections finish first to prove order is restored
+            await asyncio.sleep(0.05 if "Part 0" in prompt else 0.01)
+            in_flight -= 1
+
+            if "smoothing the joins" in prompt:
+                return completion("Smoothed opening.")
+            if "**Current Section:**" in prompt:
+                section = prompt.split("**Current Section:** ")[1].split("\n")[0]
+                return completion(f"Opening of {section}.\n\nBody of {section}.")
+            return completion("Intro or conclusion.")
+
+        monkeypatch.setattr(client._async_client.chat.completions, "create", fake_create)
+        writer = WriterAgent(client, settings)
+
+        result = await writer.aexecute(_outline(4), "research", parallel=True, max_concurrency=2)
+
+        assert result.success
+        positions = [result.content.index(f"## Part {i}") for i in range(4)]
+        assert positions == sorted(positions)
+        assert "Body of Part 3." in result.content
+        assert "Opening of Part 1." not in result.content
+        assert result.content.count("Smoothed opening.") == 4
+        assert peak == 2
+        assert result.metadata["parallel"]["llm_calls"] == 10
+        assert result.metadata["parallel"]["speedup"] > 1.0
+
+    async def test_without_transitions(self, monkeypatch: Any) -> None:
+        """Test the transition pass can be turned off."""
+        settings = Settings(blog={"parallel_sections": True, "smooth_transitions": False})
+        client = LLMClient(settings.llm)
+        calls = 0
+
+        async def fake_create(**_: Any) -> ChatCompletion:
+            nonlocal calls
+            calls += 1
+            return completion("Text.")
+
+        monkeypatch.setattr(client._async_client.chat.completions, "create", fake_create)
+
+        result = await WriterAgent(client, settings).aexecute(_outline(3), "research")
+
+        assert result.success
+        assert calls == 5